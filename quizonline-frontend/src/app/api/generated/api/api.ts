@@ -12,6 +12,8 @@ export * from './quiz-alert.service';
 import { QuizAlertApi } from './quiz-alert.service';
 export * from './quiz-answer.service';
 import { QuizAnswerApi } from './quiz-answer.service';
+export * from './quiz-events.service';
+import { QuizEventsApi } from './quiz-events.service';
 export * from './quiz-template.service';
 import { QuizTemplateApi } from './quiz-template.service';
 export * from './schema.service';
@@ -24,4 +26,4 @@ export * from './translation.service';
 import { TranslationApi } from './translation.service';
 export * from './user.service';
 import { UserApi } from './user.service';
-export const APIS = [AuthApi, DomainApi, LanguageApi, QuestionApi, QuizApi, QuizAlertApi, QuizAnswerApi, QuizTemplateApi, SchemaApi, SubjectApi, TokenApi, TranslationApi, UserApi];
+export const APIS = [AuthApi, DomainApi, LanguageApi, QuestionApi, QuizApi, QuizAlertApi, QuizAnswerApi, QuizEventsApi, QuizTemplateApi, SchemaApi, SubjectApi, TokenApi, TranslationApi, UserApi];
@@ -31,6 +31,8 @@ import { PatchedQuestionPartialWritePayloadRequestDto } from '../model/patched-q
 // @ts-ignore
 import { QuestionAnswerOptionWriteRequestDto } from '../model/question-answer-option-write-request';
 // @ts-ignore
+import { QuestionDetailDto } from '../model/question-detail';
+// @ts-ignore
 import { QuestionReadDto } from '../model/question-read';
 // @ts-ignore
 import { QuestionWriteDto } from '../model/question-write';
@@ -71,6 +73,10 @@ export interface QuestionImportStructuredCreateRequestParams {
 
 export interface QuestionListRequestParams {
     active?: boolean;
+    /** Mode curseur uniquement : ajoute &#x60;count&#x60;, estimé (&#x60;approx&#x60;) ou exact (&#x60;exact&#x60;). */
+    count?: 'approx' | 'exact';
+    /** Curseur opaque renvoyé dans &#x60;next&#x60; / &#x60;previous&#x60; (mode &#x60;pagination&#x3D;cursor&#x60;). */
+    cursor?: string;
     domain?: number;
     isModeExam?: boolean;
     isModePractice?: boolean;
@@ -78,6 +84,8 @@ export interface QuestionListRequestParams {
     page?: number;
     /** Number of results to return per page. */
     pageSize?: number;
+    /** &#x60;cursor&#x60; : pagination keyset (sans COUNT ni OFFSET) au lieu des numéros de page. */
+    pagination?: 'cursor';
     /** Recherche simple (title__icontains). */
     search?: string;
     /** Liste d\&#39;IDs de sujets pour filtrer les questions. */
@@ -463,17 +471,24 @@ export class QuestionApi extends BaseService {
     public questionList(requestParameters?: QuestionListRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<PaginatedQuestionReadListDto>>;
     public questionList(requestParameters?: QuestionListRequestParams, observe: any = 'body', reportProgress: boolean = false, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<any> {
         const active = requestParameters?.active;
+        const count = requestParameters?.count;
+        const cursor = requestParameters?.cursor;
         const domain = requestParameters?.domain;
         const isModeExam = requestParameters?.isModeExam;
         const isModePractice = requestParameters?.isModePractice;
         const page = requestParameters?.page;
         const pageSize = requestParameters?.pageSize;
+        const pagination = requestParameters?.pagination;
         const search = requestParameters?.search;
         const subjectIds = requestParameters?.subjectIds;
 
         let localVarQueryParameters = new HttpParams({encoder: this.encoder});
         localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
           <any>active, 'active');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>count, 'count');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>cursor, 'cursor');
         localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
           <any>domain, 'domain');
         localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
@@ -484,6 +499,8 @@ export class QuestionApi extends BaseService {
           <any>page, 'page');
         localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
           <any>pageSize, 'page_size');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>pagination, 'pagination');
         localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
           <any>search, 'search');
         if (subjectIds) {
@@ -902,9 +919,9 @@ export class QuestionApi extends BaseService {
      * @param observe set whether or not to return the data Observable as the body, response or events. defaults to returning the body.
      * @param reportProgress flag to report request and response progress.
      */
-    public questionRetrieve(requestParameters: QuestionRetrieveRequestParams, observe?: 'body', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<QuestionReadDto>;
-    public questionRetrieve(requestParameters: QuestionRetrieveRequestParams, observe?: 'response', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpResponse<QuestionReadDto>>;
-    public questionRetrieve(requestParameters: QuestionRetrieveRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<QuestionReadDto>>;
+    public questionRetrieve(requestParameters: QuestionRetrieveRequestParams, observe?: 'body', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<QuestionDetailDto>;
+    public questionRetrieve(requestParameters: QuestionRetrieveRequestParams, observe?: 'response', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpResponse<QuestionDetailDto>>;
+    public questionRetrieve(requestParameters: QuestionRetrieveRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<QuestionDetailDto>>;
     public questionRetrieve(requestParameters: QuestionRetrieveRequestParams, observe: any = 'body', reportProgress: boolean = false, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<any> {
         const questionId = requestParameters?.questionId;
         if (questionId === null || questionId === undefined) {
@@ -941,7 +958,7 @@ export class QuestionApi extends BaseService {
 
         let localVarPath = `/api/question/${this.configuration.encodeParam({name: "questionId", value: questionId, in: "path", style: "simple", explode: false, dataType: "number", dataFormat: undefined})}/`;
         const { basePath, withCredentials } = this.configuration;
-        return this.httpClient.request<QuestionReadDto>('get', `${basePath}${localVarPath}`,
+        return this.httpClient.request<QuestionDetailDto>('get', `${basePath}${localVarPath}`,
             {
                 context: localVarHttpContext,
                 responseType: <any>responseType_,
@@ -16,6 +16,8 @@ import { HttpClient, HttpHeaders, HttpParams,
 import { CustomHttpParameterCodec }                          from '../encoder';
 import { Observable }                                        from 'rxjs';
 
+// @ts-ignore
+import { PaginatedQuizAlertMessageListDto } from '../model/paginated-quiz-alert-message-list';
 // @ts-ignore
 import { PaginatedQuizAlertThreadListListDto } from '../model/paginated-quiz-alert-thread-list-list';
 // @ts-ignore
@@ -44,8 +46,14 @@ export interface QuizAlertsCreateRequestParams {
 }
 
 export interface QuizAlertsListRequestParams {
+    /** Mode curseur uniquement : ajoute &#x60;count&#x60;, estimé (&#x60;approx&#x60;) ou exact (&#x60;exact&#x60;). */
+    count?: 'approx' | 'exact';
+    /** Curseur opaque renvoyé dans &#x60;next&#x60; / &#x60;previous&#x60; (mode &#x60;pagination&#x3D;cursor&#x60;). */
+    cursor?: string;
     /** A page number within the paginated result set. */
     page?: number;
+    /** &#x60;cursor&#x60; : pagination keyset (sans COUNT ni OFFSET) au lieu des numéros de page. */
+    pagination?: 'cursor';
 }
 
 export interface QuizAlertsMessageCreateRequestParams {
@@ -53,6 +61,18 @@ export interface QuizAlertsMessageCreateRequestParams {
     quizAlertMessageCreateRequestDto: QuizAlertMessageCreateRequestDto;
 }
 
+export interface QuizAlertsMessagesListRequestParams {
+    alertId: number;
+    /** Mode curseur uniquement : ajoute &#x60;count&#x60;, estimé (&#x60;approx&#x60;) ou exact (&#x60;exact&#x60;). */
+    count?: 'approx' | 'exact';
+    /** Curseur opaque renvoyé dans &#x60;next&#x60; / &#x60;previous&#x60; (mode &#x60;pagination&#x3D;cursor&#x60;). */
+    cursor?: string;
+    /** A page number within the paginated result set. */
+    page?: number;
+    /** &#x60;cursor&#x60; : pagination keyset (sans COUNT ni OFFSET) au lieu des numéros de page. */
+    pagination?: 'cursor';
+}
+
 export interface QuizAlertsPartialUpdateRequestParams {
     alertId: number;
     patchedQuizAlertThreadPartialRequestDto?: PatchedQuizAlertThreadPartialRequestDto;
@@ -217,11 +237,20 @@ export class QuizAlertApi extends BaseService {
     public quizAlertsList(requestParameters?: QuizAlertsListRequestParams, observe?: 'response', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpResponse<PaginatedQuizAlertThreadListListDto>>;
     public quizAlertsList(requestParameters?: QuizAlertsListRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<PaginatedQuizAlertThreadListListDto>>;
     public quizAlertsList(requestParameters?: QuizAlertsListRequestParams, observe: any = 'body', reportProgress: boolean = false, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<any> {
+        const count = requestParameters?.count;
+        const cursor = requestParameters?.cursor;
         const page = requestParameters?.page;
+        const pagination = requestParameters?.pagination;
 
         let localVarQueryParameters = new HttpParams({encoder: this.encoder});
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>count, 'count');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>cursor, 'cursor');
         localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
           <any>page, 'page');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>pagination, 'pagination');
 
         let localVarHeaders = this.defaultHeaders;
 
@@ -342,6 +371,80 @@ export class QuizAlertApi extends BaseService {
         );
     }
 
+    /**
+     * Lister les messages d\&#39;une conversation (plus récents d\&#39;abord, paginé)
+     * @endpoint get /api/quiz/alerts/{alert_id}/messages/
+     * @param requestParameters
+     * @param observe set whether or not to return the data Observable as the body, response or events. defaults to returning the body.
+     * @param reportProgress flag to report request and response progress.
+     */
+    public quizAlertsMessagesList(requestParameters: QuizAlertsMessagesListRequestParams, observe?: 'body', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<PaginatedQuizAlertMessageListDto>;
+    public quizAlertsMessagesList(requestParameters: QuizAlertsMessagesListRequestParams, observe?: 'response', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpResponse<PaginatedQuizAlertMessageListDto>>;
+    public quizAlertsMessagesList(requestParameters: QuizAlertsMessagesListRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<PaginatedQuizAlertMessageListDto>>;
+    public quizAlertsMessagesList(requestParameters: QuizAlertsMessagesListRequestParams, observe: any = 'body', reportProgress: boolean = false, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<any> {
+        const alertId = requestParameters?.alertId;
+        if (alertId === null || alertId === undefined) {
+            throw new Error('Required parameter alertId was null or undefined when calling quizAlertsMessagesList.');
+        }
+        const count = requestParameters?.count;
+        const cursor = requestParameters?.cursor;
+        const page = requestParameters?.page;
+        const pagination = requestParameters?.pagination;
+
+        let localVarQueryParameters = new HttpParams({encoder: this.encoder});
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>count, 'count');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>cursor, 'cursor');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>page, 'page');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>pagination, 'pagination');
+
+        let localVarHeaders = this.defaultHeaders;
+
+        // authentication (jwtAuth) required
+        localVarHeaders = this.configuration.addCredentialToHeaders('jwtAuth', 'Authorization', localVarHeaders, 'Bearer ');
+
+        const localVarHttpHeaderAcceptSelected: string | undefined = options?.httpHeaderAccept ?? this.configuration.selectHeaderAccept([
+            'application/json'
+        ]);
+        if (localVarHttpHeaderAcceptSelected !== undefined) {
+            localVarHeaders = localVarHeaders.set('Accept', localVarHttpHeaderAcceptSelected);
+        }
+
+        const localVarHttpContext: HttpContext = options?.context ?? new HttpContext();
+
+        const localVarTransferCache: boolean = options?.transferCache ?? true;
+
+
+        let responseType_: 'text' | 'json' | 'blob' = 'json';
+        if (localVarHttpHeaderAcceptSelected) {
+            if (localVarHttpHeaderAcceptSelected.startsWith('text')) {
+                responseType_ = 'text';
+            } else if (this.configuration.isJsonMime(localVarHttpHeaderAcceptSelected)) {
+                responseType_ = 'json';
+            } else {
+                responseType_ = 'blob';
+            }
+        }
+
+        let localVarPath = `/api/quiz/alerts/${this.configuration.encodeParam({name: "alertId", value: alertId, in: "path", style: "simple", explode: false, dataType: "number", dataFormat: undefined})}/messages/`;
+        const { basePath, withCredentials } = this.configuration;
+        return this.httpClient.request<PaginatedQuizAlertMessageListDto>('get', `${basePath}${localVarPath}`,
+            {
+                context: localVarHttpContext,
+                params: localVarQueryParameters,
+                responseType: <any>responseType_,
+                ...(withCredentials ? { withCredentials } : {}),
+                headers: localVarHeaders,
+                observe: observe,
+                ...(localVarTransferCache !== undefined ? { transferCache: localVarTransferCache } : {}),
+                reportProgress: reportProgress
+            }
+        );
+    }
+
     /**
      * Modifier les droits de réponse de l\&#39;utilisateur
      * @endpoint patch /api/quiz/alerts/{alert_id}/
@@ -16,11 +16,17 @@ import { HttpClient, HttpHeaders, HttpParams,
 import { CustomHttpParameterCodec }                          from '../encoder';
 import { Observable }                                        from 'rxjs';
 
+// @ts-ignore
+import { PaginatedQuizQuestionAnswerBufferedListDto } from '../model/paginated-quiz-question-answer-buffered-list';
 // @ts-ignore
 import { PaginatedQuizQuestionAnswerListDto } from '../model/paginated-quiz-question-answer-list';
 // @ts-ignore
 import { PatchedQuizQuestionAnswerPartialRequestDto } from '../model/patched-quiz-question-answer-partial-request';
 // @ts-ignore
+import { QuizQuestionAnswerBatchWriteRequestDto } from '../model/quiz-question-answer-batch-write-request';
+// @ts-ignore
+import { QuizQuestionAnswerBufferedDto } from '../model/quiz-question-answer-buffered';
+// @ts-ignore
 import { QuizQuestionAnswerDto } from '../model/quiz-question-answer';
 // @ts-ignore
 import { QuizQuestionAnswerWriteRequestDto } from '../model/quiz-question-answer-write-request';
@@ -64,6 +70,13 @@ export interface QuizAnswerUpdateRequestParams {
     quizQuestionAnswerWriteRequestDto?: QuizQuestionAnswerWriteRequestDto;
 }
 
+export interface QuizAnswersBatchCreateRequestParams {
+    quizId: number;
+    quizQuestionAnswerBatchWriteRequestDto: QuizQuestionAnswerBatchWriteRequestDto;
+    /** A page number within the paginated result set. */
+    page?: number;
+}
+
 
 @Injectable({
   providedIn: 'root'
@@ -488,4 +501,85 @@ export class QuizAnswerApi extends BaseService {
         );
     }
 
+    /**
+     * Enregistrer plusieurs réponses en une requête (upsert)
+     * @endpoint post /api/quiz/{quiz_id}/answers/batch/
+     * @param requestParameters
+     * @param observe set whether or not to return the data Observable as the body, response or events. defaults to returning the body.
+     * @param reportProgress flag to report request and response progress.
+     */
+    public quizAnswersBatchCreate(requestParameters: QuizAnswersBatchCreateRequestParams, observe?: 'body', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<PaginatedQuizQuestionAnswerListDto>;
+    public quizAnswersBatchCreate(requestParameters: QuizAnswersBatchCreateRequestParams, observe?: 'response', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpResponse<PaginatedQuizQuestionAnswerListDto>>;
+    public quizAnswersBatchCreate(requestParameters: QuizAnswersBatchCreateRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<PaginatedQuizQuestionAnswerListDto>>;
+    public quizAnswersBatchCreate(requestParameters: QuizAnswersBatchCreateRequestParams, observe: any = 'body', reportProgress: boolean = false, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<any> {
+        const quizId = requestParameters?.quizId;
+        if (quizId === null || quizId === undefined) {
+            throw new Error('Required parameter quizId was null or undefined when calling quizAnswersBatchCreate.');
+        }
+        const quizQuestionAnswerBatchWriteRequestDto = requestParameters?.quizQuestionAnswerBatchWriteRequestDto;
+        if (quizQuestionAnswerBatchWriteRequestDto === null || quizQuestionAnswerBatchWriteRequestDto === undefined) {
+            throw new Error('Required parameter quizQuestionAnswerBatchWriteRequestDto was null or undefined when calling quizAnswersBatchCreate.');
+        }
+        const page = requestParameters?.page;
+
+        let localVarQueryParameters = new HttpParams({encoder: this.encoder});
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>page, 'page');
+
+        let localVarHeaders = this.defaultHeaders;
+
+        // authentication (jwtAuth) required
+        localVarHeaders = this.configuration.addCredentialToHeaders('jwtAuth', 'Authorization', localVarHeaders, 'Bearer ');
+
+        const localVarHttpHeaderAcceptSelected: string | undefined = options?.httpHeaderAccept ?? this.configuration.selectHeaderAccept([
+            'application/json'
+        ]);
+        if (localVarHttpHeaderAcceptSelected !== undefined) {
+            localVarHeaders = localVarHeaders.set('Accept', localVarHttpHeaderAcceptSelected);
+        }
+
+        const localVarHttpContext: HttpContext = options?.context ?? new HttpContext();
+
+        const localVarTransferCache: boolean = options?.transferCache ?? true;
+
+
+        // to determine the Content-Type header
+        const consumes: string[] = [
+            'application/json',
+            'application/x-www-form-urlencoded',
+            'multipart/form-data'
+        ];
+        const httpContentTypeSelected: string | undefined = this.configuration.selectHeaderContentType(consumes);
+        if (httpContentTypeSelected !== undefined) {
+            localVarHeaders = localVarHeaders.set('Content-Type', httpContentTypeSelected);
+        }
+
+        let responseType_: 'text' | 'json' | 'blob' = 'json';
+        if (localVarHttpHeaderAcceptSelected) {
+            if (localVarHttpHeaderAcceptSelected.startsWith('text')) {
+                responseType_ = 'text';
+            } else if (this.configuration.isJsonMime(localVarHttpHeaderAcceptSelected)) {
+                responseType_ = 'json';
+            } else {
+                responseType_ = 'blob';
+            }
+        }
+
+        let localVarPath = `/api/quiz/${this.configuration.encodeParam({name: "quizId", value: quizId, in: "path", style: "simple", explode: false, dataType: "number", dataFormat: undefined})}/answers/batch/`;
+        const { basePath, withCredentials } = this.configuration;
+        return this.httpClient.request<PaginatedQuizQuestionAnswerListDto>('post', `${basePath}${localVarPath}`,
+            {
+                context: localVarHttpContext,
+                body: quizQuestionAnswerBatchWriteRequestDto,
+                params: localVarQueryParameters,
+                responseType: <any>responseType_,
+                ...(withCredentials ? { withCredentials } : {}),
+                headers: localVarHeaders,
+                observe: observe,
+                ...(localVarTransferCache !== undefined ? { transferCache: localVarTransferCache } : {}),
+                reportProgress: reportProgress
+            }
+        );
+    }
+
 }
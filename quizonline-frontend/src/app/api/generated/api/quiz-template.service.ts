@@ -16,6 +16,8 @@ import { HttpClient, HttpHeaders, HttpParams,
 import { CustomHttpParameterCodec }                          from '../encoder';
 import { Observable }                                        from 'rxjs';
 
+// @ts-ignore
+import { ErrorDetailDto } from '../model/error-detail';
 // @ts-ignore
 import { GenerateFromSubjectsInputRequestDto } from '../model/generate-from-subjects-input-request';
 // @ts-ignore
@@ -23,12 +25,16 @@ import { PaginatedQuizAssignmentListListDto } from '../model/paginated-quiz-assi
 // @ts-ignore
 import { PaginatedQuizQuestionReadListDto } from '../model/paginated-quiz-question-read-list';
 // @ts-ignore
-import { PaginatedQuizTemplateListDto } from '../model/paginated-quiz-template-list';
+import { PaginatedQuizTemplateListListDto } from '../model/paginated-quiz-template-list-list';
 // @ts-ignore
 import { PatchedQuizQuestionPartialRequestDto } from '../model/patched-quiz-question-partial-request';
 // @ts-ignore
 import { PatchedQuizTemplatePartialRequestDto } from '../model/patched-quiz-template-partial-request';
 // @ts-ignore
+import { QuizItemAnalysisDto } from '../model/quiz-item-analysis';
+// @ts-ignore
+import { QuizJobDto } from '../model/quiz-job';
+// @ts-ignore
 import { QuizQuestionReadDto } from '../model/quiz-question-read';
 // @ts-ignore
 import { QuizQuestionWriteRequestDto } from '../model/quiz-question-write-request';
@@ -43,6 +49,19 @@ import { Configuration }                                     from '../configurat
 import { BaseService } from '../api.base.service';
 
 
+export interface QuizTemplateAnalyticsRetrieveRequestParams {
+    qtId: number;
+}
+
+export interface QuizTemplateCloseSessionsCreateRequestParams {
+    qtId: number;
+}
+
+export interface QuizTemplateCloseSessionsRetrieveRequestParams {
+    jobId: string;
+    qtId: number;
+}
+
 export interface QuizTemplateCreateRequestParams {
     quizTemplateWriteRequestDto: QuizTemplateWriteRequestDto;
 }
@@ -98,14 +117,26 @@ export interface QuizTemplateQuestionUpdateRequestParams {
     quizQuestionWriteRequestDto: QuizQuestionWriteRequestDto;
 }
 
+export interface QuizTemplateResultsExportRetrieveRequestParams {
+    qtId: number;
+    /** csv (défaut) ou ndjson. */
+    exportFormat?: 'csv' | 'ndjson';
+}
+
 export interface QuizTemplateRetrieveRequestParams {
     qtId: number;
 }
 
 export interface QuizTemplateSessionsListRequestParams {
     qtId: number;
+    /** Mode curseur uniquement : ajoute &#x60;count&#x60;, estimé (&#x60;approx&#x60;) ou exact (&#x60;exact&#x60;). */
+    count?: 'approx' | 'exact';
+    /** Curseur opaque renvoyé dans &#x60;next&#x60; / &#x60;previous&#x60; (mode &#x60;pagination&#x3D;cursor&#x60;). */
+    cursor?: string;
     /** A page number within the paginated result set. */
     page?: number;
+    /** &#x60;cursor&#x60; : pagination keyset (sans COUNT ni OFFSET) au lieu des numéros de page. */
+    pagination?: 'cursor';
 }
 
 export interface QuizTemplateUpdateRequestParams {
@@ -123,6 +154,187 @@ export class QuizTemplateApi extends BaseService {
         super(basePath, configuration);
     }
 
+    /**
+     * Analyse d\&#39;items d\&#39;un template (difficulté, discrimination, distracteurs, scores)
+     * @endpoint get /api/quiz/template/{qt_id}/analytics/
+     * @param requestParameters
+     * @param observe set whether or not to return the data Observable as the body, response or events. defaults to returning the body.
+     * @param reportProgress flag to report request and response progress.
+     */
+    public quizTemplateAnalyticsRetrieve(requestParameters: QuizTemplateAnalyticsRetrieveRequestParams, observe?: 'body', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<QuizItemAnalysisDto>;
+    public quizTemplateAnalyticsRetrieve(requestParameters: QuizTemplateAnalyticsRetrieveRequestParams, observe?: 'response', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpResponse<QuizItemAnalysisDto>>;
+    public quizTemplateAnalyticsRetrieve(requestParameters: QuizTemplateAnalyticsRetrieveRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<QuizItemAnalysisDto>>;
+    public quizTemplateAnalyticsRetrieve(requestParameters: QuizTemplateAnalyticsRetrieveRequestParams, observe: any = 'body', reportProgress: boolean = false, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<any> {
+        const qtId = requestParameters?.qtId;
+        if (qtId === null || qtId === undefined) {
+            throw new Error('Required parameter qtId was null or undefined when calling quizTemplateAnalyticsRetrieve.');
+        }
+
+        let localVarHeaders = this.defaultHeaders;
+
+        // authentication (jwtAuth) required
+        localVarHeaders = this.configuration.addCredentialToHeaders('jwtAuth', 'Authorization', localVarHeaders, 'Bearer ');
+
+        const localVarHttpHeaderAcceptSelected: string | undefined = options?.httpHeaderAccept ?? this.configuration.selectHeaderAccept([
+            'application/json'
+        ]);
+        if (localVarHttpHeaderAcceptSelected !== undefined) {
+            localVarHeaders = localVarHeaders.set('Accept', localVarHttpHeaderAcceptSelected);
+        }
+
+        const localVarHttpContext: HttpContext = options?.context ?? new HttpContext();
+
+        const localVarTransferCache: boolean = options?.transferCache ?? true;
+
+
+        let responseType_: 'text' | 'json' | 'blob' = 'json';
+        if (localVarHttpHeaderAcceptSelected) {
+            if (localVarHttpHeaderAcceptSelected.startsWith('text')) {
+                responseType_ = 'text';
+            } else if (this.configuration.isJsonMime(localVarHttpHeaderAcceptSelected)) {
+                responseType_ = 'json';
+            } else {
+                responseType_ = 'blob';
+            }
+        }
+
+        let localVarPath = `/api/quiz/template/${this.configuration.encodeParam({name: "qtId", value: qtId, in: "path", style: "simple", explode: false, dataType: "number", dataFormat: undefined})}/analytics/`;
+        const { basePath, withCredentials } = this.configuration;
+        return this.httpClient.request<QuizItemAnalysisDto>('get', `${basePath}${localVarPath}`,
+            {
+                context: localVarHttpContext,
+                responseType: <any>responseType_,
+                ...(withCredentials ? { withCredentials } : {}),
+                headers: localVarHeaders,
+                observe: observe,
+                ...(localVarTransferCache !== undefined ? { transferCache: localVarTransferCache } : {}),
+                reportProgress: reportProgress
+            }
+        );
+    }
+
+    /**
+     * Clôturer toutes les sessions actives d\&#39;un template (fin d\&#39;examen)
+     * @endpoint post /api/quiz/template/{qt_id}/close-sessions/
+     * @param requestParameters
+     * @param observe set whether or not to return the data Observable as the body, response or events. defaults to returning the body.
+     * @param reportProgress flag to report request and response progress.
+     */
+    public quizTemplateCloseSessionsCreate(requestParameters: QuizTemplateCloseSessionsCreateRequestParams, observe?: 'body', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<QuizJobDto>;
+    public quizTemplateCloseSessionsCreate(requestParameters: QuizTemplateCloseSessionsCreateRequestParams, observe?: 'response', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpResponse<QuizJobDto>>;
+    public quizTemplateCloseSessionsCreate(requestParameters: QuizTemplateCloseSessionsCreateRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<QuizJobDto>>;
+    public quizTemplateCloseSessionsCreate(requestParameters: QuizTemplateCloseSessionsCreateRequestParams, observe: any = 'body', reportProgress: boolean = false, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<any> {
+        const qtId = requestParameters?.qtId;
+        if (qtId === null || qtId === undefined) {
+            throw new Error('Required parameter qtId was null or undefined when calling quizTemplateCloseSessionsCreate.');
+        }
+
+        let localVarHeaders = this.defaultHeaders;
+
+        // authentication (jwtAuth) required
+        localVarHeaders = this.configuration.addCredentialToHeaders('jwtAuth', 'Authorization', localVarHeaders, 'Bearer ');
+
+        const localVarHttpHeaderAcceptSelected: string | undefined = options?.httpHeaderAccept ?? this.configuration.selectHeaderAccept([
+            'application/json'
+        ]);
+        if (localVarHttpHeaderAcceptSelected !== undefined) {
+            localVarHeaders = localVarHeaders.set('Accept', localVarHttpHeaderAcceptSelected);
+        }
+
+        const localVarHttpContext: HttpContext = options?.context ?? new HttpContext();
+
+        const localVarTransferCache: boolean = options?.transferCache ?? true;
+
+
+        let responseType_: 'text' | 'json' | 'blob' = 'json';
+        if (localVarHttpHeaderAcceptSelected) {
+            if (localVarHttpHeaderAcceptSelected.startsWith('text')) {
+                responseType_ = 'text';
+            } else if (this.configuration.isJsonMime(localVarHttpHeaderAcceptSelected)) {
+                responseType_ = 'json';
+            } else {
+                responseType_ = 'blob';
+            }
+        }
+
+        let localVarPath = `/api/quiz/template/${this.configuration.encodeParam({name: "qtId", value: qtId, in: "path", style: "simple", explode: false, dataType: "number", dataFormat: undefined})}/close-sessions/`;
+        const { basePath, withCredentials } = this.configuration;
+        return this.httpClient.request<QuizJobDto>('post', `${basePath}${localVarPath}`,
+            {
+                context: localVarHttpContext,
+                responseType: <any>responseType_,
+                ...(withCredentials ? { withCredentials } : {}),
+                headers: localVarHeaders,
+                observe: observe,
+                ...(localVarTransferCache !== undefined ? { transferCache: localVarTransferCache } : {}),
+                reportProgress: reportProgress
+            }
+        );
+    }
+
+    /**
+     * Avancement d\&#39;une clôture en masse des sessions
+     * @endpoint get /api/quiz/template/{qt_id}/close-sessions/{job_id}/
+     * @param requestParameters
+     * @param observe set whether or not to return the data Observable as the body, response or events. defaults to returning the body.
+     * @param reportProgress flag to report request and response progress.
+     */
+    public quizTemplateCloseSessionsRetrieve(requestParameters: QuizTemplateCloseSessionsRetrieveRequestParams, observe?: 'body', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<QuizJobDto>;
+    public quizTemplateCloseSessionsRetrieve(requestParameters: QuizTemplateCloseSessionsRetrieveRequestParams, observe?: 'response', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpResponse<QuizJobDto>>;
+    public quizTemplateCloseSessionsRetrieve(requestParameters: QuizTemplateCloseSessionsRetrieveRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<QuizJobDto>>;
+    public quizTemplateCloseSessionsRetrieve(requestParameters: QuizTemplateCloseSessionsRetrieveRequestParams, observe: any = 'body', reportProgress: boolean = false, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<any> {
+        const jobId = requestParameters?.jobId;
+        if (jobId === null || jobId === undefined) {
+            throw new Error('Required parameter jobId was null or undefined when calling quizTemplateCloseSessionsRetrieve.');
+        }
+        const qtId = requestParameters?.qtId;
+        if (qtId === null || qtId === undefined) {
+            throw new Error('Required parameter qtId was null or undefined when calling quizTemplateCloseSessionsRetrieve.');
+        }
+
+        let localVarHeaders = this.defaultHeaders;
+
+        // authentication (jwtAuth) required
+        localVarHeaders = this.configuration.addCredentialToHeaders('jwtAuth', 'Authorization', localVarHeaders, 'Bearer ');
+
+        const localVarHttpHeaderAcceptSelected: string | undefined = options?.httpHeaderAccept ?? this.configuration.selectHeaderAccept([
+            'application/json'
+        ]);
+        if (localVarHttpHeaderAcceptSelected !== undefined) {
+            localVarHeaders = localVarHeaders.set('Accept', localVarHttpHeaderAcceptSelected);
+        }
+
+        const localVarHttpContext: HttpContext = options?.context ?? new HttpContext();
+
+        const localVarTransferCache: boolean = options?.transferCache ?? true;
+
+
+        let responseType_: 'text' | 'json' | 'blob' = 'json';
+        if (localVarHttpHeaderAcceptSelected) {
+            if (localVarHttpHeaderAcceptSelected.startsWith('text')) {
+                responseType_ = 'text';
+            } else if (this.configuration.isJsonMime(localVarHttpHeaderAcceptSelected)) {
+                responseType_ = 'json';
+            } else {
+                responseType_ = 'blob';
+            }
+        }
+
+        let localVarPath = `/api/quiz/template/${this.configuration.encodeParam({name: "qtId", value: qtId, in: "path", style: "simple", explode: false, dataType: "number", dataFormat: undefined})}/close-sessions/${this.configuration.encodeParam({name: "jobId", value: jobId, in: "path", style: "simple", explode: false, dataType: "string", dataFormat: undefined})}/`;
+        const { basePath, withCredentials } = this.configuration;
+        return this.httpClient.request<QuizJobDto>('get', `${basePath}${localVarPath}`,
+            {
+                context: localVarHttpContext,
+                responseType: <any>responseType_,
+                ...(withCredentials ? { withCredentials } : {}),
+                headers: localVarHeaders,
+                observe: observe,
+                ...(localVarTransferCache !== undefined ? { transferCache: localVarTransferCache } : {}),
+                reportProgress: reportProgress
+            }
+        );
+    }
+
     /**
      * Créer un template de quiz
      * @endpoint post /api/quiz/template/
@@ -330,9 +542,9 @@ export class QuizTemplateApi extends BaseService {
      * @param observe set whether or not to return the data Observable as the body, response or events. defaults to returning the body.
      * @param reportProgress flag to report request and response progress.
      */
-    public quizTemplateList(requestParameters?: QuizTemplateListRequestParams, observe?: 'body', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<PaginatedQuizTemplateListDto>;
-    public quizTemplateList(requestParameters?: QuizTemplateListRequestParams, observe?: 'response', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpResponse<PaginatedQuizTemplateListDto>>;
-    public quizTemplateList(requestParameters?: QuizTemplateListRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<PaginatedQuizTemplateListDto>>;
+    public quizTemplateList(requestParameters?: QuizTemplateListRequestParams, observe?: 'body', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<PaginatedQuizTemplateListListDto>;
+    public quizTemplateList(requestParameters?: QuizTemplateListRequestParams, observe?: 'response', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpResponse<PaginatedQuizTemplateListListDto>>;
+    public quizTemplateList(requestParameters?: QuizTemplateListRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<PaginatedQuizTemplateListListDto>>;
     public quizTemplateList(requestParameters?: QuizTemplateListRequestParams, observe: any = 'body', reportProgress: boolean = false, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<any> {
         const page = requestParameters?.page;
 
@@ -370,7 +582,7 @@ export class QuizTemplateApi extends BaseService {
 
         let localVarPath = `/api/quiz/template/`;
         const { basePath, withCredentials } = this.configuration;
-        return this.httpClient.request<PaginatedQuizTemplateListDto>('get', `${basePath}${localVarPath}`,
+        return this.httpClient.request<PaginatedQuizTemplateListListDto>('get', `${basePath}${localVarPath}`,
             {
                 context: localVarHttpContext,
                 params: localVarQueryParameters,
@@ -876,6 +1088,73 @@ export class QuizTemplateApi extends BaseService {
         );
     }
 
+    /**
+     * Exporter les sessions et réponses d\&#39;un template en flux (CSV ou NDJSON)
+     * @endpoint get /api/quiz/template/{qt_id}/results-export/
+     * @param requestParameters
+     * @param observe set whether or not to return the data Observable as the body, response or events. defaults to returning the body.
+     * @param reportProgress flag to report request and response progress.
+     */
+    public quizTemplateResultsExportRetrieve(requestParameters: QuizTemplateResultsExportRetrieveRequestParams, observe?: 'body', reportProgress?: boolean, options?: {httpHeaderAccept?: 'text/csv' | 'application/x-ndjson' | 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<string>;
+    public quizTemplateResultsExportRetrieve(requestParameters: QuizTemplateResultsExportRetrieveRequestParams, observe?: 'response', reportProgress?: boolean, options?: {httpHeaderAccept?: 'text/csv' | 'application/x-ndjson' | 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpResponse<string>>;
+    public quizTemplateResultsExportRetrieve(requestParameters: QuizTemplateResultsExportRetrieveRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'text/csv' | 'application/x-ndjson' | 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<string>>;
+    public quizTemplateResultsExportRetrieve(requestParameters: QuizTemplateResultsExportRetrieveRequestParams, observe: any = 'body', reportProgress: boolean = false, options?: {httpHeaderAccept?: 'text/csv' | 'application/x-ndjson' | 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<any> {
+        const qtId = requestParameters?.qtId;
+        if (qtId === null || qtId === undefined) {
+            throw new Error('Required parameter qtId was null or undefined when calling quizTemplateResultsExportRetrieve.');
+        }
+        const exportFormat = requestParameters?.exportFormat;
+
+        let localVarQueryParameters = new HttpParams({encoder: this.encoder});
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>exportFormat, 'export_format');
+
+        let localVarHeaders = this.defaultHeaders;
+
+        // authentication (jwtAuth) required
+        localVarHeaders = this.configuration.addCredentialToHeaders('jwtAuth', 'Authorization', localVarHeaders, 'Bearer ');
+
+        const localVarHttpHeaderAcceptSelected: string | undefined = options?.httpHeaderAccept ?? this.configuration.selectHeaderAccept([
+            'text/csv',
+            'application/x-ndjson',
+            'application/json'
+        ]);
+        if (localVarHttpHeaderAcceptSelected !== undefined) {
+            localVarHeaders = localVarHeaders.set('Accept', localVarHttpHeaderAcceptSelected);
+        }
+
+        const localVarHttpContext: HttpContext = options?.context ?? new HttpContext();
+
+        const localVarTransferCache: boolean = options?.transferCache ?? true;
+
+
+        let responseType_: 'text' | 'json' | 'blob' = 'json';
+        if (localVarHttpHeaderAcceptSelected) {
+            if (localVarHttpHeaderAcceptSelected.startsWith('text')) {
+                responseType_ = 'text';
+            } else if (this.configuration.isJsonMime(localVarHttpHeaderAcceptSelected)) {
+                responseType_ = 'json';
+            } else {
+                responseType_ = 'blob';
+            }
+        }
+
+        let localVarPath = `/api/quiz/template/${this.configuration.encodeParam({name: "qtId", value: qtId, in: "path", style: "simple", explode: false, dataType: "number", dataFormat: undefined})}/results-export/`;
+        const { basePath, withCredentials } = this.configuration;
+        return this.httpClient.request<string>('get', `${basePath}${localVarPath}`,
+            {
+                context: localVarHttpContext,
+                params: localVarQueryParameters,
+                responseType: <any>responseType_,
+                ...(withCredentials ? { withCredentials } : {}),
+                headers: localVarHeaders,
+                observe: observe,
+                ...(localVarTransferCache !== undefined ? { transferCache: localVarTransferCache } : {}),
+                reportProgress: reportProgress
+            }
+        );
+    }
+
     /**
      * Détail d’un template de quiz
      * @endpoint get /api/quiz/template/{qt_id}/
@@ -950,11 +1229,20 @@ export class QuizTemplateApi extends BaseService {
         if (qtId === null || qtId === undefined) {
             throw new Error('Required parameter qtId was null or undefined when calling quizTemplateSessionsList.');
         }
+        const count = requestParameters?.count;
+        const cursor = requestParameters?.cursor;
         const page = requestParameters?.page;
+        const pagination = requestParameters?.pagination;
 
         let localVarQueryParameters = new HttpParams({encoder: this.encoder});
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>count, 'count');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>cursor, 'cursor');
         localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
           <any>page, 'page');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>pagination, 'pagination');
 
         let localVarHeaders = this.defaultHeaders;
 
@@ -29,6 +29,8 @@ import { PatchedQuizPartialUpdateRequestDto } from '../model/patched-quiz-partia
 // @ts-ignore
 import { QuizDto } from '../model/quiz';
 // @ts-ignore
+import { QuizJobDto } from '../model/quiz-job';
+// @ts-ignore
 import { QuizUpdateRequestDto } from '../model/quiz-update-request';
 
 // @ts-ignore
@@ -39,8 +41,18 @@ import { BaseService } from '../api.base.service';
 
 export interface QuizBulkCreateFromTemplateCreateRequestParams {
     bulkCreateFromTemplateInputRequestDto: BulkCreateFromTemplateInputRequestDto;
+    /** Mode curseur uniquement : ajoute &#x60;count&#x60;, estimé (&#x60;approx&#x60;) ou exact (&#x60;exact&#x60;). */
+    count?: 'approx' | 'exact';
+    /** Curseur opaque renvoyé dans &#x60;next&#x60; / &#x60;previous&#x60; (mode &#x60;pagination&#x3D;cursor&#x60;). */
+    cursor?: string;
     /** A page number within the paginated result set. */
     page?: number;
+    /** &#x60;cursor&#x60; : pagination keyset (sans COUNT ni OFFSET) au lieu des numéros de page. */
+    pagination?: 'cursor';
+}
+
+export interface QuizBulkCreateFromTemplateRetrieveRequestParams {
+    jobId: string;
 }
 
 export interface QuizCloseCreateRequestParams {
@@ -56,10 +68,16 @@ export interface QuizDestroyRequestParams {
 }
 
 export interface QuizListRequestParams {
+    /** Mode curseur uniquement : ajoute &#x60;count&#x60;, estimé (&#x60;approx&#x60;) ou exact (&#x60;exact&#x60;). */
+    count?: 'approx' | 'exact';
+    /** Curseur opaque renvoyé dans &#x60;next&#x60; / &#x60;previous&#x60; (mode &#x60;pagination&#x3D;cursor&#x60;). */
+    cursor?: string;
     /** Filtre exact (via DjangoFilterBackend). */
     name?: string;
     /** A page number within the paginated result set. */
     page?: number;
+    /** &#x60;cursor&#x60; : pagination keyset (sans COUNT ni OFFSET) au lieu des numéros de page. */
+    pagination?: 'cursor';
     /** Recherche simple (name__icontains). */
     search?: string;
 }
@@ -107,11 +125,20 @@ export class QuizApi extends BaseService {
         if (bulkCreateFromTemplateInputRequestDto === null || bulkCreateFromTemplateInputRequestDto === undefined) {
             throw new Error('Required parameter bulkCreateFromTemplateInputRequestDto was null or undefined when calling quizBulkCreateFromTemplateCreate.');
         }
+        const count = requestParameters?.count;
+        const cursor = requestParameters?.cursor;
         const page = requestParameters?.page;
+        const pagination = requestParameters?.pagination;
 
         let localVarQueryParameters = new HttpParams({encoder: this.encoder});
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>count, 'count');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>cursor, 'cursor');
         localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
           <any>page, 'page');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>pagination, 'pagination');
 
         let localVarHeaders = this.defaultHeaders;
 
@@ -169,6 +196,65 @@ export class QuizApi extends BaseService {
         );
     }
 
+    /**
+     * Avancement d\&#39;une assignation en masse (tâche de fond)
+     * @endpoint get /api/quiz/bulk-create-from-template/{job_id}/
+     * @param requestParameters
+     * @param observe set whether or not to return the data Observable as the body, response or events. defaults to returning the body.
+     * @param reportProgress flag to report request and response progress.
+     */
+    public quizBulkCreateFromTemplateRetrieve(requestParameters: QuizBulkCreateFromTemplateRetrieveRequestParams, observe?: 'body', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<QuizJobDto>;
+    public quizBulkCreateFromTemplateRetrieve(requestParameters: QuizBulkCreateFromTemplateRetrieveRequestParams, observe?: 'response', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpResponse<QuizJobDto>>;
+    public quizBulkCreateFromTemplateRetrieve(requestParameters: QuizBulkCreateFromTemplateRetrieveRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<QuizJobDto>>;
+    public quizBulkCreateFromTemplateRetrieve(requestParameters: QuizBulkCreateFromTemplateRetrieveRequestParams, observe: any = 'body', reportProgress: boolean = false, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<any> {
+        const jobId = requestParameters?.jobId;
+        if (jobId === null || jobId === undefined) {
+            throw new Error('Required parameter jobId was null or undefined when calling quizBulkCreateFromTemplateRetrieve.');
+        }
+
+        let localVarHeaders = this.defaultHeaders;
+
+        // authentication (jwtAuth) required
+        localVarHeaders = this.configuration.addCredentialToHeaders('jwtAuth', 'Authorization', localVarHeaders, 'Bearer ');
+
+        const localVarHttpHeaderAcceptSelected: string | undefined = options?.httpHeaderAccept ?? this.configuration.selectHeaderAccept([
+            'application/json'
+        ]);
+        if (localVarHttpHeaderAcceptSelected !== undefined) {
+            localVarHeaders = localVarHeaders.set('Accept', localVarHttpHeaderAcceptSelected);
+        }
+
+        const localVarHttpContext: HttpContext = options?.context ?? new HttpContext();
+
+        const localVarTransferCache: boolean = options?.transferCache ?? true;
+
+
+        let responseType_: 'text' | 'json' | 'blob' = 'json';
+        if (localVarHttpHeaderAcceptSelected) {
+            if (localVarHttpHeaderAcceptSelected.startsWith('text')) {
+                responseType_ = 'text';
+            } else if (this.configuration.isJsonMime(localVarHttpHeaderAcceptSelected)) {
+                responseType_ = 'json';
+            } else {
+                responseType_ = 'blob';
+            }
+        }
+
+        let localVarPath = `/api/quiz/bulk-create-from-template/${this.configuration.encodeParam({name: "jobId", value: jobId, in: "path", style: "simple", explode: false, dataType: "string", dataFormat: undefined})}/`;
+        const { basePath, withCredentials } = this.configuration;
+        return this.httpClient.request<QuizJobDto>('get', `${basePath}${localVarPath}`,
+            {
+                context: localVarHttpContext,
+                responseType: <any>responseType_,
+                ...(withCredentials ? { withCredentials } : {}),
+                headers: localVarHeaders,
+                observe: observe,
+                ...(localVarTransferCache !== undefined ? { transferCache: localVarTransferCache } : {}),
+                reportProgress: reportProgress
+            }
+        );
+    }
+
     /**
      * Clôturer un quiz (calcule les scores)
      * @endpoint post /api/quiz/{quiz_id}/close/
@@ -369,15 +455,24 @@ export class QuizApi extends BaseService {
     public quizList(requestParameters?: QuizListRequestParams, observe?: 'response', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpResponse<PaginatedQuizListListDto>>;
     public quizList(requestParameters?: QuizListRequestParams, observe?: 'events', reportProgress?: boolean, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<HttpEvent<PaginatedQuizListListDto>>;
     public quizList(requestParameters?: QuizListRequestParams, observe: any = 'body', reportProgress: boolean = false, options?: {httpHeaderAccept?: 'application/json', context?: HttpContext, transferCache?: boolean}): Observable<any> {
+        const count = requestParameters?.count;
+        const cursor = requestParameters?.cursor;
         const name = requestParameters?.name;
         const page = requestParameters?.page;
+        const pagination = requestParameters?.pagination;
         const search = requestParameters?.search;
 
         let localVarQueryParameters = new HttpParams({encoder: this.encoder});
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>count, 'count');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>cursor, 'cursor');
         localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
           <any>name, 'name');
         localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
           <any>page, 'page');
+        localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
+          <any>pagination, 'pagination');
         localVarQueryParameters = this.addToHttpParams(localVarQueryParameters,
           <any>search, 'search');
 
@@ -37,13 +37,15 @@ export * from './paginated-custom-user-read-list';
 export * from './paginated-domain-read-list';
 export * from './paginated-language-read-list';
 export * from './paginated-question-read-list';
+export * from './paginated-quiz-alert-message-list';
 export * from './paginated-quiz-alert-thread-list-list';
 export * from './paginated-quiz-assignment-list-list';
 export * from './paginated-quiz-list-list';
+export * from './paginated-quiz-question-answer-buffered-list';
 export * from './paginated-quiz-question-answer-list';
 export * from './paginated-quiz-question-read-list';
 export * from './paginated-quiz-simple-list';
-export * from './paginated-quiz-template-list';
+export * from './paginated-quiz-template-list-list';
 export * from './paginated-subject-read-list';
 export * from './password-change-request';
 export * from './password-reset-confirm-request';
@@ -64,9 +66,13 @@ export * from './question-answer-option-read';
 export * from './question-answer-option-write';
 export * from './question-answer-option-write-payload-request';
 export * from './question-answer-option-write-request';
+export * from './question-answer-stats';
+export * from './question-detail';
 export * from './question-in-quiz-question';
 export * from './question-in-subject';
 export * from './question-media-read';
+export * from './question-option-stats';
+export * from './question-quiz-question-stats';
 export * from './question-read';
 export * from './question-write';
 export * from './question-write-payload-request';
@@ -78,18 +84,29 @@ export * from './quiz-alert-thread-detail';
 export * from './quiz-alert-thread-list';
 export * from './quiz-assignment-list';
 export * from './quiz';
+export * from './quiz-item-analysis';
+export * from './quiz-item-option-stats';
+export * from './quiz-item-stats';
+export * from './quiz-job';
+export * from './quiz-job-status-enum';
 export * from './quiz-list';
+export * from './quiz-question-answer-batch-item-request';
+export * from './quiz-question-answer-batch-write-request';
+export * from './quiz-question-answer-buffered';
 export * from './quiz-question-answer';
 export * from './quiz-question-answer-write-request';
 export * from './quiz-question';
 export * from './quiz-question-read';
 export * from './quiz-question-write-request';
+export * from './quiz-score-bucket';
+export * from './quiz-score-stats';
 export * from './quiz-simple';
 export * from './quiz-template';
+export * from './quiz-template-list';
 export * from './quiz-template-write-request';
 export * from './quiz-update-request';
 export * from './set-current-domain-request';
-export * from './status-enum';
+export * from './status-ca5-enum';
 export * from './subject-detail';
 export * from './subject-read';
 export * from './subject-write-request';
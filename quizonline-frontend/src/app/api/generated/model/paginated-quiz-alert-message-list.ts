@@ -0,0 +1,19 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+import { QuizAlertMessageDto } from './quiz-alert-message';
+
+
+export interface PaginatedQuizAlertMessageListDto { 
+    count: number;
+    next?: string | null;
+    previous?: string | null;
+    results: Array<QuizAlertMessageDto>;
+}
+
@@ -0,0 +1,19 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+import { QuizQuestionAnswerBufferedDto } from './quiz-question-answer-buffered';
+
+
+export interface PaginatedQuizQuestionAnswerBufferedListDto { 
+    count: number;
+    next?: string | null;
+    previous?: string | null;
+    results: Array<QuizQuestionAnswerBufferedDto>;
+}
+
@@ -0,0 +1,19 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+import { QuizTemplateListDto } from './quiz-template-list';
+
+
+export interface PaginatedQuizTemplateListListDto { 
+    count: number;
+    next?: string | null;
+    previous?: string | null;
+    results: Array<QuizTemplateListDto>;
+}
+
@@ -0,0 +1,21 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+import { QuestionOptionStatsDto } from './question-option-stats';
+import { QuestionQuizQuestionStatsDto } from './question-quiz-question-stats';
+
+
+export interface QuestionAnswerStatsDto { 
+    attempts: number;
+    correct: number;
+    correct_rate: number | null;
+    options: Array<QuestionOptionStatsDto>;
+    quiz_questions: Array<QuestionQuizQuestionStatsDto>;
+}
+
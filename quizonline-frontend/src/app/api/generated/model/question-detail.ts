@@ -0,0 +1,35 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+import { QuestionAnswerOptionReadDto } from './question-answer-option-read';
+import { QuestionMediaReadDto } from './question-media-read';
+import { SubjectReadDto } from './subject-read';
+import { LocalizedQuestionTranslationDto } from './localized-question-translation';
+import { DomainReadDto } from './domain-read';
+import { QuestionAnswerStatsDto } from './question-answer-stats';
+
+
+/**
+ * Détail d\'une question pour les gestionnaires du domaine : ajoute les statistiques de réponse des quiz.
+ */
+export interface QuestionDetailDto { 
+    readonly id: number;
+    readonly domain: DomainReadDto;
+    readonly translations: { [key: string]: LocalizedQuestionTranslationDto; };
+    readonly allow_multiple_correct: boolean;
+    readonly active: boolean;
+    readonly is_mode_practice: boolean;
+    readonly is_mode_exam: boolean;
+    readonly subjects: Array<SubjectReadDto>;
+    readonly answer_options: Array<QuestionAnswerOptionReadDto>;
+    readonly media: Array<QuestionMediaReadDto>;
+    readonly created_at: string;
+    readonly answer_stats: QuestionAnswerStatsDto;
+}
+
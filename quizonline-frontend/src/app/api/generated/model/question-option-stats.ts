@@ -0,0 +1,16 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+
+export interface QuestionOptionStatsDto { 
+    answer_option_id: number;
+    picks: number;
+}
+
@@ -0,0 +1,18 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+
+export interface QuestionQuizQuestionStatsDto { 
+    quizquestion_id: number;
+    quiz_template_id: number;
+    attempts: number;
+    correct: number;
+}
+
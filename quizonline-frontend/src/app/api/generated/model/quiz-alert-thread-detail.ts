@@ -7,11 +7,14 @@
  * https://openapi-generator.tech
  * Do not edit the class manually.
  */
-import { StatusEnumDto } from './status-enum';
 import { UserSummaryDto } from './user-summary';
 import { QuizAlertMessageDto } from './quiz-alert-message';
+import { StatusCa5EnumDto } from './status-ca5-enum';
 
 
+/**
+ * Détail d\'une conversation : seuls les ALERT_THREAD_INLINE_MESSAGES derniers messages sont inclus (ordre chronologique) ; les plus anciens se lisent via alerts/{alert_id}/messages/.
+ */
 export interface QuizAlertThreadDetailDto { 
     readonly id: number;
     readonly quiz: number;
@@ -21,13 +24,14 @@ export interface QuizAlertThreadDetailDto {
     readonly question_title: string;
     readonly quiz_template_title: string;
     readonly reported_language: string;
-    readonly status: StatusEnumDto;
+    readonly status: StatusCa5EnumDto;
     readonly reporter_reply_allowed: boolean;
     readonly last_message_at: string;
     readonly created_at: string;
     readonly unread: boolean;
     readonly unread_count: number;
     readonly last_message_preview: string;
+    readonly last_message_author: number | null;
     readonly counterpart_username: string;
     readonly reporter: number;
     readonly reporter_summary: UserSummaryDto | null;
@@ -36,6 +40,7 @@ export interface QuizAlertThreadDetailDto {
     readonly closed_at: string | null;
     readonly closed_by: number | null;
     readonly messages: Array<QuizAlertMessageDto>;
+    readonly has_more_messages: boolean;
     readonly can_reply: boolean;
     readonly can_manage: boolean;
 }
@@ -7,7 +7,7 @@
  * https://openapi-generator.tech
  * Do not edit the class manually.
  */
-import { StatusEnumDto } from './status-enum';
+import { StatusCa5EnumDto } from './status-ca5-enum';
 
 
 export interface QuizAlertThreadListDto { 
@@ -19,13 +19,14 @@ export interface QuizAlertThreadListDto {
     readonly question_title: string;
     readonly quiz_template_title: string;
     readonly reported_language: string;
-    readonly status: StatusEnumDto;
+    readonly status: StatusCa5EnumDto;
     readonly reporter_reply_allowed: boolean;
     readonly last_message_at: string;
     readonly created_at: string;
     readonly unread: boolean;
     readonly unread_count: number;
     readonly last_message_preview: string;
+    readonly last_message_author: number | null;
     readonly counterpart_username: string;
 }
 
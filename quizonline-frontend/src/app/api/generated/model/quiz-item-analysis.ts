@@ -0,0 +1,28 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+import { QuizScoreStatsDto } from './quiz-score-stats';
+import { QuizItemStatsDto } from './quiz-item-stats';
+
+
+/**
+ * Analyse d\'items d\'un template sur ses sessions fermées et finalisées : difficulty = taux de réussite (p-value), discrimination = point-bisériale avec le score du reste du quiz.
+ */
+export interface QuizItemAnalysisDto { 
+    quiz_template_id: number;
+    answer_key_version: number;
+    computed_at: string;
+    /**
+     * Sessions fermées exclues, en attente de réconciliation avec la clé de correction courante.
+     */
+    stale_sessions: number;
+    score: QuizScoreStatsDto;
+    questions: Array<QuizItemStatsDto>;
+}
+
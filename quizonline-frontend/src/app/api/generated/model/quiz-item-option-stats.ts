@@ -0,0 +1,18 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+
+export interface QuizItemOptionStatsDto { 
+    answer_option_id: number;
+    is_correct: boolean;
+    count: number;
+    frequency: number | null;
+}
+
@@ -0,0 +1,25 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+import { QuizItemOptionStatsDto } from './quiz-item-option-stats';
+
+
+export interface QuizItemStatsDto { 
+    quizquestion_id: number;
+    question_id: number;
+    sort_order: number;
+    weight: number;
+    answers: number;
+    correct: number;
+    omitted: number;
+    difficulty: number | null;
+    discrimination: number | null;
+    options: Array<QuizItemOptionStatsDto>;
+}
+
@@ -0,0 +1,25 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+
+/**
+ * * `pending` - pending * `running` - running * `done` - done * `failed` - failed
+ */
+export enum QuizJobStatusEnumDto {
+
+    Pending = 'pending',
+
+    Running = 'running',
+
+    Done = 'done',
+
+    Failed = 'failed'
+}
+
@@ -0,0 +1,25 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+import { QuizJobStatusEnumDto } from './quiz-job-status-enum';
+
+
+export interface QuizJobDto { 
+    id: string;
+    kind: string;
+    status: QuizJobStatusEnumDto;
+    total: number;
+    processed: number;
+    error: string;
+    quiz_template_id?: number;
+    skipped?: number;
+}
+
+
+
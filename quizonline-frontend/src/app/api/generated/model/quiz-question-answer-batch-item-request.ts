@@ -0,0 +1,23 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+
+export interface QuizQuestionAnswerBatchItemRequestDto { 
+    /**
+     * ID de la Question (optionnel)
+     */
+    question_id?: number;
+    /**
+     * Ordre de la question dans le template (optionnel)
+     */
+    question_order?: number;
+    selected_options?: Array<number>;
+}
+
@@ -0,0 +1,19 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+import { QuizQuestionAnswerBatchItemRequestDto } from './quiz-question-answer-batch-item-request';
+
+
+/**
+ * Enregistre plusieurs réponses d\'un même quiz en une seule requête. Toutes les réponses sont validées en une passe contre les QuizQuestion du template (une requête pour les questions, une pour les options).
+ */
+export interface QuizQuestionAnswerBatchWriteRequestDto { 
+    answers: Array<QuizQuestionAnswerBatchItemRequestDto>;
+}
+
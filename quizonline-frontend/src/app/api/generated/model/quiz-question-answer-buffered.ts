@@ -0,0 +1,22 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+
+/**
+ * Réponse acquittée en mode QUIZ_ANSWER_WRITE_BEHIND : pas encore en base, donc sans id ni answered_at. `sequence` est le numéro de l\'entrée dans le tampon de la session.
+ */
+export interface QuizQuestionAnswerBufferedDto { 
+    readonly quizquestion_id: number;
+    readonly question_id: number;
+    readonly question_order: number;
+    readonly selected_options: Array<number>;
+    readonly sequence: number;
+}
+
@@ -0,0 +1,20 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+import { QuizScoreBucketDto } from './quiz-score-bucket';
+
+
+export interface QuizScoreStatsDto { 
+    sessions: number;
+    max_score: number;
+    mean: number | null;
+    std: number | null;
+    distribution: Array<QuizScoreBucketDto>;
+}
+
@@ -0,0 +1,61 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+import { ModeEnumDto } from './mode-enum';
+import { LocalizedQuizTemplateTranslationDto } from './localized-quiz-template-translation';
+import { VisibilityEnumDto } from './visibility-enum';
+
+
+/**
+ * Liste des templates : mêmes champs que QuizTemplateSerializer sans quiz_questions (le détail les expose) ; lit la projection quiz_template_list_queryset().
+ */
+export interface QuizTemplateListDto { 
+    readonly id: number;
+    domain: number;
+    readonly title: string;
+    readonly slug: string;
+    mode?: ModeEnumDto;
+    readonly description: string;
+    readonly translations: { [key: string]: LocalizedQuizTemplateTranslationDto; };
+    /**
+     * Nombre de questions à poser parmi le pool lié.
+     */
+    max_questions?: number;
+    permanent?: boolean;
+    started_at?: string | null;
+    ended_at?: string | null;
+    with_duration?: boolean;
+    duration?: number;
+    active?: boolean;
+    readonly created_at: string;
+    readonly questions_count: number;
+    readonly can_answer: boolean;
+    /**
+     * Quand le score global du quiz peut être affiché à l\'utilisateur.  * `immediate` - Immédiat * `scheduled` - À partir d\'une date * `never` - Jamais
+     */
+    result_visibility?: VisibilityEnumDto;
+    /**
+     * Utilisé uniquement si la visibilité est \'À partir d\'une date\'.
+     */
+    result_available_at?: string | null;
+    /**
+     * Quand les réponses détaillées (réponses de l\'utilisateur et bonnes réponses) peuvent être affichées.  * `immediate` - Immédiat * `scheduled` - À partir d\'une date * `never` - Jamais
+     */
+    detail_visibility?: VisibilityEnumDto;
+    /**
+     * Utilisé uniquement si la visibilité est \'À partir d\'une date\'.
+     */
+    detail_available_at?: string | null;
+    is_public?: boolean;
+    readonly created_by: number;
+    readonly created_by_username: string;
+}
+
+
+
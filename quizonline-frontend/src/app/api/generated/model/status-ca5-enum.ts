@@ -0,0 +1,21 @@
+/**
+ * QuizOnline API
+ *
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+
+/**
+ * * `open` - Open * `closed` - Closed
+ */
+export enum StatusCa5EnumDto {
+
+    Open = 'open',
+
+    Closed = 'closed'
+}
+
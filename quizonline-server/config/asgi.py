@@ -3,6 +3,9 @@ ASGI config for quizonline-server project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+The event stream (``/api/quiz/events/stream/``, quiz.event_stream) is an async view:
+serve it with an ASGI server (uvicorn, daphne) so that open connections do not hold worker threads.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max, Q, QuerySet, Sum
+from django.utils import timezone, translation
+from django.utils.cache import patch_vary_headers
+from django.utils.crypto import salted_hmac
+from django.utils.http import http_date, parse_etags
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+ETAG_SALT = "config.conditional.etag"
+
+
+class _NotModified(APIException):
+    status_code = status.HTTP_304_NOT_MODIFIED
+
+
+def queryset_version(
+    queryset: QuerySet,
+    *,
+    fields: Iterable[str] = (),
+    sums: Iterable = (),
+    time_fields: Iterable[str] = (),
+    flags: Iterable[str] = (),
+) -> tuple:
+    """
+    Jeton de version d'un queryset en une seule requête d'agrégation.
+    - nombre de lignes et somme des pk : détectent ajouts, suppressions et changements de périmètre ;
+    - `fields` : Max() des horodatages (updated_at, ...) ou compteurs de version ;
+    - `sums` : Sum() de colonnes ou d'expressions (réordonnancement, scores) ;
+    - `time_fields` : nombre de bornes temporelles déjà franchies, pour les champs calculés
+      à partir de l'heure courante (can_answer, visibilité des résultats) ;
+    - `flags` : nombre de lignes où le booléen est vrai.
+    Le queryset est réduit à ses pk : annotations, prefetch et tri ne sont pas évalués.
+    """
+    now = timezone.now()
+    base = queryset.model._base_manager.filter(pk__in=queryset.order_by().values("pk"))
+    aggregates = {"rows": Count("pk", distinct=True), "checksum": Sum("pk")}
+    for index, field in enumerate(fields):
+        aggregates[f"max_{index}"] = Max(field)
+    for index, expression in enumerate(sums):
+        aggregates[f"sum_{index}"] = Sum(expression)
+    for index, field in enumerate(time_fields):
+        aggregates[f"passed_{index}"] = Count("pk", filter=Q(**{f"{field}__lte": now}), distinct=True)
+    for index, field in enumerate(flags):
+        aggregates[f"flag_{index}"] = Count("pk", filter=Q(**{field: True}), distinct=True)
+    return tuple(sorted(base.aggregate(**aggregates).items()))
+
+
+def _latest_datetime(parts: Iterable[tuple]) -> datetime | None:
+    values = [value for part in parts for _, value in part if isinstance(value, datetime)]
+    return max(values) if values else None
+
+
+# Réponses conditionnelles (ETag / Last-Modified) pour les lectures list/retrieve.
+# Le jeton de version est calculé dans `initial()`, avant toute sérialisation :
+# si l'ETag envoyé dans If-None-Match correspond, la vue répond 304 sans exécuter le handler.
+# L'ETag dépend aussi de l'utilisateur, de la langue et de l'URL complète (filtres, pagination).
+# Les vues décrivent leurs entrées via les attributs `conditional_*` ou surchargent
+# `get_conditional_version_parts()` pour y ajouter les relations sérialisées.
+# Last-Modified est informatif : seul l'ETag couvre les suppressions de lignes liées.
+# `conditional_page_scope` : la version d'une liste paginée ne porte que sur les lignes de la page
+# demandée (plus total et liens de pagination), pas sur tout le queryset filtré.
+# (Pas de docstring : drf-spectacular la reprendrait comme description de chaque opération.)
+class ConditionalGetMixin:
+    conditional_actions = frozenset({"list", "retrieve"})
+    conditional_fields: tuple = ("updated_at",)
+    conditional_sums: tuple = ()
+    conditional_time_fields: tuple = ()
+    conditional_flags: tuple = ()
+    conditional_page_scope = False
+
+    def get_conditional_queryset(self) -> QuerySet:
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == "retrieve":
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        elif self.action == "list" and self.conditional_page_scope:
+            queryset = self.conditional_page_queryset(queryset)
+        return queryset
+
+    def conditional_page_queryset(self, queryset: QuerySet) -> QuerySet:
+        """
+        Réduit le queryset de la liste à la page demandée, paginée comme le fera le handler
+        (COUNT en pagination par page, aucun en keyset) ; total et liens entrent dans la version.
+        """
+        self._conditional_page = None
+        if self.pagination_class is None:
+            return queryset
+        paginator = self.pagination_class()
+        ordering = getattr(self, "cursor_ordering", None) or ()
+        page = paginator.paginate_queryset(
+            queryset.values("pk", *{field.lstrip("-") for field in ordering}),
+            self.request,
+            view=self,
+        )
+        if page is None:
+            return queryset
+        meta = paginator.get_paginated_response([]).data
+        self._conditional_page = tuple(sorted((key, value) for key, value in meta.items() if key != "results"))
+        return queryset.model._base_manager.filter(pk__in=[row["pk"] for row in page])
+
+    def get_conditional_version_parts(self, queryset: QuerySet) -> list[tuple]:
+        parts = [
+            queryset_version(
+                queryset,
+                fields=self.conditional_fields,
+                sums=self.conditional_sums,
+                time_fields=self.conditional_time_fields,
+                flags=self.conditional_flags,
+            )
+        ]
+        page = getattr(self, "_conditional_page", None)
+        if self.action == "list" and page is not None:
+            parts.append(page)
+        return parts
+
+    def _conditional_etag(self, parts: list[tuple]) -> str:
+        request = self.request
+        payload = repr((
+            self.__class__.__name__,
+            getattr(request.user, "pk", None),
+            translation.get_language(),
+            request.get_full_path(),
+            request.META.get("HTTP_ACCEPT", ""),
+            parts,
+        ))
+        return f'W/"{salted_hmac(ETAG_SALT, payload).hexdigest()[:32]}"'
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._conditional_headers = {}
+        if request.method not in ("GET", "HEAD") or self.action not in self.conditional_actions:
+            return
+
+        try:
+            parts = self.get_conditional_version_parts(self.get_conditional_queryset())
+        except (TypeError, ValueError, ValidationError):
+            # Identifiant mal formé : le handler répondra 404 comme avant.
+            return
+        etag = self._conditional_etag(parts)
+        self._conditional_headers["ETag"] = etag
+        last_modified = _latest_datetime(parts)
+        if last_modified is not None:
+            self._conditional_headers["Last-Modified"] = http_date(last_modified.timestamp())
+
+        if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+        if if_none_match:
+            # Comparaison faible (RFC 9110 §13.1.2) : le préfixe W/ est ignoré.
+            expected = etag.removeprefix("W/")
+            if any(tag.removeprefix("W/") == expected for tag in parse_etags(if_none_match)):
+                raise _NotModified()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        headers = getattr(self, "_conditional_headers", None)
+        if headers and response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            for name, value in headers.items():
+                response[name] = value
+            # Le navigateur garde la réponse mais la revalide à chaque lecture (If-None-Match).
+            response["Cache-Control"] = "private, no-cache"
+            patch_vary_headers(response, ("Accept", "Accept-Language", "Authorization", "Cookie"))
+        return response
@@ -1,12 +1,51 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
+from django.core.cache import cache
+
+from config.versioned_cache import cache_version, invalidate_cache_versions
+
+DOMAIN_ROLES_CACHE_PREFIX = "domain:roles"
+DOMAIN_ROLES_CACHE_TIMEOUT = 60 * 60
+
+
+def invalidate_domain_roles(user_ids: Iterable[int | None]) -> None:
+    """Rend inatteignables les rôles de domaine mis en cache pour ces utilisateurs (config.versioned_cache)."""
+    invalidate_cache_versions(DOMAIN_ROLES_CACHE_PREFIX, [user_id for user_id in user_ids if user_id is not None])
+
+
+def _domain_roles(user) -> tuple[frozenset[int], frozenset[int]]:
+    """
+    (domaines gérables, domaines visibles) d'un utilisateur non superuser, depuis le cache Django.
+    Les deux requêtes OR + DISTINCT ne tournent qu'à la construction ; la version est incrémentée
+    par domain.signals (managers, members, owner, active, création, suppression).
+    """
+    # date_joined protège contre la réutilisation d'un id (base réinitialisée, restauration).
+    date_joined = getattr(user, "date_joined", None)
+    joined = date_joined.timestamp() if date_joined else ""
+    key = f"{DOMAIN_ROLES_CACHE_PREFIX}:{user.pk}:{joined}:{cache_version(DOMAIN_ROLES_CACHE_PREFIX, user.pk)}"
+    roles = cache.get(key)
+    if roles is None:
+        roles = (
+            frozenset(user.get_manageable_domains().values_list("id", flat=True)),
+            frozenset(user.get_visible_domains().values_list("id", flat=True)),
+        )
+        cache.set(key, roles, DOMAIN_ROLES_CACHE_TIMEOUT)
+    return roles
+
 
 def manageable_domain_ids(user) -> set[int]:
     if not user or not getattr(user, "is_authenticated", False):
         return set()
     cache_attr = "_manageable_domain_ids_cache"
     if not hasattr(user, cache_attr):
-        setattr(user, cache_attr, set(user.get_manageable_domains().values_list("id", flat=True)))
+        if getattr(user, "is_superuser", False):
+            # Tous les domaines : pas de jointure, et pas de cache partagé à invalider à chaque création.
+            ids = set(user.get_manageable_domains().values_list("id", flat=True))
+        else:
+            ids = set(_domain_roles(user)[0])
+        setattr(user, cache_attr, ids)
     return getattr(user, cache_attr)
 
 
@@ -15,7 +54,11 @@ def visible_domain_ids(user) -> set[int]:
         return set()
     cache_attr = "_visible_domain_ids_cache"
     if not hasattr(user, cache_attr):
-        setattr(user, cache_attr, set(user.get_visible_domains().values_list("id", flat=True)))
+        if getattr(user, "is_superuser", False):
+            ids = set(user.get_visible_domains().values_list("id", flat=True))
+        else:
+            ids = set(_domain_roles(user)[1])
+        setattr(user, cache_attr, ids)
     return getattr(user, cache_attr)
 
 
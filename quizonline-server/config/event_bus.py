@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+EVENT_CHANNEL_PREFIX = "events:user:"
+
+# Diffusion d'événements vers les utilisateurs connectés au flux SSE (quiz.event_stream).
+# Le bus est choisi par EVENT_BUS_URL :
+# - vide : bus en mémoire du process (InProcessEventBus), suffisant avec un seul process ASGI (dev, tests) ;
+# - redis://... : pub/sub Redis (RedisEventBus), pour plusieurs process web et les workers Celery.
+# Les publications partent au commit de la transaction courante et sont « au mieux » :
+# un bus indisponible est journalisé sans faire échouer l'écriture, les clients resynchronisent
+# leurs compteurs à la (re)connexion.
+
+
+class EventSubscription:
+    """Connexion abonnée : file asyncio alimentée par le bus, lue par le flux de la connexion."""
+
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[str] = asyncio.Queue()
+
+    async def next_message(self, timeout: float) -> str | None:
+        """Message suivant, ou None après `timeout` secondes sans événement (battement de cœur)."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+
+class InProcessEventBus:
+    """Abonnés du process courant ; `publish` est appelable depuis n'importe quel thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: dict[int, set[EventSubscription]] = {}
+
+    def publish(self, user_ids: Iterable[int], message: str) -> None:
+        self.deliver(user_ids, message)
+
+    def publish_many(self, items: Iterable[tuple[Iterable[int], str]]) -> None:
+        for user_ids, message in items:
+            self.publish(user_ids, message)
+
+    def deliver(self, user_ids: Iterable[int], message: str) -> None:
+        with self._lock:
+            targets = [
+                subscription
+                for user_id in set(user_ids)
+                for subscription in self._subscriptions.get(user_id, ())
+            ]
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.queue.put_nowait, message)
+            except RuntimeError:
+                # Boucle fermée : la connexion est partie, son désabonnement suit.
+                continue
+
+    def subscriber_count(self, user_id: int) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(user_id, ()))
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: int) -> AsyncIterator[EventSubscription]:
+        subscription = EventSubscription(user_id)
+        with self._lock:
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                remaining = self._subscriptions.get(user_id, set())
+                remaining.discard(subscription)
+                if not remaining:
+                    self._subscriptions.pop(user_id, None)
+
+
+class RedisEventBus(InProcessEventBus):
+    """
+    Publication sur un canal Redis par utilisateur ; chaque process ASGI tient une seule connexion
+    d'écoute (PSUBSCRIBE sur tous les canaux) et redistribue aux abonnés locaux.
+    Un process reçoit donc tous les événements : ils sont courts et peu fréquents, et cela évite
+    une connexion Redis par client connecté.
+    """
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+        self._publisher = None
+        self._listener: asyncio.Task | None = None
+
+    def publish(self, user_ids: Iterable[int], message: str) -> None:
+        self.publish_many([(user_ids, message)])
+
+    def publish_many(self, items: Iterable[tuple[Iterable[int], str]]) -> None:
+        """Un seul aller-retour Redis pour tout un lot (assignations en masse)."""
+        import redis
+
+        if self._publisher is None:
+            self._publisher = redis.Redis.from_url(self.url)
+        pipeline = self._publisher.pipeline(transaction=False)
+        for user_ids, message in items:
+            for user_id in sorted(set(user_ids)):
+                pipeline.publish(f"{EVENT_CHANNEL_PREFIX}{user_id}", message)
+        pipeline.execute()
+
+    def receive(self, channel, data) -> None:
+        """Redistribue un message Redis (canal `events:user:<id>`) aux abonnés locaux."""
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        if isinstance(data, bytes):
+            data = data.decode()
+        user_id = channel.removeprefix(EVENT_CHANNEL_PREFIX)
+        if user_id.isdigit():
+            self.deliver([int(user_id)], data)
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: int) -> AsyncIterator[EventSubscription]:
+        self._ensure_listener()
+        async with super().subscribe(user_id) as subscription:
+            yield subscription
+
+    def _ensure_listener(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._listener is None or self._listener.done() or self._listener.get_loop() is not loop:
+            self._listener = loop.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        from redis import asyncio as redis_asyncio
+        from redis.exceptions import RedisError
+
+        while True:
+            client = redis_asyncio.Redis.from_url(self.url)
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(f"{EVENT_CHANNEL_PREFIX}*")
+                async for message in pubsub.listen():
+                    self.receive(message["channel"], message["data"])
+            except RedisError:
+                logger.warning("Event bus: connexion Redis perdue, nouvelle tentative", exc_info=True)
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+                await client.aclose()
+
+
+_buses: dict[str, InProcessEventBus] = {}
+_buses_lock = threading.Lock()
+
+
+def get_event_bus() -> InProcessEventBus:
+    """Bus du process pour EVENT_BUS_URL (une instance par URL)."""
+    url = getattr(settings, "EVENT_BUS_URL", "") or ""
+    with _buses_lock:
+        bus = _buses.get(url)
+        if bus is None:
+            bus = RedisEventBus(url) if url else InProcessEventBus()
+            _buses[url] = bus
+    return bus
+
+
+def encode_event(event: str, data: dict) -> str:
+    return json.dumps({"event": event, "data": data}, cls=DjangoJSONEncoder)
+
+
+def _publish_now(user_ids: set[int], message: str) -> None:
+    try:
+        get_event_bus().publish(user_ids, message)
+    except Exception:
+        logger.warning("Event bus: publication impossible", exc_info=True)
+
+
+def _publish_many_now(items: list[tuple[set[int], str]]) -> None:
+    try:
+        get_event_bus().publish_many(items)
+    except Exception:
+        logger.warning("Event bus: publication impossible", exc_info=True)
+
+
+def publish_event(user_ids: Iterable[int | None], event: str, data: dict) -> None:
+    """Pousse `event` aux utilisateurs donnés au commit de la transaction courante (rien si elle est annulée)."""
+    user_ids = {user_id for user_id in user_ids if user_id}
+    if not user_ids:
+        return
+    message = encode_event(event, data)
+    transaction.on_commit(lambda: _publish_now(user_ids, message))
+
+
+def publish_events(events: Iterable[tuple[Iterable[int | None], str, dict]]) -> None:
+    """Variante groupée de publish_event : un seul callback au commit et un seul envoi au bus."""
+    items = []
+    for user_ids, event, data in events:
+        user_ids = {user_id for user_id in user_ids if user_id}
+        if user_ids:
+            items.append((user_ids, encode_event(event, data)))
+    if not items:
+        return
+    transaction.on_commit(lambda: _publish_many_now(items))
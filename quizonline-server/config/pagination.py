@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import json
+
+from django.db import connections
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+
+PAGINATION_QUERY_PARAM = "pagination"
+COUNT_QUERY_PARAM = "count"
+COUNT_MODES = ("approx", "exact")
+
+
+def approximate_count(queryset) -> int:
+    """
+    Nombre de lignes estimé par le planificateur PostgreSQL (EXPLAIN), sans parcourir la table.
+    Les autres moteurs (SQLite en dev/test) retournent le COUNT exact.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+    sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class _KeysetPagination(CursorPagination):
+    """Pagination par curseur (keyset) : ni COUNT ni OFFSET, coût constant quelle que soit la page."""
+
+    def __init__(self, *, ordering, page_size, page_size_query_param, max_page_size):
+        self.ordering = ordering
+        self.page_size = page_size
+        self.page_size_query_param = page_size_query_param
+        self.max_page_size = max_page_size
+
+    def get_ordering(self, request, queryset, view):
+        # L'ordre est celui déclaré par la vue, pas celui d'un éventuel OrderingFilter.
+        return tuple(self.ordering)
+
+
+class OptionalCursorPagination(PageNumberPagination):
+    """
+    Pagination par numéro de page par défaut (clients existants inchangés).
+    `?pagination=cursor` bascule la requête en keyset sur `cursor_ordering` de la vue ;
+    les liens next/previous conservent ce paramètre.
+    `?count=approx|exact` ajoute un total au mode curseur (estimation du planificateur ou COUNT).
+    Une vue sans `cursor_ordering` reste en pagination par page.
+    """
+
+    cursor_query_param = "cursor"
+
+    def _cursor_ordering(self, view):
+        return getattr(view, "cursor_ordering", None) if view is not None else None
+
+    def use_cursor(self, request, view=None) -> bool:
+        requested = request.query_params.get(PAGINATION_QUERY_PARAM) == "cursor"
+        return requested and self._cursor_ordering(view) is not None and self.get_page_size(request) is not None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self._keyset = None
+        if not self.use_cursor(request, view):
+            return super().paginate_queryset(queryset, request, view)
+
+        count_mode = request.query_params.get(COUNT_QUERY_PARAM)
+        if count_mode is not None and count_mode not in COUNT_MODES:
+            raise ValidationError({COUNT_QUERY_PARAM: f"Expected one of: {', '.join(COUNT_MODES)}."})
+
+        self._keyset = _KeysetPagination(
+            ordering=self._cursor_ordering(view),
+            page_size=self.get_page_size(request),
+            page_size_query_param=self.page_size_query_param,
+            max_page_size=self.max_page_size,
+        )
+        self._keyset_count = None
+        if count_mode == "approx":
+            self._keyset_count = approximate_count(queryset)
+        elif count_mode == "exact":
+            self._keyset_count = queryset.count()
+        return self._keyset.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self._keyset is None:
+            return super().get_paginated_response(data)
+        payload = {
+            "next": self._keyset.get_next_link(),
+            "previous": self._keyset.get_previous_link(),
+            "results": data,
+        }
+        if self._keyset_count is not None:
+            payload = {"count": self._keyset_count, **payload}
+        return Response(payload)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        if self._cursor_ordering(view) is None:
+            return parameters
+        return [
+            *parameters,
+            {
+                "name": PAGINATION_QUERY_PARAM,
+                "required": False,
+                "in": "query",
+                "description": "`cursor` : pagination keyset (sans COUNT ni OFFSET) au lieu des numéros de page.",
+                "schema": {"type": "string", "enum": ["cursor"]},
+            },
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Curseur opaque renvoyé dans `next` / `previous` (mode `pagination=cursor`).",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": COUNT_QUERY_PARAM,
+                "required": False,
+                "in": "query",
+                "description": "Mode curseur uniquement : ajoute `count`, estimé (`approx`) ou exact (`exact`).",
+                "schema": {"type": "string", "enum": list(COUNT_MODES)},
+            },
+        ]
@@ -27,6 +27,7 @@ env = environ.Env(
     DEEPL_IS_FREE=(bool, False),
     DATABASE_URL=(str, ""),
     CACHE_URL=(str, "locmemcache://"),
+    THROTTLE_CACHE_ALIAS=(str, "default"),
     DB_CONN_MAX_AGE=(int, 0),
     CELERY_BROKER_URL=(str, "redis://127.0.0.1:6379/0"),
     CELERY_RESULT_BACKEND=(str, "redis://127.0.0.1:6379/1"),
@@ -34,6 +35,16 @@ env = environ.Env(
     API_PAGE_SIZE=(int, 20),
     QUIZ_ASSIGNMENT_ALERT_CLOSE_IMMEDIATELY=(bool, True),
     QUIZ_ASSIGNMENT_ALERT_REPORTER_REPLY_ALLOWED=(bool, True),
+    QUIZ_SQL_SCORING=(bool, True),
+    QUIZ_SCORE_ON_WRITE=(bool, False),
+    QUIZ_EXPIRY_SWEEPER_ENABLED=(bool, False),
+    QUIZ_EXPIRY_SWEEP_INTERVAL=(int, 60),
+    QUIZ_ANSWER_WRITE_BEHIND=(bool, False),
+    QUIZ_ANSWER_FLUSH_INTERVAL=(int, 5),
+    QUIZ_BULK_ASSIGN_SYNC_LIMIT=(int, 200),
+    EVENT_BUS_URL=(str, ""),
+    EVENT_STREAM_HEARTBEAT=(int, 25),
+    EVENT_STREAM_TICKET_MAX_AGE=(int, 60),
     DATA_UPLOAD_MAX_MEMORY_SIZE=(int, 10 * 1024 * 1024),
     FILE_UPLOAD_MAX_MEMORY_SIZE=(int, 10 * 1024 * 1024),
     MAX_UPLOAD_FILE_SIZE=(int, 10 * 1024 * 1024),
@@ -114,6 +125,8 @@ DATABASES = {"default": env.db("DATABASE_URL", default="sqlite:///db.sqlite3")}
 DATABASES["default"]["CONN_MAX_AGE"] = env.int("DB_CONN_MAX_AGE")
 
 CACHES = {"default": env.cache("CACHE_URL")}
+# Compteurs des throttles (customuser.throttling) : un cache partagé (redis) rend les limites globales aux workers.
+THROTTLE_CACHE_ALIAS = env("THROTTLE_CACHE_ALIAS")
 
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -147,7 +160,7 @@ REST_FRAMEWORK = {
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_FILTER_BACKENDS": ["django_filters.rest_framework.DjangoFilterBackend"],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "config.pagination.OptionalCursorPagination",
     "PAGE_SIZE": env("API_PAGE_SIZE"),
     "DEFAULT_THROTTLE_RATES": {
         "token_obtain": "5/min",
@@ -205,11 +218,31 @@ CELERY_BROKER_URL = env("CELERY_BROKER_URL")
 CELERY_RESULT_BACKEND = env("CELERY_RESULT_BACKEND")
 CELERY_TASK_ALWAYS_EAGER = env("CELERY_TASK_ALWAYS_EAGER")
 CELERY_TASK_EAGER_PROPAGATES = True
+CELERY_BEAT_SCHEDULE = {
+    "quiz-expire-sessions": {
+        "task": "quiz.tasks.expire_quiz_sessions_task",
+        "schedule": env("QUIZ_EXPIRY_SWEEP_INTERVAL"),
+    },
+    "quiz-flush-answer-buffers": {
+        "task": "quiz.tasks.flush_answer_buffers_task",
+        "schedule": env("QUIZ_ANSWER_FLUSH_INTERVAL"),
+    },
+}
 DATA_UPLOAD_MAX_MEMORY_SIZE = env("DATA_UPLOAD_MAX_MEMORY_SIZE")
 FILE_UPLOAD_MAX_MEMORY_SIZE = env("FILE_UPLOAD_MAX_MEMORY_SIZE")
 MAX_UPLOAD_FILE_SIZE = env("MAX_UPLOAD_FILE_SIZE")
 QUIZ_ASSIGNMENT_ALERT_CLOSE_IMMEDIATELY = env("QUIZ_ASSIGNMENT_ALERT_CLOSE_IMMEDIATELY")
 QUIZ_ASSIGNMENT_ALERT_REPORTER_REPLY_ALLOWED = env("QUIZ_ASSIGNMENT_ALERT_REPORTER_REPLY_ALLOWED")
+QUIZ_SQL_SCORING = env("QUIZ_SQL_SCORING")
+QUIZ_SCORE_ON_WRITE = env("QUIZ_SCORE_ON_WRITE")
+QUIZ_EXPIRY_SWEEPER_ENABLED = env("QUIZ_EXPIRY_SWEEPER_ENABLED")
+QUIZ_ANSWER_WRITE_BEHIND = env("QUIZ_ANSWER_WRITE_BEHIND")
+# Au-delà de ce nombre de destinataires, bulk-create-from-template passe en tâche de fond (202 + job).
+QUIZ_BULK_ASSIGN_SYNC_LIMIT = env("QUIZ_BULK_ASSIGN_SYNC_LIMIT")
+# Flux d'événements (config.event_bus) : vide = bus en mémoire (un seul process), sinon URL Redis pub/sub.
+EVENT_BUS_URL = env("EVENT_BUS_URL")
+EVENT_STREAM_HEARTBEAT = env("EVENT_STREAM_HEARTBEAT")
+EVENT_STREAM_TICKET_MAX_AGE = env("EVENT_STREAM_TICKET_MAX_AGE")
 
 SENSITIVE_FIELDS = {
     "password",
@@ -3,6 +3,10 @@ from .settings_base import *  # noqa: F403,F401
 DEBUG = False
 
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+# Cache et compteurs de throttling en mémoire du processus, indépendamment de CACHE_URL.
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+THROTTLE_CACHE_ALIAS = "default"
+
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
 
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+
+# Invalidation par version : chaque portée (utilisateur, catalogue, ...) d'un préfixe a un compteur
+# dans le cache Django, inclus dans la clé des entrées calculées pour elle. Incrémenter le compteur
+# rend ces entrées inatteignables ; elles expirent d'elles-mêmes.
+
+
+def _version_key(prefix: str, scope) -> str:
+    return f"{prefix}:version:{scope}"
+
+
+def cache_version(prefix: str, scope) -> int:
+    """Version courante d'une portée, à inclure dans la clé des entrées mises en cache."""
+    # Initialisée à l'horloge : une version évincée puis recréée ne retombe pas sur une ancienne entrée.
+    key = _version_key(prefix, scope)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def _bump(prefix: str, scopes: Iterable) -> None:
+    for scope in set(scopes):
+        try:
+            cache.incr(_version_key(prefix, scope))
+        except ValueError:
+            # Version absente : la prochaine lecture en crée une nouvelle.
+            pass
+
+
+def invalidate_cache_versions(prefix: str, scopes: Iterable) -> None:
+    """
+    Rend inatteignables les entrées mises en cache pour ces portées.
+    Tout de suite pour les lectures de la transaction courante, puis au commit : une entrée recalculée
+    entre-temps par une autre transaction (sans voir les écritures non commitées) devient inatteignable.
+    """
+    scopes = list(scopes)
+    if not scopes:
+        return
+    _bump(prefix, scopes)
+    transaction.on_commit(lambda: _bump(prefix, scopes))
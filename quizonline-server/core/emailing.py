@@ -1,13 +1,17 @@
 from core.mailers import (
     send_password_reset_email,
     send_quiz_assignment_email,
+    send_quiz_assignment_emails,
     send_quiz_completed_email,
+    send_quiz_completed_emails,
     send_registration_confirmation_email,
 )
 
 __all__ = [
     "send_password_reset_email",
     "send_quiz_assignment_email",
+    "send_quiz_assignment_emails",
     "send_quiz_completed_email",
+    "send_quiz_completed_emails",
     "send_registration_confirmation_email",
 ]
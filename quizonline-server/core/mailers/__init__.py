@@ -1,9 +1,19 @@
-from .quiz import send_quiz_assignment_email, send_quiz_completed_email
-from .registration import send_password_reset_email, send_registration_confirmation_email
+from .quiz import (
+    send_quiz_assignment_email,
+    send_quiz_assignment_emails,
+    send_quiz_completed_email,
+    send_quiz_completed_emails,
+)
+from .registration import (
+    send_password_reset_email,
+    send_registration_confirmation_email,
+)
 
 __all__ = [
     "send_quiz_assignment_email",
+    "send_quiz_assignment_emails",
     "send_quiz_completed_email",
+    "send_quiz_completed_emails",
     "send_password_reset_email",
     "send_registration_confirmation_email",
 ]
@@ -60,13 +60,36 @@ def send_plaintext_email(subject: str, body: str, recipients: list[str]) -> None
     queue_plaintext_email(subject, body, recipients)
 
 
-def send_user_plaintext_email(*, user, subject_builder, body_builder) -> None:
+def queue_outbound_emails(emails, *, batch_size: int = 500) -> int:
+    """
+    Met en file des e-mails déjà construits (build_user_plaintext_email) : validés comme par
+    OutboundEmail.save, insérés par bulk_create et livrés par un seul déclenchement au commit.
+    """
+    emails = [email for email in emails if email is not None]
+    if not emails:
+        return 0
+    for email in emails:
+        email.full_clean()
+    OutboundEmail.objects.bulk_create(emails, batch_size=batch_size)
+    transaction.on_commit(trigger_outbound_email_delivery)
+    logger.info("email.enqueued_bulk", extra={"count": len(emails)})
+    return len(emails)
+
+
+def build_user_plaintext_email(*, user, subject_builder, body_builder) -> OutboundEmail | None:
     email = getattr(user, "email", "")
     if not email:
-        return
+        return None
 
     with override(user_language(user)):
         subject = subject_builder(user).strip()
         body = body_builder(user)
+    return OutboundEmail(subject=subject, body=body, recipients=[email])
+
+
+def send_user_plaintext_email(*, user, subject_builder, body_builder) -> None:
+    outbound = build_user_plaintext_email(user=user, subject_builder=subject_builder, body_builder=body_builder)
+    if outbound is None:
+        return
 
-    queue_plaintext_email(subject, body, [email])
+    queue_plaintext_email(outbound.subject, outbound.body, outbound.recipients)
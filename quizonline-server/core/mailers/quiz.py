@@ -1,6 +1,12 @@
 from django.conf import settings
 
-from ._common import format_datetime, frontend_url, send_user_plaintext_email
+from ._common import (
+    build_user_plaintext_email,
+    format_datetime,
+    frontend_url,
+    queue_outbound_emails,
+    send_user_plaintext_email,
+)
 
 
 def _quiz_copy(language_code: str) -> dict[str, str]:
@@ -50,6 +56,10 @@ def build_quiz_assignment_body(quiz) -> str:
     )
 
 
+def _assignment_subject(user) -> str:
+    return _quiz_copy(getattr(user, "language", None))["assignment_subject"]
+
+
 def send_quiz_assignment_email(quiz) -> None:
     user = getattr(quiz, "user", None)
     template = getattr(quiz, "quiz_template", None)
@@ -57,11 +67,24 @@ def send_quiz_assignment_email(quiz) -> None:
         return
     send_user_plaintext_email(
         user=user,
-        subject_builder=lambda current_user: _quiz_copy(getattr(current_user, "language", None))["assignment_subject"],
+        subject_builder=_assignment_subject,
         body_builder=lambda _current_user: build_quiz_assignment_body(quiz),
     )
 
 
+def send_quiz_assignment_emails(quizzes) -> int:
+    """Mails d'assignation d'un lot de sessions (user et quiz_template chargés) : un bulk_create."""
+    return queue_outbound_emails(
+        build_user_plaintext_email(
+            user=quiz.user,
+            subject_builder=_assignment_subject,
+            body_builder=lambda _current_user, quiz=quiz: build_quiz_assignment_body(quiz),
+        )
+        for quiz in quizzes
+        if getattr(quiz, "user", None) and getattr(quiz, "quiz_template", None)
+    )
+
+
 def build_quiz_completed_body(quiz) -> str:
     template = quiz.quiz_template
     creator = template.created_by
@@ -74,14 +97,38 @@ def build_quiz_completed_body(quiz) -> str:
     )
 
 
-def send_quiz_completed_email(quiz) -> None:
+def _completed_subject(user) -> str:
+    return _quiz_copy(getattr(user, "language", None))["completed_subject"]
+
+
+def _completed_recipient(quiz):
     template = getattr(quiz, "quiz_template", None)
     creator = getattr(template, "created_by", None) if template else None
     user = getattr(quiz, "user", None)
     if not creator or not user or creator.id == user.id:
+        return None
+    return creator
+
+
+def send_quiz_completed_email(quiz) -> None:
+    creator = _completed_recipient(quiz)
+    if creator is None:
         return
     send_user_plaintext_email(
         user=creator,
-        subject_builder=lambda current_user: _quiz_copy(getattr(current_user, "language", None))["completed_subject"],
+        subject_builder=_completed_subject,
         body_builder=lambda _current_user: build_quiz_completed_body(quiz),
     )
+
+
+def send_quiz_completed_emails(quizzes) -> int:
+    """Mails de fin d'un lot de sessions (user et quiz_template__created_by chargés) : un bulk_create."""
+    return queue_outbound_emails(
+        build_user_plaintext_email(
+            user=creator,
+            subject_builder=_completed_subject,
+            body_builder=lambda _current_user, quiz=quiz: build_quiz_completed_body(quiz),
+        )
+        for quiz, creator in ((quiz, _completed_recipient(quiz)) for quiz in quizzes)
+        if creator is not None
+    )
@@ -0,0 +1,49 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from customuser.throttling import TokenObtainRateThrottle
+
+
+class SlidingWindowThrottleTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.request = Request(APIRequestFactory().post("/api/token/", REMOTE_ADDR="10.0.0.1"))
+        self.now = 60 * 16_667 + 20.0  # 20 s dans une fenêtre de 60 s
+
+    def _allow(self) -> tuple[bool, TokenObtainRateThrottle]:
+        throttle = TokenObtainRateThrottle()
+        with patch.object(throttle, "timer", return_value=self.now):
+            return throttle.allow_request(self.request, None), throttle
+
+    def test_limit_is_enforced_and_refused_requests_are_not_counted(self):
+        with patch.object(TokenObtainRateThrottle, "rate", "2/min", create=True):
+            self.assertTrue(self._allow()[0])
+            self.assertTrue(self._allow()[0])
+            allowed, throttle = self._allow()
+            self.assertFalse(allowed)
+            self.assertAlmostEqual(throttle.wait(), 40.0)
+            self.assertFalse(self._allow()[0])
+            self.assertEqual(cache.get(throttle._window_key(int(self.now // 60))), 2)
+
+    def test_previous_window_weighs_proportionally_to_its_remaining_overlap(self):
+        with patch.object(TokenObtainRateThrottle, "rate", "4/min", create=True):
+            for _ in range(4):
+                self.assertTrue(self._allow()[0])
+            # 15 s dans la fenêtre suivante : 4 × 0,75 = 3 comptés, une seule requête passe.
+            self.now += 55
+            self.assertTrue(self._allow()[0])
+            allowed, throttle = self._allow()
+            self.assertFalse(allowed)
+            self.assertAlmostEqual(throttle.wait(), 15.0)
+
+    def test_keeps_two_counters_per_client_instead_of_a_history(self):
+        with patch.object(TokenObtainRateThrottle, "rate", "100/min", create=True):
+            for _ in range(50):
+                _, throttle = self._allow()
+        window = int(self.now // 60)
+        self.assertEqual(cache.get(throttle._window_key(window)), 50)
+        self.assertIsNone(cache.get(throttle.key))
@@ -1,22 +1,97 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.cache import caches
 from rest_framework.throttling import AnonRateThrottle
 from rest_framework.throttling import UserRateThrottle
 
 
-class TokenObtainRateThrottle(AnonRateThrottle):
+class SlidingWindowThrottleMixin:
+    """
+    Fenêtre glissante approchée sur des compteurs atomiques du cache (`THROTTLE_CACHE_ALIAS`) :
+    deux entiers par clé (fenêtre courante et précédente) au lieu de la liste d'horodatages de DRF.
+    Estimation : précédente × part de la fenêtre précédente encore couverte + courante.
+    L'incrément se fait avant la vérification et est annulé en cas de refus, si bien que
+    des workers concurrents ne dépassent pas la limite. En test, le cache locmem sert
+    de stockage en mémoire du processus.
+    """
+
+    @property
+    def cache(self):
+        return caches[settings.THROTTLE_CACHE_ALIAS]
+
+    def _window_key(self, window: int) -> str:
+        return f"{self.key}:{window}"
+
+    def _increment(self, key: str) -> int:
+        self.cache.add(key, 0, self.duration * 2)
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # Clé expirée ou évincée entre add et incr.
+            self.cache.set(key, 1, self.duration * 2)
+            return 1
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        current_key = self._window_key(window)
+        self.current_count = self._increment(current_key)
+        self.previous_count = self.cache.get(self._window_key(window - 1), 0)
+        self.elapsed = self.now - window * self.duration
+
+        if self._estimate(self.current_count, self.elapsed) > self.num_requests:
+            try:
+                self.current_count = self.cache.decr(current_key)
+            except ValueError:
+                self.current_count = 0
+            return self.throttle_failure()
+        return True
+
+    def _estimate(self, current_count: int, elapsed: float) -> float:
+        return self.previous_count * (1 - elapsed / self.duration) + current_count
+
+    def wait(self):
+        remaining = self.duration - self.elapsed
+        if self.current_count + 1 > self.num_requests:
+            return remaining
+        if not self.previous_count:
+            return None
+        # Instant où la part décroissante de la fenêtre précédente laisse passer une requête.
+        target = self.duration * (1 - (self.num_requests - self.current_count - 1) / self.previous_count)
+        return max(0.0, min(target - self.elapsed, remaining))
+
+
+class SlidingWindowAnonRateThrottle(SlidingWindowThrottleMixin, AnonRateThrottle):
+    pass
+
+
+class SlidingWindowUserRateThrottle(SlidingWindowThrottleMixin, UserRateThrottle):
+    pass
+
+
+class TokenObtainRateThrottle(SlidingWindowAnonRateThrottle):
     scope = "token_obtain"
 
 
-class PasswordResetRateThrottle(AnonRateThrottle):
+class PasswordResetRateThrottle(SlidingWindowAnonRateThrottle):
     scope = "password_reset"
 
 
-class PasswordResetConfirmRateThrottle(AnonRateThrottle):
+class PasswordResetConfirmRateThrottle(SlidingWindowAnonRateThrottle):
     scope = "password_reset_confirm"
 
 
-class EmailConfirmRateThrottle(AnonRateThrottle):
+class EmailConfirmRateThrottle(SlidingWindowAnonRateThrottle):
     scope = "email_confirm"
 
 
-class QuizAnswerRateThrottle(UserRateThrottle):
+class QuizAnswerRateThrottle(SlidingWindowUserRateThrottle):
     scope = "quiz_answer"
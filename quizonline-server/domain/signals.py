@@ -1,5 +1,8 @@
-from django.db.models.signals import m2m_changed
+from django.db.models.signals import m2m_changed, post_save, pre_delete, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
+
+from config.domain_access import invalidate_domain_roles
 
 from .models import Domain
 
@@ -9,3 +12,75 @@ def ensure_domain_manager_membership(sender, instance: Domain, action: str, pk_s
     if action != "post_add" or not pk_set:
         return
     instance.members.add(*pk_set)
+
+
+@receiver(m2m_changed, sender=Domain.managers.through)
+@receiver(m2m_changed, sender=Domain.members.through)
+@receiver(m2m_changed, sender=Domain.allowed_languages.through)
+def touch_domain_on_relation_change(sender, instance, action: str, reverse: bool, pk_set, **kwargs) -> None:
+    # updated_at sert de jeton de version aux lectures conditionnelles (ETag).
+    if action not in {"post_add", "post_remove", "post_clear"}:
+        return
+    if not reverse:
+        domain_ids = [instance.pk]
+    elif pk_set:
+        domain_ids = list(pk_set)
+    else:
+        return
+    Domain.objects.filter(pk__in=domain_ids).update(updated_at=timezone.now())
+
+
+@receiver(m2m_changed, sender=Domain.managers.through)
+@receiver(m2m_changed, sender=Domain.members.through)
+def invalidate_roles_on_relation_change(sender, instance, action: str, reverse: bool, pk_set, **kwargs) -> None:
+    # Les rôles de domaine sont mis en cache par utilisateur (config.domain_access).
+    if reverse:
+        if action in {"post_add", "post_remove", "post_clear"}:
+            invalidate_domain_roles([instance.pk])
+        return
+    if action in {"post_add", "post_remove"} and pk_set:
+        invalidate_domain_roles(pk_set)
+    elif action == "pre_clear":
+        # post_clear ne fournit pas pk_set : les utilisateurs concernés sont lus avant la suppression.
+        relation = instance.managers if sender is Domain.managers.through else instance.members
+        invalidate_domain_roles(relation.values_list("id", flat=True))
+
+
+def _domain_user_ids(domain: Domain) -> list[int]:
+    return [
+        domain.owner_id,
+        *domain.managers.values_list("id", flat=True),
+        *domain.members.values_list("id", flat=True),
+    ]
+
+
+@receiver(pre_save, sender=Domain)
+def remember_domain_roles_state(sender, instance: Domain, raw: bool = False, **kwargs) -> None:
+    if raw or not instance.pk:
+        instance._roles_previous_state = None
+        return
+    instance._roles_previous_state = (
+        Domain.objects.filter(pk=instance.pk).values_list("owner_id", "active").first()
+    )
+
+
+@receiver(post_save, sender=Domain)
+def invalidate_roles_on_domain_save(sender, instance: Domain, created: bool, raw: bool = False, **kwargs) -> None:
+    if raw:
+        return
+    previous = getattr(instance, "_roles_previous_state", None)
+    if created or previous is None:
+        invalidate_domain_roles([instance.owner_id])
+        return
+    previous_owner_id, previous_active = previous
+    if previous_active != instance.active:
+        # La visibilité dépend de active : tous les utilisateurs liés sont concernés.
+        invalidate_domain_roles([previous_owner_id, *_domain_user_ids(instance)])
+    elif previous_owner_id != instance.owner_id:
+        invalidate_domain_roles([previous_owner_id, instance.owner_id])
+
+
+@receiver(pre_delete, sender=Domain)
+def invalidate_roles_on_domain_delete(sender, instance: Domain, **kwargs) -> None:
+    # Les lignes managers/members partent en cascade sans m2m_changed.
+    invalidate_domain_roles(_domain_user_ids(instance))
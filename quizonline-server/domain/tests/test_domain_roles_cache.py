@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from config.domain_access import manageable_domain_ids, visible_domain_ids
+from domain.models import Domain
+
+User = get_user_model()
+
+
+class DomainRolesCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username="owner", password="pwd")
+        self.user = User.objects.create_user(username="user", password="pwd")
+        self.domain = Domain.objects.create(owner=self.owner, active=True)
+
+    def _fresh(self, user):
+        # Nouvelle instance : seule la mémoïsation par requête est perdue, pas le cache partagé.
+        return User.objects.get(pk=user.pk)
+
+    def test_roles_are_shared_across_requests(self):
+        self.domain.managers.add(self.user)
+        self.assertEqual(manageable_domain_ids(self._fresh(self.user)), {self.domain.pk})
+
+        user = self._fresh(self.user)
+        with self.assertNumQueries(0):
+            self.assertEqual(manageable_domain_ids(user), {self.domain.pk})
+            self.assertEqual(visible_domain_ids(user), {self.domain.pk})
+
+    def test_membership_changes_invalidate_both_sides(self):
+        self.assertEqual(visible_domain_ids(self._fresh(self.user)), set())
+
+        self.domain.members.add(self.user)
+        self.assertEqual(visible_domain_ids(self._fresh(self.user)), {self.domain.pk})
+
+        self.user.linked_domains.remove(self.domain)
+        self.assertEqual(visible_domain_ids(self._fresh(self.user)), set())
+
+        self.domain.managers.add(self.user)
+        self.assertEqual(manageable_domain_ids(self._fresh(self.user)), {self.domain.pk})
+
+        self.domain.managers.clear()
+        self.assertEqual(manageable_domain_ids(self._fresh(self.user)), set())
+
+    def test_owner_and_active_changes_invalidate_related_users(self):
+        self.domain.members.add(self.user)
+        self.assertEqual(manageable_domain_ids(self._fresh(self.owner)), {self.domain.pk})
+        self.assertEqual(visible_domain_ids(self._fresh(self.user)), {self.domain.pk})
+
+        self.domain.owner = self.user
+        self.domain.save()
+        self.assertEqual(manageable_domain_ids(self._fresh(self.owner)), set())
+        self.assertEqual(manageable_domain_ids(self._fresh(self.user)), {self.domain.pk})
+
+        self.domain.active = False
+        self.domain.save()
+        self.assertEqual(visible_domain_ids(self._fresh(self.user)), set())
+        # Un domaine inactif reste gérable par son propriétaire.
+        self.assertEqual(manageable_domain_ids(self._fresh(self.user)), {self.domain.pk})
+
+    def test_domain_deletion_invalidates_members(self):
+        self.domain.members.add(self.user)
+        self.assertEqual(visible_domain_ids(self._fresh(self.user)), {self.domain.pk})
+
+        self.domain.delete()
+
+        self.assertEqual(visible_domain_ids(self._fresh(self.user)), set())
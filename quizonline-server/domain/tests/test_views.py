@@ -190,6 +190,25 @@ class DomainViewSetTests(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_retrieve_returns_304_until_members_or_subjects_change(self):
+        view = DomainViewSet.as_view({"get": "retrieve"})
+        url = f"/api/domain/{self.domain_active.id}/"
+        etag = view(self.factory.get(url), domain_id=self.domain_active.id)["ETag"]
+
+        response = view(self.factory.get(url, HTTP_IF_NONE_MATCH=etag), domain_id=self.domain_active.id)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.domain_active.members.add(self.global_staff)
+        response = view(self.factory.get(url, HTTP_IF_NONE_MATCH=etag), domain_id=self.domain_active.id)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response["ETag"]
+
+        self.subject_inactive.active = True
+        self.subject_inactive.save()
+        response = view(self.factory.get(url, HTTP_IF_NONE_MATCH=etag), domain_id=self.domain_active.id)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["subjects_count"], 2)
+
     # ----------------------------
     # DETAILS (custom action)
     # ----------------------------
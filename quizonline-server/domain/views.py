@@ -7,8 +7,12 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
+from config.conditional import ConditionalGetMixin, queryset_version
 from config.tools import MyModelViewSet
 
+from question.models import Question
+from subject.models import Subject
+
 from .models import Domain
 from .permissions import IsDomainOwnerOrManager
 from .serializers import (
@@ -165,10 +169,20 @@ from django.contrib.auth import get_user_model
         },
     ),
 )
-class DomainViewSet(MyModelViewSet):
+class DomainViewSet(ConditionalGetMixin, MyModelViewSet):
     ordering = ["id"]
     lookup_field = "pk"
     lookup_url_kwarg = "domain_id"
+    conditional_fields = ("updated_at", "allowed_languages__updated_at")
+
+    def get_conditional_version_parts(self, queryset):
+        # subjects_count / questions_count : ajouts, suppressions et (dés)activations des enfants.
+        domain_ids = queryset.values("pk")
+        return [
+            *super().get_conditional_version_parts(queryset),
+            queryset_version(Subject.objects.filter(domain__in=domain_ids), fields=("updated_at",)),
+            queryset_version(Question.objects.filter(domain__in=domain_ids), fields=("updated_at",)),
+        ]
 
     def get_permissions(self):
         if self.action in ["list", "retrieve", "details"]:
@@ -134,6 +134,49 @@ class LanguageViewSetTests(APITestCase):
         r = self.client.get(self._detail_url(999999))
         self.assertEqual(r.status_code, status.HTTP_404_NOT_FOUND)
 
+    # -------------------------
+    # lectures conditionnelles
+    # -------------------------
+    def test_retrieve_returns_304_while_language_is_unchanged(self):
+        self.client.force_authenticate(user=self.admin)
+        r = self.client.get(self._detail_url(self.lang_nl))
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        etag = r["ETag"]
+        self.assertIn("Last-Modified", r)
+
+        r = self.client.get(self._detail_url(self.lang_nl), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(r.content, b"")
+        self.assertEqual(r["ETag"], etag)
+
+        self.client.patch(self._detail_url(self.lang_nl), {"name": "Vlaams"}, format="json")
+        r = self.client.get(self._detail_url(self.lang_nl), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(r["ETag"], etag)
+
+    def test_list_etag_depends_on_rows_query_and_user(self):
+        self.client.force_authenticate(user=self.admin)
+        etag = self.client.get(self._list_url())["ETag"]
+
+        self.assertEqual(
+            self.client.get(self._list_url(), HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+        self.assertEqual(
+            self.client.get(self._list_url(), {"active": "true"}, HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_200_OK,
+        )
+
+        self.lang_en.delete()
+        self.assertEqual(
+            self.client.get(self._list_url(), HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_200_OK,
+        )
+
+        self.client.force_authenticate(user=self.user)
+        other = self.client.get(self._list_url())
+        self.assertNotEqual(other["ETag"], etag)
+
     # -------------------------
     # search / ordering
     # -------------------------
@@ -9,6 +9,7 @@ from drf_spectacular.utils import (
 from rest_framework import filters
 from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser, AllowAny
+from config.conditional import ConditionalGetMixin
 from config.tools import ErrorDetailSerializer, MyModelViewSet
 
 from .models import Language
@@ -145,7 +146,7 @@ from .serializers import LanguageReadSerializer, LanguageWriteSerializer, Langua
         },
     ),
 )
-class LanguageViewSet(MyModelViewSet):
+class LanguageViewSet(ConditionalGetMixin, MyModelViewSet):
     queryset = Language.objects.all()
 
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -5,6 +5,26 @@ from collections.abc import Iterable
 from rest_framework import serializers
 
 from .models import AnswerOption, Question
+from .signals import answer_options_changed
+
+
+def referenced_answer_option_ids(question: Question) -> set[int]:
+    """Ids des options de `question` sélectionnées dans au moins une réponse de quiz."""
+    from quiz.models import QuizQuestionAnswer
+
+    # Sélections canoniques (ids triés) : peu de combinaisons distinctes par question,
+    # dédoublonnées en SQL pour ne pas transférer une ligne par réponse.
+    referenced: set[int] = set()
+    selections = (
+        QuizQuestionAnswer.objects.filter(quizquestion__question=question)
+        .exclude(selected_option_ids=[])
+        .order_by()
+        .values_list("selected_option_ids", flat=True)
+        .distinct()
+    )
+    for option_ids in selections:
+        referenced.update(option_ids)
+    return referenced
 
 
 def sync_question_answer_options(
@@ -15,11 +35,7 @@ def sync_question_answer_options(
     upsert_translations,
 ) -> None:
     existing_options = {option.id: option for option in question.answer_options.all()}
-    referenced_existing_ids = set(
-        AnswerOption.objects.filter(question=question, quiz_answers__isnull=False)
-        .distinct()
-        .values_list("id", flat=True)
-    )
+    referenced_existing_ids = referenced_answer_option_ids(question).intersection(existing_options)
     retained_ids: set[int] = set()
 
     # Separate new vs existing, validate inline, collect (instance, translations) pairs.
@@ -109,6 +125,8 @@ def sync_question_answer_options(
     if removable_ids:
         AnswerOption.objects.filter(id__in=removable_ids).delete()
 
+    answer_options_changed.send(sender=AnswerOption, question=question)
+
     # Apply translations after all DB writes so PKs are guaranteed to exist.
     for opt, translations in update_pairs + new_pairs:
         upsert_translations(
@@ -296,6 +296,41 @@ class QuestionReadSerializer(serializers.ModelSerializer):
         return qaors(obj.answer_options.all(), many=True, context=self.context).data
 
 
+class QuestionOptionStatsSerializer(serializers.Serializer):
+    answer_option_id = serializers.IntegerField()
+    picks = serializers.IntegerField()
+
+
+class QuestionQuizQuestionStatsSerializer(serializers.Serializer):
+    quizquestion_id = serializers.IntegerField()
+    quiz_template_id = serializers.IntegerField()
+    attempts = serializers.IntegerField()
+    correct = serializers.IntegerField()
+
+
+class QuestionAnswerStatsSerializer(serializers.Serializer):
+    attempts = serializers.IntegerField()
+    correct = serializers.IntegerField()
+    correct_rate = serializers.FloatField(allow_null=True)
+    options = QuestionOptionStatsSerializer(many=True)
+    quiz_questions = QuestionQuizQuestionStatsSerializer(many=True)
+
+
+class QuestionDetailSerializer(QuestionReadSerializer):
+    """Détail d'une question pour les gestionnaires du domaine : ajoute les statistiques de réponse des quiz."""
+    answer_stats = serializers.SerializerMethodField()
+
+    class Meta(QuestionReadSerializer.Meta):
+        fields = (*QuestionReadSerializer.Meta.fields, "answer_stats")
+        read_only_fields = fields
+
+    @extend_schema_field(QuestionAnswerStatsSerializer)
+    def get_answer_stats(self, obj: Question) -> dict:
+        from quiz.answer_stats import question_answer_stats
+
+        return question_answer_stats(obj.pk)
+
+
 class QuestionWriteSerializer(serializers.ModelSerializer):
     translations = LocalizedTranslationsJSONField(
         value_serializer=LocalizedQuestionTranslationSerializer,
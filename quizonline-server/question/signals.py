@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Envoyé après une écriture en masse (bulk_create / bulk_update) des AnswerOption d'une question,
+# qui ne déclenche pas post_save. Argument : question.
+answer_options_changed = Signal()
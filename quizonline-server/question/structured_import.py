@@ -6,12 +6,13 @@ import os
 
 from django.core.files.base import ContentFile
 from django.db import transaction
-from django.db.models import Count
 
 from domain.models import Domain
 from subject.models import Subject
 
+from .answer_option_sync import referenced_answer_option_ids
 from .models import AnswerOption, MediaAsset, Question, QuestionMedia
+from .signals import answer_options_changed
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -188,13 +189,9 @@ def _sync_answer_options(question: Question, options_data: list[dict]) -> None:
             f"La question {question.pk} doit avoir au moins une réponse correcte."
         )
 
-    # Single query: load all options + flag which are referenced by existing answers
-    all_opts = list(
-        question.answer_options
-        .annotate(_answer_count=Count("quiz_answers", distinct=True))
-    )
-    existing = {opt.pk: opt for opt in all_opts}
-    referenced_ids = {opt.pk for opt in all_opts if opt._answer_count > 0}
+    # Load all options + flag which are referenced by existing answers
+    existing = {opt.pk: opt for opt in question.answer_options.all()}
+    referenced_ids = referenced_answer_option_ids(question).intersection(existing)
     kept_ids: set[int] = set()
 
     new_pairs: list[tuple[AnswerOption, dict]] = []
@@ -242,6 +239,8 @@ def _sync_answer_options(question: Question, options_data: list[dict]) -> None:
     if removable:
         AnswerOption.objects.filter(pk__in=removable).delete()
 
+    answer_options_changed.send(sender=AnswerOption, question=question)
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Point d'entrée principal
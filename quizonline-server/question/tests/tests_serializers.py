@@ -506,8 +506,12 @@ class QuestionSerializersTestCase(TestCase):
             active=True,
             started_at=timezone.now(),
         )
-        answer = QuizQuestionAnswer.objects.create(quiz=quiz, quizquestion=quiz_question, question_order=1)
-        answer.selected_options.set([second])
+        QuizQuestionAnswer.objects.create(
+            quiz=quiz,
+            quizquestion=quiz_question,
+            question_order=1,
+            selected_option_ids=[second.pk],
+        )
 
         payload = {
             "allow_multiple_correct": True,
@@ -593,8 +597,12 @@ class QuestionSerializersTestCase(TestCase):
             active=True,
             started_at=timezone.now(),
         )
-        answer = QuizQuestionAnswer.objects.create(quiz=quiz, quizquestion=quiz_question, question_order=1)
-        answer.selected_options.set([second])
+        QuizQuestionAnswer.objects.create(
+            quiz=quiz,
+            quizquestion=quiz_question,
+            question_order=1,
+            selected_option_ids=[second.pk],
+        )
 
         payload = {
             "is_mode_exam": True,
@@ -639,8 +647,12 @@ class QuestionSerializersTestCase(TestCase):
             active=True,
             started_at=timezone.now(),
         )
-        answer = QuizQuestionAnswer.objects.create(quiz=quiz, quizquestion=quiz_question, question_order=1)
-        answer.selected_options.set([second])
+        QuizQuestionAnswer.objects.create(
+            quiz=quiz,
+            quizquestion=quiz_question,
+            question_order=1,
+            selected_option_ids=[second.pk],
+        )
 
         payload = {
             "allow_multiple_correct": True,
@@ -11,7 +11,7 @@ from rest_framework.test import APITestCase
 from domain.models import Domain
 from language.models import Language
 from subject.models import Subject
-from question.models import Question, MediaAsset, QuestionMedia
+from question.models import AnswerOption, Question, MediaAsset, QuestionMedia
 
 User = get_user_model()
 
@@ -195,6 +195,21 @@ class QuestionViewSetTests(APITestCase):
         resp = self.client.get(self._list_url())
         self.assertEqual(resp.status_code, status.HTTP_200_OK)
 
+    def test_retrieve_returns_304_until_an_answer_option_changes(self):
+        question = Question.objects.create(domain=self.domain, active=True, is_mode_practice=True, is_mode_exam=True)
+        self._set_question_translation(question, "fr", title="Q")
+        option = AnswerOption.objects.create(question=question, content="A", is_correct=True, sort_order=1)
+        self.client.force_authenticate(self.domain_owner)
+
+        etag = self.client.get(self._detail_url(question))["ETag"]
+        resp = self.client.get(self._detail_url(question), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        option.delete()
+        resp = self.client.get(self._detail_url(question), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.json()["answer_options"], [])
+
     def test_list_ignores_empty_subject_ids_query_param(self):
         visible = Question.objects.create(domain=self.domain, active=True, is_mode_practice=True, is_mode_exam=True)
         visible.set_current_language("fr")
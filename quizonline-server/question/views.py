@@ -20,9 +20,11 @@ from drf_spectacular.utils import (
 from rest_framework import status, serializers
 from rest_framework.decorators import action
 from rest_framework.parsers import JSONParser, FormParser, MultiPartParser
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from config.tools import ErrorDetailSerializer
+from config.conditional import ConditionalGetMixin, queryset_version
+from config.pagination import OptionalCursorPagination
+from quiz.answer_stats import question_answer_stats_version
 from config.tools import MyModelViewSet
 from config.serializers import (
     LocalizedAnswerOptionTranslationSerializer,
@@ -30,18 +32,18 @@ from config.serializers import (
     LocalizedTranslationsDictField,
 )
 
-from .models import Question, MediaAsset
+from .models import AnswerOption, Question, MediaAsset, QuestionMedia, QuestionSubject
 from .permissions import IsQuestionDomainManager
 from .querysets import accessible_question_queryset
 from .structured_export import export_questions
 from .structured_import import import_questions, StructuredImportError, StructuredImportPermissionError
-from .serializers import QuestionReadSerializer, QuestionWriteSerializer, MediaAssetSerializer, \
+from .serializers import QuestionDetailSerializer, QuestionReadSerializer, QuestionWriteSerializer, MediaAssetSerializer, \
     MediaAssetUploadSerializer, _infer_kind_from_upload, _sha256_file
 
 logger = logging.getLogger(__name__)
 
 
-class QuestionListPagination(PageNumberPagination):
+class QuestionListPagination(OptionalCursorPagination):
     page_size_query_param = "page_size"
     max_page_size = 100
 
@@ -148,7 +150,7 @@ class QuestionPartialRequestSerializer(QuestionWriteSerializer):
             )
         ],
         responses={
-            200: QuestionReadSerializer,
+            200: QuestionDetailSerializer,
             404: OpenApiResponse(response=ErrorDetailSerializer, description="Not found"),
             403: OpenApiResponse(response=ErrorDetailSerializer, description="Forbidden (admin only)"),
         },
@@ -260,7 +262,7 @@ class QuestionPartialRequestSerializer(QuestionWriteSerializer):
         },
     ),
 )
-class QuestionViewSet(MyModelViewSet):
+class QuestionViewSet(ConditionalGetMixin, MyModelViewSet):
     queryset = Question.objects.none()
     permission_classes = [IsQuestionDomainManager]
     pagination_class = QuestionListPagination
@@ -268,6 +270,25 @@ class QuestionViewSet(MyModelViewSet):
     filterset_fields = ["domain", "active", "is_mode_practice", "is_mode_exam"]
     lookup_field = "pk"
     lookup_url_kwarg = "question_id"
+    cursor_ordering = ("-pk",)
+    conditional_fields = ("updated_at", "domain__updated_at")
+
+    def get_conditional_version_parts(self, queryset):
+        # Une requête par relation sérialisée, pour éviter le produit options × médias × sujets.
+        question_ids = queryset.values("pk")
+        return [
+            *super().get_conditional_version_parts(queryset),
+            queryset_version(AnswerOption.objects.filter(question__in=question_ids), fields=("updated_at",)),
+            queryset_version(
+                QuestionMedia.objects.filter(question__in=question_ids),
+                fields=("updated_at", "asset__updated_at"),
+            ),
+            queryset_version(
+                QuestionSubject.objects.filter(question__in=question_ids),
+                fields=("updated_at", "subject__updated_at"),
+            ),
+            *(question_answer_stats_version(question_ids) if self.action == "retrieve" else ()),
+        ]
 
     def get_parsers(self):
         action = getattr(self, "action", None)
@@ -288,7 +309,9 @@ class QuestionViewSet(MyModelViewSet):
         return ctx
 
     def get_serializer_class(self):
-        if self.action in ["list", "retrieve"]:
+        if self.action == "retrieve":
+            return QuestionDetailSerializer
+        if self.action == "list":
             return QuestionReadSerializer
         if self.action == "partial_update":
             return QuestionPartialRequestSerializer
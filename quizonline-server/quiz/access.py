@@ -3,6 +3,7 @@ from __future__ import annotations
 from rest_framework.exceptions import PermissionDenied
 from config.domain_access import manageable_domain_ids, user_can_access_domain
 
+from .access_index import has_assigned_session, has_started_exam_attempt
 from .querysets import accessible_quiz_template_queryset
 
 
@@ -24,8 +25,7 @@ def _has_started_exam_attempt(user, quiz_template) -> bool:
     return bool(
         user
         and getattr(user, "is_authenticated", False)
-        and quiz_template.mode == quiz_template.MODE_EXAM
-        and quiz_template.quiz.filter(user=user).exclude(started_at__isnull=True, ended_at__isnull=True).exists()
+        and has_started_exam_attempt(user, quiz_template)
     )
 
 
@@ -48,7 +48,7 @@ def user_can_access_template(user, quiz_template) -> bool:
         return False
     if _has_started_exam_attempt(user, quiz_template):
         return False
-    if quiz_template.quiz.filter(user=user).exists():
+    if has_assigned_session(user, quiz_template):
         return True
     return _can_access_public_template(user, quiz_template)
 
@@ -82,7 +82,7 @@ def user_can_create_quiz_from_template(user, quiz_template) -> bool:
         return False
     if _has_started_exam_attempt(user, quiz_template):
         return False
-    if quiz_template.quiz.filter(user=user).exists():
+    if has_assigned_session(user, quiz_template):
         return True
     return _can_access_public_template(user, quiz_template)
 
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from config.versioned_cache import cache_version, invalidate_cache_versions
+from quiz.models import Quiz, QuizTemplate
+
+ACCESS_INDEX_CACHE_PREFIX = "quiz:access"
+ACCESS_INDEX_CACHE_TIMEOUT = 60 * 60
+
+
+class UserTemplateAccess(NamedTuple):
+    # Templates sur lesquels l'utilisateur a au moins une session (assignée, créée ou démarrée).
+    assigned_ids: frozenset[int]
+    # Templates sur lesquels une session de l'utilisateur a démarré ou s'est terminée :
+    # bloquants si le template est en mode examen (le mode est lu sur le template au moment du contrôle).
+    started_ids: frozenset[int]
+
+
+class PublicTemplateWindow(NamedTuple):
+    id: int
+    permanent: bool
+    started_at: object
+    ended_at: object
+
+    def is_available(self, at) -> bool:
+        # Même règle que available_quiz_template_filter / QuizTemplate.can_answer (actif déjà filtré).
+        if self.permanent:
+            return True
+        if self.started_at is None or self.started_at > at:
+            return False
+        return self.ended_at is None or self.ended_at >= at
+
+
+def invalidate_user_template_access(user_ids: Iterable[int]) -> None:
+    """Rend inatteignable l'index d'accès des utilisateurs."""
+    scopes = [f"user:{user_id}" for user_id in user_ids if user_id is not None]
+    invalidate_cache_versions(ACCESS_INDEX_CACHE_PREFIX, scopes)
+
+
+def invalidate_public_templates() -> None:
+    """Rend inatteignable le catalogue public."""
+    invalidate_cache_versions(ACCESS_INDEX_CACHE_PREFIX, ["public"])
+
+
+def get_user_template_access(user) -> UserTemplateAccess:
+    """
+    Index d'accès aux templates d'un utilisateur, depuis le cache Django.
+    Une requête sur Quiz à la construction, aucune ensuite tant que la version de l'utilisateur
+    n'a pas changé (création, démarrage, modification ou suppression d'une de ses sessions).
+    """
+    scope = f"user:{user.pk}"
+    # date_joined protège contre la réutilisation d'un id (base réinitialisée, restauration).
+    date_joined = getattr(user, "date_joined", None)
+    joined = date_joined.timestamp() if date_joined else ""
+    key = f"{ACCESS_INDEX_CACHE_PREFIX}:{scope}:{joined}:{cache_version(ACCESS_INDEX_CACHE_PREFIX, scope)}"
+    access = cache.get(key)
+    if access is None:
+        assigned_ids = set()
+        started_ids = set()
+        rows = Quiz.objects.filter(user=user).values_list("quiz_template_id", "started_at", "ended_at")
+        for quiz_template_id, started_at, ended_at in rows:
+            assigned_ids.add(quiz_template_id)
+            if started_at is not None or ended_at is not None:
+                started_ids.add(quiz_template_id)
+        access = UserTemplateAccess(frozenset(assigned_ids), frozenset(started_ids))
+        cache.set(key, access, ACCESS_INDEX_CACHE_TIMEOUT)
+    return access
+
+
+def _public_template_windows() -> tuple[PublicTemplateWindow, ...]:
+    key = f"{ACCESS_INDEX_CACHE_PREFIX}:public:{cache_version(ACCESS_INDEX_CACHE_PREFIX, 'public')}"
+    windows = cache.get(key)
+    if windows is None:
+        windows = tuple(
+            PublicTemplateWindow(*row)
+            for row in QuizTemplate.objects
+            .filter(is_public=True, active=True)
+            .order_by("pk")
+            .values_list("id", "permanent", "started_at", "ended_at")
+        )
+        cache.set(key, windows, ACCESS_INDEX_CACHE_TIMEOUT)
+    return windows
+
+
+def available_public_template_ids(*, at=None) -> list[int]:
+    """
+    Templates publics disponibles à `at` (défaut : maintenant).
+    Les fenêtres d'ouverture sont mises en cache, la disponibilité est évaluée à chaque appel :
+    l'ouverture ou la fermeture d'un template n'attend pas l'invalidation.
+    """
+    if at is None:
+        at = timezone.now()
+    return [window.id for window in _public_template_windows() if window.is_available(at)]
+
+
+def has_started_exam_attempt(user, quiz_template) -> bool:
+    return (
+        quiz_template.mode == QuizTemplate.MODE_EXAM
+        and quiz_template.pk in get_user_template_access(user).started_ids
+    )
+
+
+def has_assigned_session(user, quiz_template) -> bool:
+    return quiz_template.pk in get_user_template_access(user).assigned_ids
@@ -186,7 +186,7 @@ class QuizQuestionAnswerAdmin(admin.ModelAdmin):
         "quiz__user__last_name",
         "quizquestion__question__title",
     )
-    autocomplete_fields = ["quiz", "quizquestion", "selected_options"]
+    autocomplete_fields = ["quiz", "quizquestion"]
     date_hierarchy = "answered_at"
     ordering = ("-answered_at",)
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from rest_framework.exceptions import PermissionDenied
 
@@ -11,6 +11,9 @@ if TYPE_CHECKING:
     from .models import Quiz, QuizAlertMessage, QuizAlertThread, QuizQuestion
 
 
+# Messages inclus dans le détail d'une conversation ; les plus anciens sont paginés (alerts/{id}/messages/).
+ALERT_THREAD_INLINE_MESSAGES = 50
+
 _ASSIGNMENT_ALERT_COPY: dict[str, dict[str, str]] = {
     "fr": {
         "title": "Nouveau quiz assigne",
@@ -45,23 +48,23 @@ def assignment_alert_reporter_reply_allowed() -> bool:
     return bool(settings.QUIZ_ASSIGNMENT_ALERT_REPORTER_REPLY_ALLOWED)
 
 
-def is_alert_participant(thread: "QuizAlertThread", user) -> bool:
+def is_alert_participant(thread: QuizAlertThread, user) -> bool:
     return bool(user and user.is_authenticated and user.id in {thread.reporter_id, thread.owner_id})
 
 
-def is_alert_owner(thread: "QuizAlertThread", user) -> bool:
+def is_alert_owner(thread: QuizAlertThread, user) -> bool:
     return bool(user and user.is_authenticated and user.id == thread.owner_id)
 
 
-def is_alert_reporter(thread: "QuizAlertThread", user) -> bool:
+def is_alert_reporter(thread: QuizAlertThread, user) -> bool:
     return bool(user and user.is_authenticated and user.id == thread.reporter_id)
 
 
-def can_manage_alert(thread: "QuizAlertThread", user) -> bool:
+def can_manage_alert(thread: QuizAlertThread, user) -> bool:
     return is_alert_owner(thread, user)
 
 
-def can_reply_to_alert(thread: "QuizAlertThread", user) -> bool:
+def can_reply_to_alert(thread: QuizAlertThread, user) -> bool:
     if not is_alert_participant(thread, user):
         return False
     if thread.status != thread.STATUS_OPEN:
@@ -71,7 +74,7 @@ def can_reply_to_alert(thread: "QuizAlertThread", user) -> bool:
     return thread.reporter_reply_allowed
 
 
-def participant_last_read_at(thread: "QuizAlertThread", user):
+def participant_last_read_at(thread: QuizAlertThread, user):
     if is_alert_owner(thread, user):
         return thread.owner_last_read_at
     if is_alert_reporter(thread, user):
@@ -79,7 +82,7 @@ def participant_last_read_at(thread: "QuizAlertThread", user):
     return None
 
 
-def unread_messages_queryset(thread: "QuizAlertThread", user):
+def unread_messages_queryset(thread: QuizAlertThread, user):
     if not is_alert_participant(thread, user):
         return thread.messages.none()
 
@@ -90,49 +93,82 @@ def unread_messages_queryset(thread: "QuizAlertThread", user):
     return queryset
 
 
-def unread_count_for_alert(thread: "QuizAlertThread", user) -> int:
-    return unread_messages_queryset(thread, user).count()
+def unread_count_for_alert(thread: QuizAlertThread, user) -> int:
+    # Compteur dénormalisé du participant : aucune requête.
+    if is_alert_owner(thread, user):
+        return thread.owner_unread_count
+    if is_alert_reporter(thread, user):
+        return thread.reporter_unread_count
+    return 0
 
 
-def is_alert_unread(thread: "QuizAlertThread", user) -> bool:
-    return unread_messages_queryset(thread, user).exists()
+def is_alert_unread(thread: QuizAlertThread, user) -> bool:
+    return unread_count_for_alert(thread, user) > 0
 
 
-def mark_alert_read(thread: "QuizAlertThread", user, *, at=None, save=True) -> None:
-    if not is_alert_participant(thread, user):
-        return
+def _lock_alert_thread(thread: QuizAlertThread) -> None:
+    # Les messages et les lectures d'une conversation se succèdent sous ce verrou : la remise à zéro
+    # d'un compteur ne peut pas écraser l'incrément d'un message concurrent de l'autre participant.
+    # last_message_at est relu sous le verrou.
+    from .models import QuizAlertThread
 
-    at = at or timezone.now()
-    fields: list[str] = []
+    thread.last_message_at = (
+        QuizAlertThread.objects.select_for_update().filter(pk=thread.pk).values_list("last_message_at", flat=True).first()
+    )
+
+
+def _read_marker_fields(thread: QuizAlertThread, user) -> tuple[str, str]:
     if is_alert_owner(thread, user):
-        thread.owner_last_read_at = at
-        fields.append("owner_last_read_at")
-    elif is_alert_reporter(thread, user):
-        thread.reporter_last_read_at = at
-        fields.append("reporter_last_read_at")
+        return "owner_last_read_at", "owner_unread_count"
+    return "reporter_last_read_at", "reporter_unread_count"
 
-    if save and fields:
-        thread.save(update_fields=fields)
 
+def mark_alert_read(thread: QuizAlertThread, user, *, at=None, save=True) -> None:
+    from .models import QuizAlertThread
 
-def message_is_mine(message: "QuizAlertMessage", user) -> bool:
+    if not is_alert_participant(thread, user):
+        return
+
+    marker_field, count_field = _read_marker_fields(thread, user)
+    with transaction.atomic():
+        if save:
+            _lock_alert_thread(thread)
+        read_all = at is None or (thread.last_message_at is not None and at >= thread.last_message_at)
+        at = at or timezone.now()
+        setattr(thread, marker_field, at)
+        # Lu jusqu'à un instant antérieur au dernier message : les messages postérieurs restent non lus.
+        unread = 0 if read_all else unread_messages_queryset(thread, user).count()
+        setattr(thread, count_field, unread)
+        if save:
+            QuizAlertThread.objects.filter(pk=thread.pk).update(**{marker_field: at, count_field: unread})
+
+
+def message_is_mine(message: QuizAlertMessage, user) -> bool:
     return bool(user and user.is_authenticated and message.author_id == user.id)
 
 
-def message_is_unread_for_user(message: "QuizAlertMessage", user) -> bool:
+def message_is_unread_for_user(message: QuizAlertMessage, user) -> bool:
     if not user or not user.is_authenticated or message.author_id == user.id:
         return False
     last_read_at = participant_last_read_at(message.thread, user)
     return last_read_at is None or message.created_at > last_read_at
 
 
-def alert_last_message_preview(thread: "QuizAlertThread") -> str:
-    # list() exploite le prefetch cache de Django si messages est prefetché ;
-    # sinon déclenche une requête DB. Messages sont ordonnés created_at asc.
-    messages = list(thread.messages.all())
-    if not messages:
-        return ""
-    return (messages[-1].body or "").strip()[:120]
+def alert_last_message_preview(thread: QuizAlertThread) -> str:
+    # Colonne dénormalisée (QuizAlertMessage.save) : aucune lecture des messages.
+    return thread.last_message_preview
+
+
+def alert_thread_messages_queryset(thread: QuizAlertThread):
+    """Messages d'une conversation, plus récents d'abord (ordre de la pagination keyset)."""
+    return thread.messages.select_related("author").order_by("-created_at", "-id")
+
+
+def latest_alert_messages(thread: QuizAlertThread, limit: int) -> tuple[list[QuizAlertMessage], bool]:
+    """Les `limit` derniers messages en ordre chronologique, et s'il en existe de plus anciens (1 requête)."""
+    messages = list(alert_thread_messages_queryset(thread)[: limit + 1])
+    has_more = len(messages) > limit
+    return messages[:limit][::-1], has_more
 
 
 def alert_thread_queryset():
@@ -149,7 +185,6 @@ def alert_thread_queryset():
             "owner",
             "closed_by",
         )
-        .prefetch_related("messages__author")
         .order_by("-last_message_at", "-created_at")
     )
 
@@ -161,28 +196,39 @@ def alert_thread_queryset_for_user(user):
     return queryset.filter(models.Q(reporter=user) | models.Q(owner=user))
 
 
-def unread_total_for_queryset(queryset, user) -> int:
-    total = 0
-    for thread in queryset:
-        prefetch_cache = getattr(thread, "_prefetched_objects_cache", {})
-        if "messages" in prefetch_cache:
-            last_read_at = participant_last_read_at(thread, user)
-            total += sum(
-                1 for msg in thread.messages.all()
-                if msg.author_id != user.id
-                and (last_read_at is None or msg.created_at > last_read_at)
+def unread_total_for_user(user) -> int:
+    """
+    Total des messages non lus de l'utilisateur, toutes conversations confondues : un seul agrégat
+    sur les compteurs dénormalisés, servi par les index partiels alert_*_unread_idx.
+    """
+    from .models import QuizAlertThread
+
+    if not user or not user.is_authenticated:
+        return 0
+    total = (
+        QuizAlertThread.objects
+        .filter(
+            models.Q(owner_id=user.id, owner_unread_count__gt=0)
+            | models.Q(reporter_id=user.id, reporter_unread_count__gt=0)
+        )
+        .aggregate(
+            total=models.Sum(
+                models.Case(
+                    models.When(owner_id=user.id, then=models.F("owner_unread_count")),
+                    default=models.F("reporter_unread_count"),
+                )
             )
-        else:
-            total += unread_count_for_alert(thread, user)
-    return total
+        )["total"]
+    )
+    return total or 0
 
 
-def require_alert_owner(thread: "QuizAlertThread", user, action_label: str) -> None:
+def require_alert_owner(thread: QuizAlertThread, user, action_label: str) -> None:
     if not is_alert_owner(thread, user):
         raise PermissionDenied(f"Seul le créateur du quiz peut {action_label} cette conversation.")
 
 
-def create_alert_thread(*, reporter, quiz: "Quiz", quizquestion: "QuizQuestion", owner, body: str, language: str, now=None):
+def create_alert_thread(*, reporter, quiz: Quiz, quizquestion: QuizQuestion, owner, body: str, language: str, now=None):
     from .models import QuizAlertMessage, QuizAlertThread
 
     now = now or timezone.now()
@@ -201,56 +247,98 @@ def create_alert_thread(*, reporter, quiz: "Quiz", quizquestion: "QuizQuestion",
         author=reporter,
         body=body.strip(),
     )
+    thread.refresh_from_db(
+        fields=["owner_unread_count", "reporter_unread_count", "last_message_preview", "last_message_author"]
+    )
     return thread
 
 
-def create_assignment_alert_thread(*, reporter, quiz: "Quiz", owner, now=None):
-    from .models import QuizAlertMessage, QuizAlertThread
+def create_assignment_alert_thread(*, reporter, quiz: Quiz, owner, now=None):
+    return create_assignment_alert_threads([(reporter, quiz, owner)], now=now)[0]
+
+
+def create_assignment_alert_threads(assignments, *, now=None) -> list[QuizAlertThread]:
+    """
+    Crée les conversations d'assignation de (reporter, quiz, owner) par deux bulk_create.
+    bulk_create n'appelle ni QuizAlertMessage.save ni post_save : compteurs non lus, aperçu
+    et dernier auteur sont posés à la création et les événements alert.message publiés ici.
+    """
+    from .events import publish_alert_messages
+    from .models import QuizAlertMessage, QuizAlertThread, alert_message_preview
 
+    assignments = list(assignments)
+    if not assignments:
+        return []
     now = now or timezone.now()
-    language = getattr(reporter, "language", None)
-    copy = assignment_alert_copy(language)
     status = assignment_alert_initial_status()
     reporter_reply_allowed = assignment_alert_reporter_reply_allowed()
-    closed_at = now if status == QuizAlertThread.STATUS_CLOSED else None
-    closed_by = owner if status == QuizAlertThread.STATUS_CLOSED else None
-    thread = QuizAlertThread.objects.create(
-        quiz=quiz,
-        kind=QuizAlertThread.KIND_ASSIGNMENT,
-        quizquestion=None,
-        reporter=reporter,
-        owner=owner,
-        reported_language=str(language or "en"),
-        status=status,
-        reporter_reply_allowed=reporter_reply_allowed,
-        last_message_at=now,
-        owner_last_read_at=now,
-        closed_at=closed_at,
-        closed_by=closed_by,
-    )
-    QuizAlertMessage.objects.create(
-        thread=thread,
-        author=owner,
-        body=copy["body"].strip(),
-    )
-    return thread
-
+    closed = status == QuizAlertThread.STATUS_CLOSED
+    threads = []
+    bodies = []
+    for reporter, quiz, owner in assignments:
+        language = getattr(reporter, "language", None)
+        body = assignment_alert_copy(language)["body"].strip()
+        bodies.append(body)
+        threads.append(
+            QuizAlertThread(
+                quiz=quiz,
+                kind=QuizAlertThread.KIND_ASSIGNMENT,
+                quizquestion=None,
+                reporter=reporter,
+                owner=owner,
+                reported_language=str(language or "en"),
+                status=status,
+                reporter_reply_allowed=reporter_reply_allowed,
+                last_message_at=now,
+                owner_last_read_at=now,
+                reporter_unread_count=1,
+                last_message_preview=alert_message_preview(body),
+                last_message_author=owner,
+                closed_at=now if closed else None,
+                closed_by=owner if closed else None,
+            )
+        )
+    with transaction.atomic():
+        QuizAlertThread.objects.bulk_create(threads)
+        messages = QuizAlertMessage.objects.bulk_create([
+            QuizAlertMessage(thread=thread, author=thread.owner, body=body)
+            for thread, body in zip(threads, bodies)
+        ])
+        # Même horodatage que QuizAlertMessage.save : la conversation date de son premier message.
+        for thread, message in zip(threads, messages):
+            thread.last_message_at = message.created_at
+        QuizAlertThread.objects.bulk_update(threads, ["last_message_at"])
+        publish_alert_messages(messages)
+    return threads
+
+
+def append_alert_message(*, thread: QuizAlertThread, author, body: str, now=None):
+    from .models import QuizAlertMessage, QuizAlertThread
 
-def append_alert_message(*, thread: "QuizAlertThread", author, body: str, now=None):
-    from .models import QuizAlertMessage
+    with transaction.atomic():
+        _lock_alert_thread(thread)
+        now = now or timezone.now()
+        message = QuizAlertMessage.objects.create(
+            thread=thread,
+            author=author,
+            body=body.strip(),
+        )
 
-    now = now or timezone.now()
-    message = QuizAlertMessage.objects.create(
-        thread=thread,
-        author=author,
-        body=body.strip(),
+        # QuizAlertMessage.save a déjà compté le message comme non lu pour l'autre participant ;
+        # l'auteur a tout lu jusqu'ici.
+        if is_alert_participant(thread, author):
+            marker_field, count_field = _read_marker_fields(thread, author)
+            QuizAlertThread.objects.filter(pk=thread.pk).update(**{marker_field: now, count_field: 0})
+
+    thread.refresh_from_db(
+        fields=[
+            "last_message_at",
+            "last_message_preview",
+            "last_message_author",
+            "owner_last_read_at",
+            "owner_unread_count",
+            "reporter_last_read_at",
+            "reporter_unread_count",
+        ]
     )
-
-    thread.last_message_at = message.created_at
-    if is_alert_owner(thread, author):
-        thread.owner_last_read_at = now
-    elif is_alert_reporter(thread, author):
-        thread.reporter_last_read_at = now
-
-    thread.save(update_fields=["last_message_at", "owner_last_read_at", "reporter_last_read_at"])
     return message
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterable
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from .answer_writes import save_quiz_answers_batch
+from .models import Quiz, QuizQuestion, normalize_option_ids
+
+logger = logging.getLogger(__name__)
+
+ANSWER_BUFFER_CACHE_PREFIX = "quiz:answer_buffer"
+ANSWER_BUFFER_CACHE_TIMEOUT = 60 * 60 * 24
+# Un trou de séquence (numéro réservé mais entrée absente) bloque la vidange tant qu'une
+# écriture concurrente peut encore le combler ; au-delà, l'entrée est considérée perdue.
+ANSWER_BUFFER_GAP_GRACE = timedelta(seconds=30)
+# Attente maximale, avant verrouillage, d'un trou récent à la clôture (secondes, wait_for_answer_buffers).
+ANSWER_BUFFER_BARRIER_WAIT = 2.0
+ANSWER_BUFFER_BARRIER_POLL = 0.05
+
+# Tampon d'écriture différée des réponses (QUIZ_ANSWER_WRITE_BEHIND).
+# Chaque réponse acquittée reçoit un numéro de séquence par session (cache.incr) et est stockée
+# sous sa propre clé ; la vidange applique les entrées dans l'ordre (la dernière l'emporte par question)
+# via save_quiz_answers_batch, puis avance le filigrane « vidé jusqu'à » au commit.
+# Garanties :
+# - une réponse acquittée reste dans le cache jusqu'au commit de la transaction qui l'a écrite en base ;
+#   un échec de vidange la laisse en place pour la vidange suivante ;
+# - la vidange d'une session se fait sous le verrou de sa ligne Quiz : deux vidanges ne se croisent pas ;
+# - les réponses ne sont durables que si le cache l'est : avec plusieurs process, CACHE_URL doit
+#   pointer vers un cache partagé et persistant (Redis), locmem ne convient qu'aux tests ;
+# - toute finalisation (clôture, expiration, clôture en masse) est une barrière stricte : un trou sous
+#   le verrou de la session la fait échouer (AnswerBufferGapError, 409), sans jamais finaliser une session
+#   dont des réponses acquittées restent en tampon ni attendre en tenant le verrou ; les appelants qui
+#   n'ont encore rien verrouillé laissent d'abord au trou le temps de se combler (wait_for_answer_buffers) ;
+# - une fois la session fermée, ce qui reste dans son tampon (ou a été acquitté après ended_at)
+#   arrive après la barrière et est écarté ;
+# - QUIZ_ANSWER_WRITE_BEHIND désactivé, aucune vidange n'est tentée : laisser la vidange périodique
+#   (flush_answer_buffers_task) terminer avant de désactiver le réglage.
+
+
+class AnswerBufferGapError(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "Des réponses sont encore en cours d'enregistrement, réessayez."
+    default_code = "answer_buffer_gap"
+
+
+def _seq_key(quiz_id: int) -> str:
+    return f"{ANSWER_BUFFER_CACHE_PREFIX}:{quiz_id}:seq"
+
+
+def _flushed_key(quiz_id: int) -> str:
+    return f"{ANSWER_BUFFER_CACHE_PREFIX}:{quiz_id}:flushed"
+
+
+def _entry_key(quiz_id: int, seq: int) -> str:
+    return f"{ANSWER_BUFFER_CACHE_PREFIX}:{quiz_id}:{seq}"
+
+
+def buffer_quiz_answers(*, quiz: Quiz, entries) -> int:
+    """
+    Acquitte des réponses déjà validées sans toucher la base.
+    `entries` : liste de (QuizQuestion, [answer_option_id, ...]) comme pour save_quiz_answers_batch.
+    Une réservation de séquence (1 incr) puis 1 set_many. Retourne le dernier numéro de séquence.
+    """
+    if not entries:
+        return 0
+    seq_key = _seq_key(quiz.pk)
+    cache.add(seq_key, 0, ANSWER_BUFFER_CACHE_TIMEOUT)
+    last = cache.incr(seq_key, len(entries))
+    buffered_at = timezone.now()
+    first = last - len(entries) + 1
+    cache.set_many(
+        {
+            _entry_key(quiz.pk, seq): (qq.pk, normalize_option_ids(option_ids), buffered_at)
+            for seq, (qq, option_ids) in enumerate(entries, start=first)
+        },
+        ANSWER_BUFFER_CACHE_TIMEOUT,
+    )
+    cache.touch(seq_key, ANSWER_BUFFER_CACHE_TIMEOUT)
+    return last
+
+
+def pending_answer_buffers(quiz_ids: Iterable[int]) -> list[int]:
+    """Sessions dont le tampon contient des entrées non vidées (1 get_many)."""
+    quiz_ids = list(quiz_ids)
+    keys = [key for quiz_id in quiz_ids for key in (_seq_key(quiz_id), _flushed_key(quiz_id))]
+    values = cache.get_many(keys)
+    return [
+        quiz_id
+        for quiz_id in quiz_ids
+        if values.get(_seq_key(quiz_id), 0) != values.get(_flushed_key(quiz_id), 0)
+    ]
+
+
+def _acknowledge(quiz_id: int, first: int, last: int) -> None:
+    # max() : une vidange concurrente plus avancée ne doit pas voir son filigrane reculer.
+    cache.set(_flushed_key(quiz_id), max(last, cache.get(_flushed_key(quiz_id), 0)), ANSWER_BUFFER_CACHE_TIMEOUT)
+    cache.delete_many([_entry_key(quiz_id, seq) for seq in range(first, last + 1)])
+
+
+def _readable_prefix(quiz_id: int, flushed: int, seq: int) -> tuple[int, dict[int, tuple]]:
+    """
+    Entrées lisibles à partir de `flushed` + 1, dans l'ordre et sans trou récent.
+    Retourne (dernier numéro consommé, {numéro: entrée}).
+    """
+    found = cache.get_many([_entry_key(quiz_id, n) for n in range(flushed + 1, seq + 1)])
+    entries = {
+        n: found[_entry_key(quiz_id, n)]
+        for n in range(flushed + 1, seq + 1)
+        if _entry_key(quiz_id, n) in found
+    }
+    stale_before = timezone.now() - ANSWER_BUFFER_GAP_GRACE
+    last = flushed
+    for n in range(flushed + 1, seq + 1):
+        if n not in entries:
+            # Trou : réservation en cours d'écriture, ou entrée perdue si une entrée ultérieure est ancienne.
+            if not any(later > n and entry[2] < stale_before for later, entry in entries.items()):
+                break
+            logger.warning("quiz.answer_buffer_gap", extra={"quiz_id": quiz_id, "seq": n})
+        last = n
+    return last, {n: entry for n, entry in entries.items() if n <= last}
+
+
+def _has_gap(quiz_id: int) -> bool:
+    flushed = cache.get(_flushed_key(quiz_id), 0)
+    seq = cache.get(_seq_key(quiz_id), 0)
+    return seq > flushed and _readable_prefix(quiz_id, flushed, seq)[0] < seq
+
+
+def wait_for_answer_buffers(quiz_ids: Iterable[int]) -> None:
+    """
+    À appeler avant de verrouiller des sessions à finaliser : attend qu'un trou récent de leur tampon
+    se comble, au plus ANSWER_BUFFER_BARRIER_WAIT secondes. Sans verrou, l'attente ne bloque pas
+    les écritures qui le combleront ; la barrière sous verrou échoue ensuite sans attendre.
+    """
+    if not settings.QUIZ_ANSWER_WRITE_BEHIND:
+        return
+    waiting = pending_answer_buffers(quiz_ids)
+    deadline = time.monotonic() + ANSWER_BUFFER_BARRIER_WAIT
+    while waiting:
+        waiting = [quiz_id for quiz_id in waiting if _has_gap(quiz_id)]
+        if not waiting or time.monotonic() >= deadline:
+            return
+        time.sleep(ANSWER_BUFFER_BARRIER_POLL)
+
+
+def _discard(quiz_id: int, flushed: int, seq: int) -> int:
+    logger.warning("quiz.answer_buffer_discarded", extra={"quiz_id": quiz_id, "count": seq - flushed})
+    transaction.on_commit(lambda: _acknowledge(quiz_id, flushed + 1, seq))
+    return 0
+
+
+def flush_quiz_answer_buffer(quiz_id: int, *, barrier: bool = False) -> int:
+    """
+    Écrit en base les réponses tamponnées d'une session, sous le verrou de sa ligne Quiz.
+    Les entrées ne quittent le tampon qu'au commit. Retourne le nombre d'entrées consommées.
+    `barrier` (finalisation) : toutes les entrées réservées doivent être écrites ; un trou lève
+    AnswerBufferGapError sans attendre sous le verrou (voir wait_for_answer_buffers).
+    Hors barrière, le tampon d'une session déjà fermée est écarté sans écriture ; dans tous les cas,
+    les entrées acquittées après `ended_at` sont écartées.
+    """
+    with transaction.atomic():
+        quiz = Quiz.objects.select_for_update().filter(pk=quiz_id).first()
+        if quiz is None:
+            return 0
+        flushed = cache.get(_flushed_key(quiz_id), 0)
+        seq = cache.get(_seq_key(quiz_id), 0)
+        if seq < flushed:
+            # Séquence évincée puis recréée : les anciennes entrées ont déjà été vidées.
+            flushed = 0
+            cache.set(_flushed_key(quiz_id), 0, ANSWER_BUFFER_CACHE_TIMEOUT)
+        if seq == flushed:
+            return 0
+        if not barrier and not quiz.active:
+            return _discard(quiz_id, flushed, seq)
+
+        last, entries = _readable_prefix(quiz_id, flushed, seq)
+        if barrier and last < seq:
+            logger.warning("quiz.answer_buffer_barrier_gap", extra={"quiz_id": quiz_id, "seq": last + 1})
+            raise AnswerBufferGapError()
+        if last == flushed:
+            return 0
+
+        if quiz.ended_at is not None:
+            # Une entrée acquittée après la fin de session est arrivée après la barrière : écartée.
+            entries = {n: entry for n, entry in entries.items() if entry[2] <= quiz.ended_at}
+        latest: dict[int, list[int]] = {}
+        for n in sorted(entries):
+            quizquestion_id, option_ids, _ = entries[n]
+            latest[quizquestion_id] = option_ids
+        quiz_questions = QuizQuestion.objects.filter(
+            pk__in=latest,
+            quiz_id=quiz.quiz_template_id,
+        ).only("id", "sort_order")
+        save_quiz_answers_batch(
+            quiz=quiz,
+            entries=[(qq, latest[qq.pk]) for qq in quiz_questions],
+            answered_at=max((entry[2] for entry in entries.values()), default=None),
+        )
+        transaction.on_commit(lambda: _acknowledge(quiz_id, flushed + 1, last))
+    return last - flushed
+
+
+def flush_answer_buffers(quiz_ids: Iterable[int], *, barrier: bool = False) -> int:
+    """
+    Barrière de vidange pour plusieurs sessions : 1 get_many, puis une vidange par session en attente.
+    Sans effet (ni accès au cache) si QUIZ_ANSWER_WRITE_BEHIND est désactivé.
+    """
+    if not settings.QUIZ_ANSWER_WRITE_BEHIND:
+        return 0
+    return sum(
+        flush_quiz_answer_buffer(quiz_id, barrier=barrier)
+        for quiz_id in pending_answer_buffers(quiz_ids)
+    )
+
+
+def flush_active_answer_buffers(*, batch_size: int = 500) -> int:
+    """
+    Vidange périodique : parcourt les sessions démarrées et actives par lots d'ids
+    et vide celles dont le tampon n'est pas vide. Retourne le nombre d'entrées consommées.
+    """
+    flushed = 0
+    quiz_ids = (
+        Quiz.objects
+        .filter(active=True, started_at__isnull=False)
+        .order_by("id")
+        .values_list("id", flat=True)
+        .iterator(chunk_size=batch_size)
+    )
+    batch: list[int] = []
+    for quiz_id in quiz_ids:
+        batch.append(quiz_id)
+        if len(batch) >= batch_size:
+            flushed += flush_answer_buffers(batch)
+            batch = []
+    if batch:
+        flushed += flush_answer_buffers(batch)
+    if flushed:
+        logger.info("quiz.answer_buffers_flushed", extra={"count": flushed})
+    return flushed
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from django.core.cache import cache
+from django.db.models import F
+
+from question.models import AnswerOption
+from quiz.models import QuizQuestion, QuizTemplate
+
+ANSWER_KEY_CACHE_PREFIX = "quiz:answer_key"
+ANSWER_KEY_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+class AnswerKeyEntry(NamedTuple):
+    weight: float
+    correct_ids: frozenset[int]
+
+
+def _cache_key(quiz_template_id: int, created_at, version: int) -> str:
+    # created_at protège contre la réutilisation d'un id (base réinitialisée, restauration).
+    return f"{ANSWER_KEY_CACHE_PREFIX}:{quiz_template_id}:{created_at.timestamp()}:{version}"
+
+
+def compile_answer_key(quiz_template_id: int) -> dict[int, AnswerKeyEntry]:
+    """
+    Construit la clé de correction d'un template : {quizquestion_id: (poids, ids des options correctes)}.
+    Deux requêtes, quel que soit le nombre de questions.
+    """
+    correct_ids: dict[int, set[int]] = {}
+    rows = (
+        AnswerOption.objects
+        .filter(is_correct=True, question__quiz_questions__quiz_id=quiz_template_id)
+        .values_list("question__quiz_questions__id", "id")
+    )
+    for quizquestion_id, option_id in rows:
+        correct_ids.setdefault(quizquestion_id, set()).add(option_id)
+
+    return {
+        quizquestion_id: AnswerKeyEntry(float(weight or 0), frozenset(correct_ids.get(quizquestion_id, ())))
+        for quizquestion_id, weight in QuizQuestion.objects.filter(quiz_id=quiz_template_id).values_list("id", "weight")
+    }
+
+
+def get_versioned_answer_key(quiz_template_id: int) -> tuple[int | None, dict[int, AnswerKeyEntry]]:
+    """
+    Retourne (answer_key_version, clé de correction) du template, la clé depuis le cache Django.
+    La version durable du template fait partie de la clé : une modification des entrées du scoring
+    rend l'ancienne entrée inatteignable, sans course entre lecture et invalidation.
+    La version retournée est celle de la clé : les scores calculés avec elle l'enregistrent
+    (QuizQuestionAnswer.scored_answer_key_version).
+    """
+    row = QuizTemplate.objects.filter(pk=quiz_template_id).values_list("answer_key_version", "created_at").first()
+    if row is None:
+        return None, {}
+    version, created_at = row
+    key = _cache_key(quiz_template_id, created_at, version)
+    answer_key = cache.get(key)
+    if answer_key is None:
+        answer_key = compile_answer_key(quiz_template_id)
+        cache.set(key, answer_key, ANSWER_KEY_CACHE_TIMEOUT)
+    return version, answer_key
+
+
+def get_answer_key(quiz_template_id: int) -> dict[int, AnswerKeyEntry]:
+    """Clé de correction du template (get_versioned_answer_key sans la version)."""
+    return get_versioned_answer_key(quiz_template_id)[1]
+
+
+def score_selection(entry: AnswerKeyEntry | None, selected_ids: Iterable[int]) -> tuple[float, float, bool]:
+    """(earned_score, max_score, is_correct) d'une sélection d'options face à une entrée de la clé."""
+    if entry is None:
+        return 0.0, 0.0, False
+    is_correct = bool(entry.correct_ids and set(selected_ids) == entry.correct_ids)
+    return (entry.weight if is_correct else 0.0), entry.weight, is_correct
+
+
+def bump_answer_key_version(*, quiz_template_ids: Iterable[int] | None = None, question_ids: Iterable[int] | None = None) -> None:
+    """
+    Invalide la clé de correction des templates concernés (une requête UPDATE).
+    `question_ids` cible tous les templates qui contiennent ces questions.
+    """
+    qs = QuizTemplate.objects.none()
+    if quiz_template_ids is not None:
+        qs = QuizTemplate.objects.filter(pk__in=list(quiz_template_ids))
+    elif question_ids is not None:
+        qs = QuizTemplate.objects.filter(
+            pk__in=QuizQuestion.objects.filter(question_id__in=list(question_ids)).values("quiz_id")
+        )
+    qs.update(answer_key_version=F("answer_key_version") + 1)
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Sum, Value, When
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from config.conditional import queryset_version
+
+from .models import (
+    QuizQuestion,
+    QuizQuestionAnswer,
+    QuizQuestionOptionStats,
+    QuizQuestionStats,
+)
+
+# Statistiques de réponse par question de template et par option, sur les sessions finalisées.
+# Chaque réponse mémorise la contribution déjà comptée (stats_option_ids / stats_is_correct) :
+# à chaque finalisation, seul l'écart entre l'état courant et l'état compté est appliqué.
+# Une session re-finalisée (réponses modifiées, clé de correction changée) n'est donc jamais comptée deux fois,
+# et une session supprimée retire sa contribution (retract_answer_stats).
+
+
+def _increments(field: str, deltas: dict, key_field: str) -> Greatest:
+    return Greatest(
+        F(field) + Case(
+            *(When(**{key_field: key}, then=Value(delta)) for key, delta in deltas.items()),
+            default=Value(0),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def _apply_deltas(questions: dict[int, list[int]], options: Counter) -> None:
+    """
+    Applique les écarts {quizquestion_id: [attempts, correct]} et {(quizquestion_id, option_id): picks}.
+    Les lignes manquantes sont créées à zéro, puis un UPDATE par table ajoute les écarts.
+    Les verrous sont pris dans l'ordre des pk pour que deux finalisations concurrentes ne s'interbloquent pas.
+    """
+    questions = {key: value for key, value in questions.items() if any(value)}
+    options = Counter({key: value for key, value in options.items() if value})
+    if not questions and not options:
+        return
+    now = timezone.now()
+    with transaction.atomic():
+        if questions:
+            QuizQuestionStats.objects.bulk_create(
+                [QuizQuestionStats(quizquestion_id=quizquestion_id) for quizquestion_id in sorted(questions)],
+                ignore_conflicts=True,
+            )
+            stats = QuizQuestionStats.objects.filter(quizquestion_id__in=questions)
+            list(stats.select_for_update().order_by("pk").values_list("pk", flat=True))
+            stats.update(
+                attempts=_increments("attempts", {key: value[0] for key, value in questions.items()}, "quizquestion_id"),
+                correct=_increments("correct", {key: value[1] for key, value in questions.items()}, "quizquestion_id"),
+                updated_at=now,
+            )
+        if options:
+            # Une ligne n'est créée que pour un ajout : un retrait sur une option supprimée ne touche rien.
+            QuizQuestionOptionStats.objects.bulk_create(
+                [
+                    QuizQuestionOptionStats(quizquestion_id=quizquestion_id, answer_option_id=option_id)
+                    for (quizquestion_id, option_id), delta in sorted(options.items())
+                    if delta > 0
+                ],
+                ignore_conflicts=True,
+            )
+            matches = Q()
+            for quizquestion_id, option_id in options:
+                matches |= Q(quizquestion_id=quizquestion_id, answer_option_id=option_id)
+            stats = QuizQuestionOptionStats.objects.filter(matches)
+            list(stats.select_for_update().order_by("pk").values_list("pk", flat=True))
+            stats.update(
+                picks=Greatest(
+                    F("picks") + Case(
+                        *(
+                            When(quizquestion_id=quizquestion_id, answer_option_id=option_id, then=Value(delta))
+                            for (quizquestion_id, option_id), delta in options.items()
+                        ),
+                        default=Value(0),
+                        output_field=IntegerField(),
+                    ),
+                    Value(0),
+                ),
+                updated_at=now,
+            )
+
+
+def _contribute(questions: dict, options: Counter, quizquestion_id: int, option_ids, is_correct: bool, sign: int):
+    counts = questions.setdefault(quizquestion_id, [0, 0])
+    counts[0] += sign
+    counts[1] += sign if is_correct else 0
+    for option_id in option_ids:
+        options[(quizquestion_id, option_id)] += sign
+
+
+def record_answer_stats(quiz_ids: Iterable[int]) -> int:
+    """
+    Compte les réponses des sessions qui viennent d'être finalisées (appelé par la réconciliation).
+    1 lecture des réponses, puis seulement si quelque chose a changé : les écarts (quelques requêtes
+    par table) et 1 UPDATE qui aligne l'état compté des réponses. Retourne le nombre de réponses recomptées.
+    """
+    quiz_ids = list(quiz_ids)
+    if not quiz_ids:
+        return 0
+    questions: dict[int, list[int]] = {}
+    options: Counter = Counter()
+    changed = []
+    rows = (
+        QuizQuestionAnswer.objects
+        .filter(quiz_id__in=quiz_ids)
+        .values_list("pk", "quizquestion_id", "selected_option_ids", "is_correct", "stats_option_ids", "stats_is_correct")
+    )
+    for pk, quizquestion_id, option_ids, is_correct, counted_ids, counted_correct in rows:
+        option_ids = option_ids or []
+        is_correct = bool(is_correct)
+        if counted_ids == option_ids and counted_correct == is_correct:
+            continue
+        if counted_ids is not None:
+            _contribute(questions, options, quizquestion_id, counted_ids, counted_correct, -1)
+        _contribute(questions, options, quizquestion_id, option_ids, is_correct, 1)
+        changed.append(pk)
+    if not changed:
+        return 0
+    with transaction.atomic():
+        _apply_deltas(questions, options)
+        QuizQuestionAnswer.objects.filter(pk__in=changed).update(
+            stats_option_ids=F("selected_option_ids"),
+            stats_is_correct=Coalesce(F("is_correct"), Value(False)),
+        )
+    return len(changed)
+
+
+def retract_answer_stats(answers) -> None:
+    """Retire la contribution déjà comptée des réponses données (avant leur suppression)."""
+    questions: dict[int, list[int]] = {}
+    options: Counter = Counter()
+    rows = answers.filter(stats_option_ids__isnull=False).values_list(
+        "quizquestion_id", "stats_option_ids", "stats_is_correct"
+    )
+    for quizquestion_id, counted_ids, counted_correct in rows:
+        _contribute(questions, options, quizquestion_id, counted_ids, counted_correct, -1)
+    _apply_deltas(questions, options)
+
+
+def rebuild_answer_stats(*, quiz_template_ids: Iterable[int] | None = None) -> int:
+    """
+    Reconstruit les statistiques depuis les réponses des sessions fermées et finalisées
+    (commande de réparation), template par template. Retourne le nombre de templates traités.
+    """
+    templates = QuizQuestion.objects.order_by("quiz_id").values_list("quiz_id", flat=True).distinct()
+    if quiz_template_ids is not None:
+        templates = templates.filter(quiz_id__in=list(quiz_template_ids))
+    rebuilt = 0
+    for quiz_template_id in list(templates):
+        with transaction.atomic():
+            answers = QuizQuestionAnswer.objects.filter(quizquestion__quiz_id=quiz_template_id)
+            counted = Q(quiz__active=False, quiz__finalized_answer_key_version__isnull=False)
+            answers.exclude(counted).update(stats_option_ids=None, stats_is_correct=False)
+            answers.filter(counted).update(
+                stats_option_ids=F("selected_option_ids"),
+                stats_is_correct=Coalesce(F("is_correct"), Value(False)),
+            )
+            QuizQuestionStats.objects.filter(quizquestion__quiz_id=quiz_template_id).delete()
+            QuizQuestionOptionStats.objects.filter(quizquestion__quiz_id=quiz_template_id).delete()
+
+            counted_answers = answers.filter(stats_option_ids__isnull=False).order_by()
+            QuizQuestionStats.objects.bulk_create([
+                QuizQuestionStats(quizquestion_id=row["quizquestion_id"], attempts=row["attempts"], correct=row["correct"])
+                for row in counted_answers.values("quizquestion_id").annotate(
+                    attempts=Count("id"),
+                    correct=Count("id", filter=Q(stats_is_correct=True)),
+                )
+            ])
+            picks: Counter = Counter()
+            # Sélections canoniques regroupées en SQL, ventilées par option ici.
+            selections = (
+                counted_answers
+                .values("quizquestion_id", "stats_option_ids")
+                .annotate(count=Count("id"))
+                .values_list("quizquestion_id", "stats_option_ids", "count")
+            )
+            for quizquestion_id, option_ids, count in selections:
+                for option_id in option_ids:
+                    picks[(quizquestion_id, option_id)] += count
+            QuizQuestionOptionStats.objects.bulk_create([
+                QuizQuestionOptionStats(quizquestion_id=quizquestion_id, answer_option_id=option_id, picks=count)
+                for (quizquestion_id, option_id), count in sorted(picks.items())
+            ])
+        rebuilt += 1
+    return rebuilt
+
+
+def question_answer_stats(question_id: int) -> dict:
+    """
+    Statistiques d'une question, toutes questions de template confondues (2 requêtes) :
+    tentatives, réponses correctes, taux de réussite et sélections par option.
+    """
+    per_template = list(
+        QuizQuestionStats.objects
+        .filter(quizquestion__question_id=question_id)
+        .order_by("quizquestion__quiz_id", "quizquestion_id")
+        .values("quizquestion_id", "attempts", "correct", quiz_template_id=F("quizquestion__quiz_id"))
+    )
+    attempts = sum(row["attempts"] for row in per_template)
+    correct = sum(row["correct"] for row in per_template)
+    picks = (
+        QuizQuestionOptionStats.objects
+        .filter(quizquestion__question_id=question_id)
+        .order_by("answer_option_id")
+        .values("answer_option_id")
+        .annotate(total=Sum("picks"))
+        .values_list("answer_option_id", "total")
+    )
+    return {
+        "attempts": attempts,
+        "correct": correct,
+        "correct_rate": round(correct / attempts, 4) if attempts else None,
+        "options": [{"answer_option_id": option_id, "picks": total} for option_id, total in picks],
+        "quiz_questions": per_template,
+    }
+
+
+def question_answer_stats_version(question_ids) -> list[tuple]:
+    """Parts de version (ETag) des statistiques des questions données : 1 agrégat par table."""
+    return [
+        queryset_version(QuizQuestionStats.objects.filter(quizquestion__question__in=question_ids), fields=("updated_at",)),
+        queryset_version(
+            QuizQuestionOptionStats.objects.filter(quizquestion__question__in=question_ids),
+            fields=("updated_at",),
+        ),
+    ]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from quiz.answer_key import get_versioned_answer_key
+from quiz.models import Quiz, QuizQuestionAnswer, normalize_option_ids
+from quiz.scoring import apply_answer_key_score
+from quiz.totals import refresh_quiz_totals
+
+
+def save_quiz_answers_batch(*, quiz: Quiz, entries, answered_at=None) -> list[QuizQuestionAnswer]:
+    """
+    Upsert de plusieurs réponses d'un quiz en écritures ensemblistes.
+    `entries` est une liste de (QuizQuestion, [answer_option_id, ...]) déjà validée.
+    Le quiz est verrouillé une seule fois, puis : 1 SELECT des réponses existantes,
+    1 bulk_create des manquantes, 1 bulk_update des existantes (sélection comprise,
+    stockée sur la ligne de réponse), 1 UPDATE des totaux de la session.
+    Avec QUIZ_SCORE_ON_WRITE, les scores sont calculés ici et écrits par les mêmes bulk ;
+    sinon la version de scoring des réponses modifiées est effacée, pour rescoring à la réconciliation.
+    `answered_at` (défaut : maintenant) permet de conserver l'heure de saisie d'un tampon.
+    """
+    if not entries:
+        return []
+
+    now = answered_at or timezone.now()
+    score_on_write = settings.QUIZ_SCORE_ON_WRITE
+    versioned_answer_key = get_versioned_answer_key(quiz.quiz_template_id) if score_on_write else None
+    update_fields = ["question_order", "answered_at", "selected_option_ids", "scored_answer_key_version"]
+    if score_on_write:
+        update_fields += ["earned_score", "max_score", "is_correct"]
+
+    with transaction.atomic():
+        Quiz.objects.select_for_update().filter(pk=quiz.pk).exists()
+
+        existing = {
+            answer.quizquestion_id: answer
+            for answer in QuizQuestionAnswer.objects.filter(
+                quiz=quiz,
+                quizquestion_id__in=[qq.pk for qq, _ in entries],
+            )
+        }
+
+        to_create = []
+        to_update = []
+        answers = []
+        for qq, option_ids in entries:
+            answer = existing.get(qq.pk)
+            if answer is None:
+                answer = QuizQuestionAnswer(
+                    quiz=quiz,
+                    quizquestion=qq,
+                    question_order=qq.sort_order,
+                    answered_at=now,
+                )
+                to_create.append(answer)
+            else:
+                answer.question_order = qq.sort_order
+                answer.answered_at = now
+                to_update.append(answer)
+            answer.selected_option_ids = normalize_option_ids(option_ids)
+            answer.scored_answer_key_version = None
+            if score_on_write:
+                apply_answer_key_score(answer, option_ids, versioned_answer_key)
+            answers.append(answer)
+
+        if to_create:
+            QuizQuestionAnswer.objects.bulk_create(to_create)
+        if to_update:
+            QuizQuestionAnswer.objects.bulk_update(to_update, update_fields)
+
+        refresh_quiz_totals([quiz.pk], unfinalize=True)
+
+    return answers
@@ -1,5 +1,6 @@
 from django.urls import path
 
+from .event_stream import EventStreamTicketView, event_stream
 from .views import (
     QuizTemplateViewSet,
     QuizViewSet,
@@ -19,6 +20,10 @@ quiztemplate_detail = QuizTemplateViewSet.as_view({
     "delete": "destroy",
 })
 quiztemplate_sessions = QuizTemplateViewSet.as_view({"get": "sessions"})
+quiztemplate_analytics = QuizTemplateViewSet.as_view({"get": "analytics"})
+quiztemplate_results_export = QuizTemplateViewSet.as_view({"get": "results_export"})
+quiztemplate_close_sessions = QuizTemplateViewSet.as_view({"post": "close_sessions"})
+quiztemplate_close_sessions_status = QuizTemplateViewSet.as_view({"get": "close_sessions_status"})
 quiztemplate_generate = QuizTemplateViewSet.as_view({"post": "generate_from_subjects"})
 # # --- QuizQuestion nested under template ---
 template_question_list = QuizTemplateQuizQuestionViewSet.as_view({"get": "list", "post": "create"})
@@ -40,11 +45,13 @@ quiz_detail = QuizViewSet.as_view({
 quiz_start = QuizViewSet.as_view({"post": "start"})
 quiz_close = QuizViewSet.as_view({"post": "close"})
 quiz_bulk = QuizViewSet.as_view({"post": "bulk_create_from_template"})
+quiz_bulk_status = QuizViewSet.as_view({"get": "bulk_create_from_template_status"})
 #
 # # --- Alert threads ---
 quiz_alert_list = QuizAlertThreadViewSet.as_view({"get": "list", "post": "create"})
 quiz_alert_detail = QuizAlertThreadViewSet.as_view({"get": "retrieve", "patch": "partial_update"})
 quiz_alert_message = QuizAlertThreadViewSet.as_view({"post": "post_message"})
+quiz_alert_messages = QuizAlertThreadViewSet.as_view({"get": "thread_messages"})
 quiz_alert_close = QuizAlertThreadViewSet.as_view({"post": "close"})
 quiz_alert_reopen = QuizAlertThreadViewSet.as_view({"post": "reopen"})
 quiz_alert_unread_count = QuizAlertThreadViewSet.as_view({"get": "unread_count"})
@@ -57,12 +64,25 @@ quiz_answer_detail = QuizQuestionAnswerViewSet.as_view({
     "patch": "partial_update",
     "delete": "destroy",
 })
+quiz_answer_batch = QuizQuestionAnswerViewSet.as_view({"post": "batch"})
 #
 urlpatterns = [
     #     # QuizTemplate
     path("template/", quiztemplate_list, name="quiz-template-list"),
     path("template/<int:qt_id>/", quiztemplate_detail, name="quiz-template-detail"),
     path("template/<int:qt_id>/sessions/", quiztemplate_sessions, name="quiz-template-sessions"),
+    path("template/<int:qt_id>/analytics/", quiztemplate_analytics, name="quiz-template-analytics"),
+    path(
+        "template/<int:qt_id>/results-export/",
+        quiztemplate_results_export,
+        name="quiz-template-results-export",
+    ),
+    path("template/<int:qt_id>/close-sessions/", quiztemplate_close_sessions, name="quiz-template-close-sessions"),
+    path(
+        "template/<int:qt_id>/close-sessions/<slug:job_id>/",
+        quiztemplate_close_sessions_status,
+        name="quiz-template-close-sessions-status",
+    ),
     path("template/generate-from-subjects/", quiztemplate_generate, name="quiz-template-generate-from-subjects"),
     #
     #     # Template -> questions (QuizQuestion)
@@ -77,6 +97,11 @@ urlpatterns = [
     path("", quiz_list, name="quiz-list"),
     path("<int:quiz_id>/", quiz_detail, name="quiz-detail"),
     path("bulk-create-from-template/", quiz_bulk, name="quiz-bulk-create-from-template"),
+    path(
+        "bulk-create-from-template/<slug:job_id>/",
+        quiz_bulk_status,
+        name="quiz-bulk-create-from-template-status",
+    ),
     path("<int:quiz_id>/start/", quiz_start, name="quiz-start"),
     path("<int:quiz_id>/close/", quiz_close, name="quiz-close"),
     #
@@ -85,10 +110,16 @@ urlpatterns = [
     path("alerts/unread-count/", quiz_alert_unread_count, name="quiz-alert-unread-count"),
     path("alerts/<int:alert_id>/", quiz_alert_detail, name="quiz-alert-detail"),
     path("alerts/<int:alert_id>/message/", quiz_alert_message, name="quiz-alert-message"),
+    path("alerts/<int:alert_id>/messages/", quiz_alert_messages, name="quiz-alert-messages"),
     path("alerts/<int:alert_id>/close/", quiz_alert_close, name="quiz-alert-close"),
     path("alerts/<int:alert_id>/reopen/", quiz_alert_reopen, name="quiz-alert-reopen"),
     #
+    #     # Flux d'événements (SSE)
+    path("events/ticket/", EventStreamTicketView.as_view(), name="quiz-event-ticket"),
+    path("events/stream/", event_stream, name="quiz-event-stream"),
+    #
     #     # Quiz -> answers
     path("<int:quiz_id>/answer/", quiz_answer_list, name="quiz-answer-list"),
     path("<int:quiz_id>/answer/<int:answer_id>/", quiz_answer_detail, name="quiz-answer-detail"),
+    path("<int:quiz_id>/answers/batch/", quiz_answer_batch, name="quiz-answer-batch"),
 ]
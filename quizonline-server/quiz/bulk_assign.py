@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+
+from domain.models import Domain
+
+from .access_index import invalidate_user_template_access
+from .jobs import JOB_DONE, JOB_FAILED, JOB_RUNNING, update_job
+from .models import Quiz, QuizTemplate
+from .notifications import notify_quizzes_assigned_on_commit
+
+logger = logging.getLogger(__name__)
+
+BULK_ASSIGN_CHUNK_SIZE = 500
+
+
+def resolve_assignment_targets(quiz_template, user_ids: Iterable[int]) -> tuple[list[int], list[int]]:
+    """
+    Sépare en une requête les destinataires existants en (éligibles, refusés) selon la règle de
+    validate_target_user_domain : superuser, ou membre/manager/owner du domaine actif du template.
+    Les ids inconnus sont ignorés, comme le filtre id__in de l'assignation unitaire.
+    """
+    user_ids = {int(user_id) for user_id in user_ids}
+    if not user_ids:
+        return [], []
+    users = get_user_model().objects.filter(pk__in=user_ids)
+    if quiz_template.domain_id is None:
+        return sorted(users.values_list("pk", flat=True)), []
+
+    in_domain = Domain.objects.filter(pk=quiz_template.domain_id, active=True).filter(
+        Q(owner=OuterRef("pk")) | Q(managers=OuterRef("pk")) | Q(members=OuterRef("pk"))
+    )
+    eligible, rejected = [], []
+    for user_id, is_superuser, is_in_domain in (
+        users
+        .annotate(in_domain=Exists(in_domain))
+        .order_by("pk")
+        .values_list("pk", "is_superuser", "in_domain")
+    ):
+        (eligible if is_superuser or is_in_domain else rejected).append(user_id)
+    return eligible, rejected
+
+
+def assign_quiz_template(
+    quiz_template,
+    user_ids: Iterable[int],
+    *,
+    assigned_by=None,
+    chunk_size: int = BULK_ASSIGN_CHUNK_SIZE,
+    on_chunk: Callable[[list[Quiz]], None] | None = None,
+) -> list[Quiz]:
+    """
+    Crée une session par destinataire (déjà validés, cf. resolve_assignment_targets) par lots
+    de `chunk_size` : un lot = une transaction avec un bulk_create des sessions, l'invalidation
+    de l'index d'accès et, au commit, les e-mails, conversations et événements du lot en masse.
+    Un échec n'annule que le lot en cours ; les lots précédents restent assignés.
+    """
+    user_ids = sorted(set(user_ids))
+    chunk_size = max(1, chunk_size)
+    User = get_user_model()
+    created: list[Quiz] = []
+
+    for start in range(0, len(user_ids), chunk_size):
+        chunk_ids = user_ids[start:start + chunk_size]
+        with transaction.atomic():
+            users = User.objects.filter(pk__in=chunk_ids).order_by("pk")
+            quizzes = Quiz.objects.bulk_create([
+                Quiz(
+                    domain_id=quiz_template.domain_id,
+                    quiz_template=quiz_template,
+                    user=user,
+                    active=False,
+                )
+                for user in users
+            ])
+            # bulk_create n'émet pas post_save : l'index d'accès des destinataires est invalidé ici.
+            invalidate_user_template_access(quiz.user_id for quiz in quizzes)
+            notify_quizzes_assigned_on_commit(quizzes, assigned_by=assigned_by)
+        created.extend(quizzes)
+        if on_chunk is not None:
+            on_chunk(quizzes)
+
+    return created
+
+
+def assign_quiz_template_job(
+    quiz_template_id: int,
+    user_ids: list[int],
+    *,
+    assigned_by_id: int | None = None,
+    job_id: str | None = None,
+    chunk_size: int = BULK_ASSIGN_CHUNK_SIZE,
+) -> int:
+    """
+    Assignation en tâche de fond d'une grande cohorte ; l'avancement est publié dans le job
+    `job_id` (quiz.jobs) après chaque lot. L'éligibilité est revérifiée au démarrage : les
+    destinataires sortis du domaine entre-temps sont comptés dans `skipped`.
+    """
+    processed = 0
+
+    def report(quizzes: list[Quiz]) -> None:
+        nonlocal processed
+        processed += len(quizzes)
+        update_job(job_id, processed=processed)
+        logger.info(
+            "quiz.template_assigned",
+            extra={"quiz_template_id": quiz_template_id, "count": len(quizzes)},
+        )
+
+    update_job(job_id, status=JOB_RUNNING)
+    try:
+        quiz_template = QuizTemplate.objects.select_related("created_by").get(pk=quiz_template_id)
+        assigned_by = get_user_model().objects.filter(pk=assigned_by_id).first() if assigned_by_id else None
+        eligible, rejected = resolve_assignment_targets(quiz_template, user_ids)
+        update_job(job_id, total=len(eligible), skipped=len(rejected))
+        assign_quiz_template(
+            quiz_template,
+            eligible,
+            assigned_by=assigned_by,
+            chunk_size=chunk_size,
+            on_chunk=report,
+        )
+    except Exception as exc:
+        update_job(job_id, status=JOB_FAILED, error=str(exc))
+        raise
+    update_job(job_id, status=JOB_DONE)
+    return processed
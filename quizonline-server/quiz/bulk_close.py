@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .access_index import invalidate_user_template_access
+from .jobs import JOB_DONE, JOB_FAILED, JOB_RUNNING, update_job
+from .models import Quiz
+from .notifications import notify_quizzes_completed_on_commit
+from .session_integrity import reconcile_quizzes_answers
+
+logger = logging.getLogger(__name__)
+
+
+def close_quiz_sessions_in_batches(
+    queryset,
+    *,
+    ordering: tuple[str, ...] = ("id",),
+    batch_size: int = 200,
+    limit: int | None = None,
+    on_batch: Callable[[list[int]], None] | None = None,
+) -> int:
+    """
+    Clôture les sessions actives de `queryset` par lots : chaque lot est verrouillé (skip_locked),
+    désactivé en un UPDATE (ended_at conservé s'il est déjà fixé, comme close_quiz_session),
+    réconcilié de façon ensembliste, et les notifications de fin sont mises en file au commit.
+    Le queryset est réévalué à chaque lot : les sessions clôturées en sortent d'elles-mêmes.
+    Retourne le nombre de sessions clôturées.
+    """
+    batch_size = max(1, batch_size)
+    closed = 0
+
+    while limit is None or closed < limit:
+        size = batch_size if limit is None else min(batch_size, limit - closed)
+        with transaction.atomic():
+            quiz_ids = list(
+                queryset
+                .select_for_update(skip_locked=True)
+                .order_by(*ordering)
+                .values_list("id", flat=True)[:size]
+            )
+            if not quiz_ids:
+                break
+            Quiz.objects.filter(pk__in=quiz_ids, active=True).update(
+                active=False,
+                ended_at=Coalesce(F("ended_at"), Value(timezone.now())),
+            )
+            quizzes = list(
+                Quiz.objects
+                .filter(pk__in=quiz_ids)
+                .select_related("quiz_template__created_by", "user")
+            )
+            reconcile_quizzes_answers(quizzes, finalize=True)
+            # update() n'émet pas post_save : ended_at vient d'être posé sur ces sessions.
+            invalidate_user_template_access(quiz.user_id for quiz in quizzes)
+            notify_quizzes_completed_on_commit(quizzes)
+        closed += len(quiz_ids)
+        if on_batch is not None:
+            on_batch(quiz_ids)
+
+    return closed
+
+
+def active_template_sessions_queryset(quiz_template_id: int):
+    """Sessions démarrées et encore actives d'un template (cible de la clôture de fin d'examen)."""
+    return Quiz.objects.filter(quiz_template_id=quiz_template_id, active=True, started_at__isnull=False)
+
+
+def close_template_sessions(quiz_template_id: int, *, batch_size: int = 200, job_id: str | None = None) -> int:
+    """
+    Clôture en masse toutes les sessions actives d'un template (fin d'une fenêtre d'examen).
+    L'avancement est publié dans le job `job_id` (quiz.jobs) après chaque lot.
+    Idempotent : une relance ne traite que les sessions restées actives.
+    """
+    closed = 0
+
+    def report(quiz_ids: list[int]) -> None:
+        nonlocal closed
+        closed += len(quiz_ids)
+        update_job(job_id, processed=closed)
+        logger.info(
+            "quiz.template_sessions_closed",
+            extra={"quiz_template_id": quiz_template_id, "count": len(quiz_ids)},
+        )
+
+    update_job(job_id, status=JOB_RUNNING)
+    try:
+        close_quiz_sessions_in_batches(
+            active_template_sessions_queryset(quiz_template_id),
+            batch_size=batch_size,
+            on_batch=report,
+        )
+    except Exception as exc:
+        update_job(job_id, status=JOB_FAILED, error=str(exc))
+        raise
+    update_job(job_id, status=JOB_DONE)
+    return closed
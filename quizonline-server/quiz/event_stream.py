@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.http import JsonResponse, StreamingHttpResponse
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from config.event_bus import get_event_bus
+
+EVENT_STREAM_TICKET_SALT = "quiz.event_stream"
+
+# Flux Server-Sent Events des alertes et assignations (quiz.events), servi par une vue async :
+# une connexion ouverte ne tient ni thread ni connexion à la base, seulement un abonnement au bus.
+# EventSource n'envoie pas d'en-tête Authorization : le client échange son JWT contre un ticket signé
+# de courte durée (POST events/ticket/) puis ouvre GET events/stream/?ticket=...
+
+
+def issue_event_stream_ticket(user) -> str:
+    return signing.dumps({"user": user.pk}, salt=EVENT_STREAM_TICKET_SALT)
+
+
+def event_stream_ticket_user_id(ticket: str) -> int | None:
+    try:
+        payload = signing.loads(ticket, salt=EVENT_STREAM_TICKET_SALT, max_age=settings.EVENT_STREAM_TICKET_MAX_AGE)
+    except signing.BadSignature:
+        return None
+    return payload.get("user")
+
+
+def format_sse(message: str) -> str:
+    """Trame SSE d'un message du bus (`{"event": ..., "data": {...}}`)."""
+    payload = json.loads(message)
+    return f"event: {payload['event']}\ndata: {json.dumps(payload['data'])}\n\n"
+
+
+async def _event_frames(user_id: int):
+    heartbeat = settings.EVENT_STREAM_HEARTBEAT
+    yield "retry: 5000\n\n"
+    async with get_event_bus().subscribe(user_id) as subscription:
+        while True:
+            message = await subscription.next_message(timeout=heartbeat)
+            # Commentaire SSE : garde la connexion ouverte derrière les proxys et détecte les clients partis.
+            yield ": keepalive\n\n" if message is None else format_sse(message)
+
+
+async def event_stream(request):
+    if request.method != "GET":
+        return JsonResponse({"detail": "Méthode non autorisée."}, status=status.HTTP_405_METHOD_NOT_ALLOWED)
+    user_id = event_stream_ticket_user_id(request.GET.get("ticket", ""))
+    if user_id is None or not await get_user_model().objects.filter(pk=user_id, is_active=True).aexists():
+        return JsonResponse({"detail": "Ticket invalide ou expiré."}, status=status.HTTP_401_UNAUTHORIZED)
+
+    response = StreamingHttpResponse(_event_frames(user_id), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+class EventStreamTicketView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        tags=["QuizEvents"],
+        summary="Obtenir un ticket d'ouverture du flux d'événements",
+        request=None,
+        responses={200: OpenApiResponse(description='{"ticket": str, "expires_in": int}')},
+    )
+    def post(self, request, *args, **kwargs):
+        return Response(
+            {
+                "ticket": issue_event_stream_ticket(request.user),
+                "expires_in": settings.EVENT_STREAM_TICKET_MAX_AGE,
+            },
+            status=status.HTTP_200_OK,
+        )
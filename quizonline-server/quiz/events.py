@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from config.event_bus import publish_event, publish_events
+
+if TYPE_CHECKING:
+    from .models import Quiz, QuizAlertMessage, QuizAlertThread
+
+# Événements poussés sur le flux /api/quiz/events/stream/ ; le client recharge la ressource visée.
+ALERT_MESSAGE_EVENT = "alert.message"
+ALERT_STATUS_EVENT = "alert.status"
+QUIZ_ASSIGNED_EVENT = "quiz.assigned"
+
+
+def _alert_message_event(message: QuizAlertMessage):
+    thread = message.thread
+    return (
+        [thread.owner_id, thread.reporter_id],
+        ALERT_MESSAGE_EVENT,
+        {
+            "thread_id": thread.pk,
+            "message_id": message.pk,
+            "author_id": message.author_id,
+            "created_at": message.created_at,
+        },
+    )
+
+
+def publish_alert_message(message: QuizAlertMessage) -> None:
+    publish_event(*_alert_message_event(message))
+
+
+def publish_alert_messages(messages: Iterable[QuizAlertMessage]) -> None:
+    publish_events(_alert_message_event(message) for message in messages)
+
+
+def publish_alert_status(thread: QuizAlertThread) -> None:
+    publish_event(
+        [thread.owner_id, thread.reporter_id],
+        ALERT_STATUS_EVENT,
+        {"thread_id": thread.pk, "status": thread.status},
+    )
+
+
+def _quiz_assigned_event(quiz: Quiz):
+    return [quiz.user_id], QUIZ_ASSIGNED_EVENT, {"quiz_id": quiz.pk, "quiz_template_id": quiz.quiz_template_id}
+
+
+def publish_quiz_assigned(quiz: Quiz) -> None:
+    publish_event(*_quiz_assigned_event(quiz))
+
+
+def publish_quizzes_assigned(quizzes: Iterable[Quiz]) -> None:
+    publish_events(_quiz_assigned_event(quiz) for quiz in quizzes)
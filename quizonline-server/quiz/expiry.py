@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import logging
+
+from django.conf import settings
+from django.utils import timezone
+
+from .bulk_close import close_quiz_sessions_in_batches
+from .models import Quiz
+
+logger = logging.getLogger(__name__)
+
+
+def expire_quiz_on_read(quiz: Quiz) -> bool:
+    """
+    Expiration constatée lors d'une lecture.
+    Avec QUIZ_EXPIRY_SWEEPER_ENABLED, la lecture n'écrit plus : la session est seulement
+    marquée inactive en mémoire, le balayage périodique la clôture et la réconcilie.
+    Retourne True dans ce cas (clôture en attente du balayage).
+    """
+    if settings.QUIZ_EXPIRY_SWEEPER_ENABLED:
+        return quiz.expire_if_needed(save=False)
+    quiz.expire_if_needed()
+    return False
+
+
+def expired_quiz_sessions_queryset(at=None):
+    """Sessions démarrées encore actives dont l'échéance est dépassée (index quiz_active_ended_at_idx)."""
+    if at is None:
+        at = timezone.now()
+    return Quiz.objects.filter(active=True, started_at__isnull=False, ended_at__lte=at)
+
+
+def expire_quiz_sessions(*, at=None, batch_size: int = 200, limit: int | None = None) -> int:
+    """
+    Clôture les sessions expirées par lots : chaque lot est verrouillé (skip_locked),
+    désactivé en un UPDATE, réconcilié de façon ensembliste, et les notifications
+    de fin sont mises en file au commit. Retourne le nombre de sessions clôturées.
+    """
+    if at is None:
+        at = timezone.now()
+    return close_quiz_sessions_in_batches(
+        expired_quiz_sessions_queryset(at),
+        ordering=("ended_at", "id"),
+        batch_size=batch_size,
+        limit=limit,
+        on_batch=lambda quiz_ids: logger.info("quiz.sessions_expired", extra={"count": len(quiz_ids)}),
+    )
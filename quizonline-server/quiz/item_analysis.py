@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import hashlib
+import math
+
+from django.core.cache import cache
+from django.db.models import Count, F, FloatField, Q, Sum
+from django.db.models.functions import Cast
+from django.utils import timezone
+
+from config.conditional import queryset_version
+from question.models import AnswerOption
+
+from .models import Quiz, QuizQuestion, QuizQuestionAnswer, QuizTemplate
+from .template_resync import schedule_template_resync, stale_sessions_queryset
+
+ITEM_ANALYSIS_CACHE_PREFIX = "quiz:item_analysis"
+ITEM_ANALYSIS_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Analyse d'items classique d'un template (difficulté, discrimination, distracteurs, distribution des scores).
+# Périmètre : sessions fermées et finalisées contre la clé de correction courante du template.
+# Les sessions périmées (quiz/template_resync.py) sont exclues et comptées dans `stale_sessions` ;
+# leur réconciliation est planifiée en tâche de fond, elles entrent ensuite dans l'analyse.
+# Tout est agrégé en SQL : le volume transféré dépend du nombre de questions et de sélections
+# distinctes, pas du nombre de sessions.
+
+
+def analysed_sessions_queryset(quiz_template: QuizTemplate):
+    return Quiz.objects.filter(
+        quiz_template_id=quiz_template.pk,
+        active=False,
+        finalized_answer_key_version=quiz_template.answer_key_version,
+    )
+
+
+def _answers_queryset(quiz_template: QuizTemplate):
+    # Jointure plutôt que sous-requête pk__in : un seul parcours des réponses du template.
+    return QuizQuestionAnswer.objects.filter(
+        quiz__quiz_template_id=quiz_template.pk,
+        quiz__active=False,
+        quiz__finalized_answer_key_version=quiz_template.answer_key_version,
+    )
+
+
+def _cache_key(quiz_template: QuizTemplate) -> str:
+    """
+    Version de l'ensemble de réponses analysé : clé de correction du template (questions, poids,
+    options correctes) et agrégat des sessions finalisées (1 requête). Une session rouverte perd
+    sa finalisation et sort du périmètre, une session clôturée y entre : la clé change dans les deux cas.
+    """
+    version = queryset_version(
+        analysed_sessions_queryset(quiz_template),
+        fields=("ended_at",),
+        sums=("earned_score", "total_answers", "correct_answers"),
+    )
+    digest = hashlib.sha1(repr(version).encode()).hexdigest()
+    # created_at protège contre la réutilisation d'un id (base réinitialisée, restauration).
+    return (
+        f"{ITEM_ANALYSIS_CACHE_PREFIX}:{quiz_template.pk}:{quiz_template.created_at.timestamp()}"
+        f":{quiz_template.answer_key_version}:{digest}"
+    )
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 4)
+
+
+def _point_biserial(*, answers: int, correct: int, rest_sum: float, rest_sq_sum: float, rest_correct_sum: float):
+    """
+    Discrimination : corrélation point-bisériale entre la réussite à l'item et le score du reste
+    du quiz (score de session moins l'item, pour ne pas corréler l'item avec lui-même).
+    r = (M1 - M0) / s * sqrt(p * q), s écart-type (population) du score du reste.
+    None si l'item ne discrimine rien (tous justes, tous faux, ou scores du reste constants).
+    """
+    if not answers or correct in (0, answers):
+        return None
+    mean = rest_sum / answers
+    variance = rest_sq_sum / answers - mean * mean
+    if variance <= 1e-12:
+        return None
+    p = correct / answers
+    mean_correct = rest_correct_sum / correct
+    mean_wrong = (rest_sum - rest_correct_sum) / (answers - correct)
+    return (mean_correct - mean_wrong) / math.sqrt(variance) * math.sqrt(p * (1 - p))
+
+
+def _score_distribution(quiz_template: QuizTemplate) -> dict:
+    rows = list(
+        analysed_sessions_queryset(quiz_template)
+        .order_by("earned_score")
+        .values("earned_score")
+        .annotate(count=Count("id"))
+        .values_list("earned_score", "count")
+    )
+    sessions = sum(count for _, count in rows)
+    mean = sum(score * count for score, count in rows) / sessions if sessions else None
+    std = (
+        math.sqrt(max(sum(count * (score - mean) ** 2 for score, count in rows) / sessions, 0.0))
+        if sessions
+        else None
+    )
+    max_score = (
+        QuizQuestion.objects.filter(quiz_id=quiz_template.pk).aggregate(total=Sum("weight"))["total"] or 0
+    )
+    return {
+        "sessions": sessions,
+        "max_score": float(max_score),
+        "mean": _round(mean),
+        "std": _round(std),
+        "distribution": [{"score": score, "count": count} for score, count in rows],
+    }
+
+
+def compute_item_analysis(quiz_template: QuizTemplate) -> dict:
+    """
+    Calcule l'analyse d'items d'un template, en 5 requêtes quel que soit le nombre de sessions :
+    questions, options, agrégats par question, sélections distinctes par question, distribution des scores.
+    """
+    quiz_questions = list(
+        QuizQuestion.objects
+        .filter(quiz_id=quiz_template.pk)
+        .order_by("sort_order", "id")
+        .values_list("id", "question_id", "sort_order", "weight")
+    )
+    options: dict[int, list[tuple[int, bool]]] = {}
+    option_rows = (
+        AnswerOption.objects
+        .filter(question__quiz_questions__quiz_id=quiz_template.pk)
+        .order_by("sort_order", "id")
+        .values_list("question__quiz_questions__id", "id", "is_correct")
+    )
+    for quizquestion_id, option_id, is_correct in option_rows:
+        options.setdefault(quizquestion_id, []).append((option_id, is_correct))
+
+    answers = _answers_queryset(quiz_template)
+    rest_score = Cast(F("quiz__earned_score") - F("earned_score"), FloatField())
+    correct = Q(is_correct=True)
+    aggregates = {
+        row["quizquestion_id"]: row
+        for row in (
+            answers
+            .order_by()
+            .values("quizquestion_id")
+            .annotate(
+                answers=Count("id"),
+                correct=Count("id", filter=correct),
+                rest_sum=Sum(rest_score),
+                rest_sq_sum=Sum(rest_score * rest_score),
+                rest_correct_sum=Sum(rest_score, filter=correct),
+            )
+        )
+    }
+
+    # Sélections canoniques (ids triés) : peu de combinaisons distinctes par question,
+    # regroupées en SQL puis ventilées par option ici.
+    picks: dict[int, dict[int, int]] = {}
+    omitted: dict[int, int] = {}
+    selections = (
+        answers
+        .order_by()
+        .values("quizquestion_id", "selected_option_ids")
+        .annotate(count=Count("id"))
+        .values_list("quizquestion_id", "selected_option_ids", "count")
+    )
+    for quizquestion_id, option_ids, count in selections:
+        if not option_ids:
+            omitted[quizquestion_id] = omitted.get(quizquestion_id, 0) + count
+            continue
+        counts = picks.setdefault(quizquestion_id, {})
+        for option_id in option_ids:
+            counts[option_id] = counts.get(option_id, 0) + count
+
+    questions = []
+    for quizquestion_id, question_id, sort_order, weight in quiz_questions:
+        row = aggregates.get(quizquestion_id) or {}
+        total = row.get("answers", 0)
+        correct_count = row.get("correct", 0)
+        counts = picks.get(quizquestion_id, {})
+        questions.append({
+            "quizquestion_id": quizquestion_id,
+            "question_id": question_id,
+            "sort_order": sort_order,
+            "weight": weight,
+            "answers": total,
+            "correct": correct_count,
+            "omitted": omitted.get(quizquestion_id, 0),
+            "difficulty": _round(correct_count / total) if total else None,
+            "discrimination": _round(
+                _point_biserial(
+                    answers=total,
+                    correct=correct_count,
+                    rest_sum=row.get("rest_sum") or 0.0,
+                    rest_sq_sum=row.get("rest_sq_sum") or 0.0,
+                    rest_correct_sum=row.get("rest_correct_sum") or 0.0,
+                )
+            ),
+            "options": [
+                {
+                    "answer_option_id": option_id,
+                    "is_correct": is_correct,
+                    "count": counts.get(option_id, 0),
+                    "frequency": _round(counts.get(option_id, 0) / total) if total else None,
+                }
+                for option_id, is_correct in options.get(quizquestion_id, ())
+            ],
+        })
+
+    return {
+        "quiz_template_id": quiz_template.pk,
+        "answer_key_version": quiz_template.answer_key_version,
+        "computed_at": timezone.now(),
+        "score": _score_distribution(quiz_template),
+        "questions": questions,
+    }
+
+
+def get_item_analysis(quiz_template: QuizTemplate) -> dict:
+    """
+    Analyse d'items depuis le cache Django, indexée par la version de l'ensemble de réponses analysé :
+    version de la clé de correction, agrégat et nombre de sessions périmées relus (3 requêtes)
+    tant que rien n'a changé, recalcul complet sinon.
+    Des sessions périmées planifient leur réconciliation en tâche de fond (schedule_template_resync).
+    """
+    # Version relue en base : celle de l'instance de l'appelant peut précéder un changement de barème.
+    quiz_template.refresh_from_db(fields=["answer_key_version"])
+    key = _cache_key(quiz_template)
+    analysis = cache.get(key)
+    if analysis is None:
+        analysis = compute_item_analysis(quiz_template)
+        cache.set(key, analysis, ITEM_ANALYSIS_CACHE_TIMEOUT)
+    stale_sessions = stale_sessions_queryset(quiz_template.pk, quiz_template.answer_key_version).count()
+    if stale_sessions:
+        schedule_template_resync(quiz_template.pk)
+    return {**analysis, "stale_sessions": stale_sessions}
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import uuid
+
+from django.core.cache import cache
+
+JOB_CACHE_PREFIX = "quiz:job"
+JOB_CACHE_TIMEOUT = 60 * 60 * 24
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+def _cache_key(job_id: str) -> str:
+    return f"{JOB_CACHE_PREFIX}:{job_id}"
+
+
+def create_job(kind: str, *, total: int = 0, **meta) -> dict:
+    """
+    Enregistre un traitement de masse (clôture, assignation...) et retourne son état initial.
+    L'avancement vit dans le cache Django : il est consultable par l'API pendant l'exécution
+    du worker Celery et expire avec JOB_CACHE_TIMEOUT.
+    """
+    job = {
+        "id": uuid.uuid4().hex,
+        "kind": kind,
+        "status": JOB_PENDING,
+        "total": total,
+        "processed": 0,
+        "error": "",
+        **meta,
+    }
+    cache.set(_cache_key(job["id"]), job, JOB_CACHE_TIMEOUT)
+    return job
+
+
+def get_job(job_id: str | None) -> dict | None:
+    if not job_id:
+        return None
+    return cache.get(_cache_key(job_id))
+
+
+def update_job(job_id: str | None, **fields) -> dict | None:
+    """Met à jour l'état d'un job ; sans effet si le job est inconnu ou expiré."""
+    job = get_job(job_id)
+    if job is None:
+        return None
+    job.update(fields)
+    cache.set(_cache_key(job_id), job, JOB_CACHE_TIMEOUT)
+    return job
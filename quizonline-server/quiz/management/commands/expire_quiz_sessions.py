@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from quiz.expiry import expire_quiz_sessions
+
+
+class Command(BaseCommand):
+    help = "Close expired timed quiz sessions, reconcile their scores and queue completion emails."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument("--limit", type=int, default=None)
+
+    def handle(self, *args, **options):
+        limit = options["limit"]
+        expired = expire_quiz_sessions(
+            batch_size=max(1, options["batch_size"]),
+            limit=max(1, limit) if limit is not None else None,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Expired {expired} quiz session(s)."))
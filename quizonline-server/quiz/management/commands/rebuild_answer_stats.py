@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from quiz.answer_stats import rebuild_answer_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-question answer statistics from the answers of finalized quiz sessions."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--template", type=int, action="append", dest="template_ids")
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_answer_stats(quiz_template_ids=options["template_ids"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt answer statistics for {rebuilt} quiz template(s)."))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from quiz.totals import rebuild_quiz_totals
+
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized score totals of every quiz session from its answers, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_quiz_totals(batch_size=max(1, options["batch_size"]))
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt totals for {rebuilt} quiz session(s)."))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0006_quiztemplate_domain_required'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quiztemplate',
+            name='answer_key_version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
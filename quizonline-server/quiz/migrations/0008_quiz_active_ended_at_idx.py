@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0007_quiztemplate_answer_key_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='quiz',
+            index=models.Index(condition=models.Q(('active', True)), fields=['ended_at', 'id'], name='quiz_active_ended_at_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0011_quiz_score_totals'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quiz',
+            name='finalized_answer_key_version',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+    ]
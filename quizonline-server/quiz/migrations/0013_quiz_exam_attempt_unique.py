@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0012_quiz_finalized_answer_key_version'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quiz',
+            name='is_exam_attempt',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddConstraint(
+            model_name='quiz',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_exam_attempt', True)), fields=('quiz_template', 'user'), name='quiz_unique_exam_attempt'),
+        ),
+    ]
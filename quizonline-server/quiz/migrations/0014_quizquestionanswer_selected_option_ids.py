@@ -0,0 +1,60 @@
+from itertools import groupby
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def copy_selected_options_to_ids(apps, schema_editor):
+    QuizQuestionAnswer = apps.get_model('quiz', 'QuizQuestionAnswer')
+    through = QuizQuestionAnswer.selected_options.through
+    rows = (
+        through.objects
+        .order_by('quizquestionanswer_id', 'answeroption_id')
+        .values_list('quizquestionanswer_id', 'answeroption_id')
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    batch = []
+    for answer_id, group in groupby(rows, key=lambda row: row[0]):
+        batch.append(QuizQuestionAnswer(pk=answer_id, selected_option_ids=[option_id for _, option_id in group]))
+        if len(batch) >= BATCH_SIZE:
+            QuizQuestionAnswer.objects.bulk_update(batch, ['selected_option_ids'])
+            batch = []
+    if batch:
+        QuizQuestionAnswer.objects.bulk_update(batch, ['selected_option_ids'])
+
+
+def copy_ids_to_selected_options(apps, schema_editor):
+    QuizQuestionAnswer = apps.get_model('quiz', 'QuizQuestionAnswer')
+    through = QuizQuestionAnswer.selected_options.through
+    through.objects.all().delete()
+    rows = (
+        QuizQuestionAnswer.objects
+        .exclude(selected_option_ids=[])
+        .values_list('pk', 'selected_option_ids')
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+    batch = []
+    for answer_id, option_ids in rows:
+        batch.extend(through(quizquestionanswer_id=answer_id, answeroption_id=option_id) for option_id in option_ids)
+        if len(batch) >= BATCH_SIZE:
+            through.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        through.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0013_quiz_exam_attempt_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quizquestionanswer',
+            name='selected_option_ids',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.RunPython(copy_selected_options_to_ids, reverse_code=copy_ids_to_selected_options),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0014_quizquestionanswer_selected_option_ids'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='quizquestionanswer',
+            name='selected_options',
+        ),
+    ]
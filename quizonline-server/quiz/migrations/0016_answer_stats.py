@@ -0,0 +1,46 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('question', '0004_add_domain_active_index'),
+        ('quiz', '0015_remove_quizquestionanswer_selected_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quizquestionanswer',
+            name='stats_option_ids',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='quizquestionanswer',
+            name='stats_is_correct',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.CreateModel(
+            name='QuizQuestionStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('correct', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('quizquestion', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='quiz.quizquestion')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='QuizQuestionOptionStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('picks', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('answer_option', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='quiz_stats', to='question.answeroption')),
+                ('quizquestion', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='option_stats', to='quiz.quizquestion')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('quizquestion', 'answer_option'), name='uniq_option_stats_per_quiz_question')],
+            },
+        ),
+    ]
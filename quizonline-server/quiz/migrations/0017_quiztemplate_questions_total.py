@@ -0,0 +1,35 @@
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def fill_questions_total(apps, schema_editor):
+    QuizTemplate = apps.get_model("quiz", "QuizTemplate")
+    QuizQuestion = apps.get_model("quiz", "QuizQuestion")
+    per_template = (
+        QuizQuestion.objects
+        .filter(quiz_id=OuterRef("pk"))
+        .order_by()
+        .values("quiz_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    QuizTemplate.objects.update(
+        questions_total=Coalesce(Subquery(per_template, output_field=IntegerField()), Value(0)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0016_answer_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quiztemplate',
+            name='questions_total',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_questions_total, migrations.RunPython.noop),
+    ]
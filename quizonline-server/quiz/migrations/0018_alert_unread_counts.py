@@ -0,0 +1,58 @@
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _unread_count(QuizAlertMessage, participant: str, *, since: bool):
+    messages = QuizAlertMessage.objects.filter(thread_id=OuterRef("pk")).exclude(author_id=OuterRef(f"{participant}_id"))
+    if since:
+        messages = messages.filter(created_at__gt=OuterRef(f"{participant}_last_read_at"))
+    per_thread = messages.order_by().values("thread_id").annotate(total=Count("id")).values("total")
+    return Coalesce(Subquery(per_thread, output_field=IntegerField()), Value(0))
+
+
+def fill_unread_counts(apps, schema_editor):
+    QuizAlertThread = apps.get_model("quiz", "QuizAlertThread")
+    QuizAlertMessage = apps.get_model("quiz", "QuizAlertMessage")
+    for participant in ("owner", "reporter"):
+        for since in (False, True):
+            QuizAlertThread.objects.filter(**{f"{participant}_last_read_at__isnull": not since}).update(
+                **{f"{participant}_unread_count": _unread_count(QuizAlertMessage, participant, since=since)}
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0017_quiztemplate_questions_total'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quizalertthread',
+            name='owner_unread_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='quizalertthread',
+            name='reporter_unread_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_unread_counts, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='quizalertthread',
+            index=models.Index(
+                condition=models.Q(owner_unread_count__gt=0),
+                fields=['owner', 'owner_unread_count'],
+                name='alert_owner_unread_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='quizalertthread',
+            index=models.Index(
+                condition=models.Q(reporter_unread_count__gt=0),
+                fields=['reporter', 'reporter_unread_count'],
+                name='alert_reporter_unread_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def fill_last_message(apps, schema_editor):
+    QuizAlertThread = apps.get_model("quiz", "QuizAlertThread")
+    QuizAlertMessage = apps.get_model("quiz", "QuizAlertMessage")
+    last = QuizAlertMessage.objects.filter(thread_id=OuterRef("pk")).order_by("-created_at", "-pk")
+    rows = list(
+        QuizAlertThread.objects
+        .annotate(last_body=Subquery(last.values("body")[:1]), last_author_id=Subquery(last.values("author_id")[:1]))
+        .filter(last_author_id__isnull=False)
+        .values_list("pk", "last_body", "last_author_id")
+    )
+    threads = [
+        QuizAlertThread(pk=pk, last_message_preview=(body or "").strip()[:120], last_message_author_id=author_id)
+        for pk, body, author_id in rows
+    ]
+    QuizAlertThread.objects.bulk_update(threads, ["last_message_preview", "last_message_author"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('quiz', '0018_alert_unread_counts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quizalertthread',
+            name='last_message_preview',
+            field=models.CharField(blank=True, default='', editable=False, max_length=120),
+        ),
+        migrations.AddField(
+            model_name='quizalertthread',
+            name='last_message_author',
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='+',
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(fill_last_message, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='quizalertmessage',
+            index=models.Index(fields=['thread', '-created_at', '-id'], name='alert_message_thread_idx'),
+        ),
+    ]
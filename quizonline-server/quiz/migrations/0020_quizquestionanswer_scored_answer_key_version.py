@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0019_alert_last_message'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quizquestionanswer',
+            name='scored_answer_key_version',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -8,7 +8,7 @@ from django.utils.translation import get_language
 from django.utils import timezone
 from django.utils.text import slugify
 from config.models import AuditMixin
-from question.models import Question, AnswerOption
+from question.models import Question
 
 from .constants import (
     VISIBILITY_IMMEDIATE,
@@ -94,6 +94,12 @@ class QuizTemplate(AuditMixin, models.Model):
     is_public = models.BooleanField("Public ?", default=False)
     active = models.BooleanField("Actif ?", default=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Incrémentée (via F()) à chaque changement des entrées du scoring : poids, membres, options correctes.
+    answer_key_version = models.PositiveIntegerField(default=1, editable=False)
+    # Nombre de QuizQuestion, maintenu par quiz/totals.py (signaux QuizQuestion) : lu par la liste
+    # des templates sans jointure ni GROUP BY.
+    questions_total = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ["title"]
@@ -186,6 +192,14 @@ class QuizTemplate(AuditMixin, models.Model):
         original_title = self.title
         self.sync_fields_from_translations(preferred_language)
         creating = self.pk is None
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            # answer_key_version (bump_answer_key_version) et questions_total (refresh_template_questions_total)
+            # ne sont modifiés que par des UPDATE dédiés : une instance chargée avant ne doit pas réécrire
+            # l'ancienne valeur.
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in {"answer_key_version", "questions_total"}
+            ]
         if creating:
             self._make_unique_title()
             if self.title != original_title:
@@ -343,11 +357,37 @@ class Quiz(models.Model):
     started_at = models.DateTimeField(null=True, blank=True)
     ended_at = models.DateTimeField(null=True, blank=True)
     active = models.BooleanField(default=False)
+    # Totaux dénormalisés des réponses, maintenus par quiz/totals.py :
+    # les listes les lisent sans agréger QuizQuestionAnswer.
+    earned_score = models.FloatField(default=0, editable=False)
+    max_score = models.FloatField(default=0, editable=False)
+    total_answers = models.PositiveIntegerField(default=0, editable=False)
+    correct_answers = models.PositiveIntegerField(default=0, editable=False)
+    # Version de la clé de correction du template contre laquelle la session fermée a été réconciliée.
+    # None : à réconcilier (jamais finalisée, ou réponses modifiées depuis).
+    finalized_answer_key_version = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    # Tentative d'examen créée par l'utilisateur (QuizViewSet.create en MODE_EXAM) :
+    # une seule par (template, utilisateur), garantie par la contrainte partielle ci-dessous.
+    is_exam_attempt = models.BooleanField(default=False, editable=False)
 
     class Meta:
+        constraints = (
+            models.UniqueConstraint(
+                fields=["quiz_template", "user"],
+                condition=models.Q(is_exam_attempt=True),
+                name="quiz_unique_exam_attempt",
+            ),
+        )
         indexes = [
             models.Index(fields=["user", "active"], name="quiz_user_active_idx"),
             models.Index(fields=["user", "-created_at"], name="quiz_user_created_idx"),
+            # Pagination keyset de la liste staff (?pagination=cursor).
+            models.Index(fields=["-created_at", "-id"], name="quiz_created_id_idx"),
+            models.Index(
+                fields=["ended_at", "id"],
+                condition=models.Q(active=True),
+                name="quiz_active_ended_at_idx",
+            ),
         ]
 
     def __str__(self):
@@ -395,6 +435,11 @@ class Quiz(models.Model):
         super().save(*args, **kwargs)
 
 
+def normalize_option_ids(option_ids) -> list[int]:
+    """Forme canonique d'une sélection : ids entiers triés, sans doublon (accepte aussi des AnswerOption)."""
+    return sorted({int(getattr(option, "pk", option)) for option in option_ids or ()})
+
+
 class QuizQuestionAnswer(models.Model):
     quiz = models.ForeignKey(
         Quiz,
@@ -408,17 +453,22 @@ class QuizQuestionAnswer(models.Model):
     )
     question_order = models.PositiveIntegerField()
 
-    selected_options = models.ManyToManyField(
-        AnswerOption,
-        related_name="quiz_answers",
-        blank=True,
-    )
+    # Ids des AnswerOption choisies, triés et sans doublon (normalize_option_ids) :
+    # la forme canonique permet de comparer une sélection à la clé de correction par égalité.
+    selected_option_ids = models.JSONField(default=list, blank=True)
 
     given_answer = models.CharField(max_length=255, blank=True, null=True)
     is_correct = models.BooleanField(null=True, blank=True)
     earned_score = models.FloatField(default=0)
     max_score = models.FloatField(default=0)
+    # Version de la clé de correction du template contre laquelle earned_score / max_score / is_correct
+    # ont été calculés. None : jamais scorée, ou sélection modifiée depuis.
+    scored_answer_key_version = models.PositiveIntegerField(null=True, blank=True, editable=False)
     answered_at = models.DateTimeField(auto_now=True)
+    # Contribution de la réponse déjà comptée dans QuizQuestionStats / QuizQuestionOptionStats
+    # (quiz/answer_stats.py) : None tant que la session n'a pas été finalisée.
+    stats_option_ids = models.JSONField(null=True, blank=True, editable=False)
+    stats_is_correct = models.BooleanField(default=False, editable=False)
 
     class Meta:
         constraints = [
@@ -446,6 +496,7 @@ class QuizQuestionAnswer(models.Model):
             raise ValidationError("Ce quiz n'est plus disponible pour répondre.")
 
     def save(self, *args, **kwargs):
+        self.selected_option_ids = normalize_option_ids(self.selected_option_ids)
         self.full_clean()
         super().save(*args, **kwargs)
 
@@ -458,25 +509,57 @@ class QuizQuestionAnswer(models.Model):
         return self.quiz.quiz_template
 
     def compute_score(self, save=True):
-        correct_opts = set(
-            self.quizquestion.question.answer_options.filter(is_correct=True).values_list("id", flat=True)
+        from .answer_key import get_versioned_answer_key, score_selection
+
+        self.scored_answer_key_version, answer_key = get_versioned_answer_key(self.quizquestion.quiz_id)
+        earned, max_score, self.is_correct = score_selection(
+            answer_key.get(self.quizquestion_id),
+            self.selected_option_ids,
         )
-        selected = set(self.selected_options.values_list("id", flat=True))
-        weight = self.quizquestion.weight
-        max_score = float(weight)
-        if selected == correct_opts and len(correct_opts) > 0:
-            earned = max_score
-            self.is_correct = True
-        else:
-            earned = 0.0
-            self.is_correct = False
         self.earned_score = earned
         self.max_score = max_score
         if save:
-            super().save(update_fields=["earned_score", "max_score", "is_correct"])
+            super().save(update_fields=["earned_score", "max_score", "is_correct", "scored_answer_key_version"])
         return earned, max_score
 
 
+class QuizQuestionStats(models.Model):
+    """
+    Statistiques de réponse d'une question de template, sur les sessions finalisées.
+    Maintenues de façon incrémentale à la finalisation (quiz/answer_stats.py),
+    reconstruites par `python manage.py rebuild_answer_stats`.
+    """
+    quizquestion = models.OneToOneField(QuizQuestion, on_delete=models.CASCADE, related_name="stats")
+    attempts = models.PositiveIntegerField(default=0)
+    correct = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Stats {self.quizquestion}"
+
+
+class QuizQuestionOptionStats(models.Model):
+    """Nombre de sélections d'une option de réponse pour une question de template (sessions finalisées)."""
+    quizquestion = models.ForeignKey(QuizQuestion, on_delete=models.CASCADE, related_name="option_stats")
+    answer_option = models.ForeignKey("question.AnswerOption", on_delete=models.CASCADE, related_name="quiz_stats")
+    picks = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = (
+            models.UniqueConstraint(
+                fields=["quizquestion", "answer_option"],
+                name="uniq_option_stats_per_quiz_question",
+            ),
+        )
+
+    def __str__(self):
+        return f"Stats {self.quizquestion} / option {self.answer_option_id}"
+
+
+ALERT_MESSAGE_PREVIEW_LENGTH = 120
+
+
 class QuizAlertThread(models.Model):
     KIND_QUESTION = "question"
     KIND_ASSIGNMENT = "assignment"
@@ -520,6 +603,20 @@ class QuizAlertThread(models.Model):
     last_message_at = models.DateTimeField(auto_now_add=True)
     reporter_last_read_at = models.DateTimeField(null=True, blank=True)
     owner_last_read_at = models.DateTimeField(null=True, blank=True)
+    # Messages non lus par participant, tenus à jour à la création d'un message (QuizAlertMessage.save)
+    # et remis à zéro à la lecture (quiz.alerting.mark_alert_read) : le compteur global est un seul agrégat.
+    reporter_unread_count = models.PositiveIntegerField(default=0, editable=False)
+    owner_unread_count = models.PositiveIntegerField(default=0, editable=False)
+    # Aperçu du dernier message, recopié par QuizAlertMessage.save : la liste ne lit aucun message.
+    last_message_preview = models.CharField(max_length=ALERT_MESSAGE_PREVIEW_LENGTH, blank=True, default="", editable=False)
+    last_message_author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
     closed_at = models.DateTimeField(null=True, blank=True)
     closed_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -532,6 +629,18 @@ class QuizAlertThread(models.Model):
 
     class Meta:
         ordering = ["-last_message_at"]
+        indexes = (
+            models.Index(
+                fields=["owner", "owner_unread_count"],
+                condition=models.Q(owner_unread_count__gt=0),
+                name="alert_owner_unread_idx",
+            ),
+            models.Index(
+                fields=["reporter", "reporter_unread_count"],
+                condition=models.Q(reporter_unread_count__gt=0),
+                name="alert_reporter_unread_idx",
+            ),
+        )
 
     def __str__(self):
         return f"Alert #{self.pk} quiz={self.quiz_id} kind={self.kind} question={self.quizquestion_id}"
@@ -616,6 +725,10 @@ class QuizAlertThread(models.Model):
             self.save(update_fields=["status", "closed_at", "closed_by"])
 
 
+def alert_message_preview(body: str | None) -> str:
+    return (body or "").strip()[:ALERT_MESSAGE_PREVIEW_LENGTH]
+
+
 class QuizAlertMessage(models.Model):
     thread = models.ForeignKey(
         QuizAlertThread,
@@ -632,6 +745,10 @@ class QuizAlertMessage(models.Model):
 
     class Meta:
         ordering = ["created_at", "pk"]
+        indexes = (
+            # Pagination keyset des messages d'une conversation (plus récents d'abord).
+            models.Index(fields=["thread", "-created_at", "-id"], name="alert_message_thread_idx"),
+        )
 
     def __str__(self):
         return f"AlertMessage #{self.pk} thread={self.thread_id} author={self.author_id}"
@@ -640,4 +757,17 @@ class QuizAlertMessage(models.Model):
         creating = self.pk is None
         super().save(*args, **kwargs)
         if creating and self.thread_id:
-            QuizAlertThread.objects.filter(pk=self.thread_id).update(last_message_at=self.created_at)
+            # Le message est non lu pour chaque participant qui n'en est pas l'auteur.
+            QuizAlertThread.objects.filter(pk=self.thread_id).update(
+                last_message_at=self.created_at,
+                last_message_preview=alert_message_preview(self.body),
+                last_message_author_id=self.author_id,
+                owner_unread_count=models.Case(
+                    models.When(owner_id=self.author_id, then=models.F("owner_unread_count")),
+                    default=models.F("owner_unread_count") + 1,
+                ),
+                reporter_unread_count=models.Case(
+                    models.When(reporter_id=self.author_id, then=models.F("reporter_unread_count")),
+                    default=models.F("reporter_unread_count") + 1,
+                ),
+            )
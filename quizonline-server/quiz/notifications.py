@@ -3,31 +3,34 @@ from __future__ import annotations
 from collections.abc import Iterable
 from django.db import transaction
 
-from core.mailers import send_quiz_assignment_email, send_quiz_completed_email
+from core.mailers import send_quiz_assignment_emails, send_quiz_completed_emails
 
-from .alerting import create_assignment_alert_thread
+from .alerting import create_assignment_alert_threads
+from .events import publish_quizzes_assigned
 
 
 def notify_quiz_assigned(quiz, *, assigned_by=None) -> None:
-    send_quiz_assignment_email(quiz)
-    user = getattr(quiz, "user", None)
-    owner = assigned_by or getattr(getattr(quiz, "quiz_template", None), "created_by", None)
-    if not user or not owner or owner.id == user.id:
-        return
-    create_assignment_alert_thread(
-        reporter=user,
-        quiz=quiz,
-        owner=owner,
-    )
+    notify_quizzes_assigned([quiz], assigned_by=assigned_by)
 
 
 def notify_quizzes_assigned(quizzes: Iterable, *, assigned_by=None) -> None:
+    """E-mails, conversations d'assignation et événements d'un lot de sessions : quelques requêtes par lot."""
+    quizzes = list(quizzes)
+    if not quizzes:
+        return
+    send_quiz_assignment_emails(quizzes)
+    publish_quizzes_assigned(quizzes)
+    assignments = []
     for quiz in quizzes:
-        notify_quiz_assigned(quiz, assigned_by=assigned_by)
+        user = getattr(quiz, "user", None)
+        owner = assigned_by or getattr(getattr(quiz, "quiz_template", None), "created_by", None)
+        if user and owner and owner.id != user.id:
+            assignments.append((user, quiz, owner))
+    create_assignment_alert_threads(assignments)
 
 
 def notify_quiz_completed(quiz) -> None:
-    send_quiz_completed_email(quiz)
+    notify_quizzes_completed([quiz])
 
 
 def notify_quiz_assigned_on_commit(quiz, *, assigned_by=None) -> None:
@@ -41,3 +44,13 @@ def notify_quizzes_assigned_on_commit(quizzes: Iterable, *, assigned_by=None) ->
 
 def notify_quiz_completed_on_commit(quiz) -> None:
     transaction.on_commit(lambda: notify_quiz_completed(quiz))
+
+
+def notify_quizzes_completed(quizzes: Iterable) -> None:
+    """E-mails de fin d'un lot de sessions clôturées : un seul bulk_create par lot."""
+    send_quiz_completed_emails(quizzes)
+
+
+def notify_quizzes_completed_on_commit(quizzes: Iterable) -> None:
+    quizzes = tuple(quizzes)
+    transaction.on_commit(lambda: notify_quizzes_completed(quizzes))
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from django.db.models import Count, FloatField, Prefetch, Q, Sum
-from django.db.models.functions import Coalesce
+from django.db.models import Count, F, Prefetch, Q
 from config.domain_access import manageable_domain_ids
 from django.utils import timezone
 
-from .models import Quiz, QuizQuestion, QuizQuestionAnswer, QuizTemplate
+from .access_index import available_public_template_ids, get_user_template_access
+from .models import Quiz, QuizQuestionAnswer, QuizTemplate
 
 
 def quiz_template_queryset():
@@ -18,6 +18,46 @@ def quiz_template_queryset():
     )
 
 
+# Colonnes lues par QuizTemplateListSerializer (titre et description localisés depuis translations).
+QUIZ_TEMPLATE_LIST_FIELDS = (
+    "id",
+    "domain",
+    "title",
+    "slug",
+    "mode",
+    "description",
+    "translations",
+    "max_questions",
+    "permanent",
+    "started_at",
+    "ended_at",
+    "with_duration",
+    "duration",
+    "active",
+    "created_at",
+    "result_visibility",
+    "result_available_at",
+    "detail_visibility",
+    "detail_available_at",
+    "is_public",
+    "created_by__username",
+)
+
+
+def quiz_template_list_queryset():
+    """
+    Projection de la liste des templates : une seule requête, sans prefetch des questions
+    ni COUNT/GROUP BY (nombre de questions lu sur la colonne dénormalisée questions_total).
+    """
+    return (
+        QuizTemplate.objects
+        .select_related("created_by")
+        .only(*QUIZ_TEMPLATE_LIST_FIELDS)
+        .annotate(_questions_count=F("questions_total"))
+        .order_by("title", "pk")
+    )
+
+
 def available_quiz_template_filter(*, at=None) -> Q:
     if at is None:
         at = timezone.now()
@@ -30,35 +70,26 @@ def available_quiz_template_filter(*, at=None) -> Q:
     )
 
 
-def accessible_quiz_template_queryset(user):
-    queryset = quiz_template_queryset()
-    available_filter = available_quiz_template_filter()
+def accessible_quiz_template_queryset(user, *, queryset=None):
+    if queryset is None:
+        queryset = quiz_template_queryset()
     if not user or not getattr(user, "is_authenticated", False):
-        return queryset.filter(is_public=True).filter(available_filter)
+        return queryset.filter(pk__in=available_public_template_ids())
     if user.is_superuser:
         return queryset
 
     manageable_ids = manageable_domain_ids(user)
     if manageable_ids:
-        return queryset.filter(domain_id__in=manageable_ids).distinct().order_by("title", "pk")
+        # Filtre sur la colonne domain_id : pas de jointure, donc pas de doublon à éliminer.
+        return queryset.filter(domain_id__in=manageable_ids).order_by("title", "pk")
 
-    # Use a subquery instead of a JOIN on the (potentially large) Quiz table
-    assigned_template_ids = (
-        Quiz.objects.filter(user=user).values("quiz_template_id").distinct()
-    )
-    started_exam_template_ids = (
-        Quiz.objects
-        .filter(user=user, quiz_template__mode=QuizTemplate.MODE_EXAM)
-        .exclude(started_at__isnull=True, ended_at__isnull=True)
-        .values("quiz_template_id")
-        .distinct()
-    )
+    # Index d'accès en cache (quiz.access_index) : plus de sous-requêtes sur la table Quiz ni de DISTINCT.
+    access = get_user_template_access(user)
     return (
         queryset
-        .filter(available_filter)
-        .filter(Q(is_public=True) | Q(pk__in=assigned_template_ids))
-        .exclude(pk__in=started_exam_template_ids)
-        .distinct()
+        .filter(available_quiz_template_filter())
+        .filter(Q(is_public=True) | Q(pk__in=access.assigned_ids))
+        .exclude(Q(mode=QuizTemplate.MODE_EXAM) & Q(pk__in=access.started_ids))
         .order_by("title", "pk")
     )
 
@@ -67,25 +98,16 @@ def quiz_queryset_for_user(user, *, include_details: bool, include_manageable_te
     queryset = (
         Quiz.objects
         .select_related("quiz_template", "user")
-        .annotate(
-            _earned_score=Coalesce(Sum("answers__earned_score"), 0.0, output_field=FloatField()),
-            _max_score=Coalesce(Sum("answers__max_score"), 0.0, output_field=FloatField()),
-        )
         .order_by("-created_at", "-id")
     )
     if include_details:
-        quiz_questions_prefetch = Prefetch(
-            "quiz_template__quiz_questions",
-            queryset=QuizQuestion.objects.select_related("question").prefetch_related(
-                "question__answer_options",
-                "question__media__asset",
-                "question__subjects",
-            ),
-        )
+        # Les questions du template sont servies par le cache de rendu de session (quiz.snapshots) :
+        # seul l'état mutable des réponses est chargé ici.
         queryset = queryset.prefetch_related(
-            "answers__selected_options",
-            "answers__quizquestion__question__answer_options",
-            quiz_questions_prefetch,
+            Prefetch(
+                "answers",
+                queryset=QuizQuestionAnswer.objects.select_related("quizquestion"),
+            ),
         )
     if user.is_staff or user.is_superuser:
         return queryset
@@ -102,7 +124,6 @@ def template_sessions_queryset(quiz_template):
     return (
         quiz_template.quiz
         .select_related("user", "quiz_template")
-        .prefetch_related("answers__selected_options")
         .order_by("-created_at", "-id")
     )
 
@@ -111,7 +132,6 @@ def quiz_answer_queryset_for_user(user, quiz_id: int):
     queryset = (
         QuizQuestionAnswer.objects
         .select_related("quiz", "quizquestion__question")
-        .prefetch_related("selected_options")
         .filter(quiz_id=quiz_id)
     )
     if user.is_staff or user.is_superuser:
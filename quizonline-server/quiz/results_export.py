@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import Quiz, QuizQuestionAnswer, QuizTemplate
+
+RESULTS_EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+RESULTS_EXPORT_BATCH_SIZE = 500
+
+# Export des résultats d'un template : une ligne par (session, réponse), les sessions sans réponse
+# sur une ligne aux colonnes de réponse vides. Les sessions sont lues par lots de pk croissants
+# et les réponses de chaque lot via .iterator() : la mémoire ne dépend que de la taille du lot.
+# L'export ne fait que lire : une session fermée pas encore réconciliée avec la clé de correction
+# courante est exportée telle quelle, marquée session_stale (scores de l'ancienne clé), et sa
+# réconciliation est planifiée en tâche de fond (quiz/template_resync.py). Les réponses encore
+# dans le tampon d'écriture différée d'une session active n'y figurent pas.
+SESSION_COLUMNS = (
+    ("session_id", "id"),
+    ("user_id", "user_id"),
+    ("username", "user__username"),
+    ("created_at", "created_at"),
+    ("started_at", "started_at"),
+    ("ended_at", "ended_at"),
+    ("active", "active"),
+    ("session_earned_score", "earned_score"),
+    ("session_max_score", "max_score"),
+    ("session_total_answers", "total_answers"),
+    ("session_correct_answers", "correct_answers"),
+)
+STALE_COLUMN = "session_stale"
+ANSWER_COLUMNS = (
+    ("question_order", "question_order"),
+    ("quizquestion_id", "quizquestion_id"),
+    ("question_id", "quizquestion__question_id"),
+    ("selected_option_ids", "selected_option_ids"),
+    ("is_correct", "is_correct"),
+    ("earned_score", "earned_score"),
+    ("max_score", "max_score"),
+    ("answered_at", "answered_at"),
+)
+RESULTS_EXPORT_COLUMNS = (
+    *(name for name, _ in SESSION_COLUMNS),
+    STALE_COLUMN,
+    *(name for name, _ in ANSWER_COLUMNS),
+)
+
+
+def iter_results_rows(quiz_template: QuizTemplate, *, batch_size: int = RESULTS_EXPORT_BATCH_SIZE) -> Iterator[dict]:
+    """
+    Lignes d'export d'un template, dans l'ordre (session, question_order).
+    1 requête pour la version de la clé de correction, puis 2 par lot de sessions.
+    """
+    # Version relue en base : l'instance de l'appelant peut précéder un changement de barème.
+    version = QuizTemplate.objects.filter(pk=quiz_template.pk).values_list("answer_key_version", flat=True).first()
+    session_fields = [field for _, field in SESSION_COLUMNS]
+    answer_fields = [field for _, field in ANSWER_COLUMNS]
+    last_id = 0
+    while True:
+        batch = (
+            Quiz.objects
+            .filter(quiz_template_id=quiz_template.pk, pk__gt=last_id)
+            .order_by("pk")
+            .values(*session_fields, "finalized_answer_key_version")
+        )
+        sessions = list(batch[:batch_size])
+        if not sessions:
+            return
+        last_id = sessions[-1]["id"]
+
+        answers = (
+            QuizQuestionAnswer.objects
+            .filter(quiz_id__in=[row["id"] for row in sessions])
+            .order_by("quiz_id", "question_order")
+            .values_list("quiz_id", *answer_fields)
+            .iterator(chunk_size=2000)
+        )
+        answers_iter = iter(answers)
+        pending = next(answers_iter, None)
+        for session in sessions:
+            base = {name: session[field] for name, field in SESSION_COLUMNS}
+            base[STALE_COLUMN] = (
+                not session["active"]
+                and session["started_at"] is not None
+                and session["finalized_answer_key_version"] != version
+            )
+            emitted = False
+            while pending is not None and pending[0] == session["id"]:
+                yield {**base, **dict(zip((name for name, _ in ANSWER_COLUMNS), pending[1:]))}
+                emitted = True
+                pending = next(answers_iter, None)
+            if not emitted:
+                yield {**base, **{name: None for name, _ in ANSWER_COLUMNS}}
+
+
+class _Echo:
+    """Pseudo-fichier pour csv.writer : chaque ligne est rendue au lieu d'être bufferisée."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return " ".join(str(item) for item in value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def stream_results(quiz_template: QuizTemplate, export_format: str) -> Iterator[str]:
+    """Flux texte de l'export au format `export_format` (clé de RESULTS_EXPORT_FORMATS)."""
+    rows = iter_results_rows(quiz_template)
+    if export_format == "ndjson":
+        for row in rows:
+            yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+        return
+    writer = csv.writer(_Echo())
+    yield writer.writerow(RESULTS_EXPORT_COLUMNS)
+    for row in rows:
+        yield writer.writerow([_csv_value(row[name]) for name in RESULTS_EXPORT_COLUMNS])
+
@@ -1,17 +1,91 @@
 from __future__ import annotations
 
+from django.db.models import (
+    BooleanField,
+    Case,
+    FloatField,
+    IntegerField,
+    Q,
+    Value,
+    When,
+)
 
-def compute_answer_score(answer) -> tuple[float, float, bool]:
+from .answer_key import get_versioned_answer_key, score_selection
+
+
+def compute_answer_score(answer, answer_key=None) -> tuple[float, float, bool]:
     """
     Calcule (earned_score, max_score, is_correct) pour une QuizQuestionAnswer.
-    Suppose que answer_options et selected_options sont prefetch_related.
+    Avec `answer_key` (clé de correction compilée du template), seule la sélection
+    stockée sur la réponse est lue.
+    Sans clé, suppose que quizquestion.question.answer_options est prefetch_related.
     """
+    selected_ids = set(answer.selected_option_ids)
+    if answer_key is not None:
+        return score_selection(answer_key.get(answer.quizquestion_id), selected_ids)
+
     correct_ids = {
         opt.id for opt in answer.quizquestion.question.answer_options.all()
         if opt.is_correct
     }
-    selected_ids = {opt.id for opt in answer.selected_options.all()}
     weight = float(answer.quizquestion.weight or 0)
     is_correct = bool(correct_ids and selected_ids == correct_ids)
     earned_score = weight if is_correct else 0.0
     return earned_score, weight, is_correct
+
+
+def apply_answer_key_score(answer, selected_ids, versioned_answer_key=None) -> None:
+    """
+    Renseigne earned_score, max_score, is_correct et scored_answer_key_version sur l'instance
+    (sans sauvegarde) à partir de la clé de correction du template. Utilisé par QUIZ_SCORE_ON_WRITE.
+    `versioned_answer_key` : (version, clé) de get_versioned_answer_key, relue si absente.
+    """
+    if versioned_answer_key is None:
+        versioned_answer_key = get_versioned_answer_key(answer.quiz.quiz_template_id)
+    version, answer_key = versioned_answer_key
+    answer.earned_score, answer.max_score, answer.is_correct = score_selection(
+        answer_key.get(answer.quizquestion_id),
+        selected_ids,
+    )
+    answer.scored_answer_key_version = version
+
+
+def score_answers_in_db(answers, quiz_template_ids=None) -> int:
+    """
+    Calcule earned_score, max_score et is_correct de toutes les réponses du queryset
+    en un seul UPDATE, à partir des clés de correction compilées (cache) des templates concernés :
+    une sélection est correcte quand sa forme canonique (ids triés) égale celle des options correctes.
+    Le même UPDATE enregistre la version de clé utilisée (scored_answer_key_version).
+    `quiz_template_ids` évite la requête de découverte des templates quand l'appelant les connaît.
+    Retourne le nombre de lignes mises à jour.
+    """
+    if quiz_template_ids is None:
+        quiz_template_ids = answers.order_by().values_list("quiz__quiz_template_id", flat=True).distinct()
+    weights = []
+    correct_selections = []
+    versions = []
+    for quiz_template_id in set(quiz_template_ids):
+        version, answer_key = get_versioned_answer_key(quiz_template_id)
+        if answer_key:
+            versions.append(When(quizquestion_id__in=list(answer_key), then=Value(version)))
+        for quizquestion_id, entry in answer_key.items():
+            weights.append(When(quizquestion_id=quizquestion_id, then=Value(entry.weight)))
+            if entry.correct_ids:
+                correct_selections.append(
+                    (Q(quizquestion_id=quizquestion_id, selected_option_ids=sorted(entry.correct_ids)), entry.weight)
+                )
+
+    return answers.order_by().update(
+        max_score=Case(*weights, default=Value(0.0), output_field=FloatField()),
+        is_correct=Case(
+            *(When(condition, then=Value(True)) for condition, _ in correct_selections),
+            default=Value(False),
+            output_field=BooleanField(),
+        ),
+        earned_score=Case(
+            *(When(condition, then=Value(weight)) for condition, weight in correct_selections),
+            default=Value(0.0),
+            output_field=FloatField(),
+        ),
+        scored_answer_key_version=Case(*versions, default=None, output_field=IntegerField()),
+    )
@@ -1,6 +1,7 @@
 import logging
 
 from drf_spectacular.utils import extend_schema_field
+from django.conf import settings
 from django.db import IntegrityError, transaction
 from question.models import Question, AnswerOption
 from question.serializers import QuestionInQuizQuestionSerializer, QuestionReadSerializer
@@ -19,18 +20,23 @@ from .models import (
     QuizQuestionAnswer,
     QuizAlertThread,
     QuizAlertMessage,
+    normalize_option_ids,
 )
 from .alerting import (
+    ALERT_THREAD_INLINE_MESSAGES,
     alert_last_message_preview,
     append_alert_message,
     can_manage_alert,
     can_reply_to_alert,
     create_alert_thread,
     is_alert_unread,
+    latest_alert_messages,
     message_is_mine,
     message_is_unread_for_user,
     unread_count_for_alert,
 )
+from .answer_key import get_versioned_answer_key
+from .answer_writes import save_quiz_answers_batch
 from .policies import (
     ANSWER_CORRECTNESS_FULL,
     ANSWER_CORRECTNESS_HIDDEN,
@@ -39,6 +45,9 @@ from .policies import (
     can_show_quiz_result,
     is_quiz_admin,
 )
+from .scoring import apply_answer_key_score
+from .snapshots import session_questions_snapshot, snapshot_quiz_questions_queryset
+from .totals import refresh_quiz_totals
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +107,66 @@ class BulkCreateFromTemplateInputSerializer(serializers.Serializer):
     user_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
 
 
+class QuizJobSerializer(serializers.Serializer):
+    id = serializers.CharField()
+    kind = serializers.CharField()
+    status = serializers.ChoiceField(choices=["pending", "running", "done", "failed"])
+    total = serializers.IntegerField()
+    processed = serializers.IntegerField()
+    error = serializers.CharField(allow_blank=True)
+    quiz_template_id = serializers.IntegerField(required=False)
+    skipped = serializers.IntegerField(required=False)
+
+
+class QuizItemOptionStatsSerializer(serializers.Serializer):
+    answer_option_id = serializers.IntegerField()
+    is_correct = serializers.BooleanField()
+    count = serializers.IntegerField()
+    frequency = serializers.FloatField(allow_null=True)
+
+
+class QuizItemStatsSerializer(serializers.Serializer):
+    quizquestion_id = serializers.IntegerField()
+    question_id = serializers.IntegerField()
+    sort_order = serializers.IntegerField()
+    weight = serializers.IntegerField()
+    answers = serializers.IntegerField()
+    correct = serializers.IntegerField()
+    omitted = serializers.IntegerField()
+    difficulty = serializers.FloatField(allow_null=True)
+    discrimination = serializers.FloatField(allow_null=True)
+    options = QuizItemOptionStatsSerializer(many=True)
+
+
+class QuizScoreBucketSerializer(serializers.Serializer):
+    score = serializers.FloatField()
+    count = serializers.IntegerField()
+
+
+class QuizScoreStatsSerializer(serializers.Serializer):
+    sessions = serializers.IntegerField()
+    max_score = serializers.FloatField()
+    mean = serializers.FloatField(allow_null=True)
+    std = serializers.FloatField(allow_null=True)
+    distribution = QuizScoreBucketSerializer(many=True)
+
+
+class QuizItemAnalysisSerializer(serializers.Serializer):
+    """
+    Analyse d'items d'un template sur ses sessions fermées et finalisées :
+    difficulty = taux de réussite (p-value), discrimination = point-bisériale avec le score du reste du quiz.
+    """
+
+    quiz_template_id = serializers.IntegerField()
+    answer_key_version = serializers.IntegerField()
+    computed_at = serializers.DateTimeField()
+    stale_sessions = serializers.IntegerField(
+        help_text="Sessions fermées exclues, en attente de réconciliation avec la clé de correction courante."
+    )
+    score = QuizScoreStatsSerializer()
+    questions = QuizItemStatsSerializer(many=True)
+
+
 class CreateQuizInputSerializer(serializers.Serializer):
     quiz_template_id = serializers.IntegerField()
 
@@ -201,6 +270,16 @@ class QuizTemplateSerializer(RequestUserMixin, serializers.ModelSerializer):
         }
 
 
+class QuizTemplateListSerializer(QuizTemplateSerializer):
+    """
+    Liste des templates : mêmes champs que QuizTemplateSerializer sans quiz_questions
+    (le détail les expose) ; lit la projection quiz_template_list_queryset().
+    """
+
+    class Meta(QuizTemplateSerializer.Meta):
+        fields = tuple(field for field in QuizTemplateSerializer.Meta.fields if field != "quiz_questions")
+
+
 class QuizTemplateWriteSerializer(RequestUserMixin, serializers.ModelSerializer):
     translations = LocalizedTranslationsDictField(
         value_serializer=LocalizedQuizTemplateTranslationSerializer,
@@ -422,6 +501,11 @@ class QuizQuestionAnswerSerializer(serializers.ModelSerializer):
 
     question_id = serializers.IntegerField(source="quizquestion.question_id", read_only=True)
     quizquestion_id = serializers.IntegerField(source="quizquestion.id", read_only=True)
+    selected_options = serializers.ListField(
+        child=serializers.IntegerField(),
+        source="selected_option_ids",
+        read_only=True,
+    )
 
     class Meta:
         model = QuizQuestionAnswer
@@ -437,6 +521,19 @@ class QuizQuestionAnswerSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class QuizQuestionAnswerBufferedSerializer(serializers.Serializer):
+    """
+    Réponse acquittée en mode QUIZ_ANSWER_WRITE_BEHIND : pas encore en base, donc sans id ni answered_at.
+    `sequence` est le numéro de l'entrée dans le tampon de la session.
+    """
+
+    quizquestion_id = serializers.IntegerField(source="quizquestion.id", read_only=True)
+    question_id = serializers.IntegerField(source="quizquestion.question_id", read_only=True)
+    question_order = serializers.IntegerField(source="quizquestion.sort_order", read_only=True)
+    selected_options = serializers.ListField(child=serializers.IntegerField(), read_only=True)
+    sequence = serializers.IntegerField(read_only=True)
+
+
 class QuizQuestionReadSerializer(ShowCorrectContextMixin, serializers.ModelSerializer):
     question = serializers.SerializerMethodField()
 
@@ -467,8 +564,8 @@ class QuizListSerializer(RequestUserMixin, serializers.ModelSerializer):
     user_summary = serializers.SerializerMethodField()
     with_duration = serializers.BooleanField(source="quiz_template.with_duration", read_only=True)
     duration = serializers.IntegerField(source="quiz_template.duration", read_only=True)
-    earned_score = serializers.FloatField(source="_earned_score", read_only=True)
-    max_score = serializers.FloatField(source="_max_score", read_only=True)
+    earned_score = serializers.FloatField(read_only=True)
+    max_score = serializers.FloatField(read_only=True)
 
     class Meta:
         model = Quiz
@@ -573,16 +670,25 @@ class QuizSerializer(QuizListSerializer):
 
     @extend_schema_field(QuizQuestionReadSerializer(many=True))
     def get_questions(self, obj) -> serializers.ModelSerializer:
-        qt = obj.quiz_template
         correctness_state = self._answer_correctness_state(obj)
-        return QuizQuestionReadSerializer(
-            qt.quiz_questions.all(),
-            many=True,
-            context={
-                **self.context,
-                "show_correct_state": correctness_state,
-            },
-        ).data
+        request = self.context.get("request")
+
+        def build():
+            return QuizQuestionReadSerializer(
+                snapshot_quiz_questions_queryset(obj.quiz_template_id),
+                many=True,
+                context={
+                    **self.context,
+                    "show_correct_state": correctness_state,
+                },
+            ).data
+
+        return session_questions_snapshot(
+            obj,
+            correctness_state=correctness_state,
+            base_url=request.build_absolute_uri("/") if request is not None else "",
+            build=build,
+        )
 
     def _answers_list(self, obj):
         if not hasattr(obj, "_answers_cache"):
@@ -615,36 +721,16 @@ class QuizSerializer(QuizListSerializer):
 
 
 class QuizAssignmentListSerializer(QuizListSerializer):
-    earned_score = serializers.SerializerMethodField()
-    max_score = serializers.SerializerMethodField()
-    total_answers = serializers.SerializerMethodField()
-    correct_answers = serializers.SerializerMethodField()
+    # Totaux dénormalisés sur Quiz (quiz/totals.py) : aucune lecture des réponses.
+    total_answers = serializers.IntegerField(read_only=True)
+    correct_answers = serializers.IntegerField(read_only=True)
 
     class Meta(QuizListSerializer.Meta):
         fields = QuizListSerializer.Meta.fields + [
-            "earned_score",
-            "max_score",
             "total_answers",
             "correct_answers",
         ]
 
-    def _answers_list(self, obj):
-        if not hasattr(obj, "_answers_cache"):
-            obj._answers_cache = list(obj.answers.all())
-        return obj._answers_cache
-
-    def get_total_answers(self, obj) -> int:
-        return len(self._answers_list(obj))
-
-    def get_correct_answers(self, obj) -> int:
-        return sum(1 for a in self._answers_list(obj) if a.is_correct)
-
-    def get_earned_score(self, obj) -> float:
-        return sum(a.earned_score for a in self._answers_list(obj))
-
-    def get_max_score(self, obj) -> float:
-        return sum(a.max_score for a in self._answers_list(obj))
-
 
 class QuizUpdateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -668,6 +754,20 @@ class QuizPartialUpdateSerializer(QuizUpdateSerializer):
     active = serializers.BooleanField(required=False)
 
 
+def _save_score_on_write(answer, quiz) -> None:
+    apply_answer_key_score(
+        answer,
+        answer.selected_option_ids,
+        get_versioned_answer_key(quiz.quiz_template_id),
+    )
+    QuizQuestionAnswer.objects.filter(pk=answer.pk).update(
+        earned_score=answer.earned_score,
+        max_score=answer.max_score,
+        is_correct=answer.is_correct,
+        scored_answer_key_version=answer.scored_answer_key_version,
+    )
+
+
 class QuizQuestionAnswerWriteSerializer(serializers.ModelSerializer):
     question_id = serializers.PrimaryKeyRelatedField(
         queryset=Question.objects.all(),
@@ -680,9 +780,8 @@ class QuizQuestionAnswerWriteSerializer(serializers.ModelSerializer):
         required=False,
         help_text="Ordre de la question dans le template (optionnel)",
     )
-    selected_options = serializers.PrimaryKeyRelatedField(
-        queryset=AnswerOption.objects.all(),
-        many=True,
+    selected_options = serializers.ListField(
+        child=serializers.IntegerField(),
         required=False,
     )
 
@@ -696,8 +795,7 @@ class QuizQuestionAnswerWriteSerializer(serializers.ModelSerializer):
         allowed_option_ids = set(
             quizquestion.question.answer_options.values_list("id", flat=True)
         )
-        selected_option_ids = {option.id for option in selected_options}
-        if not selected_option_ids.issubset(allowed_option_ids):
+        if not set(selected_options).issubset(allowed_option_ids):
             raise serializers.ValidationError(
                 {
                     "selected_options": (
@@ -782,7 +880,7 @@ class QuizQuestionAnswerWriteSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         quiz = self.context["quiz"]
 
-        selected = validated_data.pop("selected_options", [])
+        selected_ids = normalize_option_ids(validated_data.pop("selected_options", []))
         validated_data.pop("question_id", None)
         qq = validated_data.pop("quizquestion")
 
@@ -793,22 +891,28 @@ class QuizQuestionAnswerWriteSerializer(serializers.ModelSerializer):
                     QuizQuestionAnswer.objects.select_for_update()
                     .get(quiz=quiz, quizquestion=qq)
                 )
-                if instance.question_order != qq.sort_order:
-                    instance.question_order = qq.sort_order
-                    instance.save(update_fields=["question_order"])
             except QuizQuestionAnswer.DoesNotExist:
                 try:
                     instance = QuizQuestionAnswer.objects.create(
                         quiz=quiz,
                         quizquestion=qq,
                         question_order=qq.sort_order,
+                        selected_option_ids=selected_ids,
                     )
                 except IntegrityError:
                     instance = (
                         QuizQuestionAnswer.objects.select_for_update()
                         .get(quiz=quiz, quizquestion=qq)
                     )
-            instance.selected_options.set(selected)
+            if instance.question_order != qq.sort_order or instance.selected_option_ids != selected_ids:
+                instance.question_order = qq.sort_order
+                instance.selected_option_ids = selected_ids
+                # Score de l'ancienne sélection : à recalculer (à l'écriture ou à la réconciliation).
+                instance.scored_answer_key_version = None
+                instance.save(update_fields=["question_order", "selected_option_ids", "scored_answer_key_version"])
+            if settings.QUIZ_SCORE_ON_WRITE:
+                _save_score_on_write(instance, quiz)
+            refresh_quiz_totals([quiz.pk], unfinalize=True)
         return instance
 
     def update(self, instance, validated_data):
@@ -820,13 +924,18 @@ class QuizQuestionAnswerWriteSerializer(serializers.ModelSerializer):
         with transaction.atomic():
             locked_instance = QuizQuestionAnswer.objects.select_for_update().get(pk=instance.pk)
 
+            if selected is not None:
+                validated_data["selected_option_ids"] = normalize_option_ids(selected)
+                validated_data["scored_answer_key_version"] = None
             if validated_data:
                 for attr, value in validated_data.items():
                     setattr(locked_instance, attr, value)
                 locked_instance.save(update_fields=list(validated_data.keys()))
 
             if selected is not None:
-                locked_instance.selected_options.set(selected)
+                if settings.QUIZ_SCORE_ON_WRITE:
+                    _save_score_on_write(locked_instance, self.context["quiz"])
+                refresh_quiz_totals([locked_instance.quiz_id], unfinalize=True)
 
         return locked_instance
 
@@ -835,6 +944,122 @@ class QuizQuestionAnswerPartialSerializer(QuizQuestionAnswerWriteSerializer):
     pass
 
 
+class QuizQuestionAnswerBatchItemSerializer(serializers.Serializer):
+    question_id = serializers.IntegerField(
+        required=False,
+        help_text="ID de la Question (optionnel)",
+    )
+    question_order = serializers.IntegerField(
+        required=False,
+        help_text="Ordre de la question dans le template (optionnel)",
+    )
+    selected_options = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        default=list,
+    )
+
+
+class QuizQuestionAnswerBatchWriteSerializer(serializers.Serializer):
+    """
+    Enregistre plusieurs réponses d'un même quiz en une seule requête.
+    Toutes les réponses sont validées en une passe contre les QuizQuestion du template
+    (une requête pour les questions, une pour les options).
+    """
+
+    answers = QuizQuestionAnswerBatchItemSerializer(many=True, allow_empty=False)
+
+    def _resolve_quizquestion(self, item, by_question_id, by_order):
+        question_id = item.get("question_id")
+        order = item.get("question_order")
+        if question_id is None and order is None:
+            raise serializers.ValidationError(
+                "Fournis au moins un des deux champs: 'question_id' et/ou 'question_order'."
+            )
+
+        qq_by_id = None
+        qq_by_order = None
+        if question_id is not None:
+            qq_by_id = by_question_id.get(question_id)
+            if qq_by_id is None:
+                raise serializers.ValidationError(
+                    {"question_id": "Cette question n'appartient pas au template de ce quiz."}
+                )
+        if order is not None:
+            if order <= 0:
+                raise serializers.ValidationError({"question_order": "Doit être un entier positif."})
+            qq_by_order = by_order.get(order)
+            if qq_by_order is None:
+                raise serializers.ValidationError(
+                    {"question_order": "Aucune question à cet ordre dans le template de ce quiz."}
+                )
+        if qq_by_id and qq_by_order and qq_by_id.pk != qq_by_order.pk:
+            raise serializers.ValidationError(
+                {"non_field_errors": ["question_id et question_order ne sont pas cohérents pour ce quiz."]}
+            )
+        return qq_by_id or qq_by_order
+
+    def validate(self, attrs):
+        quiz = self.context.get("quiz")
+        if not quiz:
+            raise serializers.ValidationError("Quiz manquant dans le contexte.")
+
+        if not quiz.can_answer:
+            raise serializers.ValidationError({"detail": "Ce quiz n'est plus disponible pour répondre."})
+
+        quiz_questions = list(
+            QuizQuestion.objects
+            .filter(quiz_id=quiz.quiz_template_id)
+            .only("id", "question_id", "sort_order")
+        )
+        by_question_id = {qq.question_id: qq for qq in quiz_questions}
+        by_order = {qq.sort_order: qq for qq in quiz_questions}
+
+        allowed_option_ids: dict[int, set[int]] = {}
+        for option_id, question_id in AnswerOption.objects.filter(
+            question_id__in=by_question_id.keys(),
+        ).values_list("id", "question_id"):
+            allowed_option_ids.setdefault(question_id, set()).add(option_id)
+
+        errors = []
+        entries = []
+        seen_quizquestion_ids = set()
+        for item in attrs["answers"]:
+            try:
+                qq = self._resolve_quizquestion(item, by_question_id, by_order)
+                if qq.pk in seen_quizquestion_ids:
+                    raise serializers.ValidationError(
+                        {"non_field_errors": ["Cette question apparaît plusieurs fois dans le lot."]}
+                    )
+                selected_option_ids = set(item.get("selected_options") or [])
+                if not selected_option_ids.issubset(allowed_option_ids.get(qq.question_id, set())):
+                    raise serializers.ValidationError(
+                        {
+                            "selected_options": (
+                                "Toutes les options sélectionnées doivent appartenir à la question répondue."
+                            )
+                        }
+                    )
+            except serializers.ValidationError as exc:
+                errors.append(exc.detail)
+                continue
+            seen_quizquestion_ids.add(qq.pk)
+            entries.append((qq, sorted(selected_option_ids)))
+            errors.append({})
+
+        if any(errors):
+            raise serializers.ValidationError({"answers": errors})
+
+        attrs["entries"] = entries
+        return attrs
+
+    def create(self, validated_data):
+        return save_quiz_answers_batch(
+            quiz=self.context["quiz"],
+            entries=validated_data["entries"],
+        )
+
+
 class QuizAlertMessageSerializer(RequestUserMixin, serializers.ModelSerializer):
     author_summary = serializers.SerializerMethodField()
     is_mine = serializers.SerializerMethodField()
@@ -874,6 +1099,7 @@ class QuizAlertThreadListSerializer(RequestUserMixin, serializers.ModelSerialize
     unread = serializers.SerializerMethodField()
     unread_count = serializers.SerializerMethodField()
     last_message_preview = serializers.SerializerMethodField()
+    last_message_author = serializers.IntegerField(source="last_message_author_id", read_only=True, allow_null=True)
     counterpart_username = serializers.SerializerMethodField()
     question_id = serializers.IntegerField(read_only=True, allow_null=True)
     question_order = serializers.IntegerField(read_only=True, allow_null=True)
@@ -898,6 +1124,7 @@ class QuizAlertThreadListSerializer(RequestUserMixin, serializers.ModelSerialize
             "unread",
             "unread_count",
             "last_message_preview",
+            "last_message_author",
             "counterpart_username",
         ]
         read_only_fields = fields
@@ -927,9 +1154,15 @@ class QuizAlertThreadListSerializer(RequestUserMixin, serializers.ModelSerialize
 
 
 class QuizAlertThreadDetailSerializer(QuizAlertThreadListSerializer):
+    """
+    Détail d'une conversation : seuls les ALERT_THREAD_INLINE_MESSAGES derniers messages sont inclus
+    (ordre chronologique) ; les plus anciens se lisent via alerts/{alert_id}/messages/.
+    """
+
     reporter_summary = serializers.SerializerMethodField()
     owner_summary = serializers.SerializerMethodField()
-    messages = QuizAlertMessageSerializer(many=True, read_only=True)
+    messages = serializers.SerializerMethodField()
+    has_more_messages = serializers.SerializerMethodField()
     can_reply = serializers.SerializerMethodField()
     can_manage = serializers.SerializerMethodField()
 
@@ -942,11 +1175,26 @@ class QuizAlertThreadDetailSerializer(QuizAlertThreadListSerializer):
             "closed_at",
             "closed_by",
             "messages",
+            "has_more_messages",
             "can_reply",
             "can_manage",
         ]
         read_only_fields = fields
 
+    def _latest_messages(self, obj) -> tuple[list, bool]:
+        # Une requête partagée par messages et has_more_messages.
+        if not hasattr(obj, "_latest_alert_messages"):
+            obj._latest_alert_messages = latest_alert_messages(obj, ALERT_THREAD_INLINE_MESSAGES)
+        return obj._latest_alert_messages
+
+    @extend_schema_field(QuizAlertMessageSerializer(many=True))
+    def get_messages(self, obj) -> list[dict]:
+        messages, _ = self._latest_messages(obj)
+        return QuizAlertMessageSerializer(messages, many=True, context=self.context).data
+
+    def get_has_more_messages(self, obj) -> bool:
+        return self._latest_messages(obj)[1]
+
     @extend_schema_field(UserSummarySerializer(allow_null=True))
     def get_reporter_summary(self, obj) -> dict | None:
         if obj.reporter_id is None:
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 
+from .access_index import invalidate_user_template_access
 from .models import Quiz
 from .session_integrity import reconcile_quiz_answers
 from .notifications import (
     notify_quiz_assigned_on_commit,
     notify_quiz_completed_on_commit,
+    notify_quizzes_assigned_on_commit,
 )
 
 # Backward-compatible names still referenced by some tests and patch points.
@@ -29,15 +31,46 @@ def create_quizzes_from_template(*, quiz_template, users, validate_target_user,
             )
             for user in users
         ])
+        # bulk_create n'émet pas post_save : l'index d'accès des destinataires est invalidé ici.
+        invalidate_user_template_access(quiz.user_id for quiz in created)
 
-        for quiz in created:
-            notify_quiz_assigned(quiz, assigned_by=assigned_by)
+        notify_quizzes_assigned_on_commit(created, assigned_by=assigned_by)
 
     return created
 
 
+def get_or_create_exam_attempt(*, quiz_template, user) -> tuple[Quiz, bool]:
+    """
+    Retourne la session d'examen de l'utilisateur pour ce template, ou la crée.
+    Aucun verrou sur le template : la contrainte partielle quiz_unique_exam_attempt arbitre
+    les créations concurrentes d'un même utilisateur (le perdant relit la tentative gagnante),
+    et les démarrages d'utilisateurs différents ne se bloquent jamais.
+    Une session déjà assignée à l'utilisateur pour ce template est retournée telle quelle.
+    """
+    existing = (
+        Quiz.objects
+        .filter(quiz_template=quiz_template, user=user)
+        .order_by("-created_at", "-id")
+        .first()
+    )
+    if existing is not None:
+        return existing, False
+    try:
+        with transaction.atomic():
+            quiz = Quiz.objects.create(
+                domain_id=quiz_template.domain_id,
+                quiz_template=quiz_template,
+                user=user,
+                active=False,
+                is_exam_attempt=True,
+            )
+    except IntegrityError:
+        return Quiz.objects.get(quiz_template=quiz_template, user=user, is_exam_attempt=True), False
+    return quiz, True
+
+
 def close_quiz_session(*, quiz) -> Quiz:
-    reconcile_quiz_answers(quiz)
+    reconcile_quiz_answers(quiz, finalize=True)
 
     quiz.active = False
     if not quiz.ended_at:
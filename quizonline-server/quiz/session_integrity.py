@@ -1,34 +1,146 @@
 from __future__ import annotations
 
-from quiz.models import Quiz, QuizQuestionAnswer
-from quiz.scoring import compute_answer_score
+from collections.abc import Iterable
 
+from django.conf import settings
+from django.db.models import Case, F, IntegerField, Q, Value, When
 
-def _answers_queryset(quiz):
-    return (
-        quiz.answers
-        .select_related("quizquestion__question")
-        .prefetch_related(
-            "selected_options",
-            "quizquestion__question__answer_options",
+from quiz.answer_buffer import flush_answer_buffers, wait_for_answer_buffers
+from quiz.answer_key import get_versioned_answer_key
+from quiz.answer_stats import record_answer_stats
+from quiz.models import Quiz, QuizQuestion, QuizQuestionAnswer, QuizTemplate
+from quiz.scoring import compute_answer_score, score_answers_in_db
+from quiz.totals import refresh_quiz_totals
+
+
+def _reset_answers_cache(quiz: Quiz) -> None:
+    if hasattr(quiz, "_prefetched_objects_cache"):
+        quiz._prefetched_objects_cache = {}
+    if hasattr(quiz, "_answers_cache"):
+        delattr(quiz, "_answers_cache")
+
+
+def _answer_key_versions(quizzes: list[Quiz]) -> dict[int, int]:
+    # Lue avant le scoring : une modification concurrente laisse la session à re-réconcilier.
+    return dict(
+        QuizTemplate.objects
+        .filter(pk__in={quiz.quiz_template_id for quiz in quizzes})
+        .values_list("pk", "answer_key_version")
+    )
+
+
+def _mark_finalized(quizzes: list[Quiz], versions: dict[int, int]) -> None:
+    """
+    Enregistre, en un UPDATE, la version de clé de correction contre laquelle les sessions sont réconciliées,
+    puis reporte leurs réponses dans les statistiques par question (quiz/answer_stats.py).
+    """
+    Quiz.objects.filter(pk__in=[quiz.pk for quiz in quizzes]).update(
+        finalized_answer_key_version=Case(
+            *(When(quiz_template_id=template_id, then=Value(version)) for template_id, version in versions.items()),
+            default=None,
+            output_field=IntegerField(),
         )
     )
+    for quiz in quizzes:
+        quiz.finalized_answer_key_version = versions.get(quiz.quiz_template_id)
+    record_answer_stats(quiz.pk for quiz in quizzes)
 
 
-def reconcile_quiz_answers(quiz: Quiz) -> None:
+def reconcile_quizzes_answers(quizzes: Iterable[Quiz], *, finalize: bool = False) -> None:
+    """
+    Version ensembliste de reconcile_quiz_answers pour une ou plusieurs sessions :
+    1 requête pour les QuizQuestion des templates, 1 pour les réponses existantes,
+    1 bulk_create des réponses manquantes, 1 UPDATE de scoring (score_answers_in_db),
+    1 UPDATE des totaux dénormalisés des sessions (refresh_quiz_totals).
+    La clé de correction de chaque template coûte 1 lecture de version si elle est en cache,
+    3 requêtes (version, options correctes, poids) quand elle est à recompiler.
+    Avec QUIZ_SCORE_ON_WRITE, seules les réponses dont la version de scoring enregistrée diffère de
+    la version courante de la clé sont scorées : insérées ici, modifiées sans scoring, ou scorées
+    avant un changement de barème.
+    `finalize` (sessions fermées) ajoute 1 SELECT des versions et 1 UPDATE du marqueur de finalisation.
+    Le nombre de requêtes ne dépend ni du nombre de sessions ni du nombre de questions,
+    hors vidange préalable des sessions dont le tampon d'écriture différée n'est pas vide
+    (barrière stricte si `finalize` : AnswerBufferGapError plutôt que finaliser au-delà d'un trou).
+    """
+    quizzes = list(quizzes)
+    if not quizzes:
+        return
+    flush_answer_buffers((quiz.pk for quiz in quizzes), barrier=finalize)
+    versions = _answer_key_versions(quizzes) if finalize else None
+
+    quiz_questions_by_template: dict[int, list[tuple[int, int]]] = {}
+    rows = (
+        QuizQuestion.objects
+        .filter(quiz_id__in={quiz.quiz_template_id for quiz in quizzes})
+        .order_by("sort_order", "id")
+        .values_list("quiz_id", "id", "sort_order")
+    )
+    for quiz_template_id, quizquestion_id, sort_order in rows:
+        quiz_questions_by_template.setdefault(quiz_template_id, []).append((quizquestion_id, sort_order))
+
+    quiz_ids = [quiz.pk for quiz in quizzes]
+    existing = set(
+        QuizQuestionAnswer.objects
+        .filter(quiz_id__in=quiz_ids)
+        .values_list("quiz_id", "quizquestion_id")
+    )
+    missing = [
+        QuizQuestionAnswer(quiz_id=quiz.pk, quizquestion_id=quizquestion_id, question_order=sort_order)
+        for quiz in quizzes
+        for quizquestion_id, sort_order in quiz_questions_by_template.get(quiz.quiz_template_id, ())
+        if (quiz.pk, quizquestion_id) not in existing
+    ]
+    if missing:
+        QuizQuestionAnswer.objects.bulk_create(missing, batch_size=1000)
+
+    quiz_template_ids = {quiz.quiz_template_id for quiz in quizzes}
+    answers = QuizQuestionAnswer.objects.filter(quiz_id__in=quiz_ids)
+    if settings.QUIZ_SCORE_ON_WRITE:
+        # Les réponses scorées à l'écriture contre la clé courante sont conservées telles quelles.
+        answers = answers.filter(
+            Q(scored_answer_key_version__isnull=True)
+            | ~Q(scored_answer_key_version=F("quiz__quiz_template__answer_key_version"))
+        )
+    score_answers_in_db(answers, quiz_template_ids)
+    refresh_quiz_totals(quiz_ids)
+    if finalize:
+        _mark_finalized(quizzes, versions)
+
+    for quiz in quizzes:
+        _reset_answers_cache(quiz)
+
+
+def reconcile_quiz_answers(quiz: Quiz, *, finalize: bool = False) -> None:
     """
     Crée les réponses manquantes et recalcule les scores pour un quiz fermé.
+    Par défaut le scoring est fait en SQL (reconcile_quizzes_answers) ;
+    QUIZ_SQL_SCORING=False conserve le calcul Python ci-dessous.
+    `finalize` marque la session comme réconciliée pour la version courante de la clé de correction.
+    """
+    if settings.QUIZ_SQL_SCORING:
+        reconcile_quizzes_answers([quiz], finalize=finalize)
+        return
+    _reconcile_quiz_answers_in_python(quiz, finalize=finalize)
+
+
+def _reconcile_quiz_answers_in_python(quiz: Quiz, *, finalize: bool = False) -> None:
+    """
     Modifie les objets en base via bulk_create / bulk_update.
+    Le scoring s'appuie sur la clé de correction compilée du template (cache) :
+    seules les options sélectionnées sont lues.
     Invalide le prefetch cache du quiz en fin d'opération.
     """
+    flush_answer_buffers([quiz.pk], barrier=finalize)
+    versions = _answer_key_versions([quiz]) if finalize else None
+    answer_key_version, answer_key = get_versioned_answer_key(quiz.quiz_template_id)
     quiz_questions = list(
-        quiz.quiz_template.quiz_questions
-        .select_related("question")
-        .prefetch_related("question__answer_options")
+        QuizQuestion.objects
+        .filter(quiz_id=quiz.quiz_template_id)
+        .only("id", "sort_order")
         .order_by("sort_order", "id")
     )
 
-    existing_answers = list(_answers_queryset(quiz))
+    existing_answers = list(quiz.answers.all())
     existing_answer_ids = {a.quizquestion_id for a in existing_answers}
 
     missing = []
@@ -39,35 +151,50 @@ def reconcile_quiz_answers(quiz: Quiz) -> None:
             missing.append(answer)
     if missing:
         QuizQuestionAnswer.objects.bulk_create(missing)
-        existing_answers = list(_answers_queryset(quiz))
+        existing_answers = list(quiz.answers.all())
 
     to_update = []
     for answer in existing_answers:
-        earned, max_score, is_correct = compute_answer_score(answer)
+        earned, max_score, is_correct = compute_answer_score(answer, answer_key)
         if (
             float(answer.max_score or 0) != max_score
             or float(answer.earned_score or 0) != earned
             or answer.is_correct != is_correct
+            or answer.scored_answer_key_version != answer_key_version
         ):
             answer.max_score = max_score
             answer.earned_score = earned
             answer.is_correct = is_correct
+            answer.scored_answer_key_version = answer_key_version
             to_update.append(answer)
 
     if to_update:
         QuizQuestionAnswer.objects.bulk_update(
             to_update,
-            ["earned_score", "max_score", "is_correct"],
+            ["earned_score", "max_score", "is_correct", "scored_answer_key_version"],
         )
+    refresh_quiz_totals([quiz.pk])
+    if finalize:
+        _mark_finalized([quiz], versions)
+
+    _reset_answers_cache(quiz)
 
-    if hasattr(quiz, "_prefetched_objects_cache"):
-        quiz._prefetched_objects_cache = {}
-    if hasattr(quiz, "_answers_cache"):
-        delattr(quiz, "_answers_cache")
+
+def is_quiz_finalized(quiz: Quiz) -> bool:
+    """Session fermée déjà réconciliée contre la version courante de la clé de correction du template."""
+    return (
+        quiz.finalized_answer_key_version is not None
+        and quiz.finalized_answer_key_version == quiz.quiz_template.answer_key_version
+    )
 
 
 def synchronize_closed_quiz_answers(quiz: Quiz) -> Quiz:
-    if quiz.started_at is None or quiz.active:
+    """
+    Réconcilie une session fermée au plus une fois par version de la clé de correction :
+    une session finalisée est servie telle quelle, sans requête ni rescoring.
+    """
+    if quiz.started_at is None or quiz.active or is_quiz_finalized(quiz):
         return quiz
-    reconcile_quiz_answers(quiz)
+    wait_for_answer_buffers([quiz.pk])
+    reconcile_quiz_answers(quiz, finalize=True)
     return quiz
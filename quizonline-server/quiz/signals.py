@@ -0,0 +1,121 @@
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from question.models import AnswerOption
+from question.signals import answer_options_changed
+
+from .access_index import invalidate_public_templates, invalidate_user_template_access
+from .answer_key import bump_answer_key_version
+from .answer_stats import retract_answer_stats
+from .events import publish_alert_message, publish_alert_status
+from .models import (
+    Quiz,
+    QuizAlertMessage,
+    QuizAlertThread,
+    QuizQuestion,
+    QuizQuestionAnswer,
+    QuizTemplate,
+)
+from .totals import refresh_template_questions_total
+
+# Entrées de la clé de correction (quiz.answer_key) : un enregistrement ne fait monter la version
+# que si l'une d'elles change. Leur état est relu avant l'écriture (1 requête) quand elles sont
+# susceptibles d'être écrites, c'est-à-dire sans update_fields ou s'il en contient une.
+_ANSWER_KEY_FIELDS = {
+    AnswerOption: ("question_id", "is_correct"),
+    QuizQuestion: ("quiz_id", "question_id", "weight"),
+}
+
+
+@receiver(pre_save, sender=AnswerOption)
+@receiver(pre_save, sender=QuizQuestion)
+def remember_answer_key_state(sender, instance, raw: bool = False, update_fields=None, **kwargs) -> None:
+    instance._answer_key_previous_state = None
+    fields = _ANSWER_KEY_FIELDS[sender]
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and not {*fields, *(field.removesuffix("_id") for field in fields)} & set(update_fields):
+        return
+    instance._answer_key_previous_state = sender._base_manager.filter(pk=instance.pk).values_list(*fields).first()
+
+
+def _changed_answer_key_state(sender, instance, created: bool) -> tuple | None:
+    # État précédent si une entrée de la clé a changé, () pour une création, None sinon.
+    if created:
+        return ()
+    previous = getattr(instance, "_answer_key_previous_state", None)
+    current = tuple(getattr(instance, field) for field in _ANSWER_KEY_FIELDS[sender])
+    return previous if previous is not None and previous != current else None
+
+
+@receiver(post_save, sender=AnswerOption)
+def invalidate_answer_key_for_option(sender, instance: AnswerOption, created: bool = False, **kwargs) -> None:
+    previous = _changed_answer_key_state(sender, instance, created)
+    if previous is None:
+        return
+    bump_answer_key_version(question_ids=list({instance.question_id, *previous[:1]}))
+
+
+@receiver(post_delete, sender=AnswerOption)
+def invalidate_answer_key_for_deleted_option(sender, instance: AnswerOption, **kwargs) -> None:
+    bump_answer_key_version(question_ids=[instance.question_id])
+
+
+@receiver(post_save, sender=QuizQuestion)
+def invalidate_answer_key_for_quiz_question(sender, instance: QuizQuestion, created: bool = False, **kwargs) -> None:
+    previous = _changed_answer_key_state(sender, instance, created)
+    if previous is None:
+        return
+    bump_answer_key_version(quiz_template_ids=list({instance.quiz_id, *previous[:1]}))
+
+
+@receiver(post_delete, sender=QuizQuestion)
+def invalidate_answer_key_for_deleted_quiz_question(sender, instance: QuizQuestion, **kwargs) -> None:
+    bump_answer_key_version(quiz_template_ids=[instance.quiz_id])
+
+
+@receiver(post_save, sender=QuizQuestion)
+@receiver(post_delete, sender=QuizQuestion)
+def refresh_questions_total_for_quiz_question(sender, instance: QuizQuestion, origin=None, **kwargs) -> None:
+    # Suppression du template : ses QuizQuestion partent en cascade, le total n'a plus de lecteur.
+    if isinstance(origin, QuizTemplate) or getattr(origin, "model", None) is QuizTemplate:
+        return
+    refresh_template_questions_total([instance.quiz_id])
+
+
+@receiver(answer_options_changed, sender=AnswerOption)
+def invalidate_answer_key_for_bulk_options(sender, question, **kwargs) -> None:
+    bump_answer_key_version(question_ids=[question.pk])
+
+
+@receiver(post_save, sender=Quiz)
+@receiver(post_delete, sender=Quiz)
+def invalidate_template_access_for_quiz(sender, instance: Quiz, **kwargs) -> None:
+    invalidate_user_template_access([instance.user_id])
+
+
+@receiver(post_save, sender=QuizTemplate)
+@receiver(post_delete, sender=QuizTemplate)
+def invalidate_public_templates_for_template(sender, instance: QuizTemplate, **kwargs) -> None:
+    invalidate_public_templates()
+
+
+@receiver(pre_delete, sender=Quiz)
+def retract_answer_stats_for_quiz(sender, instance: Quiz, origin=None, **kwargs) -> None:
+    # Les statistiques du template partent en cascade avec lui : rien à retirer.
+    if isinstance(origin, QuizTemplate) or getattr(origin, "model", None) is QuizTemplate:
+        return
+    retract_answer_stats(QuizQuestionAnswer.objects.filter(quiz_id=instance.pk))
+
+
+@receiver(post_save, sender=QuizAlertMessage)
+def push_alert_message(sender, instance: QuizAlertMessage, created=False, **kwargs) -> None:
+    if created:
+        publish_alert_message(instance)
+
+
+@receiver(post_save, sender=QuizAlertThread)
+def push_alert_status(sender, instance: QuizAlertThread, update_fields=None, **kwargs) -> None:
+    # close()/reopen() enregistrent status via update_fields ; la création est couverte par son premier message.
+    if update_fields is not None and "status" in update_fields:
+        publish_alert_status(instance)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable
+
+from django.core.cache import cache
+from django.utils import translation
+from rest_framework.renderers import JSONRenderer
+
+from .models import Quiz, QuizQuestion
+
+SNAPSHOT_CACHE_PREFIX = "quiz:session_snapshot"
+SNAPSHOT_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def snapshot_quiz_questions_queryset(quiz_template_id: int):
+    """Arbre complet des questions d'un template, chargé une fois pour construire un snapshot."""
+    return (
+        QuizQuestion.objects
+        .filter(quiz_id=quiz_template_id)
+        .select_related("question__domain")
+        .prefetch_related(
+            "question__translations",
+            "question__answer_options__translations",
+            "question__media__asset",
+            "question__subjects",
+        )
+        .order_by("sort_order")
+    )
+
+
+def _snapshot_key(quiz: Quiz, *, correctness_state: str, base_url: str) -> str:
+    # base_url : les URLs de médias sont absolues et dépendent de l'hôte de la requête.
+    host = hashlib.md5(base_url.encode("utf-8")).hexdigest()[:12]
+    language = translation.get_language() or ""
+    return (
+        f"{SNAPSHOT_CACHE_PREFIX}:{quiz.pk}:{quiz.started_at.timestamp()}:"
+        f"{quiz.quiz_template.answer_key_version}:{language}:{correctness_state}:{host}"
+    )
+
+
+def session_questions_snapshot(
+    quiz: Quiz,
+    *,
+    correctness_state: str,
+    base_url: str,
+    build: Callable[[], list],
+) -> list:
+    """
+    Payload des questions d'une session démarrée, servi depuis un cache de rendu (best-effort).
+    Le JSON est mis en cache par (session, answer_key_version, langue, état de correction, hôte)
+    au premier rendu dans cette langue (réponse de `start` pour la langue de démarrage) : tant que
+    l'entrée est en cache, les lectures ne relisent plus l'arbre question → options → traductions
+    → médias → sujets.
+    Ce n'est pas un instantané figé : l'entrée expire (SNAPSHOT_CACHE_TIMEOUT), peut être évincée,
+    n'est partagée entre processus qu'avec un cache partagé (CACHE_URL Redis), et est alors
+    reconstruite depuis l'état courant du template.
+    Les sessions non démarrées sont rendues sans cache.
+    """
+    if quiz.started_at is None:
+        return build()
+
+    key = _snapshot_key(quiz, correctness_state=correctness_state, base_url=base_url)
+    blob = cache.get(key)
+    if blob is None:
+        blob = JSONRenderer().render(build())
+        cache.set(key, blob, SNAPSHOT_CACHE_TIMEOUT)
+    return json.loads(blob)
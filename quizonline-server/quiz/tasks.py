@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from celery import shared_task
+from django.conf import settings
+
+from quiz.answer_buffer import flush_active_answer_buffers
+from quiz.bulk_assign import assign_quiz_template_job
+from quiz.bulk_close import close_template_sessions
+from quiz.expiry import expire_quiz_sessions
+from quiz.template_resync import release_template_resync, resync_template_sessions
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_jitter=True,
+    retry_kwargs={"max_retries": 5},
+)
+def expire_quiz_sessions_task(self, *, batch_size: int = 200) -> int:
+    return expire_quiz_sessions(batch_size=batch_size)
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_jitter=True,
+    retry_kwargs={"max_retries": 5},
+)
+def close_template_sessions_task(
+    self,
+    quiz_template_id: int,
+    *,
+    job_id: str | None = None,
+    batch_size: int = 200,
+) -> int:
+    return close_template_sessions(quiz_template_id, batch_size=batch_size, job_id=job_id)
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_jitter=True,
+    retry_kwargs={"max_retries": 5},
+)
+def resync_template_sessions_task(self, quiz_template_id: int, *, batch_size: int = 200) -> int:
+    try:
+        return resync_template_sessions(quiz_template_id, batch_size=batch_size)
+    finally:
+        release_template_resync(quiz_template_id)
+
+
+# Pas de relance automatique : les lots déjà commités seraient assignés une seconde fois.
+@shared_task(bind=True)
+def assign_quiz_template_task(
+    self,
+    quiz_template_id: int,
+    user_ids: list[int],
+    *,
+    assigned_by_id: int | None = None,
+    job_id: str | None = None,
+) -> int:
+    return assign_quiz_template_job(quiz_template_id, user_ids, assigned_by_id=assigned_by_id, job_id=job_id)
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_jitter=True,
+    retry_kwargs={"max_retries": 5},
+)
+def flush_answer_buffers_task(self, *, batch_size: int = 500) -> int:
+    if not settings.QUIZ_ANSWER_WRITE_BEHIND:
+        return 0
+    return flush_active_answer_buffers(batch_size=batch_size)
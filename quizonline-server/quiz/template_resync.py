@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import logging
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Quiz, QuizTemplate
+from .session_integrity import reconcile_quizzes_answers
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_RESYNC_CACHE_PREFIX = "quiz:template_resync"
+# Garde-fou si le worker meurt avant de libérer la planification.
+TEMPLATE_RESYNC_LOCK_TIMEOUT = 60 * 15
+
+# Sessions périmées d'un template : démarrées, fermées, mais pas finalisées contre sa clé de correction
+# courante (barème modifié depuis la clôture, ou jamais relues depuis). Les lectures agrégées (analyse
+# d'items, export des résultats) ne les réconcilient pas dans la requête : elles les excluent ou les
+# signalent, et planifient leur réconciliation en tâche de fond (resync_template_sessions_task).
+
+
+def _lock_key(quiz_template_id: int) -> str:
+    return f"{TEMPLATE_RESYNC_CACHE_PREFIX}:{quiz_template_id}"
+
+
+def stale_sessions_queryset(quiz_template_id: int, answer_key_version: int):
+    return Quiz.objects.filter(
+        Q(finalized_answer_key_version__isnull=True) | ~Q(finalized_answer_key_version=answer_key_version),
+        quiz_template_id=quiz_template_id,
+        active=False,
+        started_at__isnull=False,
+    )
+
+
+def resync_template_sessions(quiz_template_id: int, *, batch_size: int = 200) -> int:
+    """
+    Réconcilie (finalize) les sessions périmées d'un template par lots de pk croissants,
+    une transaction par lot : la mémoire et la durée des verrous ne dépendent que de la taille du lot.
+    Idempotent. Retourne le nombre de sessions réconciliées.
+    """
+    version = QuizTemplate.objects.filter(pk=quiz_template_id).values_list("answer_key_version", flat=True).first()
+    if version is None:
+        return 0
+    stale_ids = stale_sessions_queryset(quiz_template_id, version).order_by("pk").values_list("id", flat=True)
+    reconciled = 0
+    last_id = 0
+    while batch := list(stale_ids.filter(pk__gt=last_id)[:batch_size]):
+        with transaction.atomic():
+            reconcile_quizzes_answers(Quiz.objects.filter(pk__in=batch), finalize=True)
+        reconciled += len(batch)
+        last_id = batch[-1]
+    if reconciled:
+        logger.info("quiz.template_sessions_resynced", extra={"quiz_template_id": quiz_template_id, "count": reconciled})
+    return reconciled
+
+
+def schedule_template_resync(quiz_template_id: int) -> bool:
+    """
+    Met en file, au commit, la réconciliation des sessions périmées d'un template.
+    Une seule planification à la fois par template (libérée par la tâche) : retourne False si déjà en file.
+    """
+    from .tasks import resync_template_sessions_task
+
+    if not cache.add(_lock_key(quiz_template_id), True, TEMPLATE_RESYNC_LOCK_TIMEOUT):
+        return False
+    transaction.on_commit(lambda: resync_template_sessions_task.delay(quiz_template_id))
+    return True
+
+
+def release_template_resync(quiz_template_id: int) -> None:
+    cache.delete(_lock_key(quiz_template_id))
@@ -0,0 +1,100 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone, translation
+
+from domain.models import Domain
+from quiz.access import user_can_access_template, user_can_create_quiz_from_template
+from quiz.access_index import available_public_template_ids, get_user_template_access
+from quiz.models import Quiz, QuizTemplate
+from quiz.querysets import accessible_quiz_template_queryset
+from quiz.services import create_quizzes_from_template
+
+User = get_user_model()
+
+
+class TemplateAccessIndexTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        translation.activate("fr")
+        self.owner = User.objects.create_user(username="owner", password="pass")
+        self.user = User.objects.create_user(username="student", password="pass")
+        self.domain = Domain.objects.create(owner=self.owner, name="Domain", description="", active=True)
+        self.domain.members.add(self.user)
+        self.exam = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Exam",
+            mode=QuizTemplate.MODE_EXAM,
+            is_public=True,
+            active=True,
+            permanent=True,
+            created_by=self.owner,
+        )
+        self.private = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Private",
+            is_public=False,
+            active=True,
+            permanent=True,
+            created_by=self.owner,
+        )
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def test_access_checks_reuse_the_cached_index(self):
+        self.assertTrue(user_can_access_template(self.user, self.exam))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(user_can_access_template(self.user, self.exam))
+            self.assertTrue(user_can_create_quiz_from_template(self.user, self.exam))
+            self.assertFalse(user_can_access_template(self.user, self.private))
+
+    def test_session_start_and_assignment_invalidate_the_index(self):
+        quiz = Quiz.objects.create(quiz_template=self.exam, user=self.user, active=False)
+        self.assertEqual(get_user_template_access(self.user).started_ids, frozenset())
+
+        quiz.started_at = timezone.now()
+        quiz.active = True
+        quiz.save(update_fields=["started_at", "active"])
+
+        self.assertFalse(user_can_access_template(self.user, self.exam))
+        self.assertNotIn(self.exam.pk, accessible_quiz_template_queryset(self.user).values_list("pk", flat=True))
+
+        create_quizzes_from_template(
+            quiz_template=self.private,
+            users=[self.user],
+            validate_target_user=lambda quiz_template, user: None,
+        )
+
+        self.assertTrue(user_can_access_template(self.user, self.private))
+
+    def test_public_catalogue_is_cached_per_template_version_and_evaluated_now(self):
+        later = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Later",
+            is_public=True,
+            active=True,
+            permanent=False,
+            started_at=timezone.now() + timedelta(hours=1),
+            created_by=self.owner,
+        )
+        self.assertEqual(available_public_template_ids(), [self.exam.pk])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                available_public_template_ids(at=timezone.now() + timedelta(hours=2)),
+                [self.exam.pk, later.pk],
+            )
+
+        self.exam.is_public = False
+        self.exam.save()
+
+        self.assertEqual(
+            list(accessible_quiz_template_queryset(AnonymousUser()).values_list("pk", flat=True)),
+            [],
+        )
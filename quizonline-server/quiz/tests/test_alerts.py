@@ -6,6 +6,7 @@ from django.urls import reverse
 from django.utils import timezone, translation
 from domain.models import Domain
 from question.models import AnswerOption, Question, QuestionSubject
+from quiz.alerting import ALERT_THREAD_INLINE_MESSAGES, append_alert_message, unread_total_for_user
 from quiz.constants import VISIBILITY_IMMEDIATE
 from quiz.models import Quiz, QuizAlertThread, QuizQuestion, QuizTemplate
 from quiz.services import create_quizzes_from_template
@@ -172,6 +173,117 @@ class QuizAlertsApiTestCase(APITestCase):
         self.assertTrue(thread.unread_for(self.owner))
         self.assertGreater(second.created_at, first.created_at)
 
+    def test_unread_counters_follow_messages_and_reads(self):
+        thread = QuizAlertThread.objects.create(
+            quiz=self.quiz,
+            quizquestion=self.quizquestion,
+            reporter=self.reporter,
+            owner=self.owner,
+            reported_language="fr",
+        )
+        thread.messages.create(author=self.reporter, body="Premier message")
+        thread.messages.create(author=self.reporter, body="Deuxième message")
+        thread.refresh_from_db()
+        self.assertEqual((thread.owner_unread_count, thread.reporter_unread_count), (2, 0))
+
+        # Répondre vaut lecture pour l'auteur ; le message est non lu pour l'autre participant.
+        append_alert_message(thread=thread, author=self.owner, body="Réponse")
+        thread.refresh_from_db()
+        self.assertEqual((thread.owner_unread_count, thread.reporter_unread_count), (0, 1))
+
+        thread.mark_read_for(self.reporter)
+        thread.refresh_from_db()
+        self.assertEqual(thread.reporter_unread_count, 0)
+        self.assertFalse(thread.unread_for(self.reporter))
+
+    def test_read_marker_is_computed_against_the_stored_thread(self):
+        thread = QuizAlertThread.objects.create(
+            quiz=self.quiz,
+            quizquestion=self.quizquestion,
+            reporter=self.reporter,
+            owner=self.owner,
+            reported_language="fr",
+        )
+        first = thread.messages.create(author=self.reporter, body="Premier message")
+        stale = QuizAlertThread.objects.get(pk=thread.pk)
+        append_alert_message(thread=thread, author=self.reporter, body="Deuxième message")
+
+        stale.mark_read_for(self.owner, at=first.created_at)
+
+        thread.refresh_from_db()
+        self.assertEqual((thread.owner_unread_count, thread.reporter_unread_count), (1, 0))
+        self.assertTrue(thread.unread_for(self.owner))
+
+    def test_unread_count_endpoint_is_a_single_aggregate(self):
+        for index in range(3):
+            thread = QuizAlertThread.objects.create(
+                quiz=self.quiz,
+                quizquestion=self.quizquestion,
+                reporter=self.reporter,
+                owner=self.owner,
+                reported_language="fr",
+            )
+            for _ in range(index + 1):
+                thread.messages.create(author=self.reporter, body="Message")
+        other_thread = QuizAlertThread.objects.create(
+            quiz=self.quiz,
+            quizquestion=self.quizquestion,
+            reporter=self.owner,
+            owner=self.other,
+            reported_language="fr",
+        )
+        other_thread.messages.create(author=self.other, body="Message")
+
+        self.assertEqual(unread_total_for_user(self.owner), 7)
+        self.assertEqual(unread_total_for_user(self.reporter), 0)
+        with self.assertNumQueries(1):
+            unread_total_for_user(self.owner)
+
+        self._auth(self.owner)
+        res = self.client.get(self._rev("quiz-alert-unread-count"))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["count"], 7)
+
+    def test_thread_keeps_last_message_preview_and_pages_its_messages(self):
+        thread = QuizAlertThread.objects.create(
+            quiz=self.quiz,
+            quizquestion=self.quizquestion,
+            reporter=self.reporter,
+            owner=self.owner,
+            reported_language="fr",
+        )
+        for index in range(ALERT_THREAD_INLINE_MESSAGES + 2):
+            thread.messages.create(author=self.reporter, body=f"  Message {index}  ")
+        append_alert_message(thread=thread, author=self.owner, body="x" * 200)
+
+        thread.refresh_from_db()
+        self.assertEqual(thread.last_message_preview, "x" * 120)
+        self.assertEqual(thread.last_message_author_id, self.owner.id)
+
+        self._auth(self.owner)
+        list_res = self.client.get(self._rev("quiz-alert-list"))
+        row = self._as_list(list_res.data)[0]
+        self.assertEqual(row["last_message_preview"], "x" * 120)
+        self.assertEqual(row["last_message_author"], self.owner.id)
+
+        detail = self.client.get(self._rev("quiz-alert-detail", alert_id=thread.id)).data
+        self.assertEqual(len(detail["messages"]), ALERT_THREAD_INLINE_MESSAGES)
+        self.assertTrue(detail["has_more_messages"])
+        self.assertEqual(detail["messages"][-1]["body"], "x" * 200)
+
+        url = self._rev("quiz-alert-messages", alert_id=thread.id)
+        bodies = []
+        next_url = url + "?pagination=cursor"
+        while next_url:
+            page = self.client.get(next_url)
+            bodies += [row["body"] for row in page.data["results"]]
+            next_url = page.data["next"]
+        self.assertEqual(len(bodies), ALERT_THREAD_INLINE_MESSAGES + 3)
+        self.assertEqual((bodies[0], bodies[-1]), ("x" * 200, "  Message 0  "))
+
+        self._auth(self.other)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
     def test_reporter_cannot_reply_until_owner_allows_it(self):
         thread = QuizAlertThread.objects.create(
             quiz=self.quiz,
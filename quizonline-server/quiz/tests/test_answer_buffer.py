@@ -0,0 +1,262 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.query import QuerySet
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone, translation
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from domain.models import Domain
+from question.models import AnswerOption, Question
+from quiz.answer_buffer import (
+    ANSWER_BUFFER_GAP_GRACE,
+    AnswerBufferGapError,
+    _entry_key,
+    buffer_quiz_answers,
+    flush_active_answer_buffers,
+    flush_answer_buffers,
+    flush_quiz_answer_buffer,
+    pending_answer_buffers,
+)
+from quiz.models import Quiz, QuizQuestion, QuizQuestionAnswer, QuizTemplate
+from quiz.services import close_quiz_session
+
+User = get_user_model()
+
+
+@override_settings(QUIZ_ANSWER_WRITE_BEHIND=True)
+class AnswerBufferTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        translation.activate("fr")
+        self.owner = User.objects.create_user(username="owner", password="pass", is_staff=True)
+        self.student = User.objects.create_user(username="student", password="pass")
+        self.domain = Domain.objects.create(owner=self.owner, name="Domain", description="", active=True)
+        self.qt = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Exam",
+            mode=QuizTemplate.MODE_PRACTICE,
+            permanent=True,
+            active=True,
+            with_duration=False,
+            created_by=self.owner,
+        )
+        self.correct = {}
+        self.wrong = {}
+        self.quiz_questions = []
+        for index in (1, 2):
+            question = Question.objects.create(
+                domain=self.domain,
+                title=f"Q{index}",
+                active=True,
+                allow_multiple_correct=False,
+                is_mode_practice=True,
+                is_mode_exam=True,
+            )
+            qq = QuizQuestion.objects.create(quiz=self.qt, question=question, sort_order=index, weight=1)
+            self.correct[qq.pk] = AnswerOption.objects.create(
+                question=question, content="A", is_correct=True, sort_order=1
+            )
+            self.wrong[qq.pk] = AnswerOption.objects.create(
+                question=question, content="B", is_correct=False, sort_order=2
+            )
+            self.quiz_questions.append(qq)
+        self.quiz = Quiz.objects.create(
+            quiz_template=self.qt,
+            user=self.student,
+            active=True,
+            started_at=timezone.now(),
+        )
+        self.client.force_authenticate(self.student)
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def test_create_is_acknowledged_without_writing_and_read_flushes(self):
+        qq = self.quiz_questions[0]
+
+        res = self.client.post(
+            reverse("api:quiz-api:quiz-answer-list", kwargs={"quiz_id": self.quiz.pk}),
+            {"question_order": 1, "selected_options": [self.correct[qq.pk].pk]},
+            format="json",
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(res.data["quizquestion_id"], qq.pk)
+        self.assertEqual(res.data["sequence"], 1)
+        self.assertFalse(QuizQuestionAnswer.objects.filter(quiz=self.quiz).exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.get(reverse("api:quiz-api:quiz-answer-list", kwargs={"quiz_id": self.quiz.pk}))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["results"][0]["selected_options"], [self.correct[qq.pk].pk])
+        self.assertEqual(pending_answer_buffers([self.quiz.pk]), [])
+
+    def test_flush_applies_entries_in_order_and_close_is_a_barrier(self):
+        qq1, qq2 = self.quiz_questions
+        res = self.client.post(
+            reverse("api:quiz-api:quiz-answer-batch", kwargs={"quiz_id": self.quiz.pk}),
+            {
+                "answers": [
+                    {"question_order": 1, "selected_options": [self.wrong[qq1.pk].pk]},
+                    {"question_order": 2, "selected_options": [self.correct[qq2.pk].pk]},
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual([item["sequence"] for item in res.data], [1, 2])
+        buffer_quiz_answers(quiz=self.quiz, entries=[(qq1, [self.correct[qq1.pk].pk])])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            close_quiz_session(quiz=self.quiz)
+
+        answers = dict(QuizQuestionAnswer.objects.filter(quiz=self.quiz).values_list("quizquestion_id", "is_correct"))
+        self.assertEqual(answers, {qq1.pk: True, qq2.pk: True})
+        self.quiz.refresh_from_db()
+        self.assertEqual(self.quiz.earned_score, 2.0)
+        self.assertEqual(pending_answer_buffers([self.quiz.pk]), [])
+
+    def test_failed_flush_keeps_entries_for_the_next_flush(self):
+        qq = self.quiz_questions[0]
+        buffer_quiz_answers(quiz=self.quiz, entries=[(qq, [self.correct[qq.pk].pk])])
+
+        with (
+            patch("quiz.answer_buffer.save_quiz_answers_batch", side_effect=RuntimeError("db down")),
+            self.assertRaises(RuntimeError),
+        ):
+            flush_quiz_answer_buffer(self.quiz.pk)
+
+        self.assertEqual(pending_answer_buffers([self.quiz.pk]), [self.quiz.pk])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(flush_active_answer_buffers(), 1)
+        self.assertTrue(QuizQuestionAnswer.objects.filter(quiz=self.quiz, quizquestion=qq).exists())
+
+    def test_recent_gap_blocks_flush_until_grace_expires(self):
+        qq1, qq2 = self.quiz_questions
+        buffer_quiz_answers(quiz=self.quiz, entries=[(qq1, []), (qq2, [self.correct[qq2.pk].pk])])
+        cache.delete(_entry_key(self.quiz.pk, 1))
+
+        self.assertEqual(flush_quiz_answer_buffer(self.quiz.pk), 0)
+
+        with (
+            patch("quiz.answer_buffer.timezone.now", return_value=timezone.now() + ANSWER_BUFFER_GAP_GRACE * 2),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.assertEqual(flush_quiz_answer_buffer(self.quiz.pk), 2)
+        self.assertEqual(
+            list(QuizQuestionAnswer.objects.filter(quiz=self.quiz).values_list("quizquestion_id", flat=True)),
+            [qq2.pk],
+        )
+
+    def test_periodic_flush_covers_sessions_awaiting_expiry(self):
+        qq = self.quiz_questions[0]
+        buffer_quiz_answers(quiz=self.quiz, entries=[(qq, [self.correct[qq.pk].pk])])
+        Quiz.objects.filter(pk=self.quiz.pk).update(ended_at=timezone.now())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            flushed = flush_active_answer_buffers()
+
+        self.assertEqual(flushed, 1)
+        self.assertEqual(
+            QuizQuestionAnswer.objects.get(quiz=self.quiz, quizquestion=qq).selected_option_ids,
+            [self.correct[qq.pk].pk],
+        )
+
+    def test_close_fails_on_recent_gap_instead_of_finalizing_past_it(self):
+        qq1, qq2 = self.quiz_questions
+        buffer_quiz_answers(quiz=self.quiz, entries=[(qq1, []), (qq2, [self.correct[qq2.pk].pk])])
+        cache.delete(_entry_key(self.quiz.pk, 1))
+
+        with patch("quiz.answer_buffer.ANSWER_BUFFER_BARRIER_WAIT", 0):
+            res = self.client.post(reverse("api:quiz-api:quiz-close", kwargs={"quiz_id": self.quiz.pk}))
+
+        self.assertEqual(res.status_code, status.HTTP_409_CONFLICT)
+        self.quiz.refresh_from_db()
+        self.assertTrue(self.quiz.active)
+        self.assertIsNone(self.quiz.finalized_answer_key_version)
+        self.assertFalse(QuizQuestionAnswer.objects.filter(quiz=self.quiz).exists())
+        self.assertEqual(pending_answer_buffers([self.quiz.pk]), [self.quiz.pk])
+
+    def test_barrier_fails_under_the_lock_without_waiting(self):
+        qq1, qq2 = self.quiz_questions
+        buffer_quiz_answers(quiz=self.quiz, entries=[(qq1, []), (qq2, [self.correct[qq2.pk].pk])])
+        cache.delete(_entry_key(self.quiz.pk, 1))
+
+        with (
+            patch("quiz.answer_buffer.time.sleep", side_effect=AssertionError("attente sous verrou")),
+            self.assertRaises(AnswerBufferGapError),
+        ):
+            flush_quiz_answer_buffer(self.quiz.pk, barrier=True)
+
+    def test_close_waits_for_a_recent_gap_before_locking_the_session(self):
+        qq1, qq2 = self.quiz_questions
+        buffer_quiz_answers(quiz=self.quiz, entries=[(qq1, []), (qq2, [self.correct[qq2.pk].pk])])
+        lost = cache.get(_entry_key(self.quiz.pk, 1))
+        cache.delete(_entry_key(self.quiz.pk, 1))
+        locked_during_wait = []
+
+        def fill_gap(_):
+            # L'écriture concurrente termine pendant l'attente ; la session ne doit pas être verrouillée.
+            locked_during_wait.append(self.quiz.pk in locked)
+            cache.set(_entry_key(self.quiz.pk, 1), lost)
+
+        locked = set()
+        select_for_update = QuerySet.select_for_update
+
+        def track_lock(queryset, *args, **kwargs):
+            if queryset.model is Quiz:
+                locked.add(self.quiz.pk)
+            return select_for_update(queryset, *args, **kwargs)
+
+        with (
+            patch("quiz.answer_buffer.time.sleep", side_effect=fill_gap),
+            patch.object(QuerySet, "select_for_update", autospec=True, side_effect=track_lock),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            res = self.client.post(reverse("api:quiz-api:quiz-close", kwargs={"quiz_id": self.quiz.pk}))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(locked_during_wait, [False])
+        self.assertEqual(QuizQuestionAnswer.objects.get(quiz=self.quiz, quizquestion=qq2).is_correct, True)
+        self.assertEqual(pending_answer_buffers([self.quiz.pk]), [])
+
+    @override_settings(QUIZ_ANSWER_WRITE_BEHIND=False)
+    def test_reads_do_not_touch_the_buffer_when_write_behind_is_disabled(self):
+        with patch("quiz.answer_buffer.cache") as buffer_cache:
+            res = self.client.get(reverse("api:quiz-api:quiz-answer-list", kwargs={"quiz_id": self.quiz.pk}))
+            self.assertEqual(flush_answer_buffers([self.quiz.pk], barrier=True), 0)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        buffer_cache.assert_not_called()
+        self.assertEqual(buffer_cache.method_calls, [])
+
+    def test_entries_left_after_close_are_discarded(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            close_quiz_session(quiz=self.quiz)
+        qq = self.quiz_questions[0]
+        buffer_quiz_answers(quiz=self.quiz, entries=[(qq, [self.correct[qq.pk].pk])])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(flush_answer_buffers([self.quiz.pk]), 0)
+
+        self.assertEqual(QuizQuestionAnswer.objects.get(quiz=self.quiz, quizquestion=qq).selected_option_ids, [])
+        self.assertEqual(pending_answer_buffers([self.quiz.pk]), [])
+
+    def test_entries_buffered_after_ended_at_are_not_finalized(self):
+        qq = self.quiz_questions[0]
+        self.quiz.ended_at = timezone.now() - timedelta(seconds=1)
+        self.quiz.save(update_fields=["ended_at"])
+        buffer_quiz_answers(quiz=self.quiz, entries=[(qq, [self.correct[qq.pk].pk])])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            close_quiz_session(quiz=self.quiz)
+
+        self.assertEqual(QuizQuestionAnswer.objects.get(quiz=self.quiz, quizquestion=qq).selected_option_ids, [])
+        self.assertEqual(pending_answer_buffers([self.quiz.pk]), [])
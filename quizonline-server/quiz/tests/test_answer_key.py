@@ -0,0 +1,169 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone, translation
+
+from domain.models import Domain
+from question.answer_option_sync import sync_question_answer_options
+from question.models import AnswerOption, Question
+from quiz.answer_key import AnswerKeyEntry, get_answer_key
+from quiz.models import Quiz, QuizQuestion, QuizQuestionAnswer, QuizTemplate
+from quiz.session_integrity import reconcile_quiz_answers
+
+User = get_user_model()
+
+
+class AnswerKeyTests(TestCase):
+    def setUp(self):
+        translation.activate("fr")
+        self.user = User.objects.create_user(username="u1", password="pass")
+        self.domain = Domain.objects.create(owner=self.user, name="Domain", description="", active=True)
+        self.qt = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Template",
+            mode=QuizTemplate.MODE_EXAM,
+            permanent=True,
+            active=True,
+        )
+        self.q1 = self._create_question("Q1")
+        self.q2 = self._create_question("Q2")
+        self.qq1 = QuizQuestion.objects.create(quiz=self.qt, question=self.q1, sort_order=1, weight=2)
+        self.qq2 = QuizQuestion.objects.create(quiz=self.qt, question=self.q2, sort_order=2, weight=3)
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def _create_question(self, title: str) -> Question:
+        q = Question.objects.create(
+            domain=self.domain,
+            title=title,
+            active=True,
+            allow_multiple_correct=False,
+            is_mode_practice=True,
+            is_mode_exam=True,
+        )
+        AnswerOption.objects.create(question=q, content="A", is_correct=True, sort_order=1)
+        AnswerOption.objects.create(question=q, content="B", is_correct=False, sort_order=2)
+        return q
+
+    def _version(self) -> int:
+        return QuizTemplate.objects.values_list("answer_key_version", flat=True).get(pk=self.qt.pk)
+
+    def test_answer_key_maps_quizquestion_to_weight_and_correct_ids(self):
+        key = get_answer_key(self.qt.id)
+
+        self.assertEqual(
+            key,
+            {
+                self.qq1.id: AnswerKeyEntry(2.0, frozenset([self.q1.answer_options.get(is_correct=True).id])),
+                self.qq2.id: AnswerKeyEntry(3.0, frozenset([self.q2.answer_options.get(is_correct=True).id])),
+            },
+        )
+
+    def test_answer_key_is_served_from_cache_with_a_single_version_query(self):
+        get_answer_key(self.qt.id)
+
+        with self.assertNumQueries(1):
+            get_answer_key(self.qt.id)
+
+    def test_weight_change_bumps_version_and_recompiles(self):
+        get_answer_key(self.qt.id)
+        version = self._version()
+
+        self.qq1.weight = 5
+        self.qq1.save()
+
+        self.assertEqual(self._version(), version + 1)
+        self.assertEqual(get_answer_key(self.qt.id)[self.qq1.id].weight, 5.0)
+
+    def test_save_without_answer_key_change_keeps_version(self):
+        get_answer_key(self.qt.id)
+        version = self._version()
+
+        self.qq1.sort_order = 3
+        self.qq1.save()
+        option = self.q1.answer_options.get(is_correct=True)
+        option.content = "A modifiee"
+        option.save()
+
+        self.assertEqual(self._version(), version)
+        with self.assertNumQueries(1):
+            get_answer_key(self.qt.id)
+
+    def test_option_moved_to_another_question_bumps_version(self):
+        other = QuizTemplate.objects.create(domain=self.domain, title="Autre", mode=QuizTemplate.MODE_EXAM)
+        q3 = self._create_question("Q3")
+        QuizQuestion.objects.create(quiz=other, question=q3, sort_order=1, weight=1)
+        version = self._version()
+        other_version = QuizTemplate.objects.values_list("answer_key_version", flat=True).get(pk=other.pk)
+        option = self.q1.answer_options.get(is_correct=True)
+
+        option.question = q3
+        option.save()
+
+        self.assertEqual(self._version(), version + 1)
+        self.assertEqual(
+            QuizTemplate.objects.values_list("answer_key_version", flat=True).get(pk=other.pk),
+            other_version + 1,
+        )
+
+    def test_membership_change_bumps_version(self):
+        get_answer_key(self.qt.id)
+        version = self._version()
+
+        self.qq2.delete()
+
+        self.assertEqual(self._version(), version + 1)
+        self.assertNotIn(self.qq2.id, get_answer_key(self.qt.id))
+
+    def test_is_correct_change_bumps_version(self):
+        get_answer_key(self.qt.id)
+        wrong = self.q1.answer_options.get(is_correct=False)
+
+        wrong.is_correct = True
+        wrong.save()
+
+        self.assertIn(wrong.id, get_answer_key(self.qt.id)[self.qq1.id].correct_ids)
+
+    def test_bulk_answer_option_sync_bumps_version(self):
+        get_answer_key(self.qt.id)
+        version = self._version()
+        correct, wrong = self.q1.answer_options.order_by("sort_order")
+
+        sync_question_answer_options(
+            question=self.q1,
+            answer_options_data=[
+                {"id": correct.id, "is_correct": False, "sort_order": 1},
+                {"id": wrong.id, "is_correct": True, "sort_order": 2},
+            ],
+            allowed_langs=set(),
+            upsert_translations=lambda *args, **kwargs: None,
+        )
+
+        self.assertEqual(self._version(), version + 1)
+        self.assertEqual(get_answer_key(self.qt.id)[self.qq1.id].correct_ids, frozenset([wrong.id]))
+
+    def test_stale_template_instance_does_not_roll_back_version(self):
+        stale = QuizTemplate.objects.get(pk=self.qt.pk)
+        self.qq1.weight = 4
+        self.qq1.save()
+        version = self._version()
+
+        stale.description = "Nouvelle description"
+        stale.save()
+
+        self.assertEqual(self._version(), version)
+
+    def test_reconcile_scores_from_answer_key(self):
+        quiz = Quiz.objects.create(quiz_template=self.qt, user=self.user, active=True, started_at=timezone.now())
+        QuizQuestionAnswer.objects.create(
+            quiz=quiz,
+            quizquestion=self.qq1,
+            question_order=1,
+            selected_option_ids=[self.q1.answer_options.get(is_correct=True).pk],
+        )
+
+        reconcile_quiz_answers(quiz)
+
+        scores = dict(quiz.answers.values_list("quizquestion_id", "earned_score"))
+        self.assertEqual(scores, {self.qq1.id: 2.0, self.qq2.id: 0.0})
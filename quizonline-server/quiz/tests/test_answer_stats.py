@@ -0,0 +1,130 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone, translation
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from domain.models import Domain
+from question.models import AnswerOption, Question
+from quiz.answer_stats import question_answer_stats, rebuild_answer_stats
+from quiz.models import (
+    Quiz,
+    QuizQuestion,
+    QuizQuestionAnswer,
+    QuizQuestionOptionStats,
+    QuizQuestionStats,
+    QuizTemplate,
+)
+from quiz.services import close_quiz_session
+from quiz.session_integrity import reconcile_quiz_answers
+
+User = get_user_model()
+
+
+class AnswerStatsTests(APITestCase):
+    def setUp(self):
+        translation.activate("fr")
+        self.owner = User.objects.create_user(username="owner", password="pass", is_staff=True)
+        self.domain = Domain.objects.create(owner=self.owner, name="Domain", description="", active=True)
+        self.qt = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Exam",
+            mode=QuizTemplate.MODE_PRACTICE,
+            permanent=True,
+            active=True,
+            with_duration=False,
+            created_by=self.owner,
+        )
+        self.question = Question.objects.create(
+            domain=self.domain,
+            title="Q1",
+            active=True,
+            allow_multiple_correct=False,
+            is_mode_practice=True,
+            is_mode_exam=True,
+        )
+        self.correct = AnswerOption.objects.create(question=self.question, content="A", is_correct=True, sort_order=1)
+        self.wrong = AnswerOption.objects.create(question=self.question, content="B", is_correct=False, sort_order=2)
+        self.qq = QuizQuestion.objects.create(quiz=self.qt, question=self.question, sort_order=1, weight=1)
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def _session(self, username, option=None, *, close=True):
+        quiz = Quiz.objects.create(
+            quiz_template=self.qt,
+            user=User.objects.create_user(username=username, password="pass"),
+            active=True,
+            started_at=timezone.now(),
+        )
+        if option is not None:
+            QuizQuestionAnswer.objects.create(
+                quiz=quiz,
+                quizquestion=self.qq,
+                question_order=1,
+                selected_option_ids=[option.pk],
+            )
+        if close:
+            close_quiz_session(quiz=quiz)
+        return quiz
+
+    def _stats(self):
+        stats = QuizQuestionStats.objects.get(quizquestion=self.qq)
+        picks = dict(QuizQuestionOptionStats.objects.filter(quizquestion=self.qq).values_list("answer_option_id", "picks"))
+        return stats.attempts, stats.correct, picks
+
+    def test_finalization_counts_each_session_once(self):
+        self._session("s1", self.correct)
+        first = self._session("s2", self.wrong)
+        self._session("s3")
+        self._session("active", self.correct, close=False)
+
+        self.assertEqual(self._stats(), (3, 1, {self.correct.pk: 1, self.wrong.pk: 1}))
+
+        # Réponse modifiée après clôture puis re-finalisation : seul l'écart est appliqué.
+        QuizQuestionAnswer.objects.filter(quiz=first).update(selected_option_ids=[self.correct.pk])
+        reconcile_quiz_answers(first, finalize=True)
+        reconcile_quiz_answers(first, finalize=True)
+
+        self.assertEqual(self._stats(), (3, 2, {self.correct.pk: 2, self.wrong.pk: 0}))
+
+    def test_session_deletion_retracts_its_contribution(self):
+        self._session("s1", self.correct)
+        second = self._session("s2", self.correct)
+
+        second.delete()
+
+        self.assertEqual(self._stats(), (1, 1, {self.correct.pk: 1}))
+
+    def test_rebuild_matches_incremental_statistics(self):
+        self._session("s1", self.correct)
+        self._session("s2", self.wrong)
+        expected = self._stats()
+        QuizQuestionStats.objects.all().delete()
+        QuizQuestionOptionStats.objects.all().delete()
+        QuizQuestionAnswer.objects.update(stats_option_ids=None)
+
+        self.assertEqual(rebuild_answer_stats(), 1)
+        self.assertEqual(self._stats(), expected)
+
+        call_command("rebuild_answer_stats", "--template", str(self.qt.pk), stdout=StringIO())
+        self.assertEqual(self._stats(), expected)
+
+    def test_question_detail_exposes_statistics(self):
+        self._session("s1", self.correct)
+        self._session("s2", self.wrong)
+        self.client.force_authenticate(self.owner)
+
+        res = self.client.get(reverse("api:question-api:question-detail", kwargs={"question_id": self.question.pk}))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["answer_stats"], question_answer_stats(self.question.pk))
+        self.assertEqual(res.data["answer_stats"]["correct_rate"], 0.5)
+        self.assertEqual(
+            res.data["answer_stats"]["options"],
+            [{"answer_option_id": self.correct.pk, "picks": 1}, {"answer_option_id": self.wrong.pk, "picks": 1}],
+        )
@@ -0,0 +1,107 @@
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import translation
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.models import OutboundEmail
+from domain.models import Domain
+from quiz.bulk_assign import assign_quiz_template, resolve_assignment_targets
+from quiz.jobs import JOB_DONE, create_job
+from quiz.models import Quiz, QuizAlertMessage, QuizAlertThread, QuizTemplate
+
+User = get_user_model()
+
+
+class BulkAssignTests(APITestCase):
+    def setUp(self):
+        translation.activate("fr")
+        self.owner = User.objects.create_user(username="owner", password="pass", is_staff=True)
+        self.domain = Domain.objects.create(owner=self.owner, name="Domain", description="", active=True)
+        self.qt = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Cohorte",
+            mode=QuizTemplate.MODE_PRACTICE,
+            permanent=True,
+            active=True,
+            created_by=self.owner,
+        )
+        self.students = [
+            User.objects.create_user(username=f"student{index}", password="pass", email=f"s{index}@example.com")
+            for index in range(5)
+        ]
+        self.domain.members.add(*self.students)
+        self.outsider = User.objects.create_user(username="outsider", password="pass")
+
+    def test_targets_are_resolved_in_one_query(self):
+        admin = User.objects.create_user(username="admin", password="pass", is_superuser=True)
+        user_ids = [student.pk for student in self.students] + [self.outsider.pk, admin.pk, 999999]
+
+        with self.assertNumQueries(1):
+            eligible, rejected = resolve_assignment_targets(self.qt, user_ids)
+
+        self.assertEqual(eligible, sorted([student.pk for student in self.students] + [admin.pk]))
+        self.assertEqual(rejected, [self.outsider.pk])
+
+    def test_inactive_domain_rejects_its_members(self):
+        Domain.objects.filter(pk=self.domain.pk).update(active=False)
+
+        eligible, rejected = resolve_assignment_targets(self.qt, [self.students[0].pk])
+
+        self.assertEqual((eligible, rejected), ([], [self.students[0].pk]))
+
+    def test_chunks_create_sessions_threads_and_emails_in_bulk(self):
+        user_ids = [student.pk for student in self.students]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            created = assign_quiz_template(self.qt, user_ids, assigned_by=self.owner, chunk_size=2)
+
+        self.assertEqual(sorted(quiz.user_id for quiz in created), user_ids)
+        self.assertEqual(Quiz.objects.filter(quiz_template=self.qt).count(), 5)
+        self.assertEqual(OutboundEmail.objects.count(), 5)
+
+        threads = QuizAlertThread.objects.filter(kind=QuizAlertThread.KIND_ASSIGNMENT)
+        self.assertEqual(threads.count(), 5)
+        self.assertEqual(QuizAlertMessage.objects.filter(thread__in=threads).count(), 5)
+        thread = threads.get(reporter=self.students[0])
+        message = thread.messages.get()
+        self.assertEqual((thread.reporter_unread_count, thread.owner_unread_count), (1, 0))
+        self.assertEqual(thread.last_message_author_id, self.owner.pk)
+        self.assertEqual(thread.last_message_at, message.created_at)
+        self.assertEqual(thread.last_message_preview, message.body[:len(thread.last_message_preview)])
+
+    @override_settings(QUIZ_BULK_ASSIGN_SYNC_LIMIT=2)
+    def test_large_cohort_runs_as_job_with_progress(self):
+        self.client.force_authenticate(self.owner)
+        payload = {"quiz_template_id": self.qt.pk, "user_ids": [student.pk for student in self.students]}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(reverse("api:quiz-api:quiz-bulk-create-from-template"), payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(res.data["total"], 5)
+        self.assertEqual(Quiz.objects.filter(quiz_template=self.qt).count(), 5)
+
+        res = self.client.get(
+            reverse("api:quiz-api:quiz-bulk-create-from-template-status", kwargs={"job_id": res.data["id"]})
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual((res.data["status"], res.data["processed"]), (JOB_DONE, 5))
+
+    def test_any_rejected_target_forbids_the_whole_request(self):
+        self.client.force_authenticate(self.owner)
+        payload = {"quiz_template_id": self.qt.pk, "user_ids": [self.students[0].pk, self.outsider.pk]}
+
+        res = self.client.post(reverse("api:quiz-api:quiz-bulk-create-from-template"), payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Quiz.objects.filter(quiz_template=self.qt).exists())
+
+    def test_progress_requires_template_management_rights(self):
+        job = create_job("assign_quiz_template", total=5, quiz_template_id=self.qt.pk)
+        self.client.force_authenticate(self.students[0])
+
+        res = self.client.get(reverse("api:quiz-api:quiz-bulk-create-from-template-status", kwargs={"job_id": job["id"]}))
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,156 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone, translation
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.models import OutboundEmail
+from domain.models import Domain
+from question.models import AnswerOption, Question
+from quiz.bulk_close import close_template_sessions
+from quiz.jobs import JOB_DONE, create_job, get_job
+from quiz.models import Quiz, QuizQuestion, QuizQuestionAnswer, QuizTemplate
+
+User = get_user_model()
+
+
+class TemplateBulkCloseTests(APITestCase):
+    def setUp(self):
+        translation.activate("fr")
+        self.owner = User.objects.create_user(username="owner", password="pass", is_staff=True)
+        self.other_staff = User.objects.create_user(username="other", password="pass", is_staff=True)
+        self.domain = Domain.objects.create(owner=self.owner, name="Domain", description="", active=True)
+        self.qt = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Exam",
+            mode=QuizTemplate.MODE_EXAM,
+            permanent=True,
+            active=True,
+            with_duration=False,
+            created_by=self.owner,
+        )
+        question = Question.objects.create(
+            domain=self.domain,
+            title="Q1",
+            active=True,
+            allow_multiple_correct=False,
+            is_mode_practice=True,
+            is_mode_exam=True,
+        )
+        self.correct = AnswerOption.objects.create(question=question, content="A", is_correct=True, sort_order=1)
+        AnswerOption.objects.create(question=question, content="B", is_correct=False, sort_order=2)
+        self.qq = QuizQuestion.objects.create(quiz=self.qt, question=question, sort_order=1, weight=2)
+
+        now = timezone.now()
+        self.sessions = [
+            Quiz.objects.create(
+                quiz_template=self.qt,
+                user=User.objects.create_user(username=f"student{index}", password="pass"),
+                active=True,
+                started_at=now - timedelta(minutes=30),
+            )
+            for index in range(3)
+        ]
+        self.not_started = Quiz.objects.create(
+            quiz_template=self.qt,
+            user=User.objects.create_user(username="late", password="pass"),
+            active=False,
+        )
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def test_completion_emails_are_queued_in_bulk_per_batch(self):
+        User.objects.filter(pk=self.owner.pk).update(email="owner@example.com")
+
+        with (
+            CaptureQueriesContext(connection) as queries,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            close_template_sessions(self.qt.pk, batch_size=2)
+
+        self.assertEqual(OutboundEmail.objects.filter(recipients=["owner@example.com"]).count(), 3)
+        inserts = [query for query in queries.captured_queries if query["sql"].startswith('INSERT INTO "core_outboundemail"')]
+        self.assertEqual(len(inserts), 2)
+
+    def test_close_template_sessions_closes_reconciles_and_reports_progress(self):
+        QuizQuestionAnswer.objects.create(
+            quiz=self.sessions[0],
+            quizquestion=self.qq,
+            question_order=1,
+            selected_option_ids=[self.correct.pk],
+        )
+        job = create_job("close_template_sessions", total=3, quiz_template_id=self.qt.pk)
+
+        with (
+            patch("quiz.notifications.send_quiz_completed_emails") as send_quiz_completed_emails,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            closed = close_template_sessions(self.qt.pk, batch_size=2, job_id=job["id"])
+
+        self.assertEqual(closed, 3)
+        # Un envoi groupé par lot de clôture.
+        self.assertEqual([len(call.args[0]) for call in send_quiz_completed_emails.call_args_list], [2, 1])
+        self.assertFalse(Quiz.objects.filter(pk__in=[s.pk for s in self.sessions], active=True).exists())
+        self.assertFalse(Quiz.objects.filter(pk__in=[s.pk for s in self.sessions], ended_at__isnull=True).exists())
+        self.assertEqual(Quiz.objects.get(pk=self.sessions[0].pk).earned_score, 2.0)
+        self.assertEqual(QuizQuestionAnswer.objects.filter(quiz__in=self.sessions).count(), 3)
+        self.not_started.refresh_from_db()
+        self.assertIsNone(self.not_started.ended_at)
+        progress = get_job(job["id"])
+        self.assertEqual((progress["status"], progress["processed"]), (JOB_DONE, 3))
+
+    def test_close_template_sessions_keeps_a_fixed_deadline(self):
+        deadline = timezone.now() + timedelta(minutes=5)
+        Quiz.objects.filter(pk=self.sessions[0].pk).update(ended_at=deadline)
+
+        close_template_sessions(self.qt.pk)
+
+        self.assertEqual(Quiz.objects.get(pk=self.sessions[0].pk).ended_at, deadline)
+
+    def test_close_sessions_action_queues_job_and_exposes_progress(self):
+        self.client.force_authenticate(self.owner)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(reverse("api:quiz-api:quiz-template-close-sessions", kwargs={"qt_id": self.qt.pk}))
+
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(res.data["total"], 3)
+        self.assertFalse(Quiz.objects.filter(quiz_template=self.qt, active=True).exists())
+
+        res = self.client.get(
+            reverse(
+                "api:quiz-api:quiz-template-close-sessions-status",
+                kwargs={"qt_id": self.qt.pk, "job_id": res.data["id"]},
+            )
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual((res.data["status"], res.data["processed"]), (JOB_DONE, 3))
+
+    def test_close_sessions_action_requires_template_management_rights(self):
+        self.client.force_authenticate(self.other_staff)
+
+        res = self.client.post(reverse("api:quiz-api:quiz-template-close-sessions", kwargs={"qt_id": self.qt.pk}))
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertTrue(Quiz.objects.filter(quiz_template=self.qt, active=True).exists())
+
+    def test_progress_of_another_template_job_is_not_found(self):
+        other = QuizTemplate.objects.create(domain=self.domain, title="Other", created_by=self.owner)
+        job = create_job("close_template_sessions", quiz_template_id=other.pk)
+        self.client.force_authenticate(self.owner)
+
+        res = self.client.get(
+            reverse(
+                "api:quiz-api:quiz-template-close-sessions-status",
+                kwargs={"qt_id": self.qt.pk, "job_id": job["id"]},
+            )
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
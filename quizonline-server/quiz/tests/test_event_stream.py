@@ -0,0 +1,177 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone, translation
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from config.event_bus import (
+    InProcessEventBus,
+    RedisEventBus,
+    encode_event,
+    get_event_bus,
+)
+from domain.models import Domain
+from question.models import Question
+from quiz.event_stream import issue_event_stream_ticket
+from quiz.events import ALERT_MESSAGE_EVENT, ALERT_STATUS_EVENT, QUIZ_ASSIGNED_EVENT
+from quiz.models import Quiz, QuizAlertThread, QuizQuestion, QuizTemplate
+from quiz.services import create_quizzes_from_template
+
+User = get_user_model()
+
+
+class LocalRedisStandIn:
+    """Remplace redis.Redis : chaque PUBLISH revient au bus comme via son écoute PSUBSCRIBE."""
+
+    def __init__(self, bus):
+        self.bus = bus
+        self.published = []
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def publish(self, channel, message):
+        self.published.append(channel)
+        self.bus.receive(channel.encode(), message.encode())
+
+    def execute(self):
+        return None
+
+
+class EventBusTests(SimpleTestCase):
+    def test_in_process_bus_delivers_to_subscribers_of_the_user(self):
+        bus = InProcessEventBus()
+
+        async def scenario():
+            async with bus.subscribe(1) as first, bus.subscribe(2) as second:
+                bus.publish([1], "hello")
+                return await first.next_message(timeout=1), await second.next_message(timeout=0.05)
+
+        self.assertEqual(async_to_sync(scenario)(), ("hello", None))
+        self.assertEqual(bus.subscriber_count(1), 0)
+
+    def test_redis_bus_routes_channel_messages_to_local_subscribers(self):
+        bus = RedisEventBus("redis://unused")
+        bus._publisher = LocalRedisStandIn(bus)
+
+        async def scenario():
+            async with bus.subscribe(7) as subscription:
+                bus.publish([7, 8], "payload")
+                return await subscription.next_message(timeout=1)
+
+        with patch.object(RedisEventBus, "_ensure_listener"):
+            self.assertEqual(async_to_sync(scenario)(), "payload")
+        self.assertEqual(bus._publisher.published, ["events:user:7", "events:user:8"])
+
+
+class EventPublicationTests(APITestCase):
+    def setUp(self):
+        translation.activate("fr")
+        self.owner = User.objects.create_user(username="owner", password="pass", is_staff=True)
+        self.reporter = User.objects.create_user(username="reporter", password="pass")
+        self.domain = Domain.objects.create(owner=self.owner, name="Domain", description="", active=True)
+        self.qt = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Exam",
+            permanent=True,
+            active=True,
+            created_by=self.owner,
+        )
+        question = Question.objects.create(
+            domain=self.domain,
+            title="Q1",
+            active=True,
+            allow_multiple_correct=False,
+            is_mode_practice=True,
+            is_mode_exam=True,
+        )
+        self.qq = QuizQuestion.objects.create(quiz=self.qt, question=question, sort_order=1, weight=1)
+        self.quiz = Quiz.objects.create(
+            quiz_template=self.qt,
+            user=self.reporter,
+            active=True,
+            started_at=timezone.now(),
+        )
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def _published(self, action):
+        with (
+            patch.object(InProcessEventBus, "publish") as publish,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            action()
+        return [(set(call.args[0]), json.loads(call.args[1])) for call in publish.call_args_list]
+
+    def test_alert_message_and_status_changes_are_pushed_to_participants(self):
+        thread = QuizAlertThread.objects.create(
+            quiz=self.quiz,
+            quizquestion=self.qq,
+            reporter=self.reporter,
+            owner=self.owner,
+        )
+
+        published = self._published(lambda: thread.messages.create(author=self.reporter, body="Question"))
+        self.assertEqual(len(published), 1)
+        recipients, message = published[0]
+        self.assertEqual(recipients, {self.owner.pk, self.reporter.pk})
+        self.assertEqual(message["event"], ALERT_MESSAGE_EVENT)
+        self.assertEqual(message["data"]["thread_id"], thread.pk)
+
+        published = self._published(lambda: thread.close(user=self.owner))
+        self.assertEqual(published, [({self.owner.pk, self.reporter.pk}, {
+            "event": ALERT_STATUS_EVENT,
+            "data": {"thread_id": thread.pk, "status": QuizAlertThread.STATUS_CLOSED},
+        })])
+
+    def test_assignment_is_pushed_to_the_recipient(self):
+        student = User.objects.create_user(username="student", password="pass")
+
+        published = self._published(lambda: create_quizzes_from_template(
+            quiz_template=self.qt,
+            users=[student],
+            validate_target_user=lambda _template, _user: None,
+            assigned_by=self.owner,
+        ))
+
+        assigned = [(recipients, message) for recipients, message in published if message["event"] == QUIZ_ASSIGNED_EVENT]
+        self.assertEqual(len(assigned), 1)
+        self.assertEqual(assigned[0][0], {student.pk})
+        self.assertEqual(assigned[0][1]["data"]["quiz_template_id"], self.qt.pk)
+
+    def test_ticket_is_required_to_open_the_stream(self):
+        self.client.force_authenticate(self.reporter)
+        res = self.client.post(reverse("api:quiz-api:quiz-event-ticket"))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.data["ticket"])
+
+        res = self.client.get(reverse("api:quiz-api:quiz-event-stream"), {"ticket": "forged"})
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class EventStreamTests(TestCase):
+    async def test_stream_forwards_events_of_the_user(self):
+        user = await User.objects.acreate(username="listener")
+        url = reverse("api:quiz-api:quiz-event-stream")
+
+        res = await self.async_client.get(url, {"ticket": issue_event_stream_ticket(user)})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res["Content-Type"], "text/event-stream")
+        frames = aiter(res.streaming_content)
+        self.assertEqual(await anext(frames), b"retry: 5000\n\n")
+        next_frame = asyncio.ensure_future(anext(frames))
+        bus = get_event_bus()
+        while bus.subscriber_count(user.pk) == 0:
+            await asyncio.sleep(0.01)
+        bus.publish([user.pk], encode_event(QUIZ_ASSIGNED_EVENT, {"quiz_id": 1}))
+        self.assertEqual(await next_frame, b'event: quiz.assigned\ndata: {"quiz_id": 1}\n\n')
+        await frames.aclose()
@@ -0,0 +1,146 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connection
+from django.db.models.query import QuerySet
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+from django.utils import translation
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from domain.models import Domain
+from quiz.models import Quiz, QuizTemplate
+from quiz.services import get_or_create_exam_attempt
+
+User = get_user_model()
+
+
+def _exam_template(owner):
+    domain = Domain.objects.create(owner=owner, name="Domain", description="", active=True)
+    return QuizTemplate.objects.create(
+        domain=domain,
+        title="Exam",
+        mode=QuizTemplate.MODE_EXAM,
+        permanent=True,
+        is_public=True,
+        active=True,
+        with_duration=False,
+        created_by=owner,
+    )
+
+
+class ExamAttemptTests(TestCase):
+    def setUp(self):
+        translation.activate("fr")
+        self.owner = User.objects.create_user(username="owner", password="pass")
+        self.student = User.objects.create_user(username="student", password="pass")
+        self.qt = _exam_template(self.owner)
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def test_get_or_create_is_idempotent_per_user(self):
+        quiz, created = get_or_create_exam_attempt(quiz_template=self.qt, user=self.student)
+        again, created_again = get_or_create_exam_attempt(quiz_template=self.qt, user=self.student)
+
+        self.assertEqual((created, created_again), (True, False))
+        self.assertEqual(again.pk, quiz.pk)
+        self.assertTrue(quiz.is_exam_attempt)
+
+    def test_losing_a_creation_race_returns_the_winning_attempt(self):
+        winner, _ = get_or_create_exam_attempt(quiz_template=self.qt, user=self.student)
+
+        # La lecture préalable ne voit pas encore la tentative concurrente : l'INSERT échoue sur la contrainte.
+        with patch.object(QuerySet, "first", return_value=None):
+            quiz, created = get_or_create_exam_attempt(quiz_template=self.qt, user=self.student)
+
+        self.assertFalse(created)
+        self.assertEqual(quiz.pk, winner.pk)
+
+    def test_start_recovers_from_a_lost_creation_race(self):
+        # Variante déterministe de ConcurrentExamStartTests (ignorée sous SQLite) : la tentative concurrente
+        # existe déjà, seule la première lecture d'une session la manque, l'INSERT heurte la contrainte.
+        winner, _ = get_or_create_exam_attempt(quiz_template=self.qt, user=self.student)
+        first = QuerySet.first
+        missed = []
+
+        def miss_first_quiz_lookup(queryset):
+            if queryset.model is Quiz and not missed:
+                missed.append(queryset)
+                return None
+            return first(queryset)
+
+        client = APIClient()
+        client.force_authenticate(self.student)
+        with (
+            patch.object(QuerySet, "first", autospec=True, side_effect=miss_first_quiz_lookup),
+            patch.object(Quiz.objects, "get", wraps=Quiz.objects.get) as reread,
+        ):
+            res = client.post(reverse("api:quiz-api:quiz-list"), {"quiz_template_id": self.qt.pk}, format="json")
+
+        self.assertEqual(len(missed), 1)
+        reread.assert_called_once_with(quiz_template=self.qt, user=self.student, is_exam_attempt=True)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["id"], winner.pk)
+        self.assertEqual(Quiz.objects.filter(quiz_template=self.qt, user=self.student).count(), 1)
+
+    def test_constraint_rejects_a_second_attempt(self):
+        get_or_create_exam_attempt(quiz_template=self.qt, user=self.student)
+
+        with self.assertRaises(IntegrityError):
+            Quiz.objects.create(quiz_template=self.qt, user=self.student, is_exam_attempt=True)
+
+    def test_assigned_sessions_are_not_constrained(self):
+        Quiz.objects.create(quiz_template=self.qt, user=self.student)
+        Quiz.objects.create(quiz_template=self.qt, user=self.student)
+
+        self.assertEqual(Quiz.objects.filter(quiz_template=self.qt, user=self.student).count(), 2)
+
+
+@skipUnless(connection.vendor == "postgresql", "SQLite verrouille la table entière pour chaque écriture concurrente.")
+class ConcurrentExamStartTests(TransactionTestCase):
+    # Un démarrage d'examen par thread : chaque étudiant ne doit obtenir qu'une session,
+    # même quand ses requêtes sont dupliquées, sans verrou partagé entre étudiants.
+    students_count = 200
+    duplicated_requests = 3
+    workers = 16
+
+    def setUp(self):
+        translation.activate("fr")
+        self.owner = User.objects.create_user(username="owner", password="pass")
+        self.qt = _exam_template(self.owner)
+        self.students = [
+            User.objects.create_user(username=f"student{index}", password="pass")
+            for index in range(self.students_count)
+        ]
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def _start(self, user):
+        try:
+            client = APIClient()
+            client.force_authenticate(user)
+            res = client.post(reverse("api:quiz-api:quiz-list"), {"quiz_template_id": self.qt.pk}, format="json")
+            return user.pk, res.status_code, res.data["id"]
+        finally:
+            connection.close()
+
+    def test_parallel_starts_create_exactly_one_session_per_student(self):
+        requests = [user for user in self.students for _ in range(self.duplicated_requests)]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(self._start, requests))
+
+        self.assertTrue(all(code in (status.HTTP_200_OK, status.HTTP_201_CREATED) for _, code, _ in results))
+        quiz_ids_by_user = {}
+        for user_id, _, quiz_id in results:
+            quiz_ids_by_user.setdefault(user_id, set()).add(quiz_id)
+        self.assertTrue(all(len(quiz_ids) == 1 for quiz_ids in quiz_ids_by_user.values()))
+        self.assertEqual(Quiz.objects.filter(quiz_template=self.qt).count(), self.students_count)
+        self.assertEqual(sum(code == status.HTTP_201_CREATED for _, code, _ in results), self.students_count)
@@ -0,0 +1,125 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone, translation
+
+from domain.models import Domain
+from question.models import AnswerOption, Question
+from quiz.expiry import expire_quiz_on_read, expire_quiz_sessions
+from quiz.models import Quiz, QuizQuestion, QuizQuestionAnswer, QuizTemplate
+from quiz.tasks import expire_quiz_sessions_task
+
+User = get_user_model()
+
+
+class QuizExpiryTests(TestCase):
+    def setUp(self):
+        translation.activate("fr")
+        self.owner = User.objects.create_user(username="owner", password="pass")
+        self.student = User.objects.create_user(username="student", password="pass")
+        self.domain = Domain.objects.create(owner=self.owner, name="Domain", description="", active=True)
+        self.qt = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Exam",
+            mode=QuizTemplate.MODE_EXAM,
+            permanent=True,
+            active=True,
+            with_duration=True,
+            duration=10,
+            created_by=self.owner,
+        )
+        question = Question.objects.create(
+            domain=self.domain,
+            title="Q1",
+            active=True,
+            allow_multiple_correct=False,
+            is_mode_practice=True,
+            is_mode_exam=True,
+        )
+        self.correct = AnswerOption.objects.create(question=question, content="A", is_correct=True, sort_order=1)
+        AnswerOption.objects.create(question=question, content="B", is_correct=False, sort_order=2)
+        self.qq = QuizQuestion.objects.create(quiz=self.qt, question=question, sort_order=1, weight=2)
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def _session(self, *, ended_delta: timedelta) -> Quiz:
+        now = timezone.now()
+        return Quiz.objects.create(
+            quiz_template=self.qt,
+            user=self.student,
+            active=True,
+            started_at=now - timedelta(minutes=10),
+            ended_at=now + ended_delta,
+        )
+
+    def test_expire_quiz_sessions_closes_reconciles_and_notifies_expired_sessions(self):
+        expired = self._session(ended_delta=timedelta(minutes=5))
+        running = self._session(ended_delta=timedelta(minutes=5))
+        answer = QuizQuestionAnswer.objects.create(
+            quiz=expired,
+            quizquestion=self.qq,
+            question_order=1,
+            selected_option_ids=[self.correct.pk],
+        )
+        Quiz.objects.filter(pk=expired.pk).update(ended_at=timezone.now() - timedelta(seconds=5))
+
+        with (
+            patch("quiz.notifications.send_quiz_completed_emails") as send_quiz_completed_emails,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            count = expire_quiz_sessions(batch_size=1)
+
+        self.assertEqual(count, 1)
+        expired.refresh_from_db()
+        running.refresh_from_db()
+        self.assertFalse(expired.active)
+        self.assertTrue(running.active)
+        answer.refresh_from_db()
+        self.assertEqual((answer.earned_score, answer.is_correct), (2.0, True))
+        send_quiz_completed_emails.assert_called_once()
+        self.assertEqual([quiz.pk for quiz in send_quiz_completed_emails.call_args.args[0]], [expired.pk])
+
+    def test_expire_quiz_sessions_processes_every_batch_and_respects_limit(self):
+        for _ in range(5):
+            self._session(ended_delta=-timedelta(seconds=5))
+
+        self.assertEqual(expire_quiz_sessions(batch_size=2, limit=3), 3)
+        self.assertEqual(expire_quiz_sessions(batch_size=2), 2)
+        self.assertFalse(Quiz.objects.filter(active=True).exists())
+        self.assertEqual(QuizQuestionAnswer.objects.count(), 5)
+
+    def test_command_and_task_expire_sessions(self):
+        self._session(ended_delta=-timedelta(seconds=5))
+        out = StringIO()
+
+        call_command("expire_quiz_sessions", stdout=out)
+
+        self.assertIn("Expired 1 quiz session(s).", out.getvalue())
+        self._session(ended_delta=-timedelta(seconds=5))
+        self.assertEqual(expire_quiz_sessions_task.delay().get(), 1)
+
+    @override_settings(QUIZ_EXPIRY_SWEEPER_ENABLED=True)
+    def test_read_does_not_write_when_sweeper_enabled(self):
+        quiz = self._session(ended_delta=-timedelta(seconds=5))
+
+        with self.assertNumQueries(0):
+            pending = expire_quiz_on_read(quiz)
+
+        self.assertTrue(pending)
+        self.assertFalse(quiz.active)
+        quiz.refresh_from_db()
+        self.assertTrue(quiz.active)
+
+    def test_read_persists_expiry_when_sweeper_disabled(self):
+        quiz = self._session(ended_delta=-timedelta(seconds=5))
+
+        self.assertFalse(expire_quiz_on_read(quiz))
+
+        quiz.refresh_from_db()
+        self.assertFalse(quiz.active)
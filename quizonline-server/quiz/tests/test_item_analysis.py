@@ -0,0 +1,162 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone, translation
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from domain.models import Domain
+from question.models import AnswerOption, Question
+from quiz.item_analysis import get_item_analysis
+from quiz.models import Quiz, QuizQuestion, QuizQuestionAnswer, QuizTemplate
+from quiz.services import close_quiz_session
+from quiz.tasks import resync_template_sessions_task
+
+User = get_user_model()
+
+
+class ItemAnalysisTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        translation.activate("fr")
+        self.owner = User.objects.create_user(username="owner", password="pass", is_staff=True)
+        self.domain = Domain.objects.create(owner=self.owner, name="Domain", description="", active=True)
+        self.qt = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Exam",
+            mode=QuizTemplate.MODE_PRACTICE,
+            permanent=True,
+            active=True,
+            with_duration=False,
+            created_by=self.owner,
+        )
+        self.quiz_questions = []
+        self.correct = {}
+        self.wrong = {}
+        for index in (1, 2):
+            question = Question.objects.create(
+                domain=self.domain,
+                title=f"Q{index}",
+                active=True,
+                allow_multiple_correct=False,
+                is_mode_practice=True,
+                is_mode_exam=True,
+            )
+            qq = QuizQuestion.objects.create(quiz=self.qt, question=question, sort_order=index, weight=1)
+            self.correct[qq.pk] = AnswerOption.objects.create(
+                question=question, content="A", is_correct=True, sort_order=1
+            )
+            self.wrong[qq.pk] = AnswerOption.objects.create(
+                question=question, content="B", is_correct=False, sort_order=2
+            )
+            self.quiz_questions.append(qq)
+
+        qq1, qq2 = self.quiz_questions
+        # Scores : 2, 1, 0, 0 ; Q1 omise par la dernière session.
+        for index, (first, second) in enumerate([
+            (self.correct[qq1.pk], self.correct[qq2.pk]),
+            (self.correct[qq1.pk], self.wrong[qq2.pk]),
+            (self.wrong[qq1.pk], self.wrong[qq2.pk]),
+            (None, self.wrong[qq2.pk]),
+        ]):
+            self._closed_session(f"student{index}", {qq1: first, qq2: second})
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def _closed_session(self, username, selections):
+        quiz = Quiz.objects.create(
+            quiz_template=self.qt,
+            user=User.objects.create_user(username=username, password="pass"),
+            active=True,
+            started_at=timezone.now(),
+        )
+        for qq, option in selections.items():
+            if option is not None:
+                QuizQuestionAnswer.objects.create(
+                    quiz=quiz,
+                    quizquestion=qq,
+                    question_order=qq.sort_order,
+                    selected_option_ids=[option.pk],
+                )
+        return close_quiz_session(quiz=quiz)
+
+    def test_item_statistics(self):
+        qq1 = self.quiz_questions[0]
+
+        analysis = get_item_analysis(self.qt)
+
+        self.assertEqual(analysis["score"]["sessions"], 4)
+        self.assertEqual(analysis["score"]["max_score"], 2.0)
+        self.assertEqual(analysis["score"]["mean"], 0.75)
+        self.assertEqual(
+            analysis["score"]["distribution"],
+            [{"score": 0.0, "count": 2}, {"score": 1.0, "count": 1}, {"score": 2.0, "count": 1}],
+        )
+        first, second = analysis["questions"]
+        self.assertEqual(first["quizquestion_id"], qq1.pk)
+        self.assertEqual((first["answers"], first["correct"], first["omitted"]), (4, 2, 1))
+        self.assertEqual(first["difficulty"], 0.5)
+        # Reste du quiz (Q2) : 1, 0 chez les sessions justes ; 0, 0 chez les autres.
+        self.assertEqual(first["discrimination"], 0.5774)
+        self.assertEqual(
+            [(option["answer_option_id"], option["count"]) for option in first["options"]],
+            [(self.correct[qq1.pk].pk, 2), (self.wrong[qq1.pk].pk, 1)],
+        )
+        self.assertEqual(second["difficulty"], 0.25)
+        self.assertEqual(second["options"][1]["frequency"], 0.75)
+
+    def test_endpoint_is_cached_until_the_answer_set_changes(self):
+        self.client.force_authenticate(self.owner)
+        url = reverse("api:quiz-api:quiz-template-analytics", kwargs={"qt_id": self.qt.pk})
+
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["score"]["sessions"], 4)
+
+        # Seuls la version de la clé de correction, l'agrégat de version et le nombre de sessions périmées sont relus.
+        with self.assertNumQueries(3):
+            cached = get_item_analysis(self.qt)
+        self.assertEqual(cached["score"]["sessions"], 4)
+
+        qq1, qq2 = self.quiz_questions
+        self._closed_session("late", {qq1: self.correct[qq1.pk], qq2: self.correct[qq2.pk]})
+
+        res = self.client.get(url)
+        self.assertEqual(res.data["score"]["sessions"], 5)
+        self.assertEqual(res.data["questions"][0]["correct"], 3)
+
+    def test_answer_key_change_reports_stale_sessions_and_resyncs_them_in_the_background(self):
+        self.client.force_authenticate(self.owner)
+        url = reverse("api:quiz-api:quiz-template-analytics", kwargs={"qt_id": self.qt.pk})
+        qq1 = self.quiz_questions[0]
+        qq1.weight = 3
+        qq1.save()
+
+        with (
+            patch("quiz.tasks.resync_template_sessions_task.delay") as delay,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            res = self.client.get(url)
+            again = self.client.get(url)
+
+        self.assertEqual((res.data["score"]["sessions"], res.data["stale_sessions"]), (0, 4))
+        self.assertEqual(again.data["stale_sessions"], 4)
+        delay.assert_called_once_with(self.qt.pk)
+
+        resync_template_sessions_task(self.qt.pk)
+
+        res = self.client.get(url)
+        self.assertEqual((res.data["score"]["sessions"], res.data["stale_sessions"]), (4, 0))
+        self.assertEqual(res.data["score"]["max_score"], 4.0)
+        self.assertEqual(res.data["score"]["distribution"][-1], {"score": 4.0, "count": 1})
+
+    def test_endpoint_requires_template_management_rights(self):
+        self.client.force_authenticate(User.objects.create_user(username="outsider", password="pass"))
+
+        res = self.client.get(reverse("api:quiz-api:quiz-template-analytics", kwargs={"qt_id": self.qt.pk}))
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
@@ -7,6 +7,7 @@ from domain.models import Domain
 from question.models import Question
 from quiz.models import Quiz, QuizQuestion, QuizQuestionAnswer, QuizTemplate
 from quiz.querysets import accessible_quiz_template_queryset, quiz_template_queryset, template_sessions_queryset
+from quiz.totals import refresh_quiz_totals
 
 User = get_user_model()
 
@@ -240,7 +241,7 @@ class QuizQuerysetsTests(TestCase):
         self.assertEqual(counts[self.public_same_domain.id], 2)
         self.assertEqual(counts[self.public_other_domain.id], 1)
 
-    def test_template_sessions_queryset_prefetches_selected_options(self):
+    def test_template_sessions_queryset_reads_denormalized_totals(self):
         question = Question.objects.create(
             domain=self.domain,
             title="Question Sessions",
@@ -259,17 +260,20 @@ class QuizQuerysetsTests(TestCase):
             active=True,
             started_at=timezone.now(),
         )
-        answer = QuizQuestionAnswer.objects.create(quiz=session, quizquestion=quiz_question, question_order=1)
-        answer.selected_options.set([option])
+        answer = QuizQuestionAnswer.objects.create(
+            quiz=session,
+            quizquestion=quiz_question,
+            question_order=1,
+            selected_option_ids=[option.pk],
+        )
 
-        with self.assertNumQueries(3):
-            sessions = list(template_sessions_queryset(self.private_assigned))
+        answer.compute_score()
+        refresh_quiz_totals([session.pk])
 
-        with self.assertNumQueries(0):
-            selected_ids = [
-                [option.id for option in answer.selected_options.all()]
-                for session in sessions
-                for answer in session.answers.all()
-            ]
+        with self.assertNumQueries(1):
+            sessions = list(template_sessions_queryset(self.private_assigned))
 
-        self.assertIn([option.id], selected_ids)
+        self.assertEqual(
+            (sessions[0].earned_score, sessions[0].max_score, sessions[0].total_answers, sessions[0].correct_answers),
+            (1.0, 1.0, 1, 1),
+        )
@@ -0,0 +1,152 @@
+import csv
+import io
+import json
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone, translation
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from domain.models import Domain
+from question.models import AnswerOption, Question
+from quiz.models import Quiz, QuizQuestion, QuizQuestionAnswer, QuizTemplate
+from quiz.results_export import RESULTS_EXPORT_COLUMNS, iter_results_rows
+from quiz.template_resync import resync_template_sessions
+
+User = get_user_model()
+
+
+class ResultsExportTests(APITestCase):
+    def setUp(self):
+        translation.activate("fr")
+        self.owner = User.objects.create_user(username="owner", password="pass", is_staff=True)
+        self.domain = Domain.objects.create(owner=self.owner, name="Domain", description="", active=True)
+        self.qt = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Exam",
+            mode=QuizTemplate.MODE_PRACTICE,
+            permanent=True,
+            active=True,
+            with_duration=False,
+            created_by=self.owner,
+        )
+        self.quiz_questions = []
+        self.correct = {}
+        for index in (1, 2):
+            question = Question.objects.create(
+                domain=self.domain,
+                title=f"Q{index}",
+                active=True,
+                allow_multiple_correct=False,
+                is_mode_practice=True,
+                is_mode_exam=True,
+            )
+            qq = QuizQuestion.objects.create(quiz=self.qt, question=question, sort_order=index, weight=1)
+            self.correct[qq.pk] = AnswerOption.objects.create(
+                question=question, content="A", is_correct=True, sort_order=1
+            )
+            AnswerOption.objects.create(question=question, content="B", is_correct=False, sort_order=2)
+            self.quiz_questions.append(qq)
+
+        self.sessions = []
+        for index in range(3):
+            quiz = Quiz.objects.create(
+                quiz_template=self.qt,
+                user=User.objects.create_user(username=f"student{index}", password="pass"),
+                active=True,
+                started_at=timezone.now(),
+            )
+            self.sessions.append(quiz)
+        qq1 = self.quiz_questions[0]
+        QuizQuestionAnswer.objects.create(
+            quiz=self.sessions[0],
+            quizquestion=qq1,
+            question_order=1,
+            selected_option_ids=[self.correct[qq1.pk].pk],
+        )
+        # Session fermée sans finalisation : exportée telle quelle et marquée, réconciliée en tâche de fond.
+        Quiz.objects.filter(pk=self.sessions[0].pk).update(active=False, ended_at=timezone.now())
+        self.not_started = Quiz.objects.create(
+            quiz_template=self.qt,
+            user=User.objects.create_user(username="late", password="pass"),
+        )
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def _url(self, **params):
+        url = reverse("api:quiz-api:quiz-template-results-export", kwargs={"qt_id": self.qt.pk})
+        return url + ("?" + "&".join(f"{key}={value}" for key, value in params.items()) if params else "")
+
+    def _rows_by_session(self):
+        by_session = {}
+        for row in iter_results_rows(self.qt, batch_size=2):
+            by_session.setdefault(row["session_id"], []).append(row)
+        return by_session
+
+    def test_rows_cover_every_session_across_batches(self):
+        # Lecture seule : version de la clé, puis 2 requêtes par lot de 2 sessions, plus le lot vide final.
+        with self.assertNumQueries(6):
+            by_session = self._rows_by_session()
+
+        self.assertEqual(list(by_session), sorted(by_session))
+        self.assertEqual(len(by_session), 4)
+        closed = by_session[self.sessions[0].pk]
+        self.assertEqual([row["question_order"] for row in closed], [1])
+        self.assertEqual([row["session_stale"] for row in closed], [True])
+        self.assertFalse(by_session[self.sessions[1].pk][0]["session_stale"])
+        self.assertFalse(by_session[self.not_started.pk][0]["session_stale"])
+        self.assertEqual(by_session[self.not_started.pk][0]["question_order"], None)
+
+    def test_background_resync_clears_the_stale_marker(self):
+        self.assertEqual(resync_template_sessions(self.qt.pk, batch_size=2), 1)
+
+        closed = self._rows_by_session()[self.sessions[0].pk]
+        self.assertEqual([row["question_order"] for row in closed], [1, 2])
+        self.assertEqual([row["is_correct"] for row in closed], [True, False])
+        self.assertEqual([row["session_stale"] for row in closed], [False, False])
+        self.assertEqual(closed[0]["session_earned_score"], 1.0)
+        self.assertEqual(resync_template_sessions(self.qt.pk), 0)
+
+    def test_csv_export_is_streamed(self):
+        self.client.force_authenticate(self.owner)
+
+        with (
+            patch("quiz.tasks.resync_template_sessions_task.delay") as delay,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            res = self.client.get(self._url())
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.streaming)
+        self.assertIn("attachment;", res["Content-Disposition"])
+        # La session périmée est signalée et sa réconciliation planifiée, sans écriture dans la requête.
+        self.assertEqual(res["X-Stale-Sessions"], "1")
+        delay.assert_called_once_with(self.qt.pk)
+        self.assertEqual(QuizQuestionAnswer.objects.filter(quiz=self.sessions[0]).count(), 1)
+        reader = csv.reader(io.StringIO(b"".join(res.streaming_content).decode()))
+        header, *rows = list(reader)
+        self.assertEqual(tuple(header), RESULTS_EXPORT_COLUMNS)
+        first = dict(zip(header, rows[0]))
+        self.assertEqual(first["selected_option_ids"], str(self.correct[self.quiz_questions[0].pk].pk))
+
+    def test_ndjson_export_and_format_validation(self):
+        self.client.force_authenticate(self.owner)
+
+        res = self.client.get(self._url(export_format="ndjson"))
+        lines = [json.loads(line) for line in b"".join(res.streaming_content).decode().splitlines()]
+        self.assertEqual(lines[0]["session_id"], self.sessions[0].pk)
+        self.assertEqual(lines[0]["selected_option_ids"], [self.correct[self.quiz_questions[0].pk].pk])
+
+        res = self.client.get(self._url(export_format="xml"))
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_requires_template_management_rights(self):
+        self.client.force_authenticate(User.objects.get(username="student1"))
+
+        res = self.client.get(self._url())
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
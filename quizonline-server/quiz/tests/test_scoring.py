@@ -0,0 +1,218 @@
+import random
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone, translation
+
+from domain.models import Domain
+from question.models import AnswerOption, Question
+from quiz.answer_writes import save_quiz_answers_batch
+from quiz.models import Quiz, QuizQuestion, QuizQuestionAnswer, QuizTemplate
+from quiz.services import close_quiz_session
+from quiz.session_integrity import (
+    reconcile_quiz_answers,
+    reconcile_quizzes_answers,
+    synchronize_closed_quiz_answers,
+)
+
+User = get_user_model()
+
+
+class _ScoringFixtures(TestCase):
+    def setUp(self):
+        translation.activate("fr")
+        self.user = User.objects.create_user(username="u1", password="pass")
+        self.domain = Domain.objects.create(owner=self.user, name="Domain", description="", active=True)
+        self.qt = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Template",
+            mode=QuizTemplate.MODE_EXAM,
+            permanent=True,
+            active=True,
+        )
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def _add_question(self, sort_order: int, *, correct: int, wrong: int, weight: int = 1) -> QuizQuestion:
+        question = Question.objects.create(
+            domain=self.domain,
+            title=f"Q{sort_order}",
+            active=True,
+            allow_multiple_correct=correct > 1,
+            is_mode_practice=True,
+            is_mode_exam=True,
+        )
+        for index in range(correct + wrong):
+            AnswerOption.objects.create(
+                question=question,
+                content=f"O{index}",
+                is_correct=index < correct,
+                sort_order=index + 1,
+            )
+        return QuizQuestion.objects.create(quiz=self.qt, question=question, sort_order=sort_order, weight=weight)
+
+    def _new_session(self) -> Quiz:
+        return Quiz.objects.create(quiz_template=self.qt, user=self.user, active=True, started_at=timezone.now())
+
+    def _scores(self, quiz: Quiz):
+        return sorted(quiz.answers.values_list("quizquestion_id", "earned_score", "max_score", "is_correct"))
+
+
+class SqlScoringTests(_ScoringFixtures):
+
+    def test_sql_scoring_matches_python_scoring(self):
+        rng = random.Random(42)
+        quiz_questions = [
+            self._add_question(
+                index,
+                correct=rng.choice([0, 1, 1, 2, 3]),
+                wrong=rng.choice([1, 2, 3]),
+                weight=rng.randint(0, 4),
+            )
+            for index in range(1, 31)
+        ]
+        python_quiz = self._new_session()
+        sql_quiz = self._new_session()
+        # Une question sur cinq reste sans réponse ; les autres reçoivent une sélection aléatoire
+        # (vide, exacte, partielle ou sur-ensemble).
+        for qq in quiz_questions:
+            if rng.random() < 0.2:
+                continue
+            option_ids = list(qq.question.answer_options.values_list("id", flat=True))
+            selection = rng.sample(option_ids, rng.randint(0, len(option_ids)))
+            for quiz in (python_quiz, sql_quiz):
+                QuizQuestionAnswer.objects.create(
+                    quiz=quiz,
+                    quizquestion=qq,
+                    question_order=qq.sort_order,
+                    selected_option_ids=selection,
+                )
+
+        with override_settings(QUIZ_SQL_SCORING=False):
+            reconcile_quiz_answers(python_quiz)
+        with override_settings(QUIZ_SQL_SCORING=True):
+            reconcile_quiz_answers(sql_quiz)
+
+        python_scores = [row[1:] for row in self._scores(python_quiz)]
+        sql_scores = [row[1:] for row in self._scores(sql_quiz)]
+        self.assertEqual(len(sql_scores), len(quiz_questions))
+        self.assertEqual(sql_scores, python_scores)
+        self.assertTrue(any(is_correct for _, _, is_correct in sql_scores))
+
+    def test_sql_reconcile_query_count_does_not_grow_with_questions(self):
+        for index in range(1, 4):
+            self._add_question(index, correct=1, wrong=2)
+        # Clé de correction recompilée à chaque fois (la version change avec les questions) :
+        # 5 requêtes de réconciliation + 3 de compilation de la clé.
+        small = self._new_session()
+        with self.assertNumQueries(8):
+            reconcile_quizzes_answers([small])
+
+        # 3 x 25 réponses manquantes : un seul INSERT, même sous la limite de paramètres de SQLite.
+        for index in range(4, 26):
+            self._add_question(index, correct=2, wrong=2)
+        large = [self._new_session() for _ in range(3)]
+        with self.assertNumQueries(8):
+            reconcile_quizzes_answers(large)
+
+        self.assertEqual(QuizQuestionAnswer.objects.filter(quiz__in=large).count(), 3 * 25)
+
+
+class FinalizedSessionTests(_ScoringFixtures):
+    def _closed_session(self) -> Quiz:
+        qq = self._add_question(1, correct=1, wrong=1, weight=2)
+        quiz = self._new_session()
+        QuizQuestionAnswer.objects.create(
+            quiz=quiz,
+            quizquestion=qq,
+            question_order=1,
+            selected_option_ids=[option.pk for option in qq.question.answer_options.filter(is_correct=True)],
+        )
+        close_quiz_session(quiz=quiz)
+        return Quiz.objects.select_related("quiz_template").get(pk=quiz.pk)
+
+    def test_close_finalizes_and_later_reads_do_not_reconcile(self):
+        quiz = self._closed_session()
+        self.assertEqual(quiz.finalized_answer_key_version, quiz.quiz_template.answer_key_version)
+
+        with self.assertNumQueries(0):
+            synchronize_closed_quiz_answers(quiz)
+
+    def test_answer_key_change_triggers_a_single_rescore(self):
+        quiz = self._closed_session()
+        qq = QuizQuestion.objects.get(quiz=self.qt)
+        qq.weight = 5
+        qq.save()
+
+        quiz = Quiz.objects.select_related("quiz_template").get(pk=quiz.pk)
+        synchronize_closed_quiz_answers(quiz)
+        self.assertEqual(Quiz.objects.values_list("earned_score", flat=True).get(pk=quiz.pk), 5.0)
+
+        quiz = Quiz.objects.select_related("quiz_template").get(pk=quiz.pk)
+        with self.assertNumQueries(0):
+            synchronize_closed_quiz_answers(quiz)
+
+    def test_answer_write_clears_finalization(self):
+        quiz = self._closed_session()
+        qq = QuizQuestion.objects.get(quiz=self.qt)
+
+        save_quiz_answers_batch(quiz=quiz, entries=[(qq, [])])
+
+        quiz.refresh_from_db()
+        self.assertIsNone(quiz.finalized_answer_key_version)
+
+    def test_reconcile_without_finalize_keeps_finalization(self):
+        quiz = self._closed_session()
+        version = quiz.finalized_answer_key_version
+
+        reconcile_quiz_answers(quiz)
+
+        quiz.refresh_from_db()
+        self.assertEqual(quiz.finalized_answer_key_version, version)
+
+    @override_settings(QUIZ_SCORE_ON_WRITE=True)
+    def test_score_on_write_rescores_every_answer_after_answer_key_change(self):
+        quiz = self._closed_session()
+        qq = QuizQuestion.objects.get(quiz=self.qt)
+        qq.weight = 5
+        qq.save()
+
+        quiz = Quiz.objects.select_related("quiz_template").get(pk=quiz.pk)
+        synchronize_closed_quiz_answers(quiz)
+
+        self.assertEqual(quiz.answers.get().earned_score, 5.0)
+        self.assertEqual(Quiz.objects.values_list("earned_score", flat=True).get(pk=quiz.pk), 5.0)
+
+    @override_settings(QUIZ_SCORE_ON_WRITE=True)
+    def test_score_on_write_rescores_answers_scored_under_an_old_key_at_close(self):
+        qq = self._add_question(1, correct=1, wrong=1, weight=2)
+        quiz = self._new_session()
+        correct = [option.pk for option in qq.question.answer_options.filter(is_correct=True)]
+        save_quiz_answers_batch(quiz=quiz, entries=[(qq, correct)])
+        answer = quiz.answers.get()
+        self.qt.refresh_from_db()
+        self.assertEqual((answer.earned_score, answer.scored_answer_key_version), (2.0, self.qt.answer_key_version))
+
+        # Barème modifié pendant la session : l'écriture a remis le marqueur de finalisation à None.
+        qq.weight = 5
+        qq.save()
+        close_quiz_session(quiz=Quiz.objects.select_related("quiz_template").get(pk=quiz.pk))
+
+        answer.refresh_from_db()
+        self.qt.refresh_from_db()
+        self.assertEqual((answer.earned_score, answer.max_score), (5.0, 5.0))
+        self.assertEqual(answer.scored_answer_key_version, self.qt.answer_key_version)
+        self.assertEqual(Quiz.objects.values_list("earned_score", flat=True).get(pk=quiz.pk), 5.0)
+
+    @override_settings(QUIZ_SCORE_ON_WRITE=True)
+    def test_score_on_write_keeps_answers_scored_under_the_current_key(self):
+        qq = self._add_question(1, correct=1, wrong=1, weight=2)
+        quiz = self._new_session()
+        save_quiz_answers_batch(quiz=quiz, entries=[(qq, [])])
+        QuizQuestionAnswer.objects.filter(quiz=quiz).update(earned_score=0.5)
+
+        reconcile_quiz_answers(quiz, finalize=True)
+
+        self.assertEqual(quiz.answers.get().earned_score, 0.5)
@@ -778,7 +778,7 @@ class QuizQuestionAnswerWriteSerializerTests(LocalizedTestCase):
         self.assertEqual(ans.quiz_id, self.quiz.id)
         self.assertEqual(ans.quizquestion_id, self.qq1.id)
         self.assertEqual(ans.question_order, 1)
-        self.assertEqual(list(ans.selected_options.values_list("id", flat=True)), [self.o11.id])
+        self.assertEqual(ans.selected_option_ids, [self.o11.id])
 
     def test_create_with_question_order_sets_quizquestion(self):
         s = QuizQuestionAnswerWriteSerializer(
@@ -809,7 +809,7 @@ class QuizQuestionAnswerWriteSerializerTests(LocalizedTestCase):
         a2 = s2.save()
 
         self.assertEqual(a1.id, a2.id)
-        self.assertEqual(list(a2.selected_options.values_list("id", flat=True)), [self.o12.id])
+        self.assertEqual(a2.selected_option_ids, [self.o12.id])
 
     def test_create_rejects_selected_options_from_another_question(self):
         s = QuizQuestionAnswerWriteSerializer(
@@ -821,8 +821,12 @@ class QuizQuestionAnswerWriteSerializerTests(LocalizedTestCase):
 
     # ---- update()
     def test_update_updates_selected_options_and_ignores_attempt_to_change_question(self):
-        ans = QuizQuestionAnswer.objects.create(quiz=self.quiz, quizquestion=self.qq1, question_order=1)
-        ans.selected_options.set([self.o11])
+        ans = QuizQuestionAnswer.objects.create(
+            quiz=self.quiz,
+            quizquestion=self.qq1,
+            question_order=1,
+            selected_option_ids=[self.o11.pk],
+        )
 
         s = QuizQuestionAnswerWriteSerializer(
             instance=ans,
@@ -839,11 +843,15 @@ class QuizQuestionAnswerWriteSerializerTests(LocalizedTestCase):
 
         self.assertEqual(updated.quizquestion_id, self.qq1.id)  # inchangé
         self.assertEqual(updated.question_order, 1)  # inchangé
-        self.assertEqual(list(updated.selected_options.values_list("id", flat=True)), [self.o12.id])
+        self.assertEqual(updated.selected_option_ids, [self.o12.id])
 
-    def test_update_when_selected_options_absent_does_not_change_m2m(self):
-        ans = QuizQuestionAnswer.objects.create(quiz=self.quiz, quizquestion=self.qq1, question_order=1)
-        ans.selected_options.set([self.o11])
+    def test_update_when_selected_options_absent_does_not_change_selection(self):
+        ans = QuizQuestionAnswer.objects.create(
+            quiz=self.quiz,
+            quizquestion=self.qq1,
+            question_order=1,
+            selected_option_ids=[self.o11.pk],
+        )
 
         s = QuizQuestionAnswerWriteSerializer(
             instance=ans,
@@ -853,7 +861,7 @@ class QuizQuestionAnswerWriteSerializerTests(LocalizedTestCase):
         )
         self.assertTrue(s.is_valid(), s.errors)
         updated = s.save()
-        self.assertEqual(list(updated.selected_options.values_list("id", flat=True)), [self.o11.id])
+        self.assertEqual(updated.selected_option_ids, [self.o11.id])
 
     def test_update_rejects_selected_options_from_another_question(self):
         ans = QuizQuestionAnswer.objects.create(quiz=self.quiz, quizquestion=self.qq1, question_order=1)
@@ -0,0 +1,149 @@
+import tracemalloc
+
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils import translation
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from domain.models import Domain
+from question.models import Question
+from quiz.models import QuizQuestion, QuizTemplate
+from quiz.querysets import (
+    accessible_quiz_template_queryset,
+    quiz_template_list_queryset,
+    quiz_template_queryset,
+)
+from quiz.serializers import QuizTemplateListSerializer, QuizTemplateSerializer
+
+User = get_user_model()
+
+
+def _peak_memory(render) -> int:
+    tracemalloc.start()
+    try:
+        render()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class QuizTemplateListProjectionTests(APITestCase):
+    def setUp(self):
+        translation.activate("fr")
+        self.owner = User.objects.create_user(username="owner", password="pass", is_staff=True)
+        self.domain = Domain.objects.create(owner=self.owner, name="Domain", description="", active=True)
+        self.questions = [
+            Question.objects.create(
+                domain=self.domain,
+                title=f"Q{index}",
+                active=True,
+                allow_multiple_correct=False,
+                is_mode_practice=True,
+                is_mode_exam=True,
+            )
+            for index in range(3)
+        ]
+        self.templates = QuizTemplate.objects.bulk_create([
+            QuizTemplate(
+                domain=self.domain,
+                title=f"Template {index:03d}",
+                slug=f"template-{index:03d}",
+                permanent=True,
+                active=True,
+                created_by=self.owner,
+            )
+            for index in range(50)
+        ])
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def test_questions_total_follows_quiz_questions(self):
+        template = self.templates[0]
+        first = QuizQuestion.objects.create(quiz=template, question=self.questions[0], sort_order=1, weight=1)
+        QuizQuestion.objects.create(quiz=template, question=self.questions[1], sort_order=2, weight=1)
+        template.refresh_from_db()
+        self.assertEqual(template.questions_total, 2)
+
+        first.delete()
+        template.refresh_from_db()
+        self.assertEqual(template.questions_total, 1)
+
+    def test_stale_instance_save_keeps_questions_total(self):
+        template = QuizTemplate.objects.get(pk=self.templates[0].pk)
+        QuizQuestion.objects.create(quiz=template, question=self.questions[0], sort_order=1, weight=1)
+
+        template.description = "Mise à jour"
+        template.save()
+
+        template.refresh_from_db()
+        self.assertEqual(template.questions_total, 1)
+        self.assertEqual(template.description, "Mise à jour")
+
+    def test_list_projection_is_a_single_query(self):
+        template = self.templates[0]
+        for index, question in enumerate(self.questions, start=1):
+            QuizQuestion.objects.create(quiz=template, question=question, sort_order=index, weight=1)
+
+        queryset = accessible_quiz_template_queryset(self.owner, queryset=quiz_template_list_queryset())
+        with self.assertNumQueries(1):
+            data = QuizTemplateListSerializer(list(queryset), many=True).data
+
+        self.assertEqual(len(data), 50)
+        counts = {row["id"]: row["questions_count"] for row in data}
+        self.assertEqual(counts[template.pk], 3)
+        self.assertEqual(counts[self.templates[1].pk], 0)
+        self.assertEqual(data[0]["created_by_username"], "owner")
+        self.assertNotIn("quiz_questions", data[0])
+
+    def test_list_endpoint_omits_quiz_questions(self):
+        QuizQuestion.objects.create(quiz=self.templates[0], question=self.questions[0], sort_order=1, weight=1)
+        self.client.force_authenticate(self.owner)
+
+        res = self.client.get(reverse("api:quiz-api:quiz-template-list"))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        rows = res.data["results"] if isinstance(res.data, dict) else res.data
+        self.assertTrue(rows)
+        self.assertNotIn("quiz_questions", rows[0])
+        self.assertEqual(rows[0]["questions_count"], 1)
+
+        detail = self.client.get(reverse("api:quiz-api:quiz-template-detail", kwargs={"qt_id": self.templates[0].pk}))
+        self.assertEqual(len(detail.data["quiz_questions"]), 1)
+
+    def test_list_projection_benchmark_on_5k_templates(self):
+        templates = QuizTemplate.objects.bulk_create(
+            [
+                QuizTemplate(
+                    domain=self.domain,
+                    title=f"Bench {index:04d}",
+                    slug=f"bench-{index:04d}",
+                    description="x" * 200,
+                    permanent=True,
+                    active=True,
+                    created_by=self.owner,
+                    questions_total=1,
+                )
+                for index in range(5000)
+            ],
+            batch_size=500,
+        )
+        QuizQuestion.objects.bulk_create(
+            [QuizQuestion(quiz=template, question=self.questions[0], sort_order=1, weight=1) for template in templates],
+            batch_size=500,
+        )
+        projection = accessible_quiz_template_queryset(self.owner, queryset=quiz_template_list_queryset())
+        request = RequestFactory().get("/")
+        request.user = self.owner
+
+        with self.assertNumQueries(1):
+            projection_peak = _peak_memory(lambda: QuizTemplateListSerializer(list(projection), many=True).data)
+        # Ancien chemin de la liste : queryset complet (COUNT + prefetch des questions) et serializer admin.
+        full_peak = _peak_memory(
+            lambda: QuizTemplateSerializer(list(quiz_template_queryset()), many=True, context={"request": request}).data
+        )
+
+        self.assertLess(projection_peak, full_peak)
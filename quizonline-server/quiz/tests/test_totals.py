@@ -0,0 +1,109 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone, translation
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from domain.models import Domain
+from question.models import AnswerOption, Question
+from quiz.models import Quiz, QuizQuestion, QuizQuestionAnswer, QuizTemplate
+from quiz.services import close_quiz_session
+
+User = get_user_model()
+
+
+class QuizTotalsTests(APITestCase):
+    def setUp(self):
+        translation.activate("fr")
+        self.owner = User.objects.create_user(username="owner", password="pass", is_staff=True)
+        self.student = User.objects.create_user(username="student", password="pass")
+        self.domain = Domain.objects.create(owner=self.owner, name="Domain", description="", active=True)
+        self.qt = QuizTemplate.objects.create(
+            domain=self.domain,
+            title="Practice",
+            mode=QuizTemplate.MODE_PRACTICE,
+            permanent=True,
+            active=True,
+            with_duration=False,
+            created_by=self.owner,
+        )
+        self.correct = {}
+        self.quiz_questions = []
+        for index, weight in enumerate((2, 3), start=1):
+            question = Question.objects.create(
+                domain=self.domain,
+                title=f"Q{index}",
+                active=True,
+                allow_multiple_correct=False,
+                is_mode_practice=True,
+                is_mode_exam=True,
+            )
+            self.correct[question.pk] = AnswerOption.objects.create(
+                question=question, content="A", is_correct=True, sort_order=1
+            )
+            AnswerOption.objects.create(question=question, content="B", is_correct=False, sort_order=2)
+            self.quiz_questions.append(
+                QuizQuestion.objects.create(quiz=self.qt, question=question, sort_order=index, weight=weight)
+            )
+        self.quiz = Quiz.objects.create(
+            quiz_template=self.qt,
+            user=self.student,
+            active=True,
+            started_at=timezone.now(),
+        )
+
+    def tearDown(self):
+        translation.deactivate_all()
+        super().tearDown()
+
+    def _totals(self):
+        return Quiz.objects.values_list("earned_score", "max_score", "total_answers", "correct_answers").get(
+            pk=self.quiz.pk
+        )
+
+    def test_answer_writes_and_close_maintain_totals(self):
+        qq1 = self.quiz_questions[0]
+        self.client.force_authenticate(self.student)
+
+        res = self.client.post(
+            reverse("api:quiz-api:quiz-answer-list", kwargs={"quiz_id": self.quiz.pk}),
+            {"question_id": qq1.question_id, "selected_options": [self.correct[qq1.question_id].pk]},
+            format="json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self._totals()[2], 1)
+
+        close_quiz_session(quiz=self.quiz)
+
+        self.assertEqual(self._totals(), (2.0, 5.0, 2, 1))
+
+    def test_session_list_reads_totals_from_columns(self):
+        QuizQuestionAnswer.objects.create(
+            quiz=self.quiz,
+            quizquestion=self.quiz_questions[1],
+            question_order=2,
+            selected_option_ids=[self.correct[self.quiz_questions[1].question_id].pk],
+        )
+        close_quiz_session(quiz=self.quiz)
+        self.client.force_authenticate(self.student)
+
+        res = self.client.get(reverse("api:quiz-api:quiz-list"))
+
+        row = res.data["results"][0]
+        self.assertEqual((row["earned_score"], row["max_score"]), (3.0, 5.0))
+
+    def test_rebuild_command_repairs_drifted_totals(self):
+        close_quiz_session(quiz=self.quiz)
+        expected = self._totals()
+        Quiz.objects.filter(pk=self.quiz.pk).update(earned_score=99, total_answers=0)
+        out = StringIO()
+
+        call_command("rebuild_quiz_totals", "--batch-size", "1", stdout=out)
+
+        self.assertIn("Rebuilt totals for 1 quiz session(s).", out.getvalue())
+        self.assertEqual(self._totals(), expected)
+        # La réparation ne touche pas aux réponses : la session reste finalisée.
+        self.assertIsNotNone(Quiz.objects.values_list("finalized_answer_key_version", flat=True).get(pk=self.quiz.pk))
@@ -1,10 +1,14 @@
 # wpref/quiz/tests/test_views_api.py
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from django.utils import translation
@@ -193,17 +197,19 @@ class QuizViewsAPITestCase(_ReverseMixin, APITestCase):
         )
 
     def _make_answer(self, quiz: Quiz, qq: QuizQuestion, selected_correct=True, order=1) -> QuizQuestionAnswer:
+        correct_opts = list(qq.question.answer_options.filter(is_correct=True))
+        wrong_opts = list(qq.question.answer_options.filter(is_correct=False))
+        selected_opts = []
+        if selected_correct and correct_opts:
+            selected_opts = correct_opts
+        elif wrong_opts:
+            selected_opts = [wrong_opts[0]]
         ans = QuizQuestionAnswer.objects.create(
             quiz=quiz,
             quizquestion=qq,
             question_order=order,
+            selected_option_ids=[option.pk for option in selected_opts],
         )
-        correct_opts = list(qq.question.answer_options.filter(is_correct=True))
-        wrong_opts = list(qq.question.answer_options.filter(is_correct=False))
-        if selected_correct and correct_opts:
-            ans.selected_options.set(correct_opts)
-        elif wrong_opts:
-            ans.selected_options.set([wrong_opts[0]])
         return ans
 
     # ---------------------------------------------------------------------
@@ -741,6 +747,43 @@ class QuizViewsAPITestCase(_ReverseMixin, APITestCase):
         self.assertNotIn("questions", row)
         self.assertNotIn("answers", row)
 
+    def test_quiz_list_cursor_pagination_walks_every_session_once(self):
+        created = [self._create_quiz(self.qt_ok, self.u1).id for _ in range(25)]
+        self._auth(self.admin)
+
+        res = self.client.get(self.quiz_list_url, {"pagination": "cursor"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", res.data)
+        self.assertIsNone(res.data["previous"])
+        first_page = [row["id"] for row in res.data["results"]]
+        self.assertEqual(len(first_page), 20)
+
+        res = self.client.get(res.data["next"])
+        self.assertIsNone(res.data["next"])
+        self.assertIsNotNone(res.data["previous"])
+        ids = first_page + [row["id"] for row in res.data["results"]]
+        self.assertEqual(ids, sorted(created, reverse=True))
+
+        res = self.client.get(self.quiz_list_url, {"pagination": "cursor", "count": "approx"})
+        self.assertEqual(res.data["count"], 25)
+        res = self.client.get(self.quiz_list_url, {"pagination": "cursor", "count": "all"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # Sans paramètre, le contrat page/count historique est inchangé.
+        res = self.client.get(self.quiz_list_url, {"page": 2})
+        self.assertEqual((res.data["count"], len(res.data["results"])), (25, 5))
+
+    def test_template_sessions_are_paginated_only_in_cursor_mode(self):
+        for _ in range(3):
+            self._create_quiz(self.qt_ok, self.u1)
+        self._auth(self.admin)
+        url = self._rev("api:quiz-api:quiz-template-sessions", "quiz-api:quiz-template-sessions", qt_id=self.qt_ok.id)
+
+        self.assertEqual(len(self.client.get(url).data), 3)
+        res = self.client.get(url, {"pagination": "cursor"})
+        self.assertEqual(len(res.data["results"]), 3)
+        self.assertIsNone(res.data["next"])
+
     def test_quiz_create_missing_template_id_400(self):
         self._auth(self.admin)
         res = self.client.post(self.quiz_list_url, {}, format="json")
@@ -1344,7 +1387,7 @@ class QuizViewsAPITestCase(_ReverseMixin, APITestCase):
         self.assertEqual(res.data["total_answers"], 4)
 
     def test_close_quiz_does_not_override_existing_ended_at(self):
-        ended = timezone.now() - timezone.timedelta(days=1)
+        ended = timezone.now() - timedelta(days=1)
         quiz = self._create_quiz(self.qt_ok, self.u1, active=True, started_at=timezone.now(), ended_at=ended)
 
         url = self._rev(
@@ -1366,8 +1409,8 @@ class QuizViewsAPITestCase(_ReverseMixin, APITestCase):
             self.qt_ok,
             self.u1,
             active=True,
-            started_at=timezone.now() - timezone.timedelta(minutes=10),
-            ended_at=timezone.now() - timezone.timedelta(seconds=5),
+            started_at=timezone.now() - timedelta(minutes=10),
+            ended_at=timezone.now() - timedelta(seconds=5),
         )
 
         url = self._rev(
@@ -1414,8 +1457,8 @@ class QuizViewsAPITestCase(_ReverseMixin, APITestCase):
             repair_template,
             self.u1,
             active=True,
-            started_at=timezone.now() - timezone.timedelta(minutes=10),
-            ended_at=timezone.now() + timezone.timedelta(minutes=10),
+            started_at=timezone.now() - timedelta(minutes=10),
+            ended_at=timezone.now() + timedelta(minutes=10),
         )
         broken = QuizQuestionAnswer.objects.create(
             quiz=quiz,
@@ -1425,9 +1468,9 @@ class QuizViewsAPITestCase(_ReverseMixin, APITestCase):
             earned_score=1,
             max_score=1,
         )
-        self.assertEqual(list(broken.selected_options.values_list("id", flat=True)), [])
+        self.assertEqual(broken.selected_option_ids, [])
 
-        quiz.ended_at = timezone.now() - timezone.timedelta(minutes=1)
+        quiz.ended_at = timezone.now() - timedelta(minutes=1)
         quiz.save(update_fields=["ended_at"])
 
         url = self._rev(
@@ -1484,6 +1527,92 @@ class QuizViewsAPITestCase(_ReverseMixin, APITestCase):
         self.assertEqual(question_payload["answer_options"][0]["content"], "Answer EN")
         self.assertIn("is_correct", question_payload["answer_options"][0])
 
+    def test_quiz_retrieve_serves_questions_from_snapshot_frozen_at_start(self):
+        quiz = self._create_quiz(self.qt_ok, self.u1, active=False, started_at=None)
+        self._set_translation(self.qq1.question, "fr", title="Avant")
+        self._auth(self.u1)
+        url = self._rev("api:quiz-api:quiz-detail", "quiz-api:quiz-detail", quiz_id=quiz.id)
+
+        res = self.client.post(
+            self._rev("api:quiz-api:quiz-start", "quiz-api:quiz-start", quiz_id=quiz.id),
+            {},
+            HTTP_ACCEPT_LANGUAGE="fr",
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["questions"][0]["question"]["translations"]["fr"]["title"], "Avant")
+
+        self._set_translation(self.qq1.question, "fr", title="Apres")
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(url, HTTP_ACCEPT_LANGUAGE="fr")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["questions"][0]["question"]["translations"]["fr"]["title"], "Avant")
+        self.assertFalse(
+            [query["sql"] for query in queries.captured_queries if "question_answeroption" in query["sql"]]
+        )
+
+        res_en = self.client.get(url, HTTP_ACCEPT_LANGUAGE="en")
+        self.assertEqual(res_en.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res_en.data["questions"]), 2)
+
+    def test_quiz_retrieve_returns_304_until_session_changes(self):
+        quiz = self._create_quiz(self.qt_ok, self.u1, active=True, started_at=timezone.now())
+        self._auth(self.u1)
+        url = self._rev("api:quiz-api:quiz-detail", "quiz-api:quiz-detail", quiz_id=quiz.id)
+
+        etag = self.client.get(url)["ETag"]
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse([query["sql"] for query in queries.captured_queries if "question_answeroption" in query["sql"]])
+
+        QuizQuestionAnswer.objects.create(quiz=quiz, quizquestion=self.qq1, question_order=1)
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        etag = res["ETag"]
+
+        # Les champs dépendant de l'heure (can_answer, corrections programmées) invalident aussi l'ETag.
+        Quiz.objects.filter(pk=quiz.pk).update(ended_at=timezone.now() + timedelta(minutes=5))
+        etag = self.client.get(url)["ETag"]
+        with patch("config.conditional.timezone.now", return_value=timezone.now() + timedelta(minutes=10)):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+
+    @patch("config.pagination.OptionalCursorPagination.page_size", 1)
+    def test_quiz_list_etag_covers_only_the_requested_page(self):
+        older = self._create_quiz(self.qt_ok, self.u1, active=True, started_at=timezone.now())
+        newer = self._create_quiz(self.qt_ok, self.u1, active=True, started_at=timezone.now())
+        self._auth(self.u1)
+        url = self._rev("api:quiz-api:quiz-list", "quiz-api:quiz-list")
+        params = {"pagination": "cursor"}
+
+        res = self.client.get(url, params)
+        self.assertEqual([row["id"] for row in res.data["results"]], [newer.id])
+        etag = res["ETag"]
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse([query["sql"] for query in queries.captured_queries if "quizquestionanswer" in query["sql"]])
+
+        # Hors de la page : la version ne change pas ; totaux de la page : elle change.
+        Quiz.objects.filter(pk=older.pk).update(earned_score=3)
+        self.assertEqual(self.client.get(url, params, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+        Quiz.objects.filter(pk=newer.pk).update(earned_score=1)
+        self.assertEqual(self.client.get(url, params, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+
+    def test_template_list_etag_follows_user_assignments(self):
+        self._auth(self.u2)
+        url = self._rev("api:quiz-api:quiz-template-list", "quiz-api:quiz-template-list")
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        qt_private = QuizTemplate.objects.create(domain=self.domain, title="T_PRIVATE", is_public=False, active=True)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+        self._create_quiz(qt_private, self.u2, active=False, started_at=None)
+
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res["ETag"], etag)
+
     def test_quiz_retrieve_returns_unknown_correctness_for_running_exam(self):
         qt_exam = QuizTemplate.objects.create(
             domain=self.domain,
@@ -1545,7 +1674,7 @@ class QuizViewsAPITestCase(_ReverseMixin, APITestCase):
             qt_exam,
             self.u1,
             active=False,
-            started_at=timezone.now() - timezone.timedelta(minutes=5),
+            started_at=timezone.now() - timedelta(minutes=5),
             ended_at=timezone.now(),
         )
 
@@ -1743,8 +1872,8 @@ class QuizViewsAPITestCase(_ReverseMixin, APITestCase):
             self.qt_ok,
             self.u1,
             active=True,
-            started_at=timezone.now() - timezone.timedelta(minutes=10),
-            ended_at=timezone.now() - timezone.timedelta(seconds=5),
+            started_at=timezone.now() - timedelta(minutes=10),
+            ended_at=timezone.now() - timedelta(seconds=5),
         )
         self._auth(self.u1)
 
@@ -1782,6 +1911,173 @@ class QuizViewsAPITestCase(_ReverseMixin, APITestCase):
         self.assertEqual(second.status_code, status.HTTP_201_CREATED)
         self.assertEqual(third.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
 
+    def _answers_batch_url(self, quiz: Quiz):
+        return self._rev(
+            "api:quiz-api:quiz-answer-batch",
+            "quiz-api:quiz-answer-batch",
+            quiz_id=quiz.id,
+        )
+
+    def test_answer_batch_upserts_answers_and_selected_options(self):
+        quiz = self._create_quiz(self.qt_ok, self.u1, active=True, started_at=timezone.now())
+        existing = self._make_answer(quiz, self.qq1, selected_correct=False, order=1)
+        correct1 = self.qq1.question.answer_options.get(is_correct=True)
+        wrong2 = self.qq2.question.answer_options.get(is_correct=False)
+        self._auth(self.u1)
+
+        res = self.client.post(
+            self._answers_batch_url(quiz),
+            {
+                "answers": [
+                    {"question_id": self.q1.id, "selected_options": [correct1.id]},
+                    {"question_order": 2, "selected_options": [wrong2.id]},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 2)
+        self.assertEqual(quiz.answers.count(), 2)
+        existing.refresh_from_db()
+        self.assertEqual(existing.selected_option_ids, [correct1.id])
+        created = QuizQuestionAnswer.objects.get(quiz=quiz, quizquestion=self.qq2)
+        self.assertEqual(created.question_order, 2)
+        self.assertEqual(created.selected_option_ids, [wrong2.id])
+
+    def test_answer_batch_query_count_does_not_grow_with_answers(self):
+        extra_questions = []
+        for index in range(3, 11):
+            question = self._make_question(f"QB{index}", subjects=[self.subj1], active=True)
+            extra_questions.append(
+                QuizQuestion.objects.create(quiz=self.qt_ok, question=question, sort_order=index, weight=1)
+            )
+        quiz_small = self._create_quiz(self.qt_ok, self.u1, active=True, started_at=timezone.now())
+        quiz_large = self._create_quiz(self.qt_ok, self.u1, active=True, started_at=timezone.now())
+        self._auth(self.u1)
+
+        def payload(quiz_questions):
+            return {
+                "answers": [
+                    {
+                        "question_order": qq.sort_order,
+                        "selected_options": [qq.question.answer_options.filter(is_correct=True).first().id],
+                    }
+                    for qq in quiz_questions
+                ]
+            }
+
+        small = payload([self.qq1, self.qq2])
+        large = payload([self.qq1, self.qq2, *extra_questions])
+
+        with self.assertNumQueries(10):
+            res_small = self.client.post(self._answers_batch_url(quiz_small), small, format="json")
+        with self.assertNumQueries(10):
+            res_large = self.client.post(self._answers_batch_url(quiz_large), large, format="json")
+
+        self.assertEqual(res_small.status_code, status.HTTP_200_OK)
+        self.assertEqual(res_large.status_code, status.HTTP_200_OK)
+        self.assertEqual(quiz_small.answers.count(), 2)
+        self.assertEqual(quiz_large.answers.count(), 10)
+
+    def test_answer_batch_rejects_whole_batch_on_invalid_item(self):
+        quiz = self._create_quiz(self.qt_ok, self.u1, active=True, started_at=timezone.now())
+        correct1 = self.qq1.question.answer_options.get(is_correct=True)
+        foreign_option = self.qq2.question.answer_options.first()
+        self._auth(self.u1)
+
+        res = self.client.post(
+            self._answers_batch_url(quiz),
+            {
+                "answers": [
+                    {"question_order": 1, "selected_options": [correct1.id]},
+                    {"question_order": 1, "selected_options": [foreign_option.id]},
+                    {"question_order": 99, "selected_options": []},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data["answers"][0], {})
+        self.assertIn("non_field_errors", res.data["answers"][1])
+        self.assertIn("question_order", res.data["answers"][2])
+        self.assertFalse(quiz.answers.exists())
+
+    def test_answer_batch_rejects_closed_quiz(self):
+        quiz = self._create_quiz(self.qt_ok, self.u1, active=False, started_at=timezone.now())
+        self._auth(self.u1)
+
+        res = self.client.post(
+            self._answers_batch_url(quiz),
+            {"answers": [{"question_order": 1, "selected_options": []}]},
+            format="json",
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("detail", res.data)
+
+    @override_settings(QUIZ_SCORE_ON_WRITE=True)
+    def test_answer_write_scores_immediately_when_score_on_write_enabled(self):
+        quiz = self._create_quiz(self.qt_ok, self.u1, active=True, started_at=timezone.now())
+        correct = self.qq2.question.answer_options.get(is_correct=True)
+        wrong = self.qq2.question.answer_options.get(is_correct=False)
+        self._auth(self.u1)
+
+        res = self.client.post(
+            self._answers_list_url(quiz),
+            {"question_order": 2, "selected_options": [correct.id]},
+            format="json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        answer = QuizQuestionAnswer.objects.get(pk=res.data["id"])
+        self.assertEqual((answer.earned_score, answer.max_score, answer.is_correct), (2.0, 2.0, True))
+
+        res = self.client.patch(
+            self._answers_detail_url(quiz, answer.id),
+            {"selected_options": [wrong.id]},
+            format="json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        answer.refresh_from_db()
+        self.assertEqual((answer.earned_score, answer.max_score, answer.is_correct), (0.0, 2.0, False))
+
+        correct1 = self.qq1.question.answer_options.get(is_correct=True)
+        res = self.client.post(
+            self._answers_batch_url(quiz),
+            {"answers": [{"question_order": 1, "selected_options": [correct1.id]}]},
+            format="json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        answer = QuizQuestionAnswer.objects.get(quiz=quiz, quizquestion=self.qq1)
+        self.assertEqual((answer.earned_score, answer.max_score, answer.is_correct), (1.0, 1.0, True))
+
+    @override_settings(QUIZ_SCORE_ON_WRITE=True)
+    @patch("quiz.services.notify_quiz_completed")
+    def test_close_only_scores_missing_answers_when_score_on_write_enabled(self, notify_quiz_completed):
+        quiz = self._create_quiz(self.qt_ok, self.u1, active=True, started_at=timezone.now())
+        self._auth(self.u1)
+        correct = self.qq1.question.answer_options.get(is_correct=True)
+        res = self.client.post(
+            self._answers_list_url(quiz),
+            {"question_order": 1, "selected_options": [correct.id]},
+            format="json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        # Un score écrit à la réponse n'est pas recalculé à la clôture.
+        QuizQuestionAnswer.objects.filter(pk=res.data["id"]).update(earned_score=0.5)
+
+        res = self.client.post(
+            self._rev("api:quiz-api:quiz-close", "quiz-api:quiz-close", quiz_id=quiz.id),
+            {},
+            format="json",
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        scores = dict(quiz.answers.values_list("quizquestion_id", "earned_score"))
+        self.assertEqual(scores, {self.qq1.id: 0.5, self.qq2.id: 0.0})
+        self.assertEqual(QuizQuestionAnswer.objects.get(quiz=quiz, quizquestion=self.qq2).max_score, 2.0)
+
     # ---------------------------------------------------------------------
     # QuizQuestionAnswerViewSet: get_queryset swagger_fake_view -> .none()
     # ---------------------------------------------------------------------
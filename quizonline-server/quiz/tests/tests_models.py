@@ -459,13 +459,13 @@ class QuizModelsTestCase(TestCase):
         self.quiz.started_at = timezone.now()
         self.quiz.save()
 
+        correct_option = self.q1.answer_options.get(is_correct=True)
         a = QuizQuestionAnswer.objects.create(
             quiz=self.quiz,
             quizquestion=self.qq1,
             question_order=1,
+            selected_option_ids=[correct_option.pk],
         )
-        correct_option = self.q1.answer_options.get(is_correct=True)
-        a.selected_options.set([correct_option])
 
         earned, max_score = a.compute_score(save=True)
         a.refresh_from_db()
@@ -481,13 +481,13 @@ class QuizModelsTestCase(TestCase):
         self.quiz.started_at = timezone.now()
         self.quiz.save()
 
+        wrong_option = self.q1.answer_options.get(is_correct=False)
         a = QuizQuestionAnswer.objects.create(
             quiz=self.quiz,
             quizquestion=self.qq1,
             question_order=1,
+            selected_option_ids=[wrong_option.pk],
         )
-        wrong_option = self.q1.answer_options.get(is_correct=False)
-        a.selected_options.set([wrong_option])
 
         earned, max_score = a.compute_score(save=True)
         a.refresh_from_db()
@@ -508,7 +508,6 @@ class QuizModelsTestCase(TestCase):
             quizquestion=self.qq1,
             question_order=1,
         )
-        a.selected_options.clear()
 
         earned, max_score = a.compute_score(save=True)
         a.refresh_from_db()
@@ -522,13 +521,13 @@ class QuizModelsTestCase(TestCase):
         self.quiz.started_at = timezone.now()
         self.quiz.save()
 
+        correct_option = self.q1.answer_options.get(is_correct=True)
         a = QuizQuestionAnswer.objects.create(
             quiz=self.quiz,
             quizquestion=self.qq1,
             question_order=1,
+            selected_option_ids=[correct_option.pk],
         )
-        correct_option = self.q1.answer_options.get(is_correct=True)
-        a.selected_options.set([correct_option])
 
         earned, max_score = a.compute_score(save=False)
         self.assertEqual(earned, float(self.qq1.weight))
@@ -549,8 +548,12 @@ class QuizModelsTestCase(TestCase):
         q.answer_options.update(is_correct=False)
 
         qq = QuizQuestion.objects.create(quiz=self.qt, question=q, sort_order=3, weight=1)
-        a = QuizQuestionAnswer.objects.create(quiz=self.quiz, quizquestion=qq, question_order=3)
-        a.selected_options.set(list(q.answer_options.all()))
+        a = QuizQuestionAnswer.objects.create(
+            quiz=self.quiz,
+            quizquestion=qq,
+            question_order=3,
+            selected_option_ids=[option.pk for option in list(q.answer_options.all())],
+        )
 
         earned, max_score = a.compute_score(save=True)
         a.refresh_from_db()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from django.db.models import (
+    Count,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce
+
+from .models import Quiz, QuizQuestion, QuizQuestionAnswer, QuizTemplate
+
+
+def _answers_total(aggregate, output_field):
+    per_quiz = (
+        QuizQuestionAnswer.objects
+        .filter(quiz_id=OuterRef("pk"))
+        .order_by()
+        .values("quiz_id")
+        .annotate(total=aggregate)
+        .values("total")
+    )
+    return Coalesce(Subquery(per_quiz, output_field=output_field), Value(0), output_field=output_field)
+
+
+def quiz_totals_expressions() -> dict:
+    """Expressions SQL des totaux dénormalisés de Quiz, calculés depuis QuizQuestionAnswer."""
+    return {
+        "earned_score": _answers_total(Sum("earned_score"), FloatField()),
+        "max_score": _answers_total(Sum("max_score"), FloatField()),
+        "total_answers": _answers_total(Count("id"), IntegerField()),
+        "correct_answers": _answers_total(Count("id", filter=Q(is_correct=True)), IntegerField()),
+    }
+
+
+def refresh_quiz_totals(quiz_ids: Iterable[int], *, unfinalize: bool = False) -> int:
+    """
+    Recalcule les totaux (score obtenu/max, nombre de réponses, réponses correctes) des sessions
+    données en un seul UPDATE. Appelé par les écritures de réponses, la clôture et la réconciliation.
+    `unfinalize` (écritures de réponses) lève dans le même UPDATE la finalisation des sessions,
+    dont les réponses ont changé ; un simple recalcul des totaux la conserve.
+    """
+    quiz_ids = list(quiz_ids)
+    if not quiz_ids:
+        return 0
+    fields = quiz_totals_expressions()
+    if unfinalize:
+        fields["finalized_answer_key_version"] = None
+    return Quiz.objects.filter(pk__in=quiz_ids).update(**fields)
+
+
+def rebuild_quiz_totals(*, batch_size: int = 1000) -> int:
+    """Reconstruit les totaux de toutes les sessions par lots de pk croissants (commande de réparation)."""
+    rebuilt = 0
+    last_id = 0
+    while True:
+        quiz_ids = list(
+            Quiz.objects.filter(pk__gt=last_id).order_by("pk").values_list("pk", flat=True)[:batch_size]
+        )
+        if not quiz_ids:
+            return rebuilt
+        rebuilt += refresh_quiz_totals(quiz_ids)
+        last_id = quiz_ids[-1]
+
+
+def refresh_template_questions_total(quiz_template_ids: Iterable[int]) -> int:
+    """Recalcule QuizTemplate.questions_total des templates donnés en un seul UPDATE."""
+    quiz_template_ids = list(quiz_template_ids)
+    if not quiz_template_ids:
+        return 0
+    per_template = (
+        QuizQuestion.objects
+        .filter(quiz_id=OuterRef("pk"))
+        .order_by()
+        .values("quiz_id")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return QuizTemplate.objects.filter(pk__in=quiz_template_ids).update(
+        questions_total=Coalesce(Subquery(per_template, output_field=IntegerField()), Value(0)),
+    )
@@ -1,8 +1,11 @@
 import logging
 import random
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models import F
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from drf_spectacular.utils import (
     extend_schema,
@@ -20,6 +23,7 @@ from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from config.tools import ErrorDetailSerializer
+from config.conditional import ConditionalGetMixin, queryset_version
 from config.tools import MyModelViewSet
 
 from .models import QuizTemplate, QuizQuestion, Quiz, QuizQuestionAnswer, QuizAlertThread
@@ -35,19 +39,33 @@ from .querysets import (
     quiz_answer_queryset_for_user,
     accessible_quiz_template_queryset,
     quiz_queryset_for_user,
+    quiz_template_list_queryset,
     quiz_template_queryset,
     template_sessions_queryset,
 )
+from .answer_buffer import buffer_quiz_answers, flush_answer_buffers, wait_for_answer_buffers
+from .answer_stats import retract_answer_stats
 from .alerting import (
+    alert_thread_messages_queryset,
     alert_thread_queryset_for_user,
     require_alert_owner,
-    unread_total_for_queryset,
+    unread_total_for_user,
 )
+from .bulk_assign import assign_quiz_template, resolve_assignment_targets
+from .bulk_close import active_template_sessions_queryset
+from .expiry import expire_quiz_on_read
+from .item_analysis import get_item_analysis
+from .results_export import RESULTS_EXPORT_FORMATS, stream_results
+from .jobs import create_job, get_job
 from .session_integrity import synchronize_closed_quiz_answers
-from .services import close_quiz_session, create_quizzes_from_template
+from .services import close_quiz_session, get_or_create_exam_attempt
+from .totals import refresh_quiz_totals, refresh_template_questions_total
 from .notifications import notify_quiz_assigned_on_commit
+from .tasks import assign_quiz_template_task, close_template_sessions_task
+from .template_resync import schedule_template_resync, stale_sessions_queryset
 from .serializers import (
     QuizTemplateSerializer,
+    QuizTemplateListSerializer,
     QuizTemplateWriteSerializer,
     QuizTemplatePartialSerializer,
     QuizListSerializer,
@@ -56,14 +74,18 @@ from .serializers import (
     QuizUpdateSerializer,
     QuizPartialUpdateSerializer,
     QuizQuestionAnswerSerializer,
+    QuizQuestionAnswerBufferedSerializer,
     QuizQuestionReadSerializer,
     QuizQuestionWriteSerializer,
     QuizQuestionPartialSerializer,
     QuizQuestionAnswerWriteSerializer,
     QuizQuestionAnswerPartialSerializer,
+    QuizQuestionAnswerBatchWriteSerializer,
     GenerateFromSubjectsInputSerializer,
     BulkCreateFromTemplateInputSerializer,
     CreateQuizInputSerializer,
+    QuizJobSerializer,
+    QuizItemAnalysisSerializer,
     QuizAlertThreadListSerializer,
     QuizAlertThreadDetailSerializer,
     QuizAlertThreadCreateSerializer,
@@ -84,7 +106,7 @@ def not_found_response():
     list=extend_schema(
         tags=["QuizTemplate"],
         summary="Lister les templates de quiz",
-        responses={200: QuizTemplateSerializer(many=True)},
+        responses={200: QuizTemplateListSerializer(many=True)},
     ),
     retrieve=extend_schema(
         tags=["QuizTemplate"],
@@ -116,11 +138,40 @@ def not_found_response():
         responses={204: OpenApiResponse(description="No Content")},
     ),
 )
-class QuizTemplateViewSet(MyModelViewSet):
+class QuizTemplateViewSet(ConditionalGetMixin, MyModelViewSet):
     queryset = quiz_template_queryset()
     serializer_class = QuizTemplateSerializer
     lookup_field = "pk"
     lookup_url_kwarg = "qt_id"
+    conditional_fields = ("updated_at", "answer_key_version")
+    # can_answer dépend de l'heure courante.
+    conditional_time_fields = ("started_at", "ended_at")
+
+    @property
+    def cursor_ordering(self):
+        # Seule la liste des sessions envoyées peut basculer en keyset (?pagination=cursor).
+        return ("-created_at", "-id") if self.action == "sessions" else None
+
+    def get_queryset(self):
+        if self.action == "list":
+            return quiz_template_list_queryset()
+        return super().get_queryset()
+
+    def get_conditional_queryset(self):
+        if self.action == "list" and not self.request.user.is_superuser:
+            return accessible_quiz_template_queryset(self.request.user, queryset=quiz_template_list_queryset())
+        return super().get_conditional_queryset()
+
+    def get_conditional_version_parts(self, queryset):
+        quiz_questions = QuizQuestion.objects.filter(quiz__in=queryset.values("pk"))
+        return [
+            *super().get_conditional_version_parts(queryset),
+            queryset_version(
+                quiz_questions,
+                fields=("question__updated_at",),
+                sums=(F("id") * F("sort_order"), "weight"),
+            ),
+        ]
 
     def get_permissions(self):
         """
@@ -128,13 +179,25 @@ class QuizTemplateViewSet(MyModelViewSet):
           - generate_from_subjects, available : user authentifié
           - tout le reste (CRUD, questions)   : staff uniquement
         """
-        if self.action in ["list", "retrieve", "sessions", "create", "generate_from_subjects"]:
+        if self.action in [
+            "list",
+            "retrieve",
+            "sessions",
+            "close_sessions",
+            "close_sessions_status",
+            "analytics",
+            "results_export",
+            "create",
+            "generate_from_subjects",
+        ]:
             return [IsAuthenticated()]
 
         return [CanManageQuizTemplate()]
 
     def get_serializer_class(self):
-        if self.action in {"list", "retrieve", "generate_from_subjects"}:
+        if self.action == "list":
+            return QuizTemplateListSerializer
+        if self.action in {"retrieve", "generate_from_subjects"}:
             return QuizTemplateSerializer
         if self.action == "partial_update":
             return QuizTemplatePartialSerializer
@@ -149,12 +212,12 @@ class QuizTemplateViewSet(MyModelViewSet):
             method_name="list",
             endpoint="GET /api/quiz/template/",
             input_expected="query params (optionnels), body vide",
-            output="200 + [QuizTemplateSerializer] (paginé si pagination activée)",
+            output="200 + [QuizTemplateListSerializer] (paginé si pagination activée)",
         )
         if request.user.is_superuser:
             return super().list(request, *args, **kwargs)
 
-        qs = accessible_quiz_template_queryset(request.user)
+        qs = accessible_quiz_template_queryset(request.user, queryset=quiz_template_list_queryset())
 
         page = self.paginate_queryset(qs)
         if page is not None:
@@ -190,6 +253,11 @@ class QuizTemplateViewSet(MyModelViewSet):
             return not_found_response()
 
         sessions = template_sessions_queryset(quiz_template)
+        if self.paginator.use_cursor(request, self):
+            page = self.paginate_queryset(sessions)
+            serializer = QuizAssignmentListSerializer(page, many=True, context=self.get_serializer_context())
+            return self.get_paginated_response(serializer.data)
+
         serializer = QuizAssignmentListSerializer(
             sessions,
             many=True,
@@ -197,6 +265,118 @@ class QuizTemplateViewSet(MyModelViewSet):
         )
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @extend_schema(
+        tags=["QuizTemplate"],
+        summary="Clôturer toutes les sessions actives d'un template (fin d'examen)",
+        request=None,
+        responses={202: QuizJobSerializer, 404: ErrorDetailSerializer},
+    )
+    @action(detail=True, methods=["post"], url_path="close-sessions")
+    def close_sessions(self, request, *args, **kwargs):
+        self._log_call(
+            method_name="close_sessions",
+            endpoint="POST /api/quiz/template/{qt_id}/close-sessions/",
+            input_expected="path qt_id, body vide",
+            output="202 + QuizJobSerializer | 404",
+            extra={"qt_id": kwargs.get("qt_id")},
+        )
+        quiz_template = self.get_object()
+        if not user_can_manage_template_assignments(request.user, quiz_template):
+            return not_found_response()
+
+        job = create_job(
+            "close_template_sessions",
+            total=active_template_sessions_queryset(quiz_template.pk).count(),
+            quiz_template_id=quiz_template.pk,
+        )
+        close_template_sessions_task.delay(quiz_template.pk, job_id=job["id"])
+        logger.debug("close_sessions: queued job_id=%s qt_id=%s total=%s", job["id"], quiz_template.pk, job["total"])
+        return Response(get_job(job["id"]) or job, status=status.HTTP_202_ACCEPTED)
+
+    @extend_schema(
+        tags=["QuizTemplate"],
+        summary="Avancement d'une clôture en masse des sessions",
+        responses={200: QuizJobSerializer, 404: ErrorDetailSerializer},
+    )
+    @action(detail=True, methods=["get"], url_path=r"close-sessions/(?P<job_id>[0-9a-f]{32})")
+    def close_sessions_status(self, request, job_id=None, *args, **kwargs):
+        quiz_template = self.get_object()
+        if not user_can_manage_template_assignments(request.user, quiz_template):
+            return not_found_response()
+
+        job = get_job(job_id)
+        if job is None or job.get("quiz_template_id") != quiz_template.pk:
+            return not_found_response()
+        return Response(job, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        tags=["QuizTemplate"],
+        summary="Analyse d'items d'un template (difficulté, discrimination, distracteurs, scores)",
+        responses={200: QuizItemAnalysisSerializer, 404: ErrorDetailSerializer},
+    )
+    @action(detail=True, methods=["get"], url_path="analytics")
+    def analytics(self, request, *args, **kwargs):
+        quiz_template = self.get_object()
+        if not user_can_manage_template_assignments(request.user, quiz_template):
+            return not_found_response()
+
+        return Response(QuizItemAnalysisSerializer(get_item_analysis(quiz_template)).data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        tags=["QuizTemplate"],
+        summary="Exporter les sessions et réponses d'un template en flux (CSV ou NDJSON)",
+        parameters=[
+            OpenApiParameter(
+                name="export_format",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                enum=[*RESULTS_EXPORT_FORMATS],
+                description="csv (défaut) ou ndjson.",
+            )
+        ],
+        responses={
+            (200, "text/csv"): OpenApiTypes.STR,
+            (200, "application/x-ndjson"): OpenApiTypes.STR,
+            400: ErrorDetailSerializer,
+            404: ErrorDetailSerializer,
+        },
+    )
+    @action(detail=True, methods=["get"], url_path="results-export")
+    def results_export(self, request, *args, **kwargs):
+        self._log_call(
+            method_name="results_export",
+            endpoint="GET /api/quiz/template/{qt_id}/results-export/",
+            input_expected="path qt_id, query export_format=csv|ndjson",
+            output="200 + flux CSV/NDJSON (une ligne par session et réponse, X-Stale-Sessions) | 400 | 404",
+            extra={"qt_id": kwargs.get("qt_id")},
+        )
+        quiz_template = self.get_object()
+        if not user_can_manage_template_assignments(request.user, quiz_template):
+            return not_found_response()
+
+        export_format = request.query_params.get("export_format", "csv")
+        if export_format not in RESULTS_EXPORT_FORMATS:
+            return Response(
+                {"detail": f"export_format doit valoir {' ou '.join(RESULTS_EXPORT_FORMATS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Le flux ne fait que lire : les sessions périmées y sont marquées et réconciliées en tâche de fond.
+        stale_sessions = stale_sessions_queryset(quiz_template.pk, quiz_template.answer_key_version).count()
+        if stale_sessions:
+            schedule_template_resync(quiz_template.pk)
+        response = StreamingHttpResponse(
+            stream_results(quiz_template, export_format),
+            content_type=RESULTS_EXPORT_FORMATS[export_format],
+        )
+        filename = f"{timezone.now():%Y%m%d%H%M%S}_quiz_{quiz_template.pk}_results.{export_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response["X-Stale-Sessions"] = str(stale_sessions)
+        # nginx ne doit pas accumuler le flux avant de le transmettre.
+        response["X-Accel-Buffering"] = "no"
+        return response
+
     def create(self, request, *args, **kwargs):
         self._log_call(
             method_name="create",
@@ -327,6 +507,8 @@ class QuizTemplateViewSet(MyModelViewSet):
         for index, question in enumerate(questions_qs, start=1):
             quiz_questions.append(QuizQuestion(quiz=quiz_template, question=question, sort_order=index, weight=1, ))
         QuizQuestion.objects.bulk_create(quiz_questions)
+        # bulk_create n'émet pas post_save : le total dénormalisé est rafraîchi ici.
+        refresh_template_questions_total([quiz_template.pk])
         serializer = self.get_serializer(quiz_template)
         logger.debug("generate_from_subjects: created quiz_template_id=%s nb_questions=%s", quiz_template.id,
                     len(quiz_questions))
@@ -667,10 +849,17 @@ class QuizTemplateQuizQuestionViewSet(MyModelViewSet):
         request=BulkCreateFromTemplateInputSerializer,
         responses={
             201: QuizListSerializer(many=True),
+            202: QuizJobSerializer,
             400: OpenApiResponse(description="Input invalide"),
+            403: OpenApiResponse(description="Destinataire hors du domaine du template"),
             404: OpenApiResponse(description="QuizTemplate introuvable"),
         },
     ),
+    bulk_create_from_template_status=extend_schema(
+        tags=["Quiz"],
+        summary="Avancement d'une assignation en masse (tâche de fond)",
+        responses={200: QuizJobSerializer, 404: ErrorDetailSerializer},
+    ),
     start=extend_schema(
         tags=["Quiz"],
         summary="Démarrer une session de quiz existante",
@@ -692,11 +881,54 @@ class QuizTemplateQuizQuestionViewSet(MyModelViewSet):
         },
     )
 )
-class QuizViewSet(MyModelViewSet):
+class QuizViewSet(ConditionalGetMixin, MyModelViewSet):
     serializer_class = QuizSerializer
     permission_classes = [IsOwnerOrStaff]
     lookup_field = "pk"
     lookup_url_kwarg = "quiz_id"
+    cursor_ordering = ("-created_at", "-id")
+    # Totaux dénormalisés (quiz/totals.py) plutôt qu'une jointure sur les réponses ;
+    # le détail ajoute la version de ses réponses (get_conditional_version_parts).
+    conditional_fields = (
+        "started_at",
+        "ended_at",
+        "quiz_template__updated_at",
+        "quiz_template__answer_key_version",
+    )
+    conditional_sums = (F("id") * F("earned_score"), F("id") * F("max_score"), F("id") * F("total_answers"))
+    # Expiration, can_answer et visibilité des corrections dépendent de l'heure courante.
+    conditional_time_fields = (
+        "ended_at",
+        "quiz_template__ended_at",
+        "quiz_template__result_available_at",
+        "quiz_template__detail_available_at",
+    )
+    conditional_flags = ("active",)
+
+    def get_conditional_queryset(self):
+        if self.action == "list":
+            # Même périmètre que list() (recherche comprise), réduit à la page demandée.
+            return self.conditional_page_queryset(self._list_queryset())
+        return super().get_conditional_queryset()
+
+    def get_conditional_version_parts(self, queryset):
+        if self.action == "retrieve":
+            # Réponses encore en tampon d'écriture différée : écrites avant le calcul de la version.
+            flush_answer_buffers([self.kwargs[self.lookup_url_kwarg]])
+        parts = super().get_conditional_version_parts(queryset)
+        if self.action == "retrieve":
+            answers = QuizQuestionAnswer.objects.filter(quiz__in=queryset.values("pk"))
+            # Questions rendues en direct tant que la session n'a pas démarré.
+            quiz_questions = QuizQuestion.objects.filter(quiz__in=queryset.values("quiz_template_id"))
+            parts += [
+                queryset_version(answers, fields=("answered_at",), sums=("earned_score",)),
+                queryset_version(
+                    quiz_questions,
+                    fields=("question__updated_at",),
+                    sums=(F("id") * F("sort_order"),),
+                ),
+            ]
+        return parts
 
     def get_serializer_class(self):
         if self.action in {"list", "bulk_create_from_template"}:
@@ -719,16 +951,16 @@ class QuizViewSet(MyModelViewSet):
     def get_permissions(self):
         """
         Permissions:
-          - bulk_create_from_template : createur du template ou admin
-          - autres actions            : IsOwnerOrStaff
+          - bulk_create_from_template(_status) : createur du template ou admin
+          - autres actions                     : IsOwnerOrStaff
         """
-        if self.action == "bulk_create_from_template":
+        if self.action in {"bulk_create_from_template", "bulk_create_from_template_status"}:
             return [IsAuthenticated()]
 
         return super().get_permissions()
 
     def _expire_quiz_if_needed(self, quiz: Quiz) -> Quiz:
-        quiz.expire_if_needed()
+        expire_quiz_on_read(quiz)
         return quiz
 
     # ==========================================================
@@ -742,10 +974,7 @@ class QuizViewSet(MyModelViewSet):
             input_expected="query params optionnels, body vide",
             output="200 + [QuizListSerializer] (paginé si pagination activée)",
         )
-        qs = self.get_queryset()
-        search = request.query_params.get("search")
-        if search:
-            qs = qs.filter(quiz_template__title__icontains=search).distinct()
+        qs = self._list_queryset()
         page = self.paginate_queryset(qs)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
@@ -753,6 +982,13 @@ class QuizViewSet(MyModelViewSet):
         serializer = self.get_serializer(qs, many=True)
         return Response(serializer.data)
 
+    def _list_queryset(self):
+        qs = self.get_queryset()
+        search = self.request.query_params.get("search")
+        if search:
+            qs = qs.filter(quiz_template__title__icontains=search).distinct()
+        return qs
+
     def retrieve(self, request, *args, **kwargs):
         self._log_call(
             method_name="retrieve",
@@ -761,8 +997,9 @@ class QuizViewSet(MyModelViewSet):
             output="200 + QuizSerializer | 404",
             extra={"pk": kwargs.get("quiz_id")},
         )
-        quiz = self._expire_quiz_if_needed(self.get_object())
-        quiz = synchronize_closed_quiz_answers(quiz)
+        quiz = self.get_object()
+        if not expire_quiz_on_read(quiz):
+            quiz = synchronize_closed_quiz_answers(quiz)
         serializer = self.get_serializer(quiz)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -815,29 +1052,15 @@ class QuizViewSet(MyModelViewSet):
             validate_target_user_domain(qt, target_user)
 
         if qt.mode == QuizTemplate.MODE_EXAM:
-            with transaction.atomic():
-                qt = QuizTemplate.objects.select_for_update().get(pk=qt.pk)
-                existing_exam_quiz = (
-                    Quiz.objects.select_for_update()
-                    .filter(quiz_template=qt, user=target_user)
-                    .order_by("-created_at", "-id")
-                    .first()
-                )
-                if existing_exam_quiz is not None:
-                    if existing_exam_quiz.started_at or existing_exam_quiz.ended_at:
-                        return Response(
-                            {"detail": "Ce quiz a deja ete commence."},
-                            status=status.HTTP_400_BAD_REQUEST,
-                        )
-                    serializer = self.get_serializer(existing_exam_quiz)
-                    return Response(serializer.data, status=status.HTTP_200_OK)
-
-                quiz = Quiz.objects.create(
-                    domain_id=qt.domain_id,
-                    quiz_template=qt,
-                    user=target_user,
-                    active=False,
-                )
+            quiz, created = get_or_create_exam_attempt(quiz_template=qt, user=target_user)
+            if not created:
+                if quiz.started_at or quiz.ended_at:
+                    return Response(
+                        {"detail": "Ce quiz a deja ete commence."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                serializer = self.get_serializer(quiz)
+                return Response(serializer.data, status=status.HTTP_200_OK)
         else:
             quiz = Quiz.objects.create(
                 domain_id=qt.domain_id,
@@ -908,13 +1131,31 @@ class QuizViewSet(MyModelViewSet):
         if not user_can_manage_template_assignments(request.user, qt):
             raise PermissionDenied("Vous ne pouvez pas envoyer ce quiz.")
 
-        users = get_user_model().objects.filter(id__in=user_ids)
-        created = create_quizzes_from_template(
-            quiz_template=qt,
-            users=users,
-            validate_target_user=validate_target_user_domain,
-            assigned_by=request.user,
-        )
+        try:
+            user_ids = {int(user_id) for user_id in user_ids}
+        except (TypeError, ValueError):
+            return Response(
+                {"detail": "quiz_template_id et une liste user_ids sont requis."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        eligible_ids, rejected_ids = resolve_assignment_targets(qt, user_ids)
+        if rejected_ids:
+            logger.warning("bulk_create_from_template: rejected user_ids=%s quiz_template_id=%s", rejected_ids, qt.id)
+            raise PermissionDenied("L'utilisateur cible n'appartient pas au meme domaine que ce quiz.")
+
+        if len(eligible_ids) > settings.QUIZ_BULK_ASSIGN_SYNC_LIMIT:
+            job = create_job(
+                "assign_quiz_template",
+                total=len(eligible_ids),
+                quiz_template_id=qt.pk,
+                skipped=0,
+            )
+            assign_quiz_template_task.delay(qt.pk, eligible_ids, assigned_by_id=request.user.pk, job_id=job["id"])
+            logger.debug("bulk_create_from_template: queued job_id=%s qt_id=%s total=%s", job["id"], qt.pk, job["total"])
+            return Response(get_job(job["id"]) or job, status=status.HTTP_202_ACCEPTED)
+
+        created = assign_quiz_template(qt, eligible_ids, assigned_by=request.user)
         logger.debug(
             "bulk_create_from_template: created=%s quiz_template_id=%s users_count=%s",
             len(created),
@@ -924,6 +1165,17 @@ class QuizViewSet(MyModelViewSet):
         serializer = self.get_serializer(created, many=True)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=["get"], url_path=r"bulk-create-from-template/(?P<job_id>[0-9a-f]{32})",
+            permission_classes=[IsAuthenticated])
+    def bulk_create_from_template_status(self, request, job_id=None, *args, **kwargs):
+        job = get_job(job_id)
+        if job is None or job.get("kind") != "assign_quiz_template":
+            return not_found_response()
+        qt = QuizTemplate.objects.filter(pk=job.get("quiz_template_id")).first()
+        if qt is None or not user_can_manage_template_assignments(request.user, qt):
+            return not_found_response()
+        return Response(job, status=status.HTTP_200_OK)
+
     @action(detail=True, methods=["post"], url_path="start", permission_classes=[IsOwnerOrStaff])
     def start(self, request, quiz_id=None, *args, **kwargs):
         self._log_call(
@@ -959,10 +1211,12 @@ class QuizViewSet(MyModelViewSet):
             method_name="close",
             endpoint="POST /api/quiz/{quiz_id}/close/",
             input_expected="path quiz_id, body vide",
-            output="200 + QuizSerializer | 404",
+            output="200 + QuizSerializer | 404 | 409",
             extra={"quiz_id": quiz_id},
         )
 
+        # Trou récent du tampon d'écriture différée : attendu avant le verrou, la barrière ne patiente pas.
+        wait_for_answer_buffers([quiz_id])
         with transaction.atomic():
             quiz = get_object_or_404(self.get_queryset().select_for_update(), pk=quiz_id)
 
@@ -1013,6 +1267,13 @@ class QuizAlertThreadViewSet(MyModelViewSet):
     lookup_field = "pk"
     lookup_url_kwarg = "alert_id"
 
+    @property
+    def cursor_ordering(self):
+        # Clés keyset de ?pagination=cursor : conversations, ou messages d'une conversation.
+        if self.action == "thread_messages":
+            return ("-created_at", "-id")
+        return ("-last_message_at", "-created_at", "-id")
+
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return QuizAlertThread.objects.none()
@@ -1099,6 +1360,28 @@ class QuizAlertThreadViewSet(MyModelViewSet):
         out = QuizAlertMessageSerializer(message, context=self.get_serializer_context())
         return Response(out.data, status=status.HTTP_201_CREATED)
 
+    @extend_schema(
+        tags=["QuizAlert"],
+        summary="Lister les messages d'une conversation (plus récents d'abord, paginé)",
+        responses={200: QuizAlertMessageSerializer(many=True)},
+    )
+    @action(detail=True, methods=["get"], url_path="messages")
+    def thread_messages(self, request, *args, **kwargs):
+        self._log_call(
+            method_name="thread_messages",
+            endpoint="GET /api/quiz/alerts/{alert_id}/messages/",
+            input_expected="path alert_id, query ?pagination=cursor&cursor=... (optionnels)",
+            output="200 + [QuizAlertMessageSerializer] paginé | 404",
+            extra={"alert_id": kwargs.get("alert_id")},
+        )
+        thread = self.get_object()
+        messages = alert_thread_messages_queryset(thread)
+        page = self.paginate_queryset(messages)
+        context = self.get_serializer_context()
+        if page is not None:
+            return self.get_paginated_response(QuizAlertMessageSerializer(page, many=True, context=context).data)
+        return Response(QuizAlertMessageSerializer(messages, many=True, context=context).data)
+
     @extend_schema(
         tags=["QuizAlert"],
         summary="Clôturer une conversation d'alerte quiz",
@@ -1146,8 +1429,7 @@ class QuizAlertThreadViewSet(MyModelViewSet):
     )
     @action(detail=False, methods=["get"], url_path="unread-count")
     def unread_count(self, request, *args, **kwargs):
-        qs = self.get_queryset()
-        count = unread_total_for_queryset(qs, request.user)
+        count = unread_total_for_user(request.user)
         return Response({"count": count}, status=status.HTTP_200_OK)
 
 
@@ -1169,6 +1451,7 @@ class QuizAlertThreadViewSet(MyModelViewSet):
         request=QuizQuestionAnswerWriteSerializer,
         responses={
             201: QuizQuestionAnswerSerializer,
+            202: QuizQuestionAnswerBufferedSerializer,
             400: OpenApiResponse(description="Validation error"),
             404: OpenApiResponse(description="Quiz introuvable"),
         },
@@ -1201,6 +1484,8 @@ class QuizQuestionAnswerViewSet(MyModelViewSet):
             return QuizQuestionAnswerPartialSerializer
         if self.action in ("create", "update"):
             return QuizQuestionAnswerWriteSerializer
+        if self.action == "batch":
+            return QuizQuestionAnswerBatchWriteSerializer
         return QuizQuestionAnswerSerializer
 
     def get_quiz(self):
@@ -1213,7 +1498,7 @@ class QuizQuestionAnswerViewSet(MyModelViewSet):
             qs = qs.filter(user=user)
 
         self._quiz_cache = get_object_or_404(qs, pk=self.kwargs["quiz_id"])
-        self._quiz_cache.expire_if_needed()
+        expire_quiz_on_read(self._quiz_cache)
         return self._quiz_cache
 
     def get_serializer_context(self):
@@ -1226,8 +1511,28 @@ class QuizQuestionAnswerViewSet(MyModelViewSet):
         if getattr(self, "swagger_fake_view", False):
             return QuizQuestionAnswer.objects.none()
         quiz = self.get_quiz()
+        if not hasattr(self, "_answer_buffer_flushed"):
+            # Lecture de ses propres écritures : les réponses encore en tampon sont d'abord écrites en base.
+            flush_answer_buffers([quiz.id])
+            self._answer_buffer_flushed = True
         return quiz_answer_queryset_for_user(self.request.user, quiz.id)
 
+    def _buffer_answers(self, entries) -> list[dict]:
+        """Mode QUIZ_ANSWER_WRITE_BEHIND : acquitte les réponses validées sans transaction."""
+        last = buffer_quiz_answers(quiz=self.get_quiz(), entries=entries)
+        first = last - len(entries) + 1
+        buffered = [
+            {"quizquestion": qq, "selected_options": sorted(option_ids), "sequence": sequence}
+            for sequence, (qq, option_ids) in enumerate(entries, start=first)
+        ]
+        return QuizQuestionAnswerBufferedSerializer(buffered, many=True).data
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            retract_answer_stats(QuizQuestionAnswer.objects.filter(pk=instance.pk))
+            instance.delete()
+            refresh_quiz_totals([instance.quiz_id], unfinalize=True)
+
     def get_permissions(self):
         """
         Permissions:
@@ -1268,6 +1573,10 @@ class QuizQuestionAnswerViewSet(MyModelViewSet):
         )
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        if settings.QUIZ_ANSWER_WRITE_BEHIND:
+            validated = serializer.validated_data
+            buffered = self._buffer_answers([(validated["quizquestion"], set(validated.get("selected_options", [])))])
+            return Response(buffered[0], status=status.HTTP_202_ACCEPTED)
         instance = serializer.save()
 
         out = QuizQuestionAnswerSerializer(
@@ -1303,6 +1612,36 @@ class QuizQuestionAnswerViewSet(MyModelViewSet):
         kwargs["partial"] = True
         return self.update(request, *args, **kwargs)
 
+    @extend_schema(
+        tags=["QuizAnswer"],
+        summary="Enregistrer plusieurs réponses en une requête (upsert)",
+        request=QuizQuestionAnswerBatchWriteSerializer,
+        responses={
+            200: QuizQuestionAnswerSerializer(many=True),
+            202: QuizQuestionAnswerBufferedSerializer(many=True),
+            400: OpenApiResponse(description="Validation error"),
+            404: OpenApiResponse(description="Quiz introuvable"),
+        },
+    )
+    @action(detail=False, methods=["post"], url_path="batch")
+    def batch(self, request, *args, **kwargs):
+        self._log_call(
+            method_name="batch",
+            endpoint="POST /api/quiz/{quiz_id}/answers/batch/",
+            input_expected="path quiz_id + body {answers: [{question_id?, question_order?, selected_options}]}",
+            output="200 + [QuizQuestionAnswerSerializer] | 400 | 404",
+        )
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        if settings.QUIZ_ANSWER_WRITE_BEHIND:
+            buffered = self._buffer_answers(serializer.validated_data["entries"])
+            return Response(buffered, status=status.HTTP_202_ACCEPTED)
+        answers = serializer.save()
+
+        saved = self.get_queryset().filter(pk__in=[answer.pk for answer in answers])
+        out = QuizQuestionAnswerSerializer(saved, many=True, context=self.get_serializer_context())
+        return Response(out.data, status=status.HTTP_200_OK)
+
     def destroy(self, request, *args, **kwargs):
         self._log_call(
             method_name="destroy",
@@ -12,6 +12,7 @@ from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from config.conditional import ConditionalGetMixin
 from config.tools import MyModelViewSet, ErrorDetailSerializer
 
 from .models import Subject
@@ -156,8 +157,9 @@ logger = logging.getLogger(__name__)
         },
     ),
 )
-class SubjectViewSet(MyModelViewSet):
+class SubjectViewSet(ConditionalGetMixin, MyModelViewSet):
     queryset = Subject.objects.all()
+    conditional_fields = ("updated_at", "domain__updated_at")
     serializer_class = SubjectReadSerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ["active", "domain"]